@@ -0,0 +1,136 @@
+"""
+Peak memory of passing transcripts by value versus by artifact handle.
+
+Replays the data movement of the meeting minutes flow on a synthetic
+transcript, once the way the flow used to pass strings around (state fields,
+crew inputs, prompt interpolation into goals and task descriptions and the
+LiteLLM kwargs debug print) and once with the ArtifactStore handles. Each mode
+runs in a fresh interpreter so peak RSS is measured independently.
+
+Usage:
+    python benchmarks/artifact_memory.py --hours 8
+"""
+
+import argparse
+import io
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# Imported up front so both modes start from the same baseline RSS
+from meeting_minutes.utils.artifact_store import ArtifactStore  # noqa: E402
+
+WORDS_PER_MINUTE = 150
+CHUNK_SECONDS = 60
+SUMMARY_TEMPLATE = "Summarize the meeting transcript:\n{transcript}\nWrite files."
+GMAIL_TEMPLATE = "Send an email with the meeting minutes using the body: {body}"
+
+
+def _chunks(hours: float):
+    words = "speaker one said the quarterly revenue grew in the region".split()
+    per_chunk = WORDS_PER_MINUTE * CHUNK_SECONDS // 60
+    for i in range(int(hours * 3600 / CHUNK_SECONDS)):
+        yield " ".join(words[(i + j) % len(words)] for j in range(per_chunk))
+
+
+def _llm_call(messages, sink):
+    # Mimics the old debug print of the full LiteLLM kwargs
+    print(f"kwargs: {dict(messages=messages)}", file=sink)
+
+
+def run_by_value(hours: float) -> None:
+    sink = io.StringIO()
+    full_transcription = ""
+    for chunk in _chunks(hours):
+        full_transcription += chunk + " "
+    state_transcript = full_transcription.strip()
+    del full_transcription
+
+    inputs = {"transcript": state_transcript}
+    description = SUMMARY_TEMPLATE.format(**inputs)
+    _llm_call([{"role": "user", "content": description}], sink)
+
+    state_minutes = state_transcript[: len(state_transcript) // 4]
+    body = str(state_minutes)
+    goal = GMAIL_TEMPLATE.format(body=body)
+    task = GMAIL_TEMPLATE.format(body=body)
+    _llm_call(
+        [{"role": "system", "content": goal}, {"role": "user", "content": task}], sink
+    )
+
+
+def run_by_handle(hours: float, root: str) -> None:
+    sink = io.StringIO()
+    store = ArtifactStore("benchmark", root=root)
+    with store.open_writer("transcript.txt") as transcript_file:
+        for index, chunk in enumerate(_chunks(hours)):
+            if index:
+                transcript_file.write(" ")
+            transcript_file.write(chunk)
+    transcript_ref = store.ref("transcript.txt")
+
+    transcript = store.read_text(transcript_ref)
+    description = SUMMARY_TEMPLATE.format(transcript=transcript)
+    messages = [{"role": "user", "content": description}]
+    print(f"model=gpt-4o messages={len(messages)}", file=sink)
+    minutes_ref = store.put_text("minutes.md", transcript[: len(transcript) // 4])
+    del transcript, description, messages
+
+    goal = GMAIL_TEMPLATE.format(body=minutes_ref)
+    task = GMAIL_TEMPLATE.format(body=minutes_ref)
+    print(f"model=gpt-4o messages=2 prompt_chars={len(goal) + len(task)}", file=sink)
+    body = store.read_text(minutes_ref)  # GmailTool resolves the handle once
+    del body
+
+
+def _measure(mode: str, hours: float) -> dict:
+    tracemalloc.start()
+    with tempfile.TemporaryDirectory() as root, redirect_stdout(io.StringIO()):
+        if mode == "value":
+            run_by_value(hours)
+        else:
+            run_by_handle(hours, root)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "mode": mode,
+        "peak_python_mb": peak / 2**20,
+        # ru_maxrss is reported in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hours", type=float, default=8.0)
+    parser.add_argument("--mode", choices=["value", "handle"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(_measure(args.mode, args.hours)))
+        return
+
+    print(f"Synthetic transcript: {args.hours:g}h at {WORDS_PER_MINUTE} words/min")
+    for mode in ("value", "handle"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--hours", str(args.hours), "--mode", mode],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        print(
+            f"  by {mode:<6}: peak RSS {result['peak_rss_mb']:7.1f} MB, "
+            f"peak Python heap {result['peak_python_mb']:7.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Framework overhead of the CrewAI crews, measured without model inference.
+
+Runs MeetingMinutesCrew and GmailCrew against the record/replay LLM server
+(``meeting_minutes.utils.llm_cassette``). The first run with ``--upstream``
+records the real server's completions to the cassette; later runs replay
+them, so every run makes the same LLM round trips and only the time spent
+outside the model varies. For each crew the wall-clock time is split into
+simulated inference (the recorded latency times ``--latency-scale``) and
+overhead, with the number of round trips and the tokens and bytes sent.
+
+Gmail is not contacted: the Gmail crew's draft is created in memory.
+
+Usage:
+    # Record once against the real server
+    python benchmarks/crew_overhead.py --cassette benchmarks/crews.json \\
+        --upstream http://localhost:1337/v1 --runs 1
+    # Replay as often as needed, with or without the recorded latency
+    python benchmarks/crew_overhead.py --cassette benchmarks/crews.json --runs 10
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from meeting_minutes.config.app_config import (  # noqa: E402
+    LLM_COALESCE_CONFIG,
+    LLM_POOL_CONFIG,
+    LLM_SERVER,
+    PROCESSING_CONFIG,
+)
+from meeting_minutes.utils.llm_cassette import Cassette, CassetteServer  # noqa: E402
+
+WORDS = "speaker one said the quarterly revenue grew in the northern region".split()
+
+
+def _transcript(words: int) -> str:
+    sentences = []
+    for start in range(0, words, 12):
+        sentence = " ".join(WORDS[(start + i) % len(WORDS)] for i in range(12))
+        sentences.append(sentence.capitalize() + ".")
+    return " ".join(sentences)
+
+
+def _point_at(server: CassetteServer) -> None:
+    # Must run before the LLM modules are imported: they build their endpoint
+    # pool and clients from this configuration
+    LLM_SERVER["base_url"] = server.base_url
+    LLM_POOL_CONFIG["endpoints"] = [server.base_url]
+    LLM_POOL_CONFIG["probe_interval"] = 0
+    # Every call must reach the server to be counted
+    PROCESSING_CONFIG["minutes"]["cache_policy"] = "off"
+    LLM_COALESCE_CONFIG["window_ms"] = 0
+
+
+def _crews(drafts: list) -> dict:
+    from meeting_minutes.crews.gmailcrew import gmailcrew
+    from meeting_minutes.crews.gmailcrew.tools import gmail_tool
+    from meeting_minutes.crews.meeting_minutes_crew.meeting_minutes_crew import (
+        MeetingMinutesCrew,
+    )
+    from meeting_minutes.utils.artifact_store import ArtifactStore
+    from meeting_minutes.utils.monkey_patches import apply_monkey_patches
+
+    apply_monkey_patches()
+
+    def draft_minutes(minutes):
+        drafts.append(minutes)
+        return [{"id": f"draft-{len(drafts)}"}]
+
+    gmail_tool.draft_minutes = draft_minutes
+
+    return {
+        "MeetingMinutesCrew": lambda inputs: MeetingMinutesCrew()
+        .crew()
+        .kickoff(inputs),
+        "GmailCrew": lambda inputs: gmailcrew.GmailCrew()
+        .crew()
+        .kickoff(
+            {
+                "body_ref": ArtifactStore("benchmark").put_text(
+                    "minutes.txt", inputs["minutes"]
+                ),
+                "audio_info": inputs["audio_info"],
+            }
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cassette", default="benchmarks/crews.json")
+    parser.add_argument("--upstream", help="record from this LLM server first")
+    parser.add_argument("--runs", type=int, default=5, help="runs per crew")
+    parser.add_argument("--words", type=int, default=1500, help="transcript length")
+    parser.add_argument(
+        "--latency-scale",
+        type=float,
+        default=0.0,
+        help="share of the recorded latency to simulate (0 = none)",
+    )
+    args = parser.parse_args()
+
+    mode = "record" if args.upstream else "replay"
+    cassette = Cassette(args.cassette)
+    server = CassetteServer(
+        cassette, mode, upstream=args.upstream, latency_scale=args.latency_scale
+    )
+    with server:
+        _point_at(server)
+        drafts: list = []
+        crews = _crews(drafts)
+        inputs = {
+            "transcript": _transcript(args.words),
+            "audio_info": {"duration_seconds": args.words / 2.5},
+            "minutes": _transcript(args.words // 3),
+        }
+
+        for name, run in crews.items():
+            walls, results = [], []
+            for _ in range(args.runs):
+                cassette.rewind()
+                server.stats(reset=True)
+                started = time.perf_counter()
+                run(inputs)
+                walls.append(time.perf_counter() - started)
+                results.append(server.stats())
+
+            wall = statistics.mean(walls)
+            waited = statistics.mean(r["simulated_seconds"] for r in results)
+            last = results[-1]
+            print(f"{name} ({mode}, {args.runs} run(s)):")
+            print(
+                f"  wall {wall:8.3f} s (stdev "
+                f"{statistics.stdev(walls) if len(walls) > 1 else 0.0:.3f}), "
+                f"simulated inference {waited:8.3f} s, "
+                f"overhead {wall - waited:8.3f} s"
+            )
+            print(
+                f"  {last['round_trips']} LLM round trip(s), "
+                f"{last['prompt_tokens']} prompt + {last['completion_tokens']} "
+                f"completion tokens, {last['request_bytes']} bytes sent, "
+                f"recorded inference {last['inference_seconds']:.3f} s"
+            )
+            if last["misses"]:
+                print(
+                    f"  {last['misses']} request(s) not in the cassette; "
+                    "record it again with --upstream"
+                )
+        print(f"Gmail drafts created in memory: {len(drafts)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Throughput of the extractive summarizer on very long transcripts.
+
+Generates a synthetic transcript of ``--sentences`` sentences with a Zipf
+word distribution and summarizes it three ways: the old TextSummarizerTool
+scoring (sentence length plus keyword hits, split on "."), the TextRank
+engine on the text in memory, and the engine streaming the text from a file
+a megabyte at a time. Each is timed over ``--runs`` runs; with ``--memory``
+the peak traced allocation of one more run is shown too.
+
+Focus keyword matching is timed on its own as well: the old lowercase and
+substring scan of every sentence for every keyword against the compiled
+KeywordMatcher, with ``--keyword-count`` vocabulary words added to
+``--keywords``.
+
+Usage:
+    python benchmarks/extractive_summary.py --sentences 100000 --runs 3
+    python benchmarks/extractive_summary.py --keyword-count 500 --runs 1
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from meeting_minutes.utils.extractive_summary import (  # noqa: E402
+    ExtractiveSummarizer,
+    split_sentences,
+)
+from meeting_minutes.utils.keyword_matcher import KeywordMatcher  # noqa: E402
+
+SYLLABLES = "ka lo mi ne ru sa ti vo ze bu da fe gi ho ju".split()
+READ_CHARS = 1024 * 1024
+
+
+def _vocabulary(seed: int = 7) -> list:
+    rng = np.random.default_rng(seed)
+    return [
+        "".join(SYLLABLES[d] for d in rng.integers(0, len(SYLLABLES), size=3))
+        for _ in range(20_000)
+    ]
+
+
+def _transcript(sentences: int, seed: int = 7) -> str:
+    rng = np.random.default_rng(seed)
+    vocabulary = _vocabulary(seed)
+    ranks = np.minimum(rng.zipf(1.3, size=sentences * 25), len(vocabulary)) - 1
+    lengths = rng.integers(5, 26, size=sentences)
+    ends = rng.choice([".", ".", ".", "?", "!"], size=sentences)
+    parts, position = [], 0
+    for length, end in zip(lengths, ends):
+        words = [vocabulary[r] for r in ranks[position : position + length]]
+        position += length
+        parts.append(" ".join(words).capitalize() + end)
+    return " ".join(parts)
+
+
+def _legacy(text: str, max_sentences: int, keywords: list) -> str:
+    # TextSummarizerTool before the TextRank engine
+    sentences = [s.strip() for s in text.split(".") if s.strip()]
+    scored = []
+    for sentence in sentences:
+        score = len(sentence.split())
+        for keyword in keywords:
+            if keyword in sentence.lower():
+                score += 10
+        scored.append((score, sentence))
+    scored.sort(key=lambda x: x[0], reverse=True)
+    top = [sentence for _, sentence in scored[:max_sentences]]
+    return ". ".join(s for s in sentences if s in top) + "."
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sentences", type=int, default=100_000)
+    parser.add_argument("--max-sentences", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--keywords", default="kalomi,saruti")
+    parser.add_argument(
+        "--keyword-count",
+        type=int,
+        default=0,
+        help="vocabulary words added to the focus keywords",
+    )
+    parser.add_argument(
+        "--memory", action="store_true", help="also trace peak allocations"
+    )
+    args = parser.parse_args()
+
+    keywords = [k.strip().lower() for k in args.keywords.split(",") if k.strip()]
+    keywords += _vocabulary(seed=11)[: args.keyword_count]
+    text = _transcript(args.sentences)
+    counted = len(split_sentences(text))
+    print(
+        f"Transcript: {counted} sentences, {len(text) / 1e6:.1f} MB, "
+        f"summary of {args.max_sentences} sentences"
+    )
+
+    summarizer = ExtractiveSummarizer()
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as handle:
+        handle.write(text)
+        path = handle.name
+
+    def streamed():
+        with open(path) as source:
+            chunks = iter(lambda: source.read(READ_CHARS), "")
+            return summarizer.summarize_stream(chunks, args.max_sentences, keywords)
+
+    sentences = split_sentences(text)
+
+    def legacy_hits():
+        lowered = [sentence.lower() for sentence in sentences]
+        return [sum(k in sentence for k in keywords) for sentence in lowered]
+
+    def matcher_hits():
+        return KeywordMatcher(keywords).hits(sentences)
+
+    modes = {
+        f"{len(keywords)} keywords, substring scan": legacy_hits,
+        f"{len(keywords)} keywords, KeywordMatcher": matcher_hits,
+        "legacy scoring": lambda: _legacy(text, args.max_sentences, keywords),
+        "TextRank in memory": lambda: summarizer.summarize(
+            text, args.max_sentences, keywords
+        ),
+        "TextRank streamed": streamed,
+    }
+    try:
+        for name, run in modes.items():
+            times = []
+            for _ in range(args.runs):
+                started = time.perf_counter()
+                run()
+                times.append(time.perf_counter() - started)
+            mean = statistics.mean(times)
+            line = (
+                f"{name:34s} {mean:8.3f} s (stdev "
+                f"{statistics.stdev(times) if len(times) > 1 else 0.0:.3f}), "
+                f"{counted / mean:10.0f} sentences/s"
+            )
+            if args.memory:
+                tracemalloc.start()
+                run()
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                line += f", peak {peak / 1e6:7.1f} MB"
+            print(line)
+    finally:
+        Path(path).unlink()
+
+
+if __name__ == "__main__":
+    main()
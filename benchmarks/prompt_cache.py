@@ -0,0 +1,135 @@
+"""
+Prompt evaluation time with and without the prefix-cache-friendly layout.
+
+Sends the summarizer agent's prompt for a series of synthetic meetings to a
+llama.cpp server, once with the transcript in the middle of the task
+description (the old layout, no cache hint) and once with the static prompt
+first, the transcript last and ``cache_prompt`` set. llama-server reports how
+many prompt tokens it had to evaluate and how long that took in each
+response's ``timings``; the wall-clock time is shown for servers that don't.
+
+Usage:
+    llama-server -m model.gguf --port 1337 &
+    python benchmarks/prompt_cache.py --base-url http://localhost:1337/v1 --runs 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import requests
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from meeting_minutes.utils.prompt_layout import (  # noqa: E402
+    arrange_messages,
+    tag_variable,
+)
+
+CONFIG_DIR = (
+    Path(__file__).resolve().parent.parent
+    / "src"
+    / "meeting_minutes"
+    / "crews"
+    / "meeting_minutes_crew"
+    / "config"
+)
+WORDS = "speaker one said the quarterly revenue grew in the northern region".split()
+
+
+def _transcript(meeting: int, words: int) -> str:
+    return " ".join(WORDS[(meeting * 7 + i) % len(WORDS)] for i in range(words))
+
+
+def _messages(transcript: str, layout: str) -> list:
+    agents = yaml.safe_load((CONFIG_DIR / "agents.yaml").read_text())
+    tasks = yaml.safe_load((CONFIG_DIR / "tasks.yaml").read_text())
+    agent = agents["meeting_minutes_summarizer"]
+    task = tasks["meeting_minutes_summary_task"]
+    system = (
+        f"You are {agent['role'].strip()}. {agent['backstory'].strip()}\n"
+        f"Your personal goal is: {agent['goal'].strip()}"
+    )
+    instructions = task["description"].split("The meeting transcript:")[0].strip()
+    block = tag_variable(transcript)
+    if layout == "mixed":
+        # The old layout: the transcript right after the first instruction
+        first, rest = instructions.split("\n", 1)
+        description = f"{first}\n{block}\n{rest}"
+    else:
+        description = f"{instructions}\nThe meeting transcript:\n{block}"
+    user = (
+        f"Current Task: {description}\n\n"
+        f"This is the expected criteria for your final answer: "
+        f"{task['expected_output'].strip()}"
+    )
+    messages = [
+        {"role": "system", "content": system},
+        {"role": "user", "content": user},
+    ]
+    return arrange_messages(messages) if layout == "prefix" else messages
+
+
+def _run(base_url: str, model: str, layout: str, runs: int, words: int) -> list:
+    results = []
+    for meeting in range(runs):
+        payload = {
+            "model": model,
+            "messages": _messages(_transcript(meeting, words), layout),
+            "max_tokens": 1,
+            "temperature": 0,
+            "cache_prompt": layout == "prefix",
+        }
+        started = time.perf_counter()
+        response = requests.post(
+            f"{base_url}/chat/completions", json=payload, timeout=600
+        )
+        response.raise_for_status()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        timings = response.json().get("timings") or {}
+        results.append(
+            {
+                "prompt_tokens_evaluated": timings.get("prompt_n"),
+                "prompt_ms": timings.get("prompt_ms"),
+                "wall_ms": elapsed_ms,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://localhost:1337/v1")
+    parser.add_argument("--model", default="local-model")
+    parser.add_argument("--runs", type=int, default=5, help="meetings per layout")
+    parser.add_argument("--words", type=int, default=1500, help="transcript length")
+    args = parser.parse_args()
+
+    totals = {}
+    for layout in ("mixed", "prefix"):
+        print(f"{layout} layout:")
+        results = _run(args.base_url, args.model, layout, args.runs, args.words)
+        for run, result in enumerate(results, 1):
+            evaluated = result["prompt_tokens_evaluated"]
+            prompt_ms = result["prompt_ms"]
+            print(
+                f"  meeting {run}: "
+                + (f"{evaluated:5d} prompt tokens evaluated, " if evaluated else "")
+                + (f"prompt {prompt_ms:8.1f} ms, " if prompt_ms else "")
+                + f"wall {result['wall_ms']:8.1f} ms"
+            )
+        # The first request of each layout starts from a cold cache
+        warm = results[1:] or results
+        totals[layout] = sum(r["prompt_ms"] or r["wall_ms"] for r in warm) / len(warm)
+
+    saved = totals["mixed"] - totals["prefix"]
+    print(
+        f"Mean prompt time after the first meeting: mixed {totals['mixed']:.1f} ms, "
+        f"prefix {totals['prefix']:.1f} ms ({saved:.1f} ms saved per call)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -41,6 +41,8 @@ setup(
             "pytest-cov>=4.1.0",
             "pytest-mock>=3.12.0",
         ],
+        # inotify-backed watch mode; polling is used without it
+        "watch": ["watchdog>=3.0.0"],
     },
     entry_points={
         "console_scripts": [
@@ -25,6 +25,57 @@ GOOGLE_OAUTH: Dict[str, Any] = {
     "scopes": ["https://www.googleapis.com/auth/gmail.compose"],
     "credentials_path": str(TOOLS_DIR / "credentials.json"),
     "token_path": str(TOOLS_DIR / "token.json"),
+    # Refresh the access token this many seconds before it expires, in the
+    # background, so no draft waits for a token refresh
+    "refresh_margin": float(os.getenv("GMAIL_TOKEN_REFRESH_MARGIN", "300")),
+}
+
+# Gmail API drafts
+GMAIL_CONFIG: Dict[str, Any] = {
+    # "outbox" queues the drafts for background delivery, "direct" creates
+    # them before the flow finishes (both without an LLM); "agent" runs the
+    # Gmail crew
+    "draft_mode": os.getenv("GMAIL_DRAFT_MODE", "outbox"),
+    "sender": os.getenv("GMAIL_SENDER", ""),
+    # One draft per recipient (comma-separated)
+    "recipients": [
+        address.strip()
+        for address in os.getenv("GMAIL_RECIPIENT", "").split(",")
+        if address.strip()
+    ],
+    "subject": os.getenv("GMAIL_SUBJECT", "Meeting Minutes"),
+    # Job files attached to the drafts: any of transcript, summary,
+    # action_items, sentiment and audio_excerpt (comma-separated)
+    "attachments": [
+        name.strip()
+        for name in os.getenv("GMAIL_ATTACHMENTS", "").split(",")
+        if name.strip()
+    ],
+    # Length of the compressed audio excerpt attachment
+    "audio_excerpt_seconds": int(os.getenv("GMAIL_AUDIO_EXCERPT_SECONDS", "60")),
+    # Chunk size of resumable uploads of large drafts
+    "upload_chunk_mb": float(os.getenv("GMAIL_UPLOAD_CHUNK_MB", "5")),
+    # Gmail API root URL ("" for Google's), e.g. a local stand-in for tests
+    "api_endpoint": os.getenv("GMAIL_API_ENDPOINT", ""),
+    # Drafts created per batch request (Gmail accepts at most 100)
+    "batch_size": int(os.getenv("GMAIL_BATCH_SIZE", "50")),
+    # Attempts per draft on rate limiting and server errors
+    "max_attempts": int(os.getenv("GMAIL_MAX_ATTEMPTS", "4")),
+    # Seconds before the first retry, doubled on every further one
+    "retry_backoff": float(os.getenv("GMAIL_RETRY_BACKOFF", "1.0")),
+    # Queued drafts and their rendered messages, kept until delivered
+    "outbox_dir": os.getenv(
+        "GMAIL_OUTBOX_DIR", str(PROJECT_ROOT / "artifacts" / "gmail_outbox")
+    ),
+    # Delivery attempts per queued draft before it is marked failed
+    "outbox_max_attempts": int(os.getenv("GMAIL_OUTBOX_MAX_ATTEMPTS", "10")),
+    # Seconds before a queued draft is retried, doubled on every further one
+    "outbox_backoff": float(os.getenv("GMAIL_OUTBOX_BACKOFF", "30")),
+    # Seconds between checks for due drafts
+    "outbox_poll_interval": float(os.getenv("GMAIL_OUTBOX_POLL_INTERVAL", "30")),
+    # Seconds a command-line run waits for its drafts before exiting; the
+    # rest are delivered by the next run
+    "outbox_flush_timeout": float(os.getenv("GMAIL_OUTBOX_FLUSH_TIMEOUT", "120")),
 }
 
 # API Configuration
@@ -48,14 +99,187 @@ PROCESSING_CONFIG: Dict[str, Any] = {
         "chunk_length_ms": 60000,  # 1 minute chunks
         "supported_formats": ["wav", "mp3", "m4a", "flac"],
         "max_file_size_mb": 100,
+        # Decode one chunk at a time instead of loading the whole recording
+        "streaming_decode": os.getenv("STREAMING_DECODE", "true").lower() == "true",
+        # Format chunks are encoded in before upload: wav, flac or mp3
+        "upload_codec": os.getenv("UPLOAD_CODEC", "wav"),
     },
     "transcription": {
         "cleanup_temp_files": False,  # Disable to avoid permission issues
         "retry_attempts": 3,
         "retry_delay": 1.0,
+        # Chunks transcribed in parallel
+        "concurrency": int(os.getenv("STT_CONCURRENCY", "1")),
+    },
+    "minutes": {
+        # "crew" runs the summarizer and writer agents, "fused" a single prompt
+        "llm_path": os.getenv("MINUTES_LLM_PATH", "crew"),
+        # Which LLM results may be reused: off, deterministic or always
+        "cache_policy": os.getenv("LLM_CACHE_POLICY", "deterministic"),
+        # Stream completions token by token into the events and output file
+        "streaming": os.getenv("LLM_STREAMING", "true").lower() == "true",
+    },
+}
+
+# Deadlines in seconds (0 disables a limit)
+TIMEOUT_CONFIG: Dict[str, Any] = {
+    "stages": {
+        "transcription": float(os.getenv("TRANSCRIPTION_TIMEOUT", "3600")),
+        "minutes": float(os.getenv("MINUTES_TIMEOUT", "1800")),
+        "draft": float(os.getenv("DRAFT_TIMEOUT", "300")),
+    },
+    "requests": {
+        "elevenlabs": float(os.getenv("ELEVENLABS_REQUEST_TIMEOUT", "300")),
+        "llm": float(os.getenv("LLM_REQUEST_TIMEOUT", "600")),
+        "oauth": float(os.getenv("OAUTH_TIMEOUT", "300")),
+        "gmail": float(os.getenv("GMAIL_REQUEST_TIMEOUT", "60")),
+    },
+}
+
+# Job artifact storage (transcripts and minutes are passed around by handle)
+ARTIFACT_CONFIG: Dict[str, Any] = {
+    "root": os.getenv("ARTIFACT_ROOT", str(PROJECT_ROOT / "artifacts")),
+}
+
+# Model discovery and fail-fast behaviour for the local LLM server
+LLM_RESILIENCE_CONFIG: Dict[str, Any] = {
+    # How long the models listed by /v1/models are trusted
+    "model_cache_ttl": float(os.getenv("MODEL_CACHE_TTL", "600")),
+    "probe_timeout": float(os.getenv("MODEL_PROBE_TIMEOUT", "5")),
+    # Consecutive failures after which calls fail fast
+    "failure_threshold": int(os.getenv("LLM_BREAKER_THRESHOLD", "3")),
+    # Seconds before a trial call is let through again
+    "reset_timeout": float(os.getenv("LLM_BREAKER_RESET_TIMEOUT", "30")),
+}
+
+# Shared keep-alive connection pool for the local LLM server
+LLM_CLIENT_CONFIG: Dict[str, Any] = {
+    "pool_size": int(os.getenv("LLM_POOL_SIZE", "10")),
+    # Idle connections are kept open this many seconds
+    "keepalive_expiry": float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60")),
+    "connect_timeout": float(os.getenv("LLM_CONNECT_TIMEOUT", "10")),
+}
+
+# Load balancing over several LLM server instances (comma-separated URLs)
+LLM_POOL_CONFIG: Dict[str, Any] = {
+    "endpoints": [
+        url.strip()
+        for url in os.getenv("LLM_ENDPOINTS", LLM_SERVER["base_url"]).split(",")
+        if url.strip()
+    ],
+    # Seconds between health probes of each endpoint (0 disables probing)
+    "probe_interval": float(os.getenv("LLM_PROBE_INTERVAL", "15")),
+    "probe_timeout": float(os.getenv("LLM_PROBE_TIMEOUT", "3")),
+}
+
+# Model tiers: a small, fast model for extraction and classification and a
+# large one for long-form writing. A tier without its own model or endpoints
+# uses the default model name and LLM_ENDPOINTS.
+LLM_TIER_CONFIG: Dict[str, Any] = {
+    # Route agents and prompts by tier (false sends everything to "default")
+    "enabled": os.getenv("LLM_TIERS_ENABLED", "true").lower() == "true",
+    "default": "large",
+    "tiers": {
+        tier: {
+            "model": os.getenv(f"LLM_{tier.upper()}_MODEL", ""),
+            "endpoints": [
+                url.strip()
+                for url in os.getenv(f"LLM_{tier.upper()}_ENDPOINTS", "").split(",")
+                if url.strip()
+            ],
+        }
+        for tier in ("fast", "large")
     },
 }
 
+# Prompt layout for llama.cpp-style prompt (KV) caching
+LLM_PROMPT_CONFIG: Dict[str, Any] = {
+    # Ask the server to reuse the cached prompt prefix of its slot
+    "cache_prompt": os.getenv("LLM_CACHE_PROMPT", "true").lower()
+    == "true",
+}
+
+# Context-window budgeting of prompts, transcript segments and max_tokens
+LLM_CONTEXT_CONFIG: Dict[str, Any] = {
+    # Context length in tokens (0 discovers it from the server's metadata)
+    "window": int(os.getenv("LLM_CONTEXT_WINDOW", "0")),
+    # Assumed when the server does not report its context length
+    "fallback_window": int(os.getenv("LLM_CONTEXT_FALLBACK", "8192")),
+    # Token estimate: at least one token per this many characters
+    "chars_per_token": float(os.getenv("LLM_CHARS_PER_TOKEN", "3.5")),
+    # Share of the window left free to absorb estimation error
+    "safety_margin": 0.05,
+    # Prompts leaving less room than this for the answer are not sent
+    "min_output_tokens": 64,
+}
+
+# Cross-job batching of non-streamed LLM requests
+LLM_COALESCE_CONFIG: Dict[str, Any] = {
+    # Requests arriving within this many milliseconds are sent together
+    # (0 sends each request immediately)
+    "window_ms": float(os.getenv("LLM_COALESCE_WINDOW_MS", "0")),
+    "max_batch": int(os.getenv("LLM_COALESCE_MAX_BATCH", "8")),
+    # Requests in flight at once, e.g. llama-server --parallel times endpoints
+    "slots": int(os.getenv("LLM_PARALLEL_SLOTS", "4")),
+}
+
+# Persistent LLM completion cache (used as allowed by the minutes cache_policy)
+LLM_CACHE_CONFIG: Dict[str, Any] = {
+    "path": os.getenv(
+        "LLM_CACHE_PATH", str(PROJECT_ROOT / "artifacts" / "llm_cache.sqlite3")
+    ),
+    # Cached completions older than this are regenerated
+    "ttl_seconds": float(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600))),
+    # Least recently used completions are evicted beyond this size
+    "max_size_mb": float(os.getenv("LLM_CACHE_MAX_MB", "256")),
+}
+
+# Structured tracing of LLM calls to a JSON-lines file
+LLM_TRACE_CONFIG: Dict[str, Any] = {
+    # DEBUG, INFO (every call), ERROR (failed calls only) or OFF
+    "level": os.getenv("LLM_TRACE_LEVEL", "INFO"),
+    # Share of successful calls traced; failed calls are always traced
+    "sample_rate": float(os.getenv("LLM_TRACE_SAMPLE_RATE", "1.0")),
+    "path": os.getenv("LLM_TRACE_PATH", str(PROJECT_ROOT / "logs" / "llm_trace.jsonl")),
+}
+
+# Watch-folder ingestion (``meeting-minutes --watch DIR``)
+WATCH_CONFIG: Dict[str, Any] = {
+    # A file is ready once its size and mtime are unchanged for this long
+    "settle_seconds": float(os.getenv("WATCH_SETTLE_SECONDS", "5")),
+    # Ready files are submitted together after this much quiet time
+    "debounce_seconds": float(os.getenv("WATCH_DEBOUNCE_SECONDS", "10")),
+    "max_batch_size": int(os.getenv("WATCH_MAX_BATCH_SIZE", "10")),
+    "poll_interval": float(os.getenv("WATCH_POLL_INTERVAL", "2")),
+    "recursive": False,
+    "max_parallel_jobs": int(os.getenv("WATCH_MAX_PARALLEL_JOBS", "1")),
+    # Fingerprints of recordings that were already processed
+    "ledger_path": os.getenv(
+        "WATCH_LEDGER_PATH", str(PROJECT_ROOT / "artifacts" / "watch_ledger.jsonl")
+    ),
+}
+
+# Dependency warm-up run concurrently with audio decoding
+WARMUP_CONFIG: Dict[str, Any] = {
+    "enabled": os.getenv("WARMUP_ENABLED", "true").lower() == "true",
+    "timeout": float(os.getenv("WARMUP_TIMEOUT", "60")),
+    # Checks whose failure aborts the job before any transcription is paid for
+    # ("gmail" is only required when drafts bypass the outbox)
+    "required": ["llm_server", "elevenlabs", "gmail"],
+}
+
+# Backpressure between pipeline stages and per-worker memory limits
+BACKPRESSURE_CONFIG: Dict[str, Any] = {
+    # Producers pause while worker RSS is above this many MB (0 disables)
+    "memory_ceiling_mb": float(os.getenv("MEMORY_CEILING_MB", "0")),
+    # Decoded chunks allowed to wait for a free transcription worker
+    "chunk_queue_size": int(os.getenv("CHUNK_QUEUE_SIZE", "2")),
+    # How often paused producers re-check memory
+    "poll_interval": 0.5,
+    # How often a job's memory high-water mark is sampled
+    "sample_interval": float(os.getenv("MEMORY_SAMPLE_INTERVAL", "0.5")),
+}
+
 # Logging Configuration
 LOGGING_CONFIG: Dict[str, Any] = {
     "level": os.getenv("LOG_LEVEL", "INFO"),
@@ -0,0 +1,373 @@
+"""
+Performance profiles for Meeting Minutes Agent.
+
+A profile sets related tuning knobs together (chunk length, speech-to-text
+concurrency, upload codec, LLM path, parallelism, cache policy, streaming,
+request batching, trace sampling, model tiers and draft mode) on top of the
+configuration dicts in ``app_config``. The profile is chosen with
+``--profile``, the ``PERFORMANCE_PROFILE`` environment variable or the
+``profile`` key of a YAML overlay file, which can also tune or add profiles::
+
+    profile: site-default
+    profiles:
+      low-latency:
+        stt_concurrency: 8
+      site-default:
+        extends: low-cost
+        chunk_length_ms: 90000
+"""
+
+import copy
+import os
+import shutil
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import yaml
+
+from .app_config import (
+    API_CONFIG,
+    BACKPRESSURE_CONFIG,
+    GMAIL_CONFIG,
+    LLM_COALESCE_CONFIG,
+    LLM_TIER_CONFIG,
+    LLM_TRACE_CONFIG,
+    PROCESSING_CONFIG,
+    WATCH_CONFIG,
+)
+
+DEFAULT_PROFILE = "balanced"
+UPLOAD_CODECS = ("wav", "flac", "mp3")
+LLM_PATHS = ("crew", "fused")
+CACHE_POLICIES = ("off", "deterministic", "always")
+DRAFT_MODES = ("outbox", "direct", "agent")
+
+
+class ConfigError(ValueError):
+    """Raised when a profile or the effective configuration is invalid."""
+
+
+def _is_int(minimum: int) -> Callable[[Any], bool]:
+    return lambda value: (
+        isinstance(value, int) and not isinstance(value, bool) and value >= minimum
+    )
+
+
+def _is_number(minimum: float, maximum: float = float("inf")) -> Callable:
+    return lambda value: (
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and minimum <= value <= maximum
+    )
+
+
+def _one_of(*choices: Any) -> Callable[[Any], bool]:
+    return lambda value: value in choices
+
+
+# Profile setting -> (config dict, key, validator, description of valid values)
+SETTINGS: Dict[str, Tuple[Dict[str, Any], str, Callable[[Any], bool], str]] = {
+    "chunk_length_ms": (
+        PROCESSING_CONFIG["audio"],
+        "chunk_length_ms",
+        _is_int(1000),
+        "an integer >= 1000",
+    ),
+    "streaming_decode": (
+        PROCESSING_CONFIG["audio"],
+        "streaming_decode",
+        _one_of(True, False),
+        "true or false",
+    ),
+    "upload_codec": (
+        PROCESSING_CONFIG["audio"],
+        "upload_codec",
+        _one_of(*UPLOAD_CODECS),
+        f"one of {', '.join(UPLOAD_CODECS)}",
+    ),
+    "stt_concurrency": (
+        PROCESSING_CONFIG["transcription"],
+        "concurrency",
+        _is_int(1),
+        "an integer >= 1",
+    ),
+    "llm_path": (
+        PROCESSING_CONFIG["minutes"],
+        "llm_path",
+        _one_of(*LLM_PATHS),
+        f"one of {', '.join(LLM_PATHS)}",
+    ),
+    "cache_policy": (
+        PROCESSING_CONFIG["minutes"],
+        "cache_policy",
+        _one_of(*CACHE_POLICIES),
+        f"one of {', '.join(CACHE_POLICIES)}",
+    ),
+    "llm_streaming": (
+        PROCESSING_CONFIG["minutes"],
+        "streaming",
+        _one_of(True, False),
+        "true or false",
+    ),
+    "coalesce_window_ms": (
+        LLM_COALESCE_CONFIG,
+        "window_ms",
+        _is_number(0.0, 10000.0),
+        "a number of milliseconds between 0 and 10000",
+    ),
+    "tiered_models": (
+        LLM_TIER_CONFIG,
+        "enabled",
+        _one_of(True, False),
+        "true or false",
+    ),
+    "trace_sample_rate": (
+        LLM_TRACE_CONFIG,
+        "sample_rate",
+        _is_number(0.0, 1.0),
+        "a number between 0 and 1",
+    ),
+    "draft_mode": (
+        GMAIL_CONFIG,
+        "draft_mode",
+        _one_of(*DRAFT_MODES),
+        f"one of {', '.join(DRAFT_MODES)}",
+    ),
+    "temperature": (
+        API_CONFIG["openai"],
+        "temperature",
+        _is_number(0.0, 2.0),
+        "a number between 0 and 2",
+    ),
+    "max_parallel_jobs": (
+        WATCH_CONFIG,
+        "max_parallel_jobs",
+        _is_int(1),
+        "an integer >= 1",
+    ),
+    "chunk_queue_size": (
+        BACKPRESSURE_CONFIG,
+        "chunk_queue_size",
+        _is_int(0),
+        "an integer >= 0",
+    ),
+    "memory_ceiling_mb": (
+        BACKPRESSURE_CONFIG,
+        "memory_ceiling_mb",
+        _is_number(0.0),
+        "a number >= 0",
+    ),
+}
+
+# Built-in profiles; "balanced" keeps the configured defaults
+PROFILES: Dict[str, Dict[str, Any]] = {
+    "balanced": {},
+    "low-latency": {
+        # Short chunks transcribed in parallel, no encoding step before upload
+        "chunk_length_ms": 30000,
+        "stt_concurrency": 4,
+        "upload_codec": "wav",
+        "chunk_queue_size": 4,
+        # One LLM round trip instead of a multi-agent conversation
+        "llm_path": "fused",
+        "max_parallel_jobs": 4,
+        "cache_policy": "deterministic",
+    },
+    "low-cost": {
+        # Fewer, smaller uploads and as few LLM tokens as possible
+        "chunk_length_ms": 120000,
+        "stt_concurrency": 1,
+        "upload_codec": "mp3",
+        "llm_path": "fused",
+        "temperature": 0.0,
+        "max_parallel_jobs": 1,
+        "cache_policy": "always",
+    },
+    "high-throughput": {
+        # Many jobs at once; their LLM requests are batched onto the
+        # server's parallel slots instead of streamed one by one
+        "stt_concurrency": 2,
+        "llm_path": "fused",
+        "llm_streaming": False,
+        "coalesce_window_ms": 50,
+        # Failed calls are always traced; trace a sample of the rest
+        "trace_sample_rate": 0.1,
+        "temperature": 0.0,
+        "max_parallel_jobs": 8,
+        "cache_policy": "deterministic",
+    },
+    "low-memory": {
+        # Only a couple of short chunks are ever decoded at once
+        "chunk_length_ms": 30000,
+        "streaming_decode": True,
+        "stt_concurrency": 1,
+        "chunk_queue_size": 0,
+        "upload_codec": "wav",
+        "llm_path": "crew",
+        "max_parallel_jobs": 1,
+        "cache_policy": "deterministic",
+    },
+}
+
+_lock = threading.Lock()
+_active: Optional[Dict[str, Any]] = None
+
+
+def load_overlay(path: str) -> Tuple[Optional[str], Dict[str, Dict[str, Any]]]:
+    """
+    Read a YAML profile overlay.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Tuple of (selected profile name or None, profiles by name)
+
+    Raises:
+        ConfigError: If the file cannot be read or is malformed
+    """
+    try:
+        with open(path, encoding="utf-8") as handle:
+            data = yaml.safe_load(handle) or {}
+    except (OSError, yaml.YAMLError) as e:
+        raise ConfigError(f"Cannot read profile file {path}: {e}")
+
+    if not isinstance(data, dict):
+        raise ConfigError(f"Profile file {path} must contain a mapping")
+    unknown = set(data) - {"profile", "profiles"}
+    if unknown:
+        raise ConfigError(
+            f"Unknown keys in profile file {path}: {', '.join(sorted(unknown))}"
+        )
+
+    profiles = data.get("profiles") or {}
+    if not isinstance(profiles, dict) or not all(
+        isinstance(settings, dict) for settings in profiles.values()
+    ):
+        raise ConfigError(f"'profiles' in {path} must map names to settings")
+    return data.get("profile"), profiles
+
+
+def resolve_profile(
+    name: Optional[str] = None, overlay_path: Optional[str] = None
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Work out which profile to use and its settings.
+
+    The name is taken from the argument, then ``PERFORMANCE_PROFILE``, then
+    the overlay's ``profile`` key, then "balanced".
+
+    Args:
+        name: Profile name, e.g. from the command line
+        overlay_path: YAML overlay (defaults to ``PERFORMANCE_PROFILE_FILE``)
+
+    Returns:
+        Tuple of (profile name, settings)
+
+    Raises:
+        ConfigError: If the profile is unknown or its settings are invalid
+    """
+    overlay_path = overlay_path or os.getenv("PERFORMANCE_PROFILE_FILE")
+    profiles = copy.deepcopy(PROFILES)
+    overlay_default = None
+
+    if overlay_path:
+        overlay_default, overlay = load_overlay(overlay_path)
+        for profile_name, settings in overlay.items():
+            settings = dict(settings)
+            base = settings.pop("extends", None)
+            if base is not None:
+                if base not in profiles:
+                    raise ConfigError(
+                        f"Profile {profile_name!r} extends unknown profile {base!r}"
+                    )
+                settings = {**profiles[base], **settings}
+            profiles[profile_name] = {**profiles.get(profile_name, {}), **settings}
+
+    name = name or os.getenv("PERFORMANCE_PROFILE") or overlay_default
+    name = name or DEFAULT_PROFILE
+    if name not in profiles:
+        raise ConfigError(
+            f"Unknown performance profile {name!r}; "
+            f"available: {', '.join(sorted(profiles))}"
+        )
+
+    settings = profiles[name]
+    errors = [
+        f"unknown setting {key!r}" for key in sorted(settings) if key not in SETTINGS
+    ]
+    errors.extend(
+        f"{key} must be {SETTINGS[key][3]} (got {value!r})"
+        for key, value in settings.items()
+        if key in SETTINGS and not SETTINGS[key][2](value)
+    )
+    if errors:
+        raise ConfigError(f"Invalid profile {name!r}: {'; '.join(errors)}")
+    return name, settings
+
+
+def effective_settings() -> Dict[str, Any]:
+    """Return the current value of every profile setting."""
+    return {key: target[field] for key, (target, field, _, _) in SETTINGS.items()}
+
+
+def validate_config() -> None:
+    """
+    Check the effective configuration before any job starts.
+
+    Raises:
+        ConfigError: Listing every invalid setting
+    """
+    errors = [
+        f"{key} must be {description} (got {value!r})"
+        for key, value in effective_settings().items()
+        for _, _, validator, description in [SETTINGS[key]]
+        if not validator(value)
+    ]
+
+    codec = PROCESSING_CONFIG["audio"]["upload_codec"]
+    if codec != "wav" and shutil.which("ffmpeg") is None:
+        errors.append(f"upload_codec {codec!r} requires ffmpeg on the PATH")
+
+    if errors:
+        raise ConfigError("Invalid configuration: " + "; ".join(errors))
+
+
+def activate_profile(
+    name: Optional[str] = None, overlay_path: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Apply a profile to the configuration and validate the result.
+
+    Args:
+        name: Profile name (see resolve_profile for the fallbacks)
+        overlay_path: Optional YAML overlay
+
+    Returns:
+        Description of the active profile, as recorded in job reports
+
+    Raises:
+        ConfigError: If the profile or resulting configuration is invalid
+    """
+    global _active
+
+    name, settings = resolve_profile(name, overlay_path)
+    with _lock:
+        # Profiles are applied to the configured values, not on top of each other
+        for key, value in {**_configured, **settings}.items():
+            target, field, _, _ = SETTINGS[key]
+            target[field] = value
+        validate_config()
+        _active = {"name": name, "settings": effective_settings()}
+    return copy.deepcopy(_active)
+
+
+# Values from app_config and the environment, before any profile was applied
+_configured = effective_settings()
+
+
+def active_profile() -> Dict[str, Any]:
+    """Return the active profile, activating the configured one on first use."""
+    with _lock:
+        active = copy.deepcopy(_active)
+    return active if active is not None else activate_profile()
@@ -0,0 +1,410 @@
+"""
+Durable Gmail draft outbox for Meeting Minutes Agent.
+
+The flow queues the rendered minutes here and finishes; a background worker
+delivers them to Gmail, retrying with an exponential backoff while Gmail is
+unavailable. Each queued draft has an idempotency key derived from its job
+and recipient, so queuing a job twice adds nothing. The key is also the
+message's Message-ID: before retrying a draft whose earlier attempt may have
+reached Gmail, the worker looks for a draft with that Message-ID, so a retry
+never creates a second draft.
+
+Drafts are tracked in SQLite; their rendered messages are files next to the
+database, deleted once delivered.
+"""
+
+import base64
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from meeting_minutes.config.app_config import GMAIL_CONFIG
+from meeting_minutes.utils.logger import setup_logger
+
+from .gmail_utility import (
+    RAW_MESSAGE_LIMIT,
+    _is_retryable,
+    _render_html,
+    authenticate_gmail,
+    create_draft_from_file,
+    create_drafts,
+    find_draft,
+    write_message,
+)
+
+logger = setup_logger(__name__)
+
+QUEUED, DELIVERED, FAILED = "queued", "delivered", "failed"
+# Longest wait between two attempts of a draft
+MAX_BACKOFF_SECONDS = 3600.0
+
+
+def idempotency_key(job_id: str, recipient: Optional[str]) -> str:
+    """
+    Build the key identifying a job's draft to one recipient.
+
+    Args:
+        job_id: Job the minutes belong to
+        recipient: Recipient address (None for a draft without one)
+
+    Returns:
+        Hex digest, stable across processes
+    """
+    encoded = f"{job_id}\n{(recipient or '').strip().lower()}".encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:32]
+
+
+class DraftOutbox:
+    """SQLite-backed queue of Gmail drafts with a background delivery worker."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        service_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.directory = Path(directory or GMAIL_CONFIG["outbox_dir"])
+        self._service_factory = service_factory or authenticate_gmail
+        self._lock = threading.Lock()
+        # One delivery pass at a time, so a draft is never sent twice at once
+        self._delivering = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._passes = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.directory / "outbox.sqlite3"), check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS drafts ("
+                " key TEXT PRIMARY KEY,"
+                " job_id TEXT NOT NULL,"
+                " recipient TEXT NOT NULL,"
+                " message_id TEXT NOT NULL,"
+                " path TEXT NOT NULL,"
+                " status TEXT NOT NULL,"
+                " attempts INTEGER NOT NULL DEFAULT 0,"
+                " next_attempt_at REAL NOT NULL,"
+                " draft_id TEXT,"
+                " error TEXT,"
+                " created_at REAL NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS drafts_due"
+                " ON drafts (status, next_attempt_at)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS drafts_job ON drafts (job_id)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def enqueue(
+        self, job_id: str, minutes: str, attachments: Sequence[str] = ()
+    ) -> List[str]:
+        """
+        Queue a job's minutes as one draft per configured recipient.
+
+        Sender, recipients and subject come from GMAIL_CONFIG. Drafts already
+        queued for the job and recipient are left as they are.
+
+        Args:
+            job_id: Job the minutes belong to
+            minutes: Markdown text of the meeting minutes
+            attachments: Paths of files to attach to every draft
+
+        Returns:
+            The idempotency keys of the job's drafts, one per recipient
+        """
+        sender, subject = GMAIL_CONFIG["sender"], GMAIL_CONFIG["subject"]
+        html = _render_html(minutes)
+        keys = []
+        for to in GMAIL_CONFIG["recipients"] or [None]:
+            key = idempotency_key(job_id, to)
+            keys.append(key)
+            with self._lock:
+                db = self._db()
+                if db.execute("SELECT 1 FROM drafts WHERE key = ?", (key,)).fetchone():
+                    logger.info(f"Draft {key} of job {job_id} is already queued")
+                    continue
+
+            message_id = f"<{key}@meeting-minutes.local>"
+            path = self.directory / f"{key}.eml"
+            # Written in full before the row exists, so a queued draft always
+            # has its message
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    write_message(
+                        handle,
+                        sender,
+                        to,
+                        subject,
+                        minutes,
+                        attachments,
+                        html,
+                        message_id=message_id,
+                    )
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+
+            now = time.time()
+            with self._lock:
+                db = self._db()
+                db.execute(
+                    "INSERT OR IGNORE INTO drafts (key, job_id, recipient,"
+                    " message_id, path, status, next_attempt_at, created_at,"
+                    " updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        job_id,
+                        to or "",
+                        message_id,
+                        str(path),
+                        QUEUED,
+                        now,
+                        now,
+                        now,
+                    ),
+                )
+                db.commit()
+        logger.info(f"Queued {len(keys)} Gmail draft(s) for job {job_id}")
+        self._wake.set()
+        return keys
+
+    def _due(self, limit: int) -> List[Tuple[str, str, str, int]]:
+        with self._lock:
+            return (
+                self._db()
+                .execute(
+                    "SELECT key, message_id, path, attempts FROM drafts"
+                    " WHERE status = ? AND next_attempt_at <= ?"
+                    " ORDER BY created_at LIMIT ?",
+                    (QUEUED, time.time(), limit),
+                )
+                .fetchall()
+            )
+
+    def _update(self, key: str, **fields: Any) -> None:
+        fields["updated_at"] = time.time()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            db = self._db()
+            db.execute(
+                f"UPDATE drafts SET {assignments} WHERE key = ?",
+                (*fields.values(), key),
+            )
+            db.commit()
+
+    def _backoff(self, attempts: int) -> float:
+        delay = GMAIL_CONFIG["outbox_backoff"] * 2 ** max(0, min(attempts - 1, 16))
+        return time.time() + min(delay, MAX_BACKOFF_SECONDS)
+
+    def _delivered(self, key: str, path: str, draft: Dict[str, Any]) -> None:
+        self._update(key, status=DELIVERED, draft_id=draft.get("id"), error=None)
+        Path(path).unlink(missing_ok=True)
+
+    def _failed(self, key: str, attempts: int, error: str, retryable: bool) -> None:
+        if retryable and attempts < GMAIL_CONFIG["outbox_max_attempts"]:
+            logger.warning(f"Draft {key} not delivered (attempt {attempts}): {error}")
+            self._update(key, error=error, next_attempt_at=self._backoff(attempts))
+        else:
+            logger.error(
+                f"Giving up on draft {key} after {attempts} attempt(s): {error}"
+            )
+            self._update(key, status=FAILED, error=error)
+
+    def deliver_due(self) -> int:
+        """
+        Deliver the queued drafts whose next attempt is due.
+
+        Returns:
+            The number of drafts delivered
+        """
+        with self._delivering:
+            rows = self._due(max(1, GMAIL_CONFIG["batch_size"]))
+            if not rows:
+                return 0
+            try:
+                service = self._service_factory()
+            except Exception as e:
+                # Nothing was sent, so no attempt is counted
+                logger.warning(f"Gmail unavailable, {len(rows)} draft(s) wait: {e}")
+                for key, _, _, attempts in rows:
+                    self._update(
+                        key, error=str(e), next_attempt_at=self._backoff(attempts + 1)
+                    )
+                return 0
+
+            delivered = 0
+            inline, uploads = [], []
+            for key, message_id, path, attempts in rows:
+                if attempts:
+                    # The previous attempt may have created the draft before
+                    # failing; never send it again without checking
+                    try:
+                        draft = find_draft(service, "me", message_id)
+                    except Exception as e:
+                        self._update(
+                            key,
+                            error=f"Draft lookup failed: {e}",
+                            next_attempt_at=self._backoff(attempts),
+                        )
+                        continue
+                    if draft is not None:
+                        logger.info(f"Draft {key} was created by an earlier attempt")
+                        self._delivered(key, path, draft)
+                        delivered += 1
+                        continue
+                # Counted before sending, so a crash mid-send is checked too
+                self._update(key, attempts=attempts + 1)
+                row = (key, path, attempts + 1)
+                if os.path.getsize(path) <= RAW_MESSAGE_LIMIT:
+                    inline.append(row)
+                else:
+                    uploads.append(row)
+
+            if inline:
+                bodies = []
+                for _, path, _ in inline:
+                    with open(path, "rb") as handle:
+                        bodies.append(
+                            {"raw": base64.urlsafe_b64encode(handle.read()).decode()}
+                        )
+                # One attempt each: retries happen here, after a lookup
+                results = create_drafts(service, "me", bodies, max_attempts=1)
+                for (key, path, attempts), result in zip(inline, results):
+                    if result["draft"] is not None:
+                        self._delivered(key, path, result["draft"])
+                        delivered += 1
+                    else:
+                        self._failed(
+                            key, attempts, result["error"], result["retryable"]
+                        )
+
+            for key, path, attempts in uploads:
+                try:
+                    with open(path, "rb") as handle:
+                        draft = create_draft_from_file(
+                            service, "me", handle, max_attempts=1
+                        )
+                except Exception as e:
+                    self._failed(key, attempts, str(e), _is_retryable(e))
+                    continue
+                self._delivered(key, path, draft)
+                delivered += 1
+
+            if delivered:
+                logger.info(f"Delivered {delivered} queued Gmail draft(s)")
+            return delivered
+
+    def queued(self, job_id: Optional[str] = None) -> int:
+        """Return the number of drafts waiting for delivery, of one job or all."""
+        query = "SELECT COUNT(*) FROM drafts WHERE status = ?"
+        params: Tuple[Any, ...] = (QUEUED,)
+        if job_id is not None:
+            query += " AND job_id = ?"
+            params += (job_id,)
+        with self._lock:
+            return self._db().execute(query, params).fetchone()[0]
+
+    def job_status(self, job_id: str) -> Dict[str, Any]:
+        """Return a job's draft counts by status and the delivered draft ids."""
+        with self._lock:
+            rows = (
+                self._db()
+                .execute(
+                    "SELECT status, draft_id FROM drafts WHERE job_id = ?"
+                    " ORDER BY created_at",
+                    (job_id,),
+                )
+                .fetchall()
+            )
+        status: Dict[str, Any] = {QUEUED: 0, DELIVERED: 0, FAILED: 0}
+        for state, _ in rows:
+            status[state] += 1
+        status["draft_ids"] = [draft_id for state, draft_id in rows if draft_id]
+        return status
+
+    def _next_wait(self) -> float:
+        with self._lock:
+            row = (
+                self._db()
+                .execute(
+                    "SELECT MIN(next_attempt_at) FROM drafts WHERE status = ?",
+                    (QUEUED,),
+                )
+                .fetchone()
+            )
+        wait = GMAIL_CONFIG["outbox_poll_interval"]
+        if row[0] is not None:
+            wait = min(wait, row[0] - time.time())
+        return max(0.05, wait)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self.deliver_due()
+            except Exception as e:
+                logger.warning(f"Gmail draft delivery pass failed: {e}")
+            with self._passes:
+                self._passes.notify_all()
+            self._wake.wait(self._next_wait())
+
+    def start(self) -> None:
+        """Start the background delivery worker if it is not running."""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._stop.clear()
+            self._worker = threading.Thread(
+                target=self._run, name="gmail-outbox", daemon=True
+            )
+            self._worker.start()
+
+    def flush(self, timeout: float) -> int:
+        """
+        Wait for the queued drafts to be delivered.
+
+        Args:
+            timeout: Seconds to wait at most
+
+        Returns:
+            The number of drafts still queued
+        """
+        self.start()
+        self._wake.set()
+        deadline = time.monotonic() + timeout
+        with self._passes:
+            while True:
+                remaining = self.queued()
+                left = deadline - time.monotonic()
+                if not remaining or left <= 0:
+                    return remaining
+                self._passes.wait(left)
+
+    def stop(self) -> None:
+        """Stop the background delivery worker; queued drafts stay queued."""
+        self._stop.set()
+        self._wake.set()
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.join(timeout=10)
+
+
+# Process-wide outbox shared by all jobs in this worker
+draft_outbox = DraftOutbox()
@@ -1,10 +1,11 @@
-import os
-from typing import Type
+from typing import Optional, Type
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from .gmail_utility import authenticate_gmail, create_draft, create_message
+from meeting_minutes.utils.artifact_store import read_artifact
+
+from .gmail_utility import draft_minutes
 
 # from agentops import record_tool
 
@@ -12,27 +13,34 @@ from .gmail_utility import authenticate_gmail, create_draft, create_message
 class GmailToolInput(BaseModel):
     """Input schema for GmailTool."""
 
-    body: str = Field(..., description="The body of the email to send.")
+    body: Optional[str] = Field(
+        default=None, description="The body of the email to send."
+    )
+    body_ref: Optional[str] = Field(
+        default=None,
+        description="Artifact reference (artifact://...) holding the email body.",
+    )
 
 
 # @record_tool("This is used for gmail draft emails.")
 class GmailTool(BaseTool):
     name: str = "GmailTool"
-    description: str = "Draft Email using the body of the email to send."
+    description: str = (
+        "Draft Email using the body of the email to send, or a body_ref "
+        "artifact reference that holds the body."
+    )
     args_schema: Type[BaseModel] = GmailToolInput
 
-    def _run(self, body: str) -> str:
+    def _run(self, body: Optional[str] = None, body_ref: Optional[str] = None) -> str:
         try:
-            service = authenticate_gmail()
-
-            sender = os.getenv("GMAIL_SENDER")
-            to = os.getenv("GMAIL_RECIPIENT")
-            subject = "Meeting Minutes"
-            message_text = body
+            if body_ref:
+                body = read_artifact(body_ref)
+            if not body:
+                return "Error sending email: either body or body_ref is required"
 
-            message = create_message(sender, to, subject, message_text)
-            draft = create_draft(service, "me", message)
+            drafts = draft_minutes(body)
 
-            return f"Email sent successfully! Draft id: {draft['id']}"
+            ids = ", ".join(draft["id"] for draft in drafts)
+            return f"Email sent successfully! Draft id: {ids}"
         except Exception as e:
             return f"Error sending email: {e}"
@@ -1,17 +1,52 @@
 import base64
+import datetime
+import email.policy
+import functools
+import mimetypes
 import os
-from email.message import EmailMessage
+import tempfile
+import threading
+import time
+import uuid
+from email.message import EmailMessage, MIMEPart
+from typing import Any, Dict, List, Optional, Sequence
 
+import google_auth_httplib2
+import httplib2
 import markdown
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.errors import HttpError
+from googleapiclient.http import BatchHttpRequest, HttpRequest, MediaIoBaseUpload
 
-from meeting_minutes.config.app_config import GOOGLE_OAUTH  # Ensure correct import
+from meeting_minutes.config.app_config import (  # Ensure correct import
+    GMAIL_CONFIG,
+    GOOGLE_OAUTH,
+    TIMEOUT_CONFIG,
+)
+from meeting_minutes.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
 
 SCOPES = ["https://www.googleapis.com/auth/gmail.compose"]
 
+
+class DraftError(RuntimeError):
+    """Raised when drafts could not be created."""
+
+
+# CRLF line endings, as Gmail expects
+MIME_POLICY = email.policy.SMTP
+
+# Messages larger than this are uploaded instead of sent inline as "raw"
+RAW_MESSAGE_LIMIT = 2 * 1024 * 1024
+
+# Per-item statuses worth retrying: rate limiting and server errors
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
 HTML_TEMPLATE = """
     <!DOCTYPE html>
     <html lang="en">
@@ -26,70 +61,239 @@ HTML_TEMPLATE = """
 """
 
 
-def authenticate_gmail():
-    """Shows basic usage of the Gmail API.
-    Returns:
-    service: Authorized Gmail API service instance.
+@functools.lru_cache(maxsize=None)
+def _discovery_document() -> str:
+    """Gmail v1 discovery document shipped with google-api-python-client."""
+    document = get_static_doc("gmail", "v1")
+    if document is None:
+        raise RuntimeError(
+            "google-api-python-client has no bundled Gmail discovery document"
+        )
+    return document
+
+
+class GmailService:
+    """
+    Process-wide Gmail API service with proactively refreshed credentials.
+
+    The service is built once from the bundled discovery document, without
+    a network round trip, and shared by every draft. A background thread
+    refreshes the access token ``refresh_margin`` seconds before it expires
+    and rewrites token.json atomically, so drafts never wait for a refresh.
+    Each request gets its own HTTP connection object, as httplib2's are not
+    thread-safe.
     """
-    # Get the directory where this script is located
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    token_path = os.path.join(current_dir, "token.json")
-    credentials_path = os.path.join(current_dir, "credentials.json")
-
-    creds = None
-    # The file token.json stores the user's access and refresh tokens, and is
-    # created automatically when the authorization flow completes for the first time.
-    if os.path.exists(token_path):
-        creds = Credentials.from_authorized_user_file(token_path, SCOPES)
-    # If there are no (valid) credentials available, let the user log in.
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._creds = None
+        self._service = None
+        self._stop = threading.Event()
+        self._refresher = None
+        self.builds = 0
+        self.refreshes = 0
+
+    # Read on use so a test or profile applied after import takes effect
+    @property
+    def token_path(self) -> str:
+        return GOOGLE_OAUTH["token_path"]
+
+    @property
+    def credentials_path(self) -> str:
+        return GOOGLE_OAUTH["credentials_path"]
+
+    def get(self):
+        """
+        Return the authorized Gmail service, authenticating on first use.
+
+        Returns:
+            service: Authorized Gmail API service instance.
+        """
+        with self._lock:
+            if self._service is None:
+                self._creds = self._load_credentials()
+                endpoint = GMAIL_CONFIG["api_endpoint"]
+                self._service = build_from_document(
+                    _discovery_document(),
+                    credentials=self._creds,
+                    requestBuilder=self._build_request,
+                    client_options={"api_endpoint": endpoint} if endpoint else None,
+                )
+                self.builds += 1
+                self._start_refresher()
+            elif self._needs_refresh():
+                # The background refresh is late, e.g. after the machine slept
+                self._refresh()
+            return self._service
+
+    def _build_request(self, http, *args, **kwargs):
+        timeout = TIMEOUT_CONFIG["requests"]["gmail"] or None
+        http = httplib2.Http(timeout=timeout)
+        # 308 is how resumable uploads acknowledge a chunk, not a redirect
+        http.redirect_codes = http.redirect_codes - {308}
+        authorized = google_auth_httplib2.AuthorizedHttp(self._creds, http=http)
+        return HttpRequest(authorized, *args, **kwargs)
+
+    def _load_credentials(self) -> Credentials:
+        creds = None
+        # The file token.json stores the user's access and refresh tokens, and is
+        # created automatically when the authorization flow completes for the first time.
+        if os.path.exists(self.token_path):
+            creds = Credentials.from_authorized_user_file(self.token_path, SCOPES)
+        if creds and creds.refresh_token and (not creds.valid or self._expiring(creds)):
             creds.refresh(Request())
-        else:
-            if not os.path.exists(credentials_path):
+            self.refreshes += 1
+            self._save(creds)
+        elif not creds or not creds.valid:
+            # If there are no (valid) credentials available, let the user log in.
+            if not os.path.exists(self.credentials_path):
                 raise FileNotFoundError(
-                    f"credentials.json not found at {credentials_path}. "
+                    f"credentials.json not found at {self.credentials_path}. "
                     "Please ensure you have downloaded your OAuth 2.0 credentials "
                     "from Google Cloud Console and placed them in the correct location."
                 )
 
-            flow = InstalledAppFlow.from_client_secrets_file(credentials_path, SCOPES)
-            # Use the configured port from app_config
-            creds = flow.run_local_server(port=GOOGLE_OAUTH["port"])
-        # Save the credentials for the next run
-        with open(token_path, "w") as token:
-            token.write(creds.to_json())
+            flow = InstalledAppFlow.from_client_secrets_file(
+                self.credentials_path, SCOPES
+            )
+            # Use the configured port from app_config; don't wait forever for
+            # a browser consent that never comes
+            oauth_timeout = TIMEOUT_CONFIG["requests"]["oauth"]
+            creds = flow.run_local_server(
+                port=GOOGLE_OAUTH["port"],
+                timeout_seconds=int(oauth_timeout) if oauth_timeout else None,
+            )
+            # Save the credentials for the next run
+            self._save(creds)
+        return creds
+
+    @staticmethod
+    def _seconds_left(creds: Credentials) -> float:
+        if creds.expiry is None:
+            return float("inf")
+        # google-auth keeps expiry as a naive UTC datetime
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        return (creds.expiry - now).total_seconds()
+
+    def _expiring(self, creds: Credentials) -> bool:
+        return self._seconds_left(creds) <= GOOGLE_OAUTH["refresh_margin"]
+
+    def _needs_refresh(self) -> bool:
+        creds = self._creds
+        return bool(
+            creds and creds.refresh_token and (not creds.valid or self._expiring(creds))
+        )
+
+    def _refresh(self) -> None:
+        with self._lock:
+            self._creds.refresh(Request())
+            self.refreshes += 1
+            self._save(self._creds)
+        logger.debug(f"Gmail access token refreshed, valid until {self._creds.expiry}")
+
+    def _save(self, creds: Credentials) -> None:
+        """Replace token.json atomically, so no reader sees a partial file."""
+        directory = os.path.dirname(os.path.abspath(self.token_path))
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=".token-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w") as token:
+                    token.write(creds.to_json())
+                    token.flush()
+                    os.fsync(token.fileno())
+                os.replace(tmp, self.token_path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+    def _start_refresher(self) -> None:
+        if self._refresher is not None or not self._creds.refresh_token:
+            return
+        self._stop.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, name="gmail-token-refresh", daemon=True
+        )
+        self._refresher.start()
 
-    service = build("gmail", "v1", credentials=creds)
-    return service
+    def _refresh_loop(self) -> None:
+        while True:
+            with self._lock:
+                if self._creds is None:
+                    return
+                wait = self._seconds_left(self._creds) - GOOGLE_OAUTH["refresh_margin"]
+            # Wake up again at least every hour, e.g. after the margin changed
+            if self._stop.wait(min(max(wait, 0.0), 3600.0)):
+                return
+            try:
+                with self._lock:
+                    if self._needs_refresh():
+                        self._refresh()
+            except Exception as e:
+                # The next get() refreshes synchronously or reports it
+                logger.warning(f"Background Gmail token refresh failed: {e}")
+                if self._stop.wait(30):
+                    return
 
+    def reset(self) -> None:
+        """Stop the refresher and forget the service, e.g. after a logout."""
+        self._stop.set()
+        refresher, self._refresher = self._refresher, None
+        if refresher is not None:
+            refresher.join(timeout=5)
+        with self._lock:
+            self._creds = None
+            self._service = None
 
-def create_message(sender, to, subject, message_text):
+
+# Process-wide Gmail service shared by all jobs in this worker
+gmail_service = GmailService()
+
+
+def authenticate_gmail():
+    """Shows basic usage of the Gmail API.
+    Returns:
+    service: Authorized Gmail API service instance, shared by all callers.
+    """
+    return gmail_service.get()
+
+
+def _render_html(message_text: str) -> str:
+    md = markdown.Markdown(extensions=["tables", "fenced_code", "nl2br"])
+
+    # Format the HTML content
+    return HTML_TEMPLATE.format(final_email_body=md.convert(message_text))
+
+
+def create_message(sender, to, subject, message_text, html=None, message_id=None):
     """Create a message for an email.
 
+    The message is multipart/alternative: the markdown text as text/plain
+    and its HTML rendering.
+
     Args:
     sender: Email address of the sender.
     to: Email address of the receiver.
     subject: The subject of the email.
     message_text: The text of the email.
+    html: HTML rendering of the text, if already rendered.
+    message_id: Message-ID header, e.g. to find the draft again later.
 
     Returns:
         An object containing a base64url encoded email object.
     """
+    msg = EmailMessage(policy=MIME_POLICY)
 
-    md = markdown.Markdown(extensions=["tables", "fenced_code", "nl2br"])
-
-    # Format the HTML content
-    formatted_html = HTML_TEMPLATE.format(final_email_body=md.convert(message_text))
-
-    msg = EmailMessage()
-    content = formatted_html
-
-    msg["To"] = to
-    msg["From"] = sender
+    # A draft may be saved without a recipient or sender
+    if to:
+        msg["To"] = to
+    if sender:
+        msg["From"] = sender
     msg["Subject"] = subject
-    msg.add_header("Content-Type", "text/html")
-    msg.set_payload(content)
+    if message_id:
+        msg["Message-ID"] = message_id
+    msg.set_content(message_text)
+    msg.add_alternative(html or _render_html(message_text), subtype="html")
 
     encodedMsg = base64.urlsafe_b64encode(msg.as_bytes()).decode()
 
@@ -97,6 +301,119 @@ def create_message(sender, to, subject, message_text):
     return {"raw": encodedMsg}
 
 
+def _fold_headers(headers) -> bytes:
+    return b"".join(
+        MIME_POLICY.header_factory(name, value).fold(policy=MIME_POLICY).encode()
+        for name, value in headers
+        if value
+    )
+
+
+def write_message(
+    handle,
+    sender,
+    to,
+    subject,
+    message_text,
+    attachments=(),
+    html=None,
+    message_id=None,
+):
+    """Write a message with attachments as MIME to a binary file.
+
+    The attachments are read and base64-encoded a chunk at a time, so a
+    large attachment is never held in memory.
+
+    Args:
+    handle: Binary file to write the message to.
+    sender: Email address of the sender.
+    to: Email address of the receiver.
+    subject: The subject of the email.
+    message_text: The text of the email.
+    attachments: Paths of the files to attach.
+    html: HTML rendering of the text, if already rendered.
+    message_id: Message-ID header, e.g. to find the draft again later.
+
+    Returns:
+        The number of bytes written.
+    """
+    boundary = f"===============mm{uuid.uuid4().hex}=="
+    delimiter = f"--{boundary}\r\n".encode()
+    written = handle.write(
+        _fold_headers(
+            [
+                ("From", sender),
+                ("To", to),
+                ("Subject", subject),
+                ("Message-ID", message_id),
+                ("MIME-Version", "1.0"),
+                ("Content-Type", f'multipart/mixed; boundary="{boundary}"'),
+            ]
+        )
+        + b"\r\n"
+    )
+
+    body = MIMEPart(policy=MIME_POLICY)
+    body.set_content(message_text)
+    body.add_alternative(html or _render_html(message_text), subtype="html")
+    written += handle.write(delimiter + body.as_bytes() + b"\r\n")
+
+    for path in attachments:
+        name = os.path.basename(path)
+        content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        written += handle.write(
+            delimiter
+            + _fold_headers(
+                [
+                    ("Content-Type", content_type),
+                    ("Content-Disposition", f'attachment; filename="{name}"'),
+                    ("Content-Transfer-Encoding", "base64"),
+                ]
+            )
+            + b"\r\n"
+        )
+        with open(path, "rb") as source:
+            # Whole 57-byte groups encode to complete 76-character lines
+            while chunk := source.read(57 * 1024):
+                encoded = base64.encodebytes(chunk).replace(b"\n", b"\r\n")
+                written += handle.write(encoded)
+    written += handle.write(f"--{boundary}--\r\n".encode())
+    return written
+
+
+def create_draft_from_file(service, user_id, handle, max_attempts=None):
+    """Create a draft from a MIME message file through the media upload path.
+
+    Messages larger than one upload chunk are sent with a resumable upload,
+    a chunk at a time.
+
+    Args:
+    service: Authorized Gmail API service instance.
+    user_id: User's email address. The special value "me"
+             can be used to indicate the authenticated user.
+    handle: Binary file holding the message, e.g. from write_message.
+    max_attempts: Attempts on server errors (default GMAIL_CONFIG).
+
+    Returns:
+        The created draft.
+    """
+    max_attempts = max(1, max_attempts or GMAIL_CONFIG["max_attempts"])
+    handle.seek(0, os.SEEK_END)
+    size = handle.tell()
+    handle.seek(0)
+    # Resumable upload chunks must be multiples of 256 KiB
+    chunk = max(1, int(GMAIL_CONFIG["upload_chunk_mb"] * 4)) * 256 * 1024
+    media = MediaIoBaseUpload(
+        handle, mimetype="message/rfc822", chunksize=chunk, resumable=size > chunk
+    )
+    return (
+        service.users()
+        .drafts()
+        .create(userId=user_id, body={}, media_body=media)
+        .execute(num_retries=max_attempts - 1)
+    )
+
+
 def create_draft(service, user_id, message_body):
     """Create and insert a draft email.
 
@@ -108,16 +425,250 @@ def create_draft(service, user_id, message_body):
 
     Returns:
         The created draft.
+
+    Raises:
+        HttpError: If Gmail rejected the draft.
+    """
+    draft = (
+        service.users()
+        .drafts()
+        .create(userId=user_id, body={"message": message_body})
+        .execute()
+    )
+    logger.info(f'Draft id: {draft["id"]}')
+    return draft
+
+
+def find_draft(service, user_id, message_id):
+    """Find a draft by the Message-ID header of its message.
+
+    Args:
+    service: Authorized Gmail API service instance.
+    user_id: User's email address. The special value "me"
+             can be used to indicate the authenticated user.
+    message_id: Message-ID header the draft was created with.
+
+    Returns:
+        The draft, or None if there is none.
     """
-    try:
-        draft = (
-            service.users()
-            .drafts()
-            .create(userId=user_id, body={"message": message_body})
-            .execute()
+    response = (
+        service.users()
+        .drafts()
+        .list(userId=user_id, q=f"rfc822msgid:{message_id}", maxResults=1)
+        .execute()
+    )
+    drafts = response.get("drafts") or []
+    return drafts[0] if drafts else None
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, HttpError):
+        if error.resp.status in RETRYABLE_STATUSES:
+            return True
+        # Gmail reports per-user rate limits as 403
+        return error.resp.status == 403 and "rateLimitExceeded" in str(error)
+    # Connection failures and timeouts
+    return isinstance(error, (OSError, httplib2.HttpLib2Error))
+
+
+def _new_batch(service, callback) -> BatchHttpRequest:
+    endpoint = GMAIL_CONFIG["api_endpoint"]
+    if endpoint:
+        # The client library ignores the API endpoint for batch requests
+        batch_uri = f"{endpoint.rstrip('/')}/batch/gmail/v1"
+        return BatchHttpRequest(callback=callback, batch_uri=batch_uri)
+    return service.new_batch_http_request(callback=callback)
+
+
+def _resend_unanswered(service, user_id, indexes, message_ids, results) -> List[int]:
+    """Look up the drafts of a failed batch; return those safe to send again."""
+    resend = []
+    for index in indexes:
+        try:
+            draft = find_draft(service, user_id, message_ids[index])
+        except Exception as error:
+            # Sending it again could duplicate the draft
+            results[index].update(
+                error=f"Could not check whether the draft was created: {error}",
+                retryable=False,
+            )
+            continue
+        if draft is None:
+            resend.append(index)
+        else:
+            results[index].update(draft=draft, error=None, retryable=False)
+    return resend
+
+
+def create_drafts(
+    service,
+    user_id: str,
+    message_bodies: List[Dict[str, Any]],
+    batch_size: Optional[int] = None,
+    max_attempts: Optional[int] = None,
+    message_ids: Optional[Sequence[Optional[str]]] = None,
+) -> List[Dict[str, Any]]:
+    """Create many drafts with as few Gmail batch requests as possible.
+
+    Drafts are sent ``batch_size`` per batch request. Drafts that fail with
+    rate limiting or a server error are retried in the next batch after an
+    exponential backoff; other failures are reported without retrying.
+
+    A batch request that fails as a whole may still have created some of
+    its drafts. Its unanswered drafts are looked up by Message-ID before the
+    next batch and only sent again if Gmail has none; without a Message-ID
+    they are reported as failed rather than risk a duplicate.
+
+    Args:
+    service: Authorized Gmail API service instance.
+    user_id: User's email address. The special value "me"
+             can be used to indicate the authenticated user.
+    message_bodies: Messages as returned by create_message.
+    batch_size: Drafts per batch request (default GMAIL_CONFIG).
+    max_attempts: Attempts per draft (default GMAIL_CONFIG).
+    message_ids: Message-ID header of each message, if it has one.
+
+    Returns:
+        For each message, in order, a dict with the created ``draft`` (None
+        on failure), the ``error`` message (None on success), the number
+        of ``attempts`` made and whether the last error was ``retryable``.
+    """
+    batch_size = max(1, min(100, batch_size or GMAIL_CONFIG["batch_size"]))
+    max_attempts = max(1, max_attempts or GMAIL_CONFIG["max_attempts"])
+    message_ids = message_ids or [None] * len(message_bodies)
+    results = [
+        {"draft": None, "error": None, "attempts": 0, "retryable": False}
+        for _ in message_bodies
+    ]
+    pending = list(range(len(message_bodies)))
+    # Drafts of failed batches that Gmail may have created anyway
+    unanswered = []
+    batches = 0
+
+    for attempt in range(1, max_attempts + 1):
+        if attempt > 1 and (pending or unanswered):
+            time.sleep(GMAIL_CONFIG["retry_backoff"] * 2 ** (attempt - 2))
+        if unanswered:
+            pending = sorted(
+                pending
+                + _resend_unanswered(service, user_id, unanswered, message_ids, results)
+            )
+            unanswered = []
+        if not pending:
+            break
+        retry = []
+
+        def on_response(request_id, response, exception):
+            index = int(request_id)
+            results[index]["attempts"] = attempt
+            if exception is None:
+                results[index].update(draft=response, error=None, retryable=False)
+                return
+            retryable = _is_retryable(exception)
+            results[index].update(error=str(exception), retryable=retryable)
+            if retryable:
+                retry.append(index)
+
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start : start + batch_size]
+            batch = _new_batch(service, on_response)
+            for index in chunk:
+                batch.add(
+                    service.users()
+                    .drafts()
+                    .create(userId=user_id, body={"message": message_bodies[index]}),
+                    request_id=str(index),
+                )
+            batches += 1
+            try:
+                batch.execute()
+            except Exception as error:
+                # Gmail may have created drafts whose replies never arrived
+                answered = {i for i in chunk if results[i]["attempts"] == attempt}
+                retryable = _is_retryable(error)
+                for index in chunk:
+                    if index in answered:
+                        continue
+                    results[index].update(
+                        attempts=attempt, error=str(error), retryable=retryable
+                    )
+                    if not retryable:
+                        continue
+                    if message_ids[index]:
+                        unanswered.append(index)
+                    else:
+                        results[index].update(
+                            error=f"{error} (the draft may have been created)",
+                            retryable=False,
+                        )
+        pending = sorted(retry)
+
+    if unanswered:
+        # Out of attempts: report the drafts the last batch did create
+        _resend_unanswered(service, user_id, unanswered, message_ids, results)
+
+    failed = sum(result["draft"] is None for result in results)
+    logger.info(
+        f"Created {len(results) - failed} of {len(results)} drafts "
+        f"in {batches} batch request(s)"
+    )
+    return results
+
+
+def draft_minutes(
+    minutes: str, service=None, attachments: Sequence[str] = ()
+) -> List[Dict[str, Any]]:
+    """Draft the meeting minutes to every configured recipient.
+
+    Sender, recipients and subject come from GMAIL_CONFIG. Plain drafts are
+    created together in batch requests; drafts with attachments, or minutes
+    too large to send inline, are written to a temporary file and uploaded.
+
+    Args:
+    minutes: Markdown text of the meeting minutes.
+    service: Authorized Gmail API service instance (default: the shared one).
+    attachments: Paths of files to attach to every draft.
+
+    Returns:
+        The created drafts, one per recipient.
+
+    Raises:
+        DraftError: If any draft could not be created.
+    """
+    service = service or authenticate_gmail()
+    recipients = GMAIL_CONFIG["recipients"] or [None]
+    sender, subject = GMAIL_CONFIG["sender"], GMAIL_CONFIG["subject"]
+    html = _render_html(minutes)
+
+    if attachments or len(minutes) + len(html) > RAW_MESSAGE_LIMIT:
+        results = []
+        for to in recipients:
+            with tempfile.TemporaryFile(suffix=".eml") as handle:
+                write_message(handle, sender, to, subject, minutes, attachments, html)
+                try:
+                    draft = create_draft_from_file(service, "me", handle)
+                    results.append({"draft": draft, "error": None})
+                except Exception as error:
+                    results.append({"draft": None, "error": str(error)})
+    else:
+        # Lets a batch that fails without a reply be checked before a retry
+        message_ids = [
+            f"<{uuid.uuid4().hex}@meeting-minutes.local>" for _ in recipients
+        ]
+        messages = [
+            create_message(sender, to, subject, minutes, html, message_id=message_id)
+            for to, message_id in zip(recipients, message_ids)
+        ]
+        results = create_drafts(service, "me", messages, message_ids=message_ids)
+
+    failures = [
+        f"{to or 'draft'}: {result['error']}"
+        for to, result in zip(recipients, results)
+        if result["draft"] is None
+    ]
+    if failures:
+        raise DraftError(
+            f"Could not create {len(failures)} of {len(results)} drafts "
+            f"({'; '.join(failures)})"
         )
-        print(f'Draft id: {draft["id"]}\nDraft message: {draft["message"]}')
-        return draft
-    except Exception as error:
-        print(f"An error occurred: {error}")
-        return None
+    return [result["draft"] for result in results]
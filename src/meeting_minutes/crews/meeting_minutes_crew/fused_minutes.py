@@ -0,0 +1,139 @@
+"""
+Single-prompt meeting minutes generation for Meeting Minutes Agent.
+
+The "fused" LLM path asks the model for the summary, action items, sentiment
+and final minutes in one completion, instead of running the summarizer and
+writer agents through several tool-using iterations.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+from meeting_minutes.crews.meeting_minutes_crew.transcript_segments import (
+    fit_transcript,
+)
+from meeting_minutes.utils.context_budget import estimate_messages_tokens
+from meeting_minutes.utils.llm_config import get_llm
+from meeting_minutes.utils.logger import setup_logger
+from meeting_minutes.utils.prompt_layout import tag_variable
+
+logger = setup_logger(__name__)
+
+# Section keys in the order the model is asked to write them
+SECTIONS = {
+    "summary": "SUMMARY",
+    "action_items": "ACTION ITEMS",
+    "sentiment": "SENTIMENT",
+    "minutes": "MINUTES",
+}
+
+_TASKS_PATH = Path(__file__).parent / "config" / "tasks.yaml"
+_HEADER_PATTERN = re.compile(
+    r"^=== (" + "|".join(SECTIONS.values()) + r") ===\s*$", re.MULTILINE
+)
+
+_INSTRUCTIONS = """You turn meeting transcripts into meeting minutes.
+Answer with exactly these four sections, each starting with its header line:
+
+=== SUMMARY ===
+A concise abstract paragraph with the key points of the discussion.
+
+=== ACTION ITEMS ===
+The action items, one per line, formatted as "- Action item".
+
+=== SENTIMENT ===
+Whether the overall sentiment is positive, negative or neutral, with a brief
+explanation based on the tone and language used.
+
+=== MINUTES ===
+The meeting minutes as a markdown document built from the sections above.
+{writing_instructions}"""
+
+
+def section_header(key: str) -> str:
+    """
+    Return the header line that starts a section of a fused completion.
+
+    Args:
+        key: Section key (summary, action_items, sentiment or minutes)
+    """
+    return f"=== {SECTIONS[key]} ==="
+
+
+def build_messages(transcript: str) -> List[Tuple[str, str]]:
+    """
+    Build the chat messages for a fused minutes completion.
+
+    The meeting details (company, organizer, location) come from the writing
+    task in ``tasks.yaml`` so both LLM paths describe the meeting the same way.
+
+    Args:
+        transcript: Full meeting transcript
+
+    Returns:
+        List of (role, content) messages
+    """
+    with open(_TASKS_PATH, encoding="utf-8") as handle:
+        tasks = yaml.safe_load(handle)
+    writing_instructions = tasks["meeting_minutes_writing_task"]["description"]
+
+    return [
+        (
+            "system",
+            _INSTRUCTIONS.format(writing_instructions=writing_instructions.strip()),
+        ),
+        # The transcript comes last so the prompt above it is a cacheable prefix
+        ("human", f"Meeting transcript:\n{tag_variable(transcript)}"),
+    ]
+
+
+def parse_sections(text: str) -> Dict[str, str]:
+    """
+    Split a fused completion into its sections.
+
+    Args:
+        text: Model output
+
+    Returns:
+        Dictionary keyed by section (summary, action_items, sentiment,
+        minutes). If the model ignored the format, the whole output is
+        returned as the minutes.
+    """
+    keys = {header: key for key, header in SECTIONS.items()}
+    parts = _HEADER_PATTERN.split(text)
+    # parts = [preamble, header, body, header, body, ...]
+    sections = {
+        keys[header]: body.strip() for header, body in zip(parts[1::2], parts[2::2])
+    }
+
+    if not sections.get("minutes"):
+        logger.warning("Fused completion had no minutes section; using full output")
+        sections["minutes"] = text.strip()
+    return sections
+
+
+def generate_fused_minutes(transcript: str, llm: Optional[object] = None) -> Dict:
+    """
+    Generate summary, action items, sentiment and minutes with one LLM call.
+
+    A transcript too long for the model's context window is first condensed
+    segment by segment (see transcript_segments), one extra call per segment
+    on the fast model tier.
+
+    Args:
+        transcript: Full meeting transcript
+        llm: Chat model to use for every call (defaults to the large tier
+            for the minutes and the fast tier for condensing)
+
+    Returns:
+        Dictionary of section texts, see parse_sections
+    """
+    transcript = fit_transcript(
+        transcript, estimate_messages_tokens(build_messages("")), llm
+    )
+    llm = llm or get_llm("large")
+    response = llm.invoke(build_messages(transcript))
+    return parse_sections(getattr(response, "content", str(response)))
@@ -10,18 +10,28 @@ from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai_tools import FileWriterTool
 
+from meeting_minutes.config.app_config import PROCESSING_CONFIG
+
 # Import the agent factory
 from meeting_minutes.utils.llm_agent_factory import create_agent_from_config
 from meeting_minutes.utils.llm_config import get_llm
 
+# Directory and file names the summarizer writes its artifacts to
+OUTPUT_DIR = "meeting_minutes_text"
+ARTIFACT_FILES = {
+    "summary": "summary.txt",
+    "action_items": "action_items.txt",
+    "sentiment": "sentiment.txt",
+}
+
 file_writer_tool_summary = FileWriterTool(
-    file_name="summary.txt", directory="meeting_minutes_text"
+    file_name=ARTIFACT_FILES["summary"], directory=OUTPUT_DIR
 )
 file_writer_tool_action_items = FileWriterTool(
-    file_name="action_items.txt", directory="meeting_minutes_text"
+    file_name=ARTIFACT_FILES["action_items"], directory=OUTPUT_DIR
 )
 file_writer_tool_sentiment = FileWriterTool(
-    file_name="sentiment.txt", directory="meeting_minutes_text"
+    file_name=ARTIFACT_FILES["sentiment"], directory=OUTPUT_DIR
 )
 
 
@@ -70,4 +80,5 @@ class MeetingMinutesCrew:
             tasks=self.tasks,
             process=Process.sequential,
             verbose=True,
+            cache=PROCESSING_CONFIG["minutes"]["cache_policy"] != "off",
         )
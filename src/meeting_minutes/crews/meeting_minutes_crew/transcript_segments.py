@@ -0,0 +1,160 @@
+"""
+Transcripts longer than the model's context window for Meeting Minutes Agent.
+
+A transcript that does not fit one prompt next to its instructions is split
+into the fewest segments that do. Each segment is condensed into notes with
+one LLM call (the calls run in parallel, so the server can batch them) and
+the notes stand in for the transcript in the minutes prompts. Transcripts
+that fit are passed through unchanged, at no extra LLM call.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import yaml
+
+from meeting_minutes.config.app_config import LLM_COALESCE_CONFIG
+from meeting_minutes.utils.context_budget import (
+    ContextOverflowError,
+    context_budget,
+    estimate_messages_tokens,
+    estimate_tokens,
+)
+from meeting_minutes.utils.llm_config import get_llm
+from meeting_minutes.utils.logger import setup_logger
+from meeting_minutes.utils.prompt_layout import tag_variable
+from meeting_minutes.utils.token_stream import stream_tokens_to
+
+logger = setup_logger(__name__)
+
+_CONFIG_DIR = Path(__file__).parent / "config"
+
+# CrewAI's tool descriptions and answer format around the task prompt
+_CREW_FRAMEWORK_TOKENS = 1000
+
+# Condensing rounds before giving up on a transcript (notes of a very long
+# transcript may themselves need condensing once more)
+MAX_ROUNDS = 3
+
+_NOTES_INSTRUCTIONS = """You condense one part of a long meeting transcript \
+into notes for whoever writes the meeting minutes.
+Keep every decision, action item with its owner and due date, figure and open
+question, and the names of the speakers. Answer with the notes only."""
+
+
+def notes_messages(segment: str, part: int, parts: int) -> List[Tuple[str, str]]:
+    """
+    Build the chat messages that condense one transcript segment.
+
+    Args:
+        segment: Part of the transcript
+        part: 1-based number of the segment
+        parts: Number of segments
+
+    Returns:
+        List of (role, content) messages
+    """
+    return [
+        ("system", _NOTES_INSTRUCTIONS),
+        (
+            "human",
+            f"Part {part} of {parts} of the meeting transcript:\n"
+            f"{tag_variable(segment)}",
+        ),
+    ]
+
+
+def crew_prompt_tokens() -> int:
+    """
+    Estimate the summarizer agent's prompt without the transcript.
+
+    Returns:
+        Estimated tokens of the agent and task prompts and CrewAI's framing
+    """
+    with open(_CONFIG_DIR / "agents.yaml", encoding="utf-8") as handle:
+        agent = yaml.safe_load(handle)["meeting_minutes_summarizer"]
+    with open(_CONFIG_DIR / "tasks.yaml", encoding="utf-8") as handle:
+        task = yaml.safe_load(handle)["meeting_minutes_summary_task"]
+    prompt = " ".join(
+        [agent["role"], agent["goal"], agent["backstory"]]
+        + [task["description"].replace("{transcript}", ""), task["expected_output"]]
+    )
+    return estimate_tokens(prompt) + _CREW_FRAMEWORK_TOKENS
+
+
+def fit_transcript(
+    transcript: str, reserved_tokens: int, llm: Optional[object] = None
+) -> str:
+    """
+    Return the transcript, or notes condensed from it, fitting one prompt.
+
+    Args:
+        transcript: Full meeting transcript
+        reserved_tokens: Tokens of the prompt the transcript is inserted in
+        llm: Chat model for the notes (defaults to the fast tier)
+
+    Returns:
+        The transcript if it fits, otherwise the notes on its segments
+
+    Raises:
+        ContextOverflowError: If the prompt leaves no room for a transcript,
+            or the notes still don't fit after MAX_ROUNDS rounds
+    """
+    # Segments must fit the notes prompt as well as the minutes prompt
+    reserved_tokens = max(
+        reserved_tokens, estimate_messages_tokens(notes_messages("", 1, 1))
+    )
+    for condensed in range(MAX_ROUNDS + 1):
+        segments = context_budget.split(transcript, reserved_tokens)
+        if len(segments) <= 1:
+            return transcript
+        if condensed == MAX_ROUNDS:
+            break
+        logger.info(
+            f"Transcript of about {estimate_tokens(transcript)} tokens exceeds "
+            f"the context window; condensing it in {len(segments)} segments"
+        )
+        notes = condense_segments(segments, llm)
+        transcript = "\n\n".join(
+            f"Notes on part {part} of {len(notes)}:\n{text}"
+            for part, text in enumerate(notes, 1)
+        )
+    raise ContextOverflowError(
+        f"Transcript notes still exceed the context window after {MAX_ROUNDS} "
+        "rounds of condensing"
+    )
+
+
+def condense_segments(segments: List[str], llm: Optional[object] = None) -> List[str]:
+    """
+    Condense transcript segments into notes, one LLM call each.
+
+    The notes are intermediate results, so their tokens are not streamed to
+    the job's output.
+
+    Args:
+        segments: Transcript segments in order
+        llm: Chat model to use (defaults to the fast tier)
+
+    Returns:
+        Notes for each segment, in order
+    """
+    llm = llm or get_llm("fast")
+
+    def condense(part: int, segment: str) -> str:
+        with stream_tokens_to(None):
+            response = llm.invoke(notes_messages(segment, part, len(segments)))
+        return getattr(response, "content", str(response)).strip()
+
+    workers = max(1, min(len(segments), LLM_COALESCE_CONFIG["slots"]))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="llm-segment"
+    ) as executor:
+        # Each call runs in the caller's context (cancellation token, job id)
+        futures = [
+            executor.submit(contextvars.copy_context().run, condense, part, segment)
+            for part, segment in enumerate(segments, 1)
+        ]
+        return [future.result() for future in futures]
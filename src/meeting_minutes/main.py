@@ -16,7 +16,16 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+import argparse
+import json
+import signal
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator, List, Optional
 
 from crewai.flow.flow import Flow, listen, start
 from elevenlabs import ElevenLabs
@@ -29,13 +38,73 @@ from meeting_minutes.utils.monkey_patches import apply_monkey_patches
 
 apply_monkey_patches()
 
-from meeting_minutes.config.app_config import API_CONFIG, validate_environment
+from meeting_minutes.config.app_config import (
+    API_CONFIG,
+    GMAIL_CONFIG,
+    PROCESSING_CONFIG,
+    TIMEOUT_CONFIG,
+    WARMUP_CONFIG,
+    WATCH_CONFIG,
+    validate_environment,
+)
+from meeting_minutes.config.profiles import (
+    PROFILES,
+    ConfigError,
+    activate_profile,
+    active_profile,
+)
 from meeting_minutes.crews.gmailcrew.gmailcrew import GmailCrew
+from meeting_minutes.crews.gmailcrew.tools.draft_outbox import draft_outbox
+from meeting_minutes.crews.gmailcrew.tools.gmail_utility import (
+    authenticate_gmail,
+    draft_minutes,
+)
+from meeting_minutes.crews.meeting_minutes_crew.fused_minutes import (
+    generate_fused_minutes,
+    section_header,
+)
 from meeting_minutes.crews.meeting_minutes_crew.meeting_minutes_crew import (
+    ARTIFACT_FILES,
+    OUTPUT_DIR,
     MeetingMinutesCrew,
 )
+from meeting_minutes.crews.meeting_minutes_crew.transcript_segments import (
+    crew_prompt_tokens,
+    fit_transcript,
+)
+from meeting_minutes.utils.artifact_store import ArtifactStore, read_artifact
 from meeting_minutes.utils.audio_processor import AudioProcessor
+from meeting_minutes.utils.backpressure import (
+    JobMemoryMonitor,
+    bounded_map,
+    memory_governor,
+)
+from meeting_minutes.utils.cancellation import (
+    CancellationToken,
+    Deadline,
+    JobCancelledError,
+    StageTimeoutError,
+    cancel_job,
+    job_registry,
+    reset_current_token,
+    run_cancellable,
+    set_current_token,
+)
+from meeting_minutes.utils.completion_cache import completion_cache
+from meeting_minutes.utils.context_budget import context_budget
+from meeting_minutes.utils.endpoint_pool import endpoint_pool
+from meeting_minutes.utils.events import EventType, ProgressEvent, event_bus
+from meeting_minutes.utils.folder_watcher import FolderWatcher
+from meeting_minutes.utils.llm_clients import llm_client_registry
 from meeting_minutes.utils.logger import setup_logger
+from meeting_minutes.utils.model_tiers import model_tiers
+from meeting_minutes.utils.request_coalescer import request_coalescer
+from meeting_minutes.utils.token_stream import (
+    TokenGate,
+    stream_metrics,
+    stream_tokens_to,
+)
+from meeting_minutes.utils.warmup import Warmup, check_llm_server
 
 # Initialize logger
 logger = setup_logger(__name__)
@@ -47,13 +116,25 @@ if not eleven_api_key:
     raise ValueError("ElevenLabs API key is required")
 
 eleven_labs = ElevenLabs(api_key=eleven_api_key)
-audio_processor = AudioProcessor()
+
+# Artifact names within a job's ArtifactStore
+TRANSCRIPT_ARTIFACT = "transcript.txt"
+MINUTES_ARTIFACT = "meeting_minutes.md"
+CHECKPOINT_ARTIFACT = "checkpoint.json"
+REPORT_ARTIFACT = "report.json"
+AUDIO_EXCERPT_ARTIFACT = "audio_excerpt.mp3"
 
 
 class MeetingMinutesState(BaseModel):
-    transcript: str = ""
-    meeting_minutes: str = ""
+    job_id: str = ""
+    audio_path: str = ""
+    stage: str = ""
+    # Handles into the job's ArtifactStore; the payloads themselves live on disk
+    transcript_ref: str = ""
+    meeting_minutes_ref: str = ""
     audio_info: dict = {}
+    # Per-stage measurements written to the job report
+    report: dict = {}
 
 
 class MeetingMinutesFlow(Flow[MeetingMinutesState]):
@@ -61,9 +142,18 @@ class MeetingMinutesFlow(Flow[MeetingMinutesState]):
     def transcribe_meeting(self):
         """Transcribe meeting audio using ElevenLabs API."""
         logger.info("Starting meeting transcription")
+        self.state.job_id = self.state.job_id or uuid.uuid4().hex
+        self.state.stage = "transcription"
+        token = self._cancellation_token()
+        deadline = Deadline(TIMEOUT_CONFIG["stages"]["transcription"], "transcription")
+        request_timeout = TIMEOUT_CONFIG["requests"]["elevenlabs"] or None
+
+        # Built per job so it picks up the active performance profile
+        audio_processor = AudioProcessor()
 
         SCRIPT_DIR = Path(__file__).parent
-        audio_path = str(SCRIPT_DIR / "EarningsCall.wav")
+        audio_path = self.state.audio_path or str(SCRIPT_DIR / "EarningsCall.wav")
+        self._publish(EventType.STARTED, {"audio_path": audio_path})
 
         # Validate audio file
         if not audio_processor.validate_audio_file(audio_path):
@@ -71,6 +161,9 @@ class MeetingMinutesFlow(Flow[MeetingMinutesState]):
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
 
+        # Set up external services while the audio is probed and decoded
+        warmup = self._start_warmup()
+
         # Get audio information
         audio_info = audio_processor.get_audio_info(audio_path)
         self.state.audio_info = audio_info
@@ -78,78 +171,150 @@ class MeetingMinutesFlow(Flow[MeetingMinutesState]):
             f"Processing audio: {audio_info.get('duration_formatted', 'unknown')} duration"
         )
 
-        # Process audio in chunks
-        full_transcription = ""
+        # Fail fast before any paid transcription if a dependency is down
+        warmup.wait()
+
+        # Decode, upload and transcribe chunks through a bounded pipeline,
+        # appending each chunk to the transcript artifact in order
+        store = ArtifactStore(self.state.job_id)
+        concurrency = PROCESSING_CONFIG["transcription"]["concurrency"]
+        estimated_chunks = audio_info.get("estimated_chunks", "?")
+        pipeline_stats = {}
+        transcript_length = 0
         chunk_count = 0
         failed_chunks = 0
 
-        try:
-            for chunk_index, audio_data in audio_processor.chunk_generator(audio_path):
-                chunk_count += 1
-                logger.info(
-                    f"Transcribing chunk {chunk_count}/{audio_info.get('estimated_chunks', '?')}"
-                )
+        def transcribe_chunk(chunk):
+            chunk_index, audio_data = chunk
+            logger.info(f"Transcribing chunk {chunk_index + 1}/{estimated_chunks}")
+            return run_cancellable(
+                eleven_labs.speech_to_text.convert,
+                token=token,
+                timeout=deadline.cap(request_timeout),
+                description=f"transcription of chunk {chunk_index + 1}",
+                file=audio_data,
+                model_id=API_CONFIG["elevenlabs"]["model_id"],
+                tag_audio_events=API_CONFIG["elevenlabs"]["tag_audio_events"],
+                diarize=API_CONFIG["elevenlabs"]["diarize"],
+                request_options=(
+                    {"timeout_in_seconds": int(request_timeout)}
+                    if request_timeout
+                    else None
+                ),
+            )
 
-                try:
-                    # Use ElevenLabs for transcription
-                    transcription = eleven_labs.speech_to_text.convert(
-                        file=audio_data,
-                        model_id=API_CONFIG["elevenlabs"]["model_id"],
-                        tag_audio_events=API_CONFIG["elevenlabs"]["tag_audio_events"],
-                        diarize=API_CONFIG["elevenlabs"]["diarize"],
-                    )
+        try:
+            with store.open_writer(TRANSCRIPT_ARTIFACT) as transcript_file:
+                for (chunk_index, _), transcription, error in bounded_map(
+                    transcribe_chunk,
+                    audio_processor.chunk_generator(audio_path),
+                    workers=concurrency,
+                    token=token,
+                    stats=pipeline_stats,
+                ):
+                    deadline.check()
+                    chunk_count += 1
+
+                    if error is not None:
+                        failed_chunks += 1
+                        logger.error(
+                            f"Failed to transcribe chunk {chunk_index + 1}: {error}"
+                        )
+                        # Continue with next chunk
+                        continue
 
                     chunk_text = transcription.text.strip()
                     if chunk_text:
-                        full_transcription += chunk_text + " "
+                        if transcript_length:
+                            transcript_file.write(" ")
+                            transcript_length += 1
+                        transcript_file.write(chunk_text)
+                        transcript_length += len(chunk_text)
                         logger.debug(
-                            f"Chunk {chunk_count} transcribed: {len(chunk_text)} characters"
+                            f"Chunk {chunk_index + 1} transcribed: {len(chunk_text)} characters"
+                        )
+                        self._publish(
+                            EventType.TRANSCRIPT_CHUNK,
+                            {"index": chunk_index, "text": chunk_text},
                         )
 
-                except Exception as e:
-                    failed_chunks += 1
-                    logger.error(f"Failed to transcribe chunk {chunk_count}: {e}")
-                    # Continue with next chunk
-                    continue
+                deadline.check()
 
         except Exception as e:
             logger.error(f"Fatal error during transcription: {e}")
             raise
 
-        # Finalize transcription
-        self.state.transcript = full_transcription.strip()
-
         logger.info(f"Transcription completed:")
         logger.info(f"  - Total chunks: {chunk_count}")
         logger.info(f"  - Failed chunks: {failed_chunks}")
-        logger.info(f"  - Transcript length: {len(self.state.transcript)} characters")
+        logger.info(f"  - Transcript length: {transcript_length} characters")
 
-        if not self.state.transcript:
+        if not transcript_length:
             raise ValueError("No transcription generated from audio file")
 
+        self.state.transcript_ref = store.ref(TRANSCRIPT_ARTIFACT)
+        self.state.report["transcription"] = {
+            "chunks": chunk_count,
+            "failed_chunks": failed_chunks,
+            "concurrency": concurrency,
+            "max_chunks_in_flight": pipeline_stats["max_in_flight"],
+            "memory_paused_seconds": round(pipeline_stats["paused_seconds"], 3),
+        }
+
+        self._publish(
+            EventType.TRANSCRIPT,
+            {
+                "ref": self.state.transcript_ref,
+                "chunks": chunk_count,
+                "failed_chunks": failed_chunks,
+            },
+        )
+
     @listen(transcribe_meeting)
     def generate_meeting_minutes(self):
         """Generate structured meeting minutes from transcript."""
         logger.info("Generating meeting minutes")
+        self.state.stage = "minutes"
 
-        if not self.state.transcript:
+        if not self.state.transcript_ref:
             logger.error("No transcript available for meeting minutes generation")
             raise ValueError("Transcript is required for meeting minutes generation")
 
         try:
-            crew = MeetingMinutesCrew()
-
-            inputs = {
-                "transcript": self.state.transcript,
-                "audio_info": self.state.audio_info,
+            store = ArtifactStore(self.state.job_id)
+            token = self._cancellation_token()
+            llm_path = PROCESSING_CONFIG["minutes"]["llm_path"]
+            # The LLM prompt is the only place the full transcript is needed
+            transcript = store.read_text(self.state.transcript_ref)
+
+            logger.info(f"Starting meeting minutes generation ({llm_path} path)")
+            # Wait for memory held by other jobs' stages before loading the LLM stage
+            with (
+                memory_governor.reserve(token) as paused,
+                self._streamed_tokens(store) as minutes_tokens,
+            ):
+                if llm_path == "fused":
+                    # One completion writes every section; stream only the minutes
+                    if minutes_tokens is not None:
+                        minutes_tokens.open_after(section_header("minutes"))
+                    meeting_minutes = self._fused_minutes(transcript, token, store)
+                else:
+                    meeting_minutes = self._crew_minutes(
+                        transcript, token, store, minutes_tokens
+                    )
+            del transcript
+            self.state.report["minutes"] = {
+                "llm_path": llm_path,
+                "memory_paused_seconds": round(paused, 3),
             }
 
-            logger.info("Starting CrewAI meeting minutes generation")
-            meeting_minutes = crew.crew().kickoff(inputs)
-
-            self.state.meeting_minutes = str(meeting_minutes)
-            logger.info(
-                f"Meeting minutes generated: {len(self.state.meeting_minutes)} characters"
+            self.state.meeting_minutes_ref = store.put_text(
+                MINUTES_ARTIFACT, meeting_minutes
+            )
+            logger.info(f"Meeting minutes generated: {len(meeting_minutes)} characters")
+            self._publish(
+                EventType.MINUTES,
+                {"text": meeting_minutes, "ref": self.state.meeting_minutes_ref},
             )
 
         except Exception as e:
@@ -160,37 +325,375 @@ class MeetingMinutesFlow(Flow[MeetingMinutesState]):
     def create_draft_meeting_minutes(self):
         """Create Gmail draft with meeting minutes."""
         logger.info("Creating Gmail draft")
+        self.state.stage = "draft"
 
-        if not self.state.meeting_minutes:
+        if not self.state.meeting_minutes_ref:
             logger.error("No meeting minutes available for draft creation")
             raise ValueError("Meeting minutes are required for draft creation")
 
         try:
-            crew = GmailCrew()
-
-            inputs = {
-                "body": str(self.state.meeting_minutes),
-                "audio_info": self.state.audio_info,
-            }
-
-            logger.info("Starting Gmail draft creation")
-            draft_result = crew.crew().kickoff(inputs)
+            if GMAIL_CONFIG["draft_mode"] == "agent":
+                draft_result = self._agent_draft()
+            elif GMAIL_CONFIG["draft_mode"] == "outbox":
+                # Delivered in the background; a Gmail outage no longer
+                # fails the job after the minutes exist
+                keys = draft_outbox.enqueue(
+                    self.state.job_id,
+                    read_artifact(self.state.meeting_minutes_ref),
+                    attachments=self._draft_attachments(),
+                )
+                draft_outbox.start()
+                draft_result = f"Queued {len(keys)} draft(s) for delivery"
+            else:
+                # The minutes go into the draft as they are, without an LLM
+                logger.info("Creating Gmail draft directly")
+                drafts = run_cancellable(
+                    draft_minutes,
+                    read_artifact(self.state.meeting_minutes_ref),
+                    attachments=self._draft_attachments(),
+                    token=self._cancellation_token(),
+                    timeout=TIMEOUT_CONFIG["stages"]["draft"] or None,
+                    description="Gmail draft",
+                )
+                draft_result = f"Draft id: {', '.join(d['id'] for d in drafts)}"
 
             logger.info(f"Gmail draft created successfully: {draft_result}")
+            self._publish(EventType.DRAFT, {"result": str(draft_result)})
 
         except Exception as e:
             logger.error(f"Failed to create Gmail draft: {e}")
             raise
 
+    def _draft_attachments(self) -> List[str]:
+        """Paths of the job files configured to be attached to the drafts."""
+        store = ArtifactStore(self.state.job_id)
+        paths = []
+        for name in GMAIL_CONFIG["attachments"]:
+            if name == "transcript":
+                path = store.path(TRANSCRIPT_ARTIFACT)
+            elif name == "audio_excerpt":
+                path = store.path(AUDIO_EXCERPT_ARTIFACT)
+                try:
+                    AudioProcessor().export_excerpt(
+                        self.state.audio_path,
+                        str(path),
+                        GMAIL_CONFIG["audio_excerpt_seconds"] * 1000,
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not export the audio excerpt: {e}")
+                    continue
+            elif name in ARTIFACT_FILES:
+                # Only the job's own copy: the crew's output directory is
+                # shared with other meetings
+                path = store.path(ARTIFACT_FILES[name])
+            else:
+                logger.warning(f"Unknown draft attachment {name!r}")
+                continue
+            if path.exists():
+                paths.append(str(path))
+            else:
+                logger.warning(f"No {name} to attach to the draft")
+        return paths
+
+    def _agent_draft(self):
+        """Create the Gmail draft with the Gmail crew's agent."""
+        crew = GmailCrew()
+
+        # Pass the handle; GmailTool resolves it when it builds the message
+        inputs = {
+            "body_ref": self.state.meeting_minutes_ref,
+            "audio_info": self.state.audio_info,
+        }
+
+        logger.info("Starting Gmail draft creation")
+        return run_cancellable(
+            crew.crew().kickoff,
+            inputs,
+            token=self._cancellation_token(),
+            timeout=TIMEOUT_CONFIG["stages"]["draft"] or None,
+            description="Gmail draft crew",
+        )
+
+    def _crew_minutes(
+        self,
+        transcript: str,
+        token: CancellationToken,
+        store: ArtifactStore,
+        minutes_tokens: Optional[TokenGate] = None,
+    ) -> str:
+        """
+        Generate the minutes with the summarizer and writer agents.
+
+        Args:
+            transcript: Full transcript text
+            token: The job's cancellation token
+            store: The job's artifact store, which receives the section files
+            minutes_tokens: Gate of the streamed minutes, opened when the
+                writer task (the last one) starts
+        """
+        crew = MeetingMinutesCrew()
+        minutes_crew = crew.crew()
+        publish_artifacts = self._artifact_publisher(store)
+        tasks_before_writer = len(minutes_crew.tasks) - 1
+        finished_tasks = 0
+
+        def on_task_output(output):
+            nonlocal finished_tasks
+            publish_artifacts(output)
+            finished_tasks += 1
+            # Tasks run in order, so the writer starts once the others are done
+            if minutes_tokens is not None and finished_tasks == tasks_before_writer:
+                minutes_tokens.open()
+
+        minutes_crew.task_callback = on_task_output
+        if minutes_tokens is not None and tasks_before_writer <= 0:
+            minutes_tokens.open()
+
+        def run_crew(transcript: str):
+            # Condense transcripts that don't fit the summarizer's prompt
+            transcript = fit_transcript(transcript, crew_prompt_tokens())
+            inputs = {"transcript": transcript, "audio_info": self.state.audio_info}
+            return minutes_crew.kickoff(inputs)
+
+        return str(
+            run_cancellable(
+                run_crew,
+                transcript,
+                token=token,
+                timeout=TIMEOUT_CONFIG["stages"]["minutes"] or None,
+                description="meeting minutes crew",
+            )
+        )
+
+    def _fused_minutes(
+        self, transcript: str, token: CancellationToken, store: ArtifactStore
+    ) -> str:
+        """Generate all minutes sections with a single LLM call."""
+        sections = run_cancellable(
+            generate_fused_minutes,
+            transcript,
+            token=token,
+            timeout=TIMEOUT_CONFIG["stages"]["minutes"] or None,
+            description="fused meeting minutes",
+        )
+
+        section_events = {
+            "summary": EventType.SUMMARY,
+            "action_items": EventType.ACTION_ITEMS,
+            "sentiment": EventType.SENTIMENT,
+        }
+        for key, event_type in section_events.items():
+            if sections.get(key):
+                ref = store.put_text(ARTIFACT_FILES[key], sections[key])
+                self._publish(event_type, {"text": sections[key], "ref": ref})
+        return sections["minutes"]
+
+    @contextmanager
+    def _streamed_tokens(self, store: ArtifactStore) -> Iterator[Optional[TokenGate]]:
+        """
+        Append minutes tokens to the minutes file and publish them as they arrive.
+
+        Yields:
+            Gate to open when the call writing the minutes starts, so other
+            LLM calls of the stage stay out of the file; None if streaming
+            is off
+        """
+        if not PROCESSING_CONFIG["minutes"]["streaming"]:
+            yield None
+            return
+
+        with store.open_appender(MINUTES_ARTIFACT) as output:
+
+            def on_token(text: str) -> None:
+                output.write(text)
+                output.flush()
+                self._publish(EventType.MINUTES_TOKEN, {"text": text})
+
+            gate = TokenGate(on_token)
+            with stream_tokens_to(gate):
+                yield gate
+
+    def _cancellation_token(self) -> CancellationToken:
+        """Return the cancellation token registered for this job."""
+        return job_registry.get(self.state.job_id) or CancellationToken(
+            self.state.job_id
+        )
+
+    def save_checkpoint(self, reason: str) -> str:
+        """
+        Save the flow state so an interrupted job can be inspected or resumed.
+
+        Args:
+            reason: Why the job stopped
+
+        Returns:
+            Handle of the checkpoint artifact
+        """
+        store = ArtifactStore(self.state.job_id)
+        checkpoint = self.state.model_dump()
+        checkpoint["reason"] = reason
+        partial_transcript = f"{TRANSCRIPT_ARTIFACT}.partial"
+        if not self.state.transcript_ref and store.exists(partial_transcript):
+            checkpoint["partial_transcript_ref"] = store.ref(partial_transcript)
+        return store.put_text(CHECKPOINT_ARTIFACT, json.dumps(checkpoint, indent=2))
+
+    def save_report(self, status: str, memory: dict) -> str:
+        """
+        Save the job report with its per-stage measurements.
+
+        Args:
+            status: Final job status
+            memory: Memory high-water marks from JobMemoryMonitor
+
+        Returns:
+            Handle of the report artifact
+        """
+        llm_cache = completion_cache.pop_job_stats(self.state.job_id)
+        if llm_cache["hits"] or llm_cache["misses"]:
+            logger.info(
+                f"LLM cache for job {self.state.job_id}: "
+                f"{llm_cache['hits']}/{llm_cache['hits'] + llm_cache['misses']} hits "
+                f"({llm_cache['hit_rate']:.0%}), "
+                f"{llm_cache['time_saved_seconds']:.1f}s saved"
+            )
 
-def kickoff():
-    """Main entry point for the meeting minutes flow."""
+        llm_context = context_budget.pop_job_stats(self.state.job_id)
+        for prompt in llm_context["prompts"]:
+            if prompt["segments"] > 1:
+                logger.info(
+                    f"Transcript of about {prompt['tokens']} tokens sent in "
+                    f"{prompt['segments']} segments "
+                    f"({llm_context['window']}-token context window)"
+                )
+
+        llm_tiers = model_tiers.pop_job_stats(self.state.job_id)
+        for tier, stats in llm_tiers.items():
+            logger.info(
+                f"LLM tier {tier} for job {self.state.job_id}: "
+                f"{stats['calls']} call(s), mean {stats['mean_seconds']}s, "
+                f"p95 {stats['p95_seconds']}s"
+            )
+
+        llm_streaming = stream_metrics.pop_job_metrics(self.state.job_id)
+        if llm_streaming["calls"]:
+            logger.info(
+                f"LLM streaming for job {self.state.job_id}: "
+                f"{len(llm_streaming['calls'])} call(s), mean time to first token "
+                f"{llm_streaming['mean_ttft_seconds']}s, "
+                f"{llm_streaming['tokens_per_second']} tokens/s"
+            )
+
+        report = {
+            "job_id": self.state.job_id,
+            "status": status,
+            "stage": self.state.stage,
+            **self.state.report,
+            "memory": memory,
+            "llm_cache": llm_cache,
+            "llm_streaming": llm_streaming,
+            "llm_context": llm_context,
+            "llm_tiers": llm_tiers,
+            "gmail_drafts": draft_outbox.job_status(self.state.job_id),
+            # Cumulative for this worker process, across all of its jobs
+            "llm_connections": llm_client_registry.metrics(),
+            "llm_endpoints": endpoint_pool.stats(),
+            "llm_batching": request_coalescer.stats(),
+        }
+        store = ArtifactStore(self.state.job_id)
+        return store.put_text(REPORT_ARTIFACT, json.dumps(report, indent=2))
+
+    def _start_warmup(self) -> Warmup:
+        """Start warming up external dependencies in the background."""
+        if not WARMUP_CONFIG["enabled"]:
+            return Warmup({})
+
+        required = list(WARMUP_CONFIG["required"])
+        if GMAIL_CONFIG["draft_mode"] == "outbox":
+            # Drafts wait in the durable outbox until Gmail is reachable, so a
+            # Gmail outage or expired consent must not fail the job up front
+            required = [name for name in required if name != "gmail"]
+
+        return Warmup(
+            {
+                "llm_server": check_llm_server,
+                "elevenlabs": eleven_labs.models.list,
+                "gmail": authenticate_gmail,
+            },
+            required=required,
+            timeout=WARMUP_CONFIG["timeout"],
+        ).start()
+
+    def _publish(self, event_type: EventType, data=None):
+        """Publish a progress event for the current job."""
+        event_bus.publish(self.state.job_id, event_type, data)
+
+    def _artifact_publisher(self, store: ArtifactStore):
+        """
+        Build a task callback that streams summarizer artifacts once written.
+
+        Each artifact is copied into the job's store as soon as it appears, so
+        later stages never read the crew's shared output directory.
+        """
+        published = set()
+        started_at = time.time()
+        artifact_events = {
+            "summary": EventType.SUMMARY,
+            "action_items": EventType.ACTION_ITEMS,
+            "sentiment": EventType.SENTIMENT,
+        }
+
+        def on_task_output(output):
+            for key, event_type in artifact_events.items():
+                artifact_path = Path(OUTPUT_DIR) / ARTIFACT_FILES[key]
+                if key in published or not artifact_path.exists():
+                    continue
+                # Ignore artifacts left over from a previous run
+                if artifact_path.stat().st_mtime < started_at:
+                    continue
+                published.add(key)
+                text = artifact_path.read_text(encoding="utf-8")
+                ref = store.put_text(ARTIFACT_FILES[key], text)
+                self._publish(event_type, {"text": text, "ref": ref})
+
+            # Fall back to the summary task's own output if no file was written
+            if "summary" not in published:
+                published.add("summary")
+                text = getattr(output, "raw", str(output))
+                ref = store.put_text(ARTIFACT_FILES["summary"], text)
+                self._publish(EventType.SUMMARY, {"text": text, "ref": ref})
+
+        return on_task_output
+
+
+def kickoff(audio_path: Optional[str] = None, job_id: Optional[str] = None):
+    """Main entry point for the meeting minutes flow.
+
+    Args:
+        audio_path: Audio file to process (defaults to the bundled recording)
+        job_id: Identifier used to tag progress events
+
+    Returns:
+        True if the flow completed successfully, False otherwise
+    """
     logger.info("Starting Meeting Minutes Agent")
+    job_id = job_id or uuid.uuid4().hex
 
     # Validate environment
     if not validate_environment():
         logger.error("Environment validation failed")
+        event_bus.publish(
+            job_id, EventType.ERROR, {"error": "Environment validation failed"}
+        )
+        return False
+
+    # Validate the configuration with the selected performance profile applied
+    try:
+        profile = active_profile()
+    except ConfigError as e:
+        logger.error(f"Configuration validation failed: {e}")
+        event_bus.publish(job_id, EventType.ERROR, {"error": str(e)})
         return False
+    logger.info(f"Using performance profile: {profile['name']}")
 
     # Disable agentops integration to skip authentication during crew kickoff
     try:
@@ -201,6 +704,23 @@ def kickoff():
     except ImportError:
         logger.debug("AgentOps not installed")
 
+    # Register the job so it can be cancelled, and expose its token to the LLM layer
+    token = job_registry.register(job_id)
+    context_token = set_current_token(token)
+    memory_monitor = JobMemoryMonitor().start()
+    meeting_minutes_flow = None
+
+    def finish_report(status: str) -> Optional[str]:
+        memory = memory_monitor.stop()
+        logger.info(f"Job {job_id} memory high-water mark: {memory['peak_rss_mb']} MB")
+        if meeting_minutes_flow is None:
+            return None
+        try:
+            return meeting_minutes_flow.save_report(status, memory)
+        except Exception as report_error:
+            logger.warning(f"Could not save report for job {job_id}: {report_error}")
+            return None
+
     try:
         meeting_minutes_flow = MeetingMinutesFlow()
 
@@ -213,21 +733,227 @@ def kickoff():
 
         # Execute the flow
         logger.info("Executing meeting minutes flow")
-        meeting_minutes_flow.kickoff()
+        meeting_minutes_flow.kickoff(
+            inputs={
+                "job_id": job_id,
+                "audio_path": audio_path or "",
+                "report": {"profile": profile},
+            }
+        )
 
         logger.info("Meeting minutes flow completed successfully")
+        report_ref = finish_report("completed")
+        event_bus.publish(
+            job_id,
+            EventType.COMPLETED,
+            {
+                "transcript_ref": meeting_minutes_flow.state.transcript_ref,
+                "meeting_minutes_ref": meeting_minutes_flow.state.meeting_minutes_ref,
+                "report_ref": report_ref,
+                "memory": memory_monitor.report(),
+            },
+        )
         return True
 
+    except (JobCancelledError, StageTimeoutError) as e:
+        logger.error(f"Meeting minutes flow stopped: {e}")
+        # Make work still running in abandoned threads stop at its next check
+        token.cancel(str(e))
+        checkpoint_ref = None
+        if meeting_minutes_flow is not None:
+            try:
+                checkpoint_ref = meeting_minutes_flow.save_checkpoint(str(e))
+                logger.info(f"Partial state checkpointed to {checkpoint_ref}")
+            except Exception as checkpoint_error:
+                logger.warning(f"Could not checkpoint job {job_id}: {checkpoint_error}")
+        cancelled = isinstance(e, JobCancelledError)
+        report_ref = finish_report("cancelled" if cancelled else "timed_out")
+        event_bus.publish(
+            job_id,
+            EventType.CANCELLED if cancelled else EventType.ERROR,
+            {
+                "error": str(e),
+                "checkpoint_ref": checkpoint_ref,
+                "report_ref": report_ref,
+            },
+        )
+        return False
+
     except Exception as e:
         logger.error(f"Meeting minutes flow failed: {e}")
         import traceback
 
         logger.error(f"Full traceback: {traceback.format_exc()}")
+        report_ref = finish_report("failed")
+        event_bus.publish(
+            job_id, EventType.ERROR, {"error": str(e), "report_ref": report_ref}
+        )
         return False
 
+    finally:
+        memory_monitor.stop()
+        reset_current_token(context_token)
+        job_registry.unregister(job_id)
+
+
+def stream_meeting_minutes(
+    audio_path: Optional[str] = None, job_id: Optional[str] = None
+) -> Iterator[ProgressEvent]:
+    """
+    Run the meeting minutes flow and yield progress events as they happen.
+
+    Events include each transcribed chunk, the summary, action items and
+    sentiment once the summarizer has written them, the minutes' LLM tokens
+    as they are generated, and the final minutes.
+    The iterator ends with a COMPLETED, CANCELLED or ERROR event; use
+    cancel_job(job_id) to stop the run early.
+
+    Args:
+        audio_path: Audio file to process (defaults to the bundled recording)
+        job_id: Identifier used to tag progress events
+
+    Yields:
+        ProgressEvent objects in publication order
+    """
+    job_id = job_id or uuid.uuid4().hex
+    # Subscribe before starting so no early events are missed
+    stream = event_bus.subscribe(job_id)
+
+    worker = threading.Thread(
+        target=kickoff,
+        kwargs={"audio_path": audio_path, "job_id": job_id},
+        name=f"meeting-minutes-{job_id[:8]}",
+        daemon=True,
+    )
+    worker.start()
+
+    try:
+        yield from stream
+    finally:
+        stream.close()
+
+
+def process_recordings(audio_paths: List[Path]) -> List[Path]:
+    """
+    Run the meeting minutes flow for a batch of recordings.
+
+    Args:
+        audio_paths: Recordings to process
+
+    Returns:
+        The recordings that were processed successfully
+    """
+    max_workers = max(1, min(WATCH_CONFIG["max_parallel_jobs"], len(audio_paths)))
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="meeting-minutes-job"
+    ) as executor:
+        results = list(
+            executor.map(lambda path: kickoff(audio_path=str(path)), audio_paths)
+        )
+
+    processed = [path for path, success in zip(audio_paths, results) if success]
+    logger.info(f"Batch finished: {len(processed)}/{len(audio_paths)} succeeded")
+    return processed
+
+
+def watch(directory: str) -> None:
+    """
+    Process new recordings dropped into a directory until interrupted.
+
+    Args:
+        directory: Directory to watch
+    """
+    watcher = FolderWatcher(directory, on_batch=process_recordings)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        logger.info("Stopping watch mode")
+        watcher.stop()
+
+
+def flush_outbox() -> None:
+    """Give queued Gmail drafts a chance to be delivered before exiting."""
+    if GMAIL_CONFIG["draft_mode"] != "outbox" or not draft_outbox.queued():
+        return
+    logger.info("Waiting for queued Gmail drafts to be delivered")
+    remaining = draft_outbox.flush(GMAIL_CONFIG["outbox_flush_timeout"])
+    if remaining:
+        logger.warning(
+            f"{remaining} Gmail draft(s) still queued in "
+            f"{GMAIL_CONFIG['outbox_dir']}; the next run delivers them"
+        )
+    draft_outbox.stop()
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="meeting-minutes",
+        description="Transcribe a meeting recording and draft its minutes.",
+    )
+    parser.add_argument(
+        "audio_path", nargs="?", help="Audio file to process (default: bundled sample)"
+    )
+    parser.add_argument(
+        "--watch",
+        metavar="DIR",
+        help="Watch a directory and process new recordings as they arrive",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print progress events as JSON lines while the flow runs",
+    )
+    parser.add_argument(
+        "--profile",
+        help=(
+            "Performance profile: "
+            f"{', '.join(PROFILES)} or one defined in --profile-file "
+            "(default: $PERFORMANCE_PROFILE or balanced)"
+        ),
+    )
+    parser.add_argument(
+        "--profile-file",
+        metavar="YAML",
+        help="YAML file that tunes or adds performance profiles",
+    )
+    args = parser.parse_args(argv)
+
+    # Fail at startup, not in the middle of a job, if the configuration is bad
+    try:
+        profile = activate_profile(args.profile, args.profile_file)
+    except ConfigError as e:
+        parser.error(str(e))
+    logger.info(f"Active performance profile: {profile['name']}")
+
+    # Let process managers stop running jobs cleanly with partial state saved
+    def handle_sigterm(signum, frame):
+        for running_job_id in job_registry.active_jobs():
+            cancel_job(running_job_id, "cancelled by SIGTERM")
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
+    if GMAIL_CONFIG["draft_mode"] == "outbox" and draft_outbox.queued():
+        # Deliver drafts left queued by earlier runs alongside this one
+        draft_outbox.start()
+
+    if args.watch:
+        watch(args.watch)
+        return 0
+
+    if not args.stream:
+        success = kickoff(audio_path=args.audio_path)
+    else:
+        success = False
+        for event in stream_meeting_minutes(audio_path=args.audio_path):
+            print(json.dumps(event.model_dump(mode="json")), flush=True)
+            success = event.type == EventType.COMPLETED
+
+    flush_outbox()
+    return 0 if success else 1
+
 
 if __name__ == "__main__":
-    success = kickoff()
-    exit_code = 0 if success else 1
+    exit_code = main()
     logger.info(f"Application exiting with code: {exit_code}")
     sys.exit(exit_code)
@@ -5,85 +5,98 @@ from typing import Optional, Type
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from ..utils.artifact_store import ArtifactStore
+from ..utils.extractive_summary import ExtractiveSummarizer, split_sentences
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Characters read at a time from a text artifact being summarized
+SUMMARY_READ_CHARS = 1024 * 1024
+
 
 class TextSummarizerInput(BaseModel):
     """Input schema for TextSummarizerTool."""
 
-    text: str = Field(..., description="The text content to summarize")
+    text: Optional[str] = Field(
+        default=None, description="The text content to summarize"
+    )
+    text_ref: Optional[str] = Field(
+        default=None,
+        description="Artifact reference (artifact://...) holding the text.",
+    )
     max_sentences: int = Field(
         default=5, description="Maximum number of sentences in summary"
     )
     focus_keywords: Optional[str] = Field(
-        default=None, description="Comma-separated keywords to focus on"
+        default=None,
+        description=(
+            "Comma-separated keywords or phrases to focus on, matched as whole words"
+        ),
     )
 
 
 class TextSummarizerTool(BaseTool):
     name: str = "Text Summarizer"
     description: str = (
-        "Summarizes long text content into key points. Useful for condensing meeting transcripts, "
-        "documents, or other lengthy text into concise summaries. Can focus on specific keywords if provided."
+        "Summarizes long text content into key points by picking its most central "
+        "sentences, without an LLM. Useful for condensing meeting transcripts, "
+        "documents, or other lengthy text into concise summaries. Takes the text "
+        "or a text_ref artifact reference for transcripts too large to pass inline. "
+        "Can focus on specific keywords if provided."
     )
     args_schema: Type[BaseModel] = TextSummarizerInput
 
     def _run(
-        self, text: str, max_sentences: int = 5, focus_keywords: Optional[str] = None
+        self,
+        text: Optional[str] = None,
+        max_sentences: int = 5,
+        focus_keywords: Optional[str] = None,
+        text_ref: Optional[str] = None,
     ) -> str:
         """
         Summarize text content into key points.
 
+        Sentences are ranked by TextRank over TF-IDF sentence vectors and the
+        most central ones are kept in their original order.
+
         Args:
             text: Text to summarize
             max_sentences: Maximum sentences in summary
             focus_keywords: Keywords to focus on (comma-separated)
+            text_ref: Artifact reference holding the text, read in chunks
 
         Returns:
             Summarized text
         """
         try:
-            logger.info(f"Summarizing text of {len(text)} characters")
-
-            # Basic text processing
-            sentences = [s.strip() for s in text.split(".") if s.strip()]
-
-            if len(sentences) <= max_sentences:
-                logger.info("Text is already concise enough")
-                return text
-
-            # Simple scoring based on sentence length and keyword presence
-            scored_sentences = []
-            keywords = (
-                [k.strip().lower() for k in (focus_keywords or "").split(",")]
-                if focus_keywords
-                else []
-            )
-
-            for sentence in sentences:
-                score = len(sentence.split())  # Base score on word count
-
-                # Boost score for keyword presence
-                if keywords:
-                    for keyword in keywords:
-                        if keyword in sentence.lower():
-                            score += 10
-
-                scored_sentences.append((score, sentence))
-
-            # Sort by score and take top sentences
-            scored_sentences.sort(key=lambda x: x[0], reverse=True)
-            top_sentences = [sent for _, sent in scored_sentences[:max_sentences]]
-
-            # Reconstruct in original order
-            summary_sentences = []
-            for sentence in sentences:
-                if sentence in top_sentences:
-                    summary_sentences.append(sentence)
-
-            summary = ". ".join(summary_sentences) + "."
+            keywords = [
+                keyword.strip()
+                for keyword in (focus_keywords or "").split(",")
+                if keyword.strip()
+            ]
+            summarizer = ExtractiveSummarizer()
+
+            if text_ref:
+                logger.info(f"Summarizing {text_ref}")
+                with ArtifactStore.for_ref(text_ref).open(text_ref) as handle:
+                    chunks = iter(lambda: handle.read(SUMMARY_READ_CHARS), "")
+                    summary_sentences = summarizer.summarize_stream(
+                        chunks, max_sentences, keywords
+                    )
+            elif text:
+                logger.info(f"Summarizing text of {len(text)} characters")
+                sentences = split_sentences(text)
+                if len(sentences) <= max_sentences:
+                    logger.info("Text is already concise enough")
+                    return text
+                summary_sentences = summarizer.summarize_sentences(
+                    sentences, max_sentences, keywords
+                )
+            else:
+                return "Error generating summary: either text or text_ref is required"
+
+            summary = " ".join(summary_sentences)
             logger.info(f"Generated summary with {len(summary_sentences)} sentences")
 
             return summary
@@ -0,0 +1,199 @@
+"""
+Job artifact storage for Meeting Minutes Agent.
+
+Large payloads such as transcripts and rendered minutes are written once to a
+per-job directory and passed around as short ``artifact://`` handles, so they
+are not copied into flow state, crew inputs, prompts and logs.
+"""
+
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Optional, Tuple
+
+from ..config.app_config import ARTIFACT_CONFIG
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+ARTIFACT_SCHEME = "artifact://"
+_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+def _valid_name(value: Optional[str]) -> bool:
+    # "." and ".." match the pattern but name directories, not artifacts
+    return bool(value and _NAME_PATTERN.match(value)) and value not in (".", "..")
+
+
+def is_artifact_ref(value: str) -> bool:
+    """Return True if the value is an artifact handle."""
+    return isinstance(value, str) and value.startswith(ARTIFACT_SCHEME)
+
+
+def parse_artifact_ref(ref: str) -> Tuple[str, str]:
+    """
+    Split an artifact handle into job id and artifact name.
+
+    Args:
+        ref: Handle of the form ``artifact://<job_id>/<name>``
+
+    Returns:
+        Tuple of (job_id, name)
+
+    Raises:
+        ValueError: If the handle is malformed
+    """
+    if not is_artifact_ref(ref):
+        raise ValueError(f"Not an artifact handle: {ref!r}")
+
+    job_id, _, name = ref[len(ARTIFACT_SCHEME) :].partition("/")
+    if not _valid_name(job_id) or not _valid_name(name):
+        raise ValueError(f"Malformed artifact handle: {ref!r}")
+    return job_id, name
+
+
+class ArtifactStore:
+    """Stores the artifacts of a single job on disk."""
+
+    def __init__(self, job_id: str, root: Optional[str] = None):
+        if not _valid_name(job_id):
+            raise ValueError(f"Invalid job id: {job_id!r}")
+
+        self.job_id = job_id
+        self.root = Path(root or ARTIFACT_CONFIG["root"])
+        self.job_dir = self.root / job_id
+
+    @classmethod
+    def for_ref(cls, ref: str, root: Optional[str] = None) -> "ArtifactStore":
+        """Return the store that owns an artifact handle."""
+        job_id, _ = parse_artifact_ref(ref)
+        return cls(job_id, root=root)
+
+    def ref(self, name: str) -> str:
+        """Return the handle of an artifact in this store."""
+        if not _valid_name(name):
+            raise ValueError(f"Invalid artifact name: {name!r}")
+        return f"{ARTIFACT_SCHEME}{self.job_id}/{name}"
+
+    def path(self, ref_or_name: str) -> Path:
+        """
+        Return the file path of an artifact given its handle or name.
+
+        Raises:
+            ValueError: If the handle or name is invalid, belongs to another
+                job or resolves outside the artifact root
+        """
+        if is_artifact_ref(ref_or_name):
+            job_id, name = parse_artifact_ref(ref_or_name)
+            if job_id != self.job_id:
+                raise ValueError(f"Artifact {ref_or_name} belongs to another job")
+        else:
+            name = ref_or_name
+            self.ref(name)  # validate
+        path = self.job_dir / name
+        # Handles come from LLM output; never let one leave the root, e.g.
+        # through a symlinked job directory
+        if not path.resolve().is_relative_to(self.root.resolve()):
+            raise ValueError(f"Artifact {ref_or_name!r} is outside the artifact root")
+        return path
+
+    def put_text(self, name: str, text: str) -> str:
+        """
+        Write a text artifact.
+
+        Args:
+            name: Artifact name, e.g. "minutes.md"
+            text: Content to store
+
+        Returns:
+            Handle of the stored artifact
+        """
+        path = self.path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so readers never see partial content
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        temp_path.write_text(text, encoding="utf-8")
+        os.replace(temp_path, path)
+
+        logger.debug(f"Stored artifact {name} ({len(text)} characters)")
+        return self.ref(name)
+
+    @contextmanager
+    def open_writer(self, name: str) -> Iterator[IO[str]]:
+        """
+        Open a text artifact for incremental writing.
+
+        Args:
+            name: Artifact name
+
+        Yields:
+            Text file object; the artifact is replaced when the block exits.
+            If the block raises, what was written so far is kept as
+            ``<name>.partial`` for checkpointing.
+        """
+        path = self.path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+
+        try:
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                yield handle
+        except BaseException:
+            if temp_path.exists():
+                os.replace(temp_path, self.path(f"{name}.partial"))
+            raise
+        os.replace(temp_path, path)
+
+    @contextmanager
+    def open_appender(self, name: str) -> Iterator[IO[str]]:
+        """
+        Open a text artifact that readers can follow while it is written.
+
+        Unlike open_writer(), writes go straight to the artifact; it is
+        truncated first and each write is visible once flushed.
+
+        Args:
+            name: Artifact name
+
+        Yields:
+            Text file object opened for appending
+        """
+        path = self.path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+        with open(path, "a", encoding="utf-8") as handle:
+            yield handle
+
+    def read_text(self, ref_or_name: str) -> str:
+        """Read a text artifact."""
+        return self.path(ref_or_name).read_text(encoding="utf-8")
+
+    def open(self, ref_or_name: str, mode: str = "r") -> IO:
+        """Open an artifact for reading in text ("r") or binary ("rb") mode."""
+        if mode not in ("r", "rb"):
+            raise ValueError("Artifacts can only be opened for reading")
+        encoding = "utf-8" if mode == "r" else None
+        return open(self.path(ref_or_name), mode, encoding=encoding)
+
+    def size(self, ref_or_name: str) -> int:
+        """Return the size of an artifact in bytes."""
+        return self.path(ref_or_name).stat().st_size
+
+    def exists(self, ref_or_name: str) -> bool:
+        """Return True if the artifact has been written."""
+        return self.path(ref_or_name).exists()
+
+
+def read_artifact(ref: str) -> str:
+    """
+    Resolve an artifact handle to its text content.
+
+    Args:
+        ref: Artifact handle
+
+    Returns:
+        The artifact's text
+    """
+    return ArtifactStore.for_ref(ref).read_text(ref)
@@ -2,14 +2,16 @@
 Audio processing utilities for Meeting Minutes Agent.
 """
 
+import math
 import os
 import tempfile
+import wave
 from io import BytesIO
 from pathlib import Path
-from typing import Generator, List, Tuple
+from typing import Generator, Iterator, List, Tuple
 
 from pydub import AudioSegment
-from pydub.utils import make_chunks
+from pydub.utils import make_chunks, mediainfo
 
 from ..config.app_config import PROCESSING_CONFIG
 from .logger import setup_logger
@@ -25,6 +27,8 @@ class AudioProcessor:
         self.chunk_length_ms = self.config["chunk_length_ms"]
         self.supported_formats = self.config["supported_formats"]
         self.max_file_size_mb = self.config["max_file_size_mb"]
+        self.streaming_decode = self.config.get("streaming_decode", False)
+        self.upload_codec = self.config.get("upload_codec", "wav")
 
     def validate_audio_file(self, file_path: str) -> bool:
         """
@@ -83,6 +87,79 @@ class AudioProcessor:
             logger.error(f"Failed to load audio file: {e}")
             raise ValueError(f"Cannot load audio file: {e}")
 
+    def probe_audio(self, file_path: str) -> dict:
+        """
+        Read duration and stream parameters without decoding the audio.
+
+        Args:
+            file_path: Path to audio file
+
+        Returns:
+            Dictionary with duration_ms, sample_rate, channels and sample_width
+
+        Raises:
+            ValueError: If the file cannot be probed
+        """
+        path = Path(file_path)
+        try:
+            if path.suffix.lower() == ".wav":
+                with wave.open(str(path), "rb") as wav_file:
+                    frame_rate = wav_file.getframerate()
+                    return {
+                        "duration_ms": wav_file.getnframes() * 1000 / frame_rate,
+                        "sample_rate": frame_rate,
+                        "channels": wav_file.getnchannels(),
+                        "sample_width": wav_file.getsampwidth(),
+                    }
+
+            info = mediainfo(str(path))
+            bits_per_sample = int(info.get("bits_per_sample") or 0)
+            return {
+                "duration_ms": float(info["duration"]) * 1000,
+                "sample_rate": int(info["sample_rate"]),
+                "channels": int(info["channels"]),
+                "sample_width": bits_per_sample // 8,
+            }
+        except Exception as e:
+            raise ValueError(f"Cannot probe audio file: {e}")
+
+    def load_segment(
+        self, file_path: str, start_ms: int, duration_ms: int
+    ) -> AudioSegment:
+        """
+        Decode only one section of an audio file.
+
+        Args:
+            file_path: Path to audio file
+            start_ms: Start of the section in milliseconds
+            duration_ms: Length of the section in milliseconds
+
+        Returns:
+            AudioSegment holding just that section
+        """
+        path = Path(file_path)
+        if path.suffix.lower() == ".wav":
+            # pydub reads whole WAV files even when a range is requested
+            with wave.open(str(path), "rb") as wav_file:
+                frame_rate = wav_file.getframerate()
+                start_frame = int(start_ms * frame_rate / 1000)
+                wav_file.setpos(min(start_frame, wav_file.getnframes()))
+                frames = wav_file.readframes(int(duration_ms * frame_rate / 1000))
+                return AudioSegment(
+                    data=frames,
+                    sample_width=wav_file.getsampwidth(),
+                    frame_rate=frame_rate,
+                    channels=wav_file.getnchannels(),
+                )
+
+        # ffmpeg seeks to the section, so only it is decoded
+        return AudioSegment.from_file(
+            file_path,
+            format=path.suffix.lower().lstrip("."),
+            start_second=start_ms / 1000,
+            duration=duration_ms / 1000,
+        )
+
     def create_chunks(self, audio: AudioSegment) -> List[AudioSegment]:
         """
         Split audio into chunks for processing.
@@ -111,22 +188,20 @@ class AudioProcessor:
         Yields:
             Tuple of (chunk_index, chunk_audio_data)
         """
-        audio = self.load_audio(file_path)
-        chunks = self.create_chunks(audio)
-
-        for i, chunk in enumerate(chunks):
+        for i, chunk in enumerate(self._iter_decoded_chunks(file_path)):
             temp_file_path = None
             try:
                 # Create temporary file for chunk
                 with tempfile.NamedTemporaryFile(
-                    suffix=".wav", delete=False
+                    suffix=f".{self.upload_codec}", delete=False
                 ) as temp_file:
                     temp_file_path = temp_file.name
-                    chunk.export(temp_file_path, format="wav")
+                    chunk.export(temp_file_path, format=self.upload_codec)
 
                 # Read as BytesIO - ensure file is closed before cleanup
                 with open(temp_file_path, "rb") as f:
                     audio_data = BytesIO(f.read())
+                audio_data.name = f"chunk_{i}.{self.upload_codec}"
 
                 yield i, audio_data
 
@@ -144,6 +219,45 @@ class AudioProcessor:
                             f"Could not delete temporary file {temp_file_path}: {e}"
                         )
 
+    def _iter_decoded_chunks(self, file_path: str) -> Iterator[AudioSegment]:
+        """Decode chunks one at a time when streaming, else all up front."""
+        if self.streaming_decode:
+            if not self.validate_audio_file(file_path):
+                raise ValueError(f"Invalid audio file: {file_path}")
+            try:
+                duration_ms = self.probe_audio(file_path)["duration_ms"]
+            except ValueError as e:
+                logger.warning(f"Falling back to full decode: {e}")
+            else:
+                chunk_count = math.ceil(duration_ms / self.chunk_length_ms)
+                logger.info(
+                    f"Streaming {chunk_count} chunks of {self.chunk_length_ms/1000}s each"
+                )
+                for i in range(chunk_count):
+                    yield self.load_segment(
+                        file_path, i * self.chunk_length_ms, self.chunk_length_ms
+                    )
+                return
+
+        audio = self.load_audio(file_path)
+        yield from self.create_chunks(audio)
+
+    def export_excerpt(self, file_path: str, output_path: str, duration_ms: int) -> str:
+        """
+        Write the start of an audio file as a compressed mono MP3.
+
+        Args:
+            file_path: Path to audio file
+            output_path: Path of the MP3 file to write
+            duration_ms: Length of the excerpt in milliseconds
+
+        Returns:
+            The output path
+        """
+        excerpt = self.load_segment(file_path, 0, duration_ms).set_channels(1)
+        excerpt.export(output_path, format="mp3", bitrate="48k").close()
+        return output_path
+
     def get_audio_info(self, file_path: str) -> dict:
         """
         Get audio file information.
@@ -157,6 +271,23 @@ class AudioProcessor:
         if not self.validate_audio_file(file_path):
             return {}
 
+        if self.streaming_decode:
+            try:
+                probe = self.probe_audio(file_path)
+            except ValueError as e:
+                logger.warning(f"Falling back to full decode for audio info: {e}")
+            else:
+                duration_ms = int(probe["duration_ms"])
+                return {
+                    "duration_seconds": duration_ms / 1000,
+                    "duration_formatted": f"{duration_ms // 60000}:{(duration_ms % 60000) // 1000:02d}",
+                    "sample_rate": probe["sample_rate"],
+                    "channels": probe["channels"],
+                    "bit_depth": probe["sample_width"] * 8,
+                    "file_size_mb": Path(file_path).stat().st_size / (1024 * 1024),
+                    "estimated_chunks": math.ceil(duration_ms / self.chunk_length_ms),
+                }
+
         audio = self.load_audio(file_path)
 
         return {
@@ -0,0 +1,345 @@
+"""
+Backpressure and memory limits for Meeting Minutes Agent workers.
+
+Pipeline stages are connected through bounded hand-offs, so a fast producer
+(audio decoding) cannot run ahead of slow consumers (speech-to-text, the LLM).
+The process-wide ``memory_governor`` also pauses producers while the worker's
+resident memory is above the configured ceiling.
+"""
+
+import contextvars
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from ..config.app_config import BACKPRESSURE_CONFIG
+from .cancellation import CancellationToken
+from .logger import setup_logger
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = setup_logger(__name__)
+
+_MB = 1024 * 1024
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+# How often blocked consumers re-check their token
+_POLL_INTERVAL = 0.1
+_DONE = object()
+
+
+def current_rss_bytes() -> int:
+    """Return the resident set size of this process in bytes (0 if unknown)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        pass
+
+    if resource is None:
+        return 0
+    # Peak rather than current RSS, but the best available without /proc
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemoryGovernor:
+    """Pauses producers while the worker is above its memory ceiling."""
+
+    def __init__(
+        self, ceiling_mb: Optional[float] = None, poll_interval: Optional[float] = None
+    ):
+        self._ceiling_mb = ceiling_mb
+        self.poll_interval = poll_interval or BACKPRESSURE_CONFIG["poll_interval"]
+        self.pauses = 0
+        self._condition = threading.Condition()
+        self._in_flight = 0
+
+    @property
+    def ceiling_bytes(self) -> int:
+        """Memory ceiling in bytes, 0 if none."""
+        # Read on use so a performance profile applied later takes effect
+        ceiling_mb = self._ceiling_mb
+        if ceiling_mb is None:
+            ceiling_mb = BACKPRESSURE_CONFIG["memory_ceiling_mb"]
+        return int(ceiling_mb * _MB) if ceiling_mb else 0
+
+    @property
+    def enabled(self) -> bool:
+        """True if a memory ceiling is configured."""
+        return self.ceiling_bytes > 0
+
+    @property
+    def in_flight(self) -> int:
+        """Units of work currently holding a reservation."""
+        with self._condition:
+            return self._in_flight
+
+    def over_ceiling(self) -> bool:
+        """Return True if the worker's RSS is at or above the ceiling."""
+        return self.enabled and current_rss_bytes() >= self.ceiling_bytes
+
+    def acquire(self, token: Optional[CancellationToken] = None) -> float:
+        """
+        Reserve room for one more unit of in-flight work.
+
+        Blocks while the worker is above its ceiling and other work is still
+        in flight, since finishing that work is what frees memory. With
+        nothing in flight the reservation is granted anyway, so a job never
+        waits on memory that no one will release.
+
+        Args:
+            token: Token whose cancellation aborts the wait
+
+        Returns:
+            Seconds spent paused
+
+        Raises:
+            JobCancelledError: If the token is cancelled while paused
+        """
+        started = time.monotonic()
+        paused = False
+        with self._condition:
+            while self._in_flight and self.over_ceiling():
+                if token is not None:
+                    token.raise_if_cancelled()
+                if not paused:
+                    paused = True
+                    self.pauses += 1
+                    logger.warning(
+                        f"Memory ceiling of {self.ceiling_bytes // _MB} MB reached; "
+                        f"pausing until {self._in_flight} in-flight item(s) finish"
+                    )
+                self._condition.wait(self.poll_interval)
+            self._in_flight += 1
+        return time.monotonic() - started if paused else 0.0
+
+    def release(self) -> None:
+        """Give back a reservation made with acquire()."""
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._condition.notify_all()
+
+    @contextmanager
+    def reserve(self, token: Optional[CancellationToken] = None) -> Iterator[float]:
+        """Hold a reservation for the duration of a block; yields seconds paused."""
+        paused = self.acquire(token)
+        try:
+            yield paused
+        finally:
+            self.release()
+
+
+class JobMemoryMonitor:
+    """
+    Samples worker RSS while a job runs to record its memory high-water mark.
+
+    RSS belongs to the whole process, so when a worker runs several jobs at
+    once the figures cover all of them.
+    """
+
+    def __init__(self, interval: Optional[float] = None):
+        self.interval = interval or BACKPRESSURE_CONFIG["sample_interval"]
+        self.start_bytes = 0
+        self.peak_bytes = 0
+        self.end_bytes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "JobMemoryMonitor":
+        """Start sampling in a background thread."""
+        self.start_bytes = self.peak_bytes = current_rss_bytes()
+        self._thread = threading.Thread(
+            target=self._sample, name="job-memory-monitor", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak_bytes = max(self.peak_bytes, current_rss_bytes())
+
+    def stop(self) -> Dict[str, float]:
+        """Stop sampling and return the memory report."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.end_bytes = current_rss_bytes()
+        self.peak_bytes = max(self.peak_bytes, self.end_bytes)
+        return self.report()
+
+    def report(self) -> Dict[str, float]:
+        """Return start, peak and end RSS in MB."""
+        return {
+            "start_rss_mb": round(self.start_bytes / _MB, 1),
+            "peak_rss_mb": round(self.peak_bytes / _MB, 1),
+            "end_rss_mb": round(self.end_bytes / _MB, 1),
+        }
+
+    def __enter__(self) -> "JobMemoryMonitor":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def bounded_map(
+    func: Callable[[Any], Any],
+    source: Iterable[Any],
+    workers: int = 1,
+    max_pending: Optional[int] = None,
+    governor: Optional[MemoryGovernor] = None,
+    token: Optional[CancellationToken] = None,
+    stats: Optional[Dict[str, Any]] = None,
+) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+    """
+    Apply func to items of source concurrently with bounded look-ahead.
+
+    Items are pulled from source in a producer thread, so producing them
+    (e.g. decoding and encoding audio) overlaps with func. At most
+    ``workers + max_pending`` items are produced but not yet consumed by the
+    caller; at that limit, or while the governor reports the memory ceiling,
+    the producer pauses instead of allocating more.
+
+    Args:
+        func: Function applied to each item, run in the caller's context
+        source: Items to process, consumed lazily
+        workers: Number of items processed in parallel
+        max_pending: Produced items allowed to wait for a worker
+        governor: Memory governor (defaults to the process-wide one)
+        token: Token whose cancellation stops the pipeline
+        stats: Optional dict updated with items, max_in_flight and paused_seconds
+
+    Yields:
+        Tuples of (item, result, error) in source order, where error is the
+        exception func raised for that item or None
+
+    Raises:
+        JobCancelledError: If the token is cancelled
+        Exception: Anything raised while producing items
+    """
+    workers = max(1, workers)
+    if max_pending is None:
+        max_pending = BACKPRESSURE_CONFIG["chunk_queue_size"]
+    governor = governor or memory_governor
+    stats = stats if stats is not None else {}
+    stats.update(items=0, max_in_flight=0, paused_seconds=0.0)
+
+    slots = threading.Semaphore(workers + max(0, max_pending))
+    handoff: "queue.Queue[Any]" = queue.Queue()
+    lock = threading.Lock()
+    stop = threading.Event()
+    in_flight = [0]
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bounded")
+
+    def produce():
+        iterator = iter(source)
+        try:
+            while True:
+                while not slots.acquire(timeout=_POLL_INTERVAL):
+                    if stop.is_set():
+                        return
+                paused = governor.acquire(token)
+                try:
+                    item = next(iterator)
+                except BaseException:
+                    governor.release()
+                    raise
+
+                with lock:
+                    if stop.is_set():
+                        governor.release()
+                        return
+                    future = executor.submit(contextvars.copy_context().run, func, item)
+                    handoff.put((item, future))
+                    in_flight[0] += 1
+                    stats["items"] += 1
+                    stats["paused_seconds"] += paused
+                    stats["max_in_flight"] = max(stats["max_in_flight"], in_flight[0])
+        except StopIteration:
+            pass
+        except BaseException as e:
+            handoff.put(e)
+        finally:
+            handoff.put(_DONE)
+
+    def finish() -> None:
+        with lock:
+            in_flight[0] -= 1
+        slots.release()
+        governor.release()
+
+    producer = threading.Thread(
+        target=contextvars.copy_context().run,
+        args=(produce,),
+        name="bounded-producer",
+        daemon=True,
+    )
+    producer.start()
+
+    try:
+        while True:
+            entry = _get(handoff, token)
+            if entry is _DONE:
+                return
+            if isinstance(entry, BaseException):
+                raise entry
+
+            item, future = entry
+            try:
+                try:
+                    result, error = _result(future, token), None
+                except Exception as e:
+                    if token is not None and token.cancelled:
+                        raise
+                    result, error = None, e
+                yield item, result, error
+            finally:
+                finish()
+            del item, future, entry
+    finally:
+        with lock:
+            stop.set()
+        # Return the reservations of items that will never be consumed
+        while True:
+            try:
+                entry = handoff.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(entry, tuple):
+                entry[1].cancel()
+                finish()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _get(handoff: "queue.Queue[Any]", token: Optional[CancellationToken]) -> Any:
+    while True:
+        if token is not None:
+            token.raise_if_cancelled()
+        try:
+            return handoff.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            continue
+
+
+def _result(future: Future, token: Optional[CancellationToken]) -> Any:
+    while True:
+        if token is not None:
+            token.raise_if_cancelled()
+        try:
+            return future.result(timeout=_POLL_INTERVAL)
+        except FutureTimeoutError:
+            continue
+
+
+# Process-wide governor shared by all jobs in this worker
+memory_governor = MemoryGovernor()
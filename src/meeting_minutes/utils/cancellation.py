@@ -0,0 +1,244 @@
+"""
+Cooperative cancellation and deadlines for Meeting Minutes Agent jobs.
+
+Each running job registers a CancellationToken in the process-wide
+``job_registry``. Blocking calls to external services are made through
+``run_cancellable`` so a cancelled or timed-out job releases its worker
+immediately, while the abandoned call is bounded by its own request timeout.
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional
+
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# How often blocked callers re-check their token while waiting
+_POLL_INTERVAL = 0.1
+
+
+class JobCancelledError(RuntimeError):
+    """Raised when a job has been cancelled."""
+
+
+class StageTimeoutError(TimeoutError):
+    """Raised when a stage or request exceeds its deadline."""
+
+
+class CancellationToken:
+    """Thread-safe flag that signals a job should stop."""
+
+    def __init__(self, job_id: str = ""):
+        self.job_id = job_id
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancel() has been called."""
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Request cancellation."""
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+            logger.warning(f"Job {self.job_id or '?'} cancellation requested: {reason}")
+
+    def raise_if_cancelled(self) -> None:
+        """Raise JobCancelledError if cancellation was requested."""
+        if self._event.is_set():
+            raise JobCancelledError(f"Job {self.job_id} {self.reason}")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until cancelled or the timeout expires; return True if cancelled."""
+        return self._event.wait(timeout)
+
+
+class Deadline:
+    """Absolute deadline for a stage; None means no limit."""
+
+    def __init__(self, seconds: Optional[float], name: str = "stage"):
+        self.name = name
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds if seconds else None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or None if the deadline is unlimited."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """True once the deadline has passed."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def check(self) -> None:
+        """Raise StageTimeoutError if the deadline has passed."""
+        if self.expired:
+            raise StageTimeoutError(
+                f"{self.name} exceeded its {self.seconds}s deadline"
+            )
+
+    def cap(self, timeout: Optional[float]) -> Optional[float]:
+        """Return the smaller of a request timeout and the remaining time."""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
+
+
+# Token of the job running in the current context, used by the LLM layer
+_current_token: contextvars.ContextVar[Optional[CancellationToken]] = (
+    contextvars.ContextVar("current_cancellation_token", default=None)
+)
+
+
+def current_token() -> Optional[CancellationToken]:
+    """Return the cancellation token of the job running in this context."""
+    return _current_token.get()
+
+
+def set_current_token(token: Optional[CancellationToken]) -> contextvars.Token:
+    """Bind a cancellation token to the current context."""
+    return _current_token.set(token)
+
+
+def reset_current_token(context_token: contextvars.Token) -> None:
+    """Restore the token that was bound before set_current_token()."""
+    _current_token.reset(context_token)
+
+
+def check_cancelled() -> None:
+    """Raise JobCancelledError if the current context's job was cancelled."""
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def run_cancellable(
+    func: Callable[..., Any],
+    *args: Any,
+    token: Optional[CancellationToken] = None,
+    timeout: Optional[float] = None,
+    description: str = "call",
+    **kwargs: Any,
+) -> Any:
+    """
+    Run a blocking call in a worker thread that the caller can walk away from.
+
+    The call runs with the caller's context (including the current cancellation
+    token), so nested LLM calls see the same token.
+
+    Args:
+        func: Callable to run
+        *args: Positional arguments for func
+        token: Token whose cancellation aborts the wait
+        timeout: Maximum seconds to wait for the result
+        description: Human readable name used in errors and logs
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Whatever func returns
+
+    Raises:
+        JobCancelledError: If the token was cancelled before func finished
+        StageTimeoutError: If func did not finish within timeout
+    """
+    if token is not None:
+        token.raise_if_cancelled()
+
+    future: Future = Future()
+    context = contextvars.copy_context()
+
+    def runner():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(context.run(func, *args, **kwargs))
+        except BaseException as e:  # propagate everything to the waiting caller
+            future.set_exception(e)
+
+    thread = threading.Thread(target=runner, name=f"cancellable-{description}")
+    thread.daemon = True
+    thread.start()
+
+    deadline = Deadline(timeout, description)
+    while True:
+        wait_for = deadline.cap(_POLL_INTERVAL)
+        try:
+            return future.result(timeout=wait_for)
+        except FutureTimeoutError:
+            pass
+
+        if token is not None and token.cancelled:
+            logger.warning(f"Abandoning {description}: job cancelled")
+            raise JobCancelledError(f"Job {token.job_id} {token.reason}")
+        if deadline.expired:
+            logger.warning(f"Abandoning {description}: timed out after {timeout}s")
+            raise StageTimeoutError(f"{description} timed out after {timeout}s")
+
+
+class JobRegistry:
+    """Tracks cancellation tokens of running jobs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, CancellationToken] = {}
+
+    def register(self, job_id: str) -> CancellationToken:
+        """Create and register the token of a new job."""
+        token = CancellationToken(job_id)
+        with self._lock:
+            self._tokens[job_id] = token
+        return token
+
+    def get(self, job_id: str) -> Optional[CancellationToken]:
+        """Return the token of a running job."""
+        with self._lock:
+            return self._tokens.get(job_id)
+
+    def unregister(self, job_id: str) -> None:
+        """Forget a finished job."""
+        with self._lock:
+            self._tokens.pop(job_id, None)
+
+    def cancel(self, job_id: str, reason: str = "cancelled by operator") -> bool:
+        """
+        Cancel a running job.
+
+        Args:
+            job_id: Job identifier
+            reason: Reason recorded on the token
+
+        Returns:
+            True if the job was running, False otherwise
+        """
+        token = self.get(job_id)
+        if token is None:
+            return False
+        token.cancel(reason)
+        return True
+
+    def active_jobs(self) -> List[str]:
+        """Return the ids of all running jobs."""
+        with self._lock:
+            return list(self._tokens)
+
+
+# Process-wide registry of running jobs
+job_registry = JobRegistry()
+
+
+def cancel_job(job_id: str, reason: str = "cancelled by operator") -> bool:
+    """Cancel a running job; returns False if no such job is running."""
+    return job_registry.cancel(job_id, reason)
@@ -0,0 +1,348 @@
+"""
+Persistent LLM completion cache for Meeting Minutes Agent.
+
+Completions are stored in SQLite keyed by the normalized messages, the model
+and the sampling parameters, so reruns and retries of a job don't pay for
+identical prompts again. Entries expire after a TTL and the least recently
+used ones are evicted once the cache exceeds its size limit. Hits, misses
+and the generation time saved are tracked per job.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+
+from ..config.app_config import LLM_CACHE_CONFIG, PROCESSING_CONFIG
+from .cancellation import current_token
+from .llm_trace import note_cache_lookup
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+# Keyword arguments that change what a model generates
+SAMPLING_PARAMS = (
+    "temperature",
+    "top_p",
+    "top_k",
+    "max_tokens",
+    "stop",
+    "seed",
+    "n",
+    "presence_penalty",
+    "frequency_penalty",
+    "response_format",
+    "tools",
+    "tool_choice",
+)
+
+
+def should_cache(temperature: Optional[float], policy: Optional[str] = None) -> bool:
+    """
+    Decide whether completions at a temperature may be cached.
+
+    Args:
+        temperature: Sampling temperature of the call
+        policy: off, deterministic or always (defaults to the active profile's)
+
+    Returns:
+        True if the completion cache should be used
+    """
+    policy = policy or PROCESSING_CONFIG["minutes"]["cache_policy"]
+    if policy == "off":
+        return False
+    if policy == "always":
+        return True
+    # Sampled completions are meant to differ between calls
+    return not temperature
+
+
+def _normalize(value: Any) -> Any:
+    """Drop per-call ids and collapse whitespace so equal prompts share a key."""
+    if isinstance(value, dict):
+        return {
+            key: _normalize(item)
+            for key, item in sorted(value.items())
+            if key not in ("id", "run_id")
+        }
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    if isinstance(value, str):
+        return _WHITESPACE.sub(" ", value).strip()
+    return value
+
+
+def make_key(
+    messages: Sequence[Dict[str, Any]], model: str, params: Dict[str, Any]
+) -> str:
+    """
+    Build a cache key from messages, model and sampling parameters.
+
+    Args:
+        messages: Chat messages as dicts with role and content
+        model: Model name
+        params: Call keyword arguments; only sampling parameters are used
+
+    Returns:
+        Hex digest identifying the completion
+    """
+    sampling = {
+        name: params[name] for name in SAMPLING_PARAMS if params.get(name) is not None
+    }
+    payload = {
+        "messages": [
+            _normalize({"role": m.get("role"), "content": m.get("content")})
+            for m in messages
+        ],
+        "model": model,
+        "params": sampling,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CacheStats:
+    """Hit and miss counters of one job."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.time_saved = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "time_saved_seconds": round(self.time_saved, 3),
+        }
+
+
+class CompletionCache:
+    """SQLite-backed completion store with TTL and size-bounded LRU eviction."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_size_mb: Optional[float] = None,
+    ):
+        self.path = Path(path or LLM_CACHE_CONFIG["path"])
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else LLM_CACHE_CONFIG["ttl_seconds"]
+        )
+        max_size_mb = (
+            max_size_mb if max_size_mb is not None else LLM_CACHE_CONFIG["max_size_mb"]
+        )
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._stats: Dict[str, CacheStats] = {}
+        # key -> time the generation for a missed lookup started
+        self._pending: Dict[str, float] = {}
+
+    def _db(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS completions ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " elapsed REAL NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS completions_lru"
+                " ON completions (accessed_at)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def _job_stats(self) -> CacheStats:
+        token = current_token()
+        job_id = token.job_id if token is not None else ""
+        return self._stats.setdefault(job_id, CacheStats())
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a completion.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            The stored value, or None on a miss or expired entry
+        """
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            row = db.execute(
+                "SELECT value, elapsed, created_at FROM completions WHERE key = ?",
+                (key,),
+            ).fetchone()
+            stats = self._job_stats()
+
+            if (
+                row is not None
+                and self.ttl_seconds
+                and (now - row[2] > self.ttl_seconds)
+            ):
+                db.execute("DELETE FROM completions WHERE key = ?", (key,))
+                db.commit()
+                row = None
+
+            if row is None:
+                stats.misses += 1
+                self._pending[key] = time.monotonic()
+                return None
+
+            db.execute(
+                "UPDATE completions SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            db.commit()
+            stats.hits += 1
+            stats.time_saved += row[1]
+        logger.debug(f"LLM cache hit {key[:12]} (saved {row[1]:.1f}s)")
+        return row[0]
+
+    def put(self, key: str, value: str, elapsed: Optional[float] = None) -> None:
+        """
+        Store a completion and evict old entries beyond the size limit.
+
+        Args:
+            key: Key from make_key()
+            value: Serialized completion
+            elapsed: Seconds the completion took to generate (measured from
+                the missed lookup if omitted)
+        """
+        now = time.time()
+        with self._lock:
+            started = self._pending.pop(key, None)
+            if elapsed is None:
+                elapsed = time.monotonic() - started if started is not None else 0.0
+            size = len(value.encode("utf-8"))
+            if self.max_bytes and size > self.max_bytes:
+                return
+
+            db = self._db()
+            db.execute(
+                "INSERT OR REPLACE INTO completions"
+                " (key, value, size, elapsed, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, value, size, elapsed, now, now),
+            )
+            self._evict(db)
+            db.commit()
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        if self.ttl_seconds:
+            db.execute(
+                "DELETE FROM completions WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+        if not self.max_bytes:
+            return
+
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM completions").fetchone()
+        excess = total[0] - self.max_bytes
+        if excess <= 0:
+            return
+
+        evicted = 0
+        for key, size in db.execute(
+            "SELECT key, size FROM completions ORDER BY accessed_at"
+        ).fetchall():
+            if excess <= 0:
+                break
+            db.execute("DELETE FROM completions WHERE key = ?", (key,))
+            excess -= size
+            evicted += 1
+        logger.debug(f"Evicted {evicted} least recently used LLM completion(s)")
+
+    def clear(self) -> None:
+        """Remove every stored completion."""
+        with self._lock:
+            db = self._db()
+            db.execute("DELETE FROM completions")
+            db.commit()
+
+    def job_stats(self, job_id: str) -> Dict[str, Any]:
+        """Return hit rate and time saved for a job."""
+        with self._lock:
+            return self._stats.get(job_id, CacheStats()).to_dict()
+
+    def pop_job_stats(self, job_id: str) -> Dict[str, Any]:
+        """Return and forget the stats of a finished job."""
+        with self._lock:
+            return self._stats.pop(job_id, CacheStats()).to_dict()
+
+    def langchain(self) -> "LangChainCompletionCache":
+        """Return an adapter usable as a LangChain chat model cache."""
+        return LangChainCompletionCache(self)
+
+
+class LangChainCompletionCache(BaseCache):
+    """LangChain cache interface over a CompletionCache."""
+
+    def __init__(self, store: CompletionCache):
+        self.store = store
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        try:
+            prompt_data: Any = json.loads(prompt)
+        except ValueError:
+            prompt_data = prompt
+        encoded = json.dumps(
+            {"prompt": _normalize(prompt_data), "llm": llm_string},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        value = self.store.get(self._key(prompt, llm_string))
+        note_cache_lookup("langchain", hit=value is not None)
+        if value is None:
+            return None
+        try:
+            return [loads(item) for item in json.loads(value)]
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cached completion: {e}")
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE):
+        value = json.dumps([dumps(generation) for generation in return_val])
+        self.store.put(self._key(prompt, llm_string), value)
+
+    def clear(self, **kwargs: Any) -> None:
+        self.store.clear()
+
+
+def messages_for_key(messages: List[Any]) -> List[Dict[str, Any]]:
+    """Convert LiteLLM/OpenAI style messages to plain role/content dicts."""
+    return [
+        (
+            message
+            if isinstance(message, dict)
+            else {"role": getattr(message, "role", None), "content": str(message)}
+        )
+        for message in messages
+    ]
+
+
+# Process-wide cache shared by all jobs in this worker
+completion_cache = CompletionCache()
@@ -0,0 +1,380 @@
+"""
+Context-window budgeting for Meeting Minutes Agent.
+
+The context length of the local model is discovered from the server's
+metadata (``/v1/models``, and llama-server's ``/props`` for the context each
+slot actually runs with) or taken from the configuration. Prompt sizes are
+estimated without a model-specific tokenizer, so long transcripts can be
+split into the fewest segments that fit and every request gets a
+``max_tokens`` its prompt leaves room for, instead of being truncated or
+failing with a context overflow after minutes of prompt processing.
+"""
+
+import math
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from ..config.app_config import (
+    API_CONFIG,
+    LLM_CONTEXT_CONFIG,
+    LLM_POOL_CONFIG,
+    LLM_RESILIENCE_CONFIG,
+    LLM_TIER_CONFIG,
+)
+from .cancellation import current_token
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Model metadata fields servers use for the context length
+# (vLLM, LM Studio/OpenRouter, others; llama-server nests them under "meta")
+CONTEXT_FIELDS = ("max_model_len", "context_length", "context_window", "n_ctx")
+META_FIELDS = ("n_ctx", "n_ctx_train")
+
+# Chat template tokens added around each message
+_PER_MESSAGE_TOKENS = 4
+_PIECE = re.compile(r"\w+|[^\w\s]")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+class ContextOverflowError(ValueError):
+    """Raised instead of sending a prompt the model's context cannot hold."""
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens of a text.
+
+    Counts words and punctuation marks, and at least one token per
+    ``chars_per_token`` characters. BPE tokenizers rarely produce more tokens
+    than that for transcripts, so the estimate errs on the large side.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Estimated token count
+    """
+    if not text:
+        return 0
+    by_chars = len(text) / LLM_CONTEXT_CONFIG["chars_per_token"]
+    return math.ceil(max(by_chars, len(_PIECE.findall(text))))
+
+
+def _content(message: Any) -> Any:
+    if isinstance(message, dict):
+        return message.get("content")
+    if isinstance(message, (tuple, list)) and len(message) == 2:
+        return message[1]
+    return getattr(message, "content", message)
+
+
+def estimate_messages_tokens(messages: Iterable[Any]) -> int:
+    """
+    Estimate the prompt tokens of a chat.
+
+    Args:
+        messages: OpenAI-style dicts, (role, content) tuples or LangChain
+            messages
+
+    Returns:
+        Estimated token count including the chat template overhead
+    """
+    total = 0
+    for message in messages:
+        content = _content(message)
+        if isinstance(content, list):
+            # Multi-part content: only the text parts count
+            content = " ".join(
+                part.get("text", "") for part in content if isinstance(part, dict)
+            )
+        total += estimate_tokens(str(content or "")) + _PER_MESSAGE_TOKENS
+    return total
+
+
+def parse_context_window(payload: Dict[str, Any]) -> Optional[int]:
+    """
+    Read the context length from a ``/models`` response.
+
+    Args:
+        payload: Decoded ``/models`` response
+
+    Returns:
+        The smallest context length of the listed models, or None if the
+        server does not report one
+    """
+    windows = []
+    for entry in payload.get("data") or []:
+        if not isinstance(entry, dict):
+            continue
+        meta = entry.get("meta") if isinstance(entry.get("meta"), dict) else {}
+        candidates = [entry.get(field) for field in CONTEXT_FIELDS]
+        candidates += [meta.get(field) for field in META_FIELDS]
+        found = [int(value) for value in candidates if isinstance(value, int)]
+        if found:
+            windows.append(found[0])
+    return min(windows) if windows else None
+
+
+def split_text(text: str, max_tokens: int) -> List[str]:
+    """
+    Split a text into the fewest segments of at most max_tokens each.
+
+    Segments end at sentence boundaries (at word boundaries for sentences
+    that are longer than a segment) and are of similar size.
+
+    Args:
+        text: Text to split, e.g. a transcript
+        max_tokens: Estimated tokens a segment may hold
+
+    Returns:
+        Segments in order; the whole text if it fits
+    """
+    text = text.strip()
+    if estimate_tokens(text) <= max_tokens:
+        return [text] if text else []
+
+    # A joined segment is never estimated larger than its units plus one
+    # token per separating space
+    units: List[Tuple[str, int]] = []
+    for sentence in _SENTENCE_END.split(text):
+        cost = estimate_tokens(sentence) + 1
+        if cost <= max_tokens:
+            units.append((sentence, cost))
+            continue
+        for word in sentence.split():
+            units.append((word, estimate_tokens(word) + 1))
+
+    def pack(target: float) -> List[List[str]]:
+        segments: List[List[str]] = []
+        current: List[str] = []
+        size = 0
+        for unit, cost in units:
+            if current and (size + cost > max_tokens or size >= target):
+                segments.append(current)
+                current, size = [], 0
+            current.append(unit)
+            size += cost
+        if current:
+            segments.append(current)
+        return segments
+
+    # Filling each segment to the limit gives the fewest segments; spreading
+    # the text evenly over that many keeps the last one from being a stub
+    fewest = pack(math.inf)
+    total = sum(cost for _, cost in units)
+    balanced = pack(total / len(fewest))
+    segments = balanced if len(balanced) == len(fewest) else fewest
+    return [" ".join(segment) for segment in segments]
+
+
+class ContextBudget:
+    """Knows the model's context window and divides it between prompt parts."""
+
+    def __init__(
+        self,
+        window: Optional[int] = None,
+        ttl: Optional[float] = None,
+        probe_timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            window: Context length in tokens (default: configured or discovered)
+            ttl: How long a discovered context length is trusted
+            probe_timeout: Timeout of the metadata requests
+        """
+        self._window = window
+        self.ttl = ttl if ttl is not None else LLM_RESILIENCE_CONFIG["model_cache_ttl"]
+        self.probe_timeout = probe_timeout or LLM_RESILIENCE_CONFIG["probe_timeout"]
+        self._lock = threading.Lock()
+        self._discovered: Dict[str, Tuple[Optional[int], float]] = {}
+        self._plans: Dict[str, Dict[str, Any]] = {}
+
+    def window(self, base_urls: Optional[List[str]] = None) -> int:
+        """
+        Return the context length prompts must fit in.
+
+        Args:
+            base_urls: Endpoints a prompt may be sent to (default: the
+                configured pool and tier endpoints); the smallest of their
+                windows is used
+
+        Returns:
+            Context length in tokens
+        """
+        configured = self._window or LLM_CONTEXT_CONFIG["window"]
+        if configured:
+            return configured
+
+        # By default a prompt may go to any endpoint of any model tier
+        urls = base_urls or LLM_POOL_CONFIG["endpoints"] + [
+            url
+            for tier in LLM_TIER_CONFIG["tiers"].values()
+            for url in tier["endpoints"]
+        ]
+        windows = [w for w in (self._discover(url) for url in urls) if w]
+        if windows:
+            return min(windows)
+        return LLM_CONTEXT_CONFIG["fallback_window"]
+
+    def _discover(self, base_url: str) -> Optional[int]:
+        base_url = base_url.rstrip("/")
+        with self._lock:
+            window, discovered_at = self._discovered.get(base_url, (None, 0.0))
+            if time.monotonic() - discovered_at < self.ttl:
+                return window
+
+        window = None
+        try:
+            response = requests.get(f"{base_url}/models", timeout=self.probe_timeout)
+            if response.ok:
+                window = parse_context_window(response.json())
+        except (requests.RequestException, ValueError, AttributeError) as e:
+            logger.debug(f"No model metadata from {base_url}: {e}")
+
+        # llama-server lists the model's training context in /models, but each
+        # slot runs with the (often smaller) context it was started with
+        root = base_url[: -len("/v1")] if base_url.endswith("/v1") else base_url
+        try:
+            response = requests.get(f"{root}/props", timeout=self.probe_timeout)
+            if response.ok:
+                props = response.json()
+                settings = props.get("default_generation_settings") or {}
+                n_ctx = settings.get("n_ctx") or props.get("n_ctx")
+                if isinstance(n_ctx, int) and n_ctx > 0:
+                    window = n_ctx
+        except (requests.RequestException, ValueError, AttributeError):
+            pass
+
+        if window:
+            logger.info(f"Context window of {base_url}: {window} tokens")
+        else:
+            logger.warning(
+                f"{base_url} does not report its context length; assuming "
+                f"{LLM_CONTEXT_CONFIG['fallback_window']} tokens "
+                "(set LLM_CONTEXT_WINDOW to override)"
+            )
+        with self._lock:
+            self._discovered[base_url] = (window, time.monotonic())
+        return window
+
+    @staticmethod
+    def margin(window: int) -> int:
+        """Tokens kept free to absorb estimation error."""
+        return math.ceil(window * LLM_CONTEXT_CONFIG["safety_margin"])
+
+    def output_reserve(self, window: int) -> int:
+        """Tokens reserved for an answer when planning a prompt."""
+        return min(API_CONFIG["openai"]["max_tokens"], window // 4)
+
+    def transcript_tokens(
+        self, reserved_tokens: int, base_urls: Optional[List[str]] = None
+    ) -> int:
+        """
+        Return how many transcript tokens fit in one prompt.
+
+        Args:
+            reserved_tokens: Tokens of the rest of the prompt
+            base_urls: Endpoints the prompt may be sent to
+
+        Returns:
+            Estimated tokens available for the transcript
+        """
+        window = self.window(base_urls)
+        return (
+            window - reserved_tokens - self.output_reserve(window) - self.margin(window)
+        )
+
+    def split(
+        self,
+        text: str,
+        reserved_tokens: int,
+        base_urls: Optional[List[str]] = None,
+    ) -> List[str]:
+        """
+        Split a transcript into the fewest segments that fit a prompt.
+
+        The plan is recorded for the calling job (see pop_job_stats).
+
+        Args:
+            text: Transcript
+            reserved_tokens: Tokens of the rest of the prompt
+            base_urls: Endpoints the prompts may be sent to
+
+        Returns:
+            Segments in order; the whole transcript if it fits
+
+        Raises:
+            ContextOverflowError: If the rest of the prompt leaves no room
+        """
+        room = self.transcript_tokens(reserved_tokens, base_urls)
+        if room < LLM_CONTEXT_CONFIG["min_output_tokens"]:
+            raise ContextOverflowError(
+                f"A {reserved_tokens}-token prompt leaves no room for the "
+                f"transcript in a {self.window(base_urls)}-token context window"
+            )
+        segments = split_text(text, room)
+        self._record_plan(estimate_tokens(text), len(segments), base_urls)
+        return segments
+
+    def fit_request(
+        self, kwargs: Dict[str, Any], base_urls: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Set ``max_tokens`` to what a chat completion's prompt leaves room for.
+
+        Args:
+            kwargs: Arguments for ``chat.completions.create`` or LiteLLM
+            base_urls: Endpoints the request may be sent to
+
+        Returns:
+            New arguments with ``max_tokens`` capped by the free context
+
+        Raises:
+            ContextOverflowError: If the prompt alone (nearly) fills the window
+        """
+        window = self.window(base_urls)
+        prompt_tokens = estimate_messages_tokens(kwargs.get("messages") or [])
+        room = window - prompt_tokens - self.margin(window)
+        if room < LLM_CONTEXT_CONFIG["min_output_tokens"]:
+            raise ContextOverflowError(
+                f"Prompt of about {prompt_tokens} tokens does not fit the "
+                f"{window}-token context window"
+            )
+        fitted = dict(kwargs)
+        requested = kwargs.get("max_tokens") or API_CONFIG["openai"]["max_tokens"]
+        fitted["max_tokens"] = min(requested, room)
+        return fitted
+
+    def _record_plan(
+        self, tokens: int, segments: int, base_urls: Optional[List[str]]
+    ) -> None:
+        token = current_token()
+        job_id = token.job_id if token is not None else ""
+        window = self.window(base_urls)
+        with self._lock:
+            plan = self._plans.setdefault(job_id, {"prompts": []})
+            plan["window"] = window
+            plan["prompts"].append({"tokens": tokens, "segments": segments})
+
+    def pop_job_stats(self, job_id: str) -> Dict[str, Any]:
+        """
+        Return and forget how a finished job's transcripts were budgeted.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The context window and, per split text, its estimated tokens and
+            the number of segments it was sent in
+        """
+        with self._lock:
+            return self._plans.pop(job_id, {"prompts": []})
+
+
+# Process-wide budget (and discovered windows) shared by all jobs in this worker
+context_budget = ContextBudget()
@@ -0,0 +1,312 @@
+"""
+Load balancing across several local LLM server instances.
+
+Completions are routed to the healthy endpoint with the fewest requests in
+flight, so parallel jobs and segments spread over every instance instead of
+queuing on one. A background probe ejects endpoints whose ``/models`` check
+fails and readmits them once they answer again; endpoints that fail real
+requests are ejected by their own circuit breaker.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import requests
+
+from ..config.app_config import LLM_POOL_CONFIG, LLM_SERVER
+from .completion_cache import make_key
+from .context_budget import context_budget
+from .llm_clients import llm_client_registry
+from .llm_trace import LLMCallTrace, llm_tracer
+from .logger import setup_logger
+from .model_registry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ModelResolver,
+    is_server_failure,
+    model_resolver,
+)
+from .prompt_layout import prepare_request
+from .request_coalescer import RequestCoalescer, request_coalescer
+
+logger = setup_logger(__name__)
+
+
+class Endpoint:
+    """One LLM server instance and its load."""
+
+    def __init__(self, base_url: str, breaker: Optional[CircuitBreaker] = None):
+        self.base_url = base_url.rstrip("/")
+        self.breaker = breaker or CircuitBreaker(f"LLM endpoint {self.base_url}")
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.breaker.state,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "failures": self.failures,
+        }
+
+
+class EndpointPool:
+    """Routes LLM requests by least outstanding requests across endpoints."""
+
+    def __init__(
+        self,
+        base_urls: Optional[List[str]] = None,
+        probe_interval: Optional[float] = None,
+        probe_timeout: Optional[float] = None,
+    ):
+        urls = base_urls or LLM_POOL_CONFIG["endpoints"] or [LLM_SERVER["base_url"]]
+        self.endpoints = [Endpoint(url) for url in dict.fromkeys(urls)]
+        self.probe_interval = (
+            probe_interval
+            if probe_interval is not None
+            else LLM_POOL_CONFIG["probe_interval"]
+        )
+        self.probe_timeout = probe_timeout or LLM_POOL_CONFIG["probe_timeout"]
+        # Models are discovered from these endpoints, not LLM_SERVER; the
+        # service-wide breaker is shared with every other pool
+        self.resolver = ModelResolver(pool=self, breaker=model_resolver.breaker)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._prober: Optional[threading.Thread] = None
+
+    def _select(self) -> Endpoint:
+        with self._lock:
+            # Fewest in flight first; fewest served breaks ties, so an idle
+            # pool is used round-robin
+            for endpoint in sorted(
+                self.endpoints, key=lambda e: (e.outstanding, e.requests)
+            ):
+                try:
+                    # Skips ejected endpoints; one due for a trial is let in
+                    endpoint.breaker.before_call()
+                except CircuitOpenError:
+                    continue
+                endpoint.outstanding += 1
+                endpoint.requests += 1
+                return endpoint
+        raise CircuitOpenError(
+            f"All {len(self.endpoints)} LLM endpoint(s) are unavailable"
+        )
+
+    def _release(self, endpoint: Endpoint, error: Optional[BaseException]) -> None:
+        with self._lock:
+            endpoint.outstanding -= 1
+            if error is not None and is_server_failure(error):
+                endpoint.failures += 1
+        if error is not None and is_server_failure(error):
+            endpoint.breaker.record_failure()
+        else:
+            endpoint.breaker.record_success()
+
+    @contextmanager
+    def acquire(self) -> Iterator[Endpoint]:
+        """
+        Reserve the least loaded healthy endpoint for one request.
+
+        Yields:
+            The chosen endpoint; an exception raised in the block counts
+            against it if it means the server is unhealthy
+
+        Raises:
+            CircuitOpenError: If every endpoint is ejected
+        """
+        self.start_probing()
+        endpoint = self._select()
+        try:
+            yield endpoint
+        except BaseException as e:
+            self._release(endpoint, e)
+            raise
+        self._release(endpoint, None)
+
+    def admissible(self) -> bool:
+        """Return True if some endpoint is not ejected."""
+        return any(e.breaker.state != CircuitBreaker.OPEN for e in self.endpoints)
+
+    def record_outcome(
+        self, breaker: CircuitBreaker, error: Optional[BaseException] = None
+    ) -> None:
+        """
+        Count a call's outcome against the breaker of the whole LLM service.
+
+        A lone endpoint is the whole service, so its failures count. In a pool
+        each endpoint's own breaker ejects it and calls are routed around it;
+        the service's circuit only opens once no endpoint is left.
+
+        Args:
+            breaker: Breaker guarding every call, e.g. the model resolver's
+            error: What the call raised, or None if it succeeded
+        """
+        if error is None or not is_server_failure(error):
+            breaker.record_success()
+        elif len(self.endpoints) < 2:
+            breaker.record_failure()
+        elif not self.admissible():
+            breaker.trip()
+
+    def probe(self) -> None:
+        """Check every endpoint once, ejecting or readmitting it."""
+        for endpoint in self.endpoints:
+            try:
+                response = requests.get(
+                    f"{endpoint.base_url}/models", timeout=self.probe_timeout
+                )
+                healthy = response.status_code < 500
+            except requests.RequestException:
+                healthy = False
+
+            if healthy:
+                if endpoint.breaker.state != CircuitBreaker.CLOSED:
+                    logger.info(f"LLM endpoint {endpoint.base_url} readmitted")
+                endpoint.breaker.record_success()
+            elif endpoint.breaker.state != CircuitBreaker.OPEN:
+                logger.warning(f"LLM endpoint {endpoint.base_url} failed its probe")
+                endpoint.breaker.trip()
+
+    def _probe_loop(self) -> None:
+        while not self._stop.wait(self.probe_interval):
+            try:
+                self.probe()
+            except Exception as e:
+                logger.warning(f"LLM endpoint probe failed: {e}")
+
+    def start_probing(self) -> None:
+        """Start the background health probe if there is a pool to balance."""
+        if len(self.endpoints) < 2 or not self.probe_interval:
+            return
+        with self._lock:
+            if self._prober is not None:
+                return
+            self._stop.clear()
+            self._prober = threading.Thread(
+                target=self._probe_loop, name="llm-endpoint-probe", daemon=True
+            )
+            self._prober.start()
+
+    def stop(self) -> None:
+        """Stop the background health probe."""
+        self._stop.set()
+        with self._lock:
+            prober, self._prober = self._prober, None
+        if prober is not None:
+            prober.join(timeout=self.probe_timeout + 1)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the state and load of each endpoint."""
+        with self._lock:
+            return {e.base_url: e.snapshot() for e in self.endpoints}
+
+
+class RoutedCompletions:
+    """
+    Drop-in for ``OpenAI().chat.completions`` that balances over a pool.
+
+    Each ``create()`` call goes to the least loaded endpoint through that
+    endpoint's pooled client. A streamed response holds its endpoint until
+    the stream has been consumed. Other requests are batched with concurrent
+    ones by the request coalescer (when it is enabled) before an endpoint is
+    chosen for them. Messages are laid out for prompt caching first and
+    ``max_tokens`` is fitted to the model's context window.
+    """
+
+    def __init__(
+        self,
+        pool: Optional[EndpointPool] = None,
+        api_key: str = "",
+        coalescer: Optional[RequestCoalescer] = None,
+    ):
+        self.pool = pool or endpoint_pool
+        self.api_key = api_key or LLM_SERVER["api_key"]
+        self.coalescer = coalescer or request_coalescer
+
+    def _prepare(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # Lay the prompt out for caching, then cap max_tokens by the room its
+        # prompt leaves in the smallest context window of the pool
+        base_urls = [endpoint.base_url for endpoint in self.pool.endpoints]
+        return context_budget.fit_request(prepare_request(kwargs), base_urls)
+
+    def create(self, **kwargs: Any) -> Any:
+        kwargs = self._prepare(kwargs)
+        if kwargs.get("stream"):
+            return self._stream(**kwargs)
+
+        with llm_tracer.trace("langchain", model=kwargs.get("model")) as call:
+            call.record_request(kwargs)
+
+            def send():
+                with self.pool.acquire() as endpoint:
+                    call.set(endpoint=endpoint.base_url)
+                    clients = llm_client_registry.get(endpoint.base_url, self.api_key)
+                    return clients.client.chat.completions.create(**kwargs)
+
+            # Identical deterministic requests in one batch are sent only once
+            key = None
+            if not kwargs.get("temperature"):
+                key = make_key(
+                    kwargs.get("messages") or [], kwargs.get("model"), kwargs
+                )
+            response = self.coalescer.call(send, key)
+            call.record_usage(getattr(response, "usage", None))
+            return response
+
+    def _stream(self, **kwargs: Any) -> Iterator[Any]:
+        with llm_tracer.trace(
+            "langchain", model=kwargs.get("model"), stream=True
+        ) as call:
+            call.record_request(kwargs)
+            with self.pool.acquire() as endpoint:
+                call.set(endpoint=endpoint.base_url)
+                clients = llm_client_registry.get(endpoint.base_url, self.api_key)
+                for chunk in clients.client.chat.completions.create(**kwargs):
+                    _trace_chunk(call, chunk)
+                    yield chunk
+
+
+class AsyncRoutedCompletions(RoutedCompletions):
+    """Async counterpart of RoutedCompletions."""
+
+    async def create(self, **kwargs: Any) -> Any:
+        kwargs = self._prepare(kwargs)
+        if kwargs.get("stream"):
+            return self._astream(**kwargs)
+        with llm_tracer.trace("langchain", model=kwargs.get("model")) as call:
+            call.record_request(kwargs)
+            with self.pool.acquire() as endpoint:
+                call.set(endpoint=endpoint.base_url)
+                clients = llm_client_registry.get(endpoint.base_url, self.api_key)
+                response = await clients.async_client.chat.completions.create(**kwargs)
+            call.record_usage(getattr(response, "usage", None))
+            return response
+
+    async def _astream(self, **kwargs: Any):
+        with llm_tracer.trace(
+            "langchain", model=kwargs.get("model"), stream=True
+        ) as call:
+            call.record_request(kwargs)
+            with self.pool.acquire() as endpoint:
+                call.set(endpoint=endpoint.base_url)
+                clients = llm_client_registry.get(endpoint.base_url, self.api_key)
+                async for chunk in await clients.async_client.chat.completions.create(
+                    **kwargs
+                ):
+                    _trace_chunk(call, chunk)
+                    yield chunk
+
+
+def _trace_chunk(call: LLMCallTrace, chunk: Any) -> None:
+    """Count a streamed chunk's token and take usage from the final chunk."""
+    choices = getattr(chunk, "choices", None)
+    if choices and getattr(choices[0].delta, "content", None):
+        call.on_token()
+    call.record_usage(getattr(chunk, "usage", None))
+
+
+# Process-wide pool of the configured LLM endpoints
+endpoint_pool = EndpointPool()
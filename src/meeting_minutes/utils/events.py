@@ -0,0 +1,163 @@
+"""
+Progress events for streaming meeting minutes results.
+
+The flow publishes events to the process-wide ``event_bus`` as each stage
+produces output, so callers can show partial results long before the whole
+pipeline finishes.
+"""
+
+import queue
+import threading
+import time
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional
+
+from pydantic import BaseModel, Field
+
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class EventType(str, Enum):
+    """Kinds of progress events emitted by the meeting minutes flow."""
+
+    STARTED = "started"
+    TRANSCRIPT_CHUNK = "transcript_chunk"
+    TRANSCRIPT = "transcript"
+    SUMMARY = "summary"
+    ACTION_ITEMS = "action_items"
+    SENTIMENT = "sentiment"
+    MINUTES_TOKEN = "minutes_token"
+    MINUTES = "minutes"
+    DRAFT = "draft"
+    ERROR = "error"
+    CANCELLED = "cancelled"
+    COMPLETED = "completed"
+
+
+# Events after which no further events are published for a job
+TERMINAL_EVENTS = {EventType.COMPLETED, EventType.ERROR, EventType.CANCELLED}
+
+
+class ProgressEvent(BaseModel):
+    """A single progress event for a job."""
+
+    job_id: str
+    type: EventType
+    sequence: int
+    data: Any = None
+    timestamp: float = Field(default_factory=time.time)
+
+
+class EventStream:
+    """Iterable subscription to the events of one job."""
+
+    def __init__(self, bus: "EventBus", job_id: str, maxsize: int = 0):
+        self.bus = bus
+        self.job_id = job_id
+        self._queue: "queue.Queue[ProgressEvent]" = queue.Queue(maxsize=maxsize)
+
+    def put(self, event: ProgressEvent) -> None:
+        """Deliver an event to this subscriber."""
+        self._queue.put(event)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[ProgressEvent]:
+        """
+        Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait, or None to wait forever
+
+        Returns:
+            The next event, or None if the timeout expired
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        self.bus.unsubscribe(self)
+
+    def __iter__(self) -> Iterator[ProgressEvent]:
+        try:
+            while True:
+                event = self._queue.get()
+                yield event
+                if event.type in TERMINAL_EVENTS:
+                    return
+        finally:
+            self.close()
+
+
+class EventBus:
+    """Thread-safe fan-out of progress events to per-job subscribers."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, List[EventStream]] = {}
+        self._sequences: Dict[str, int] = {}
+
+    def subscribe(self, job_id: str, maxsize: int = 0) -> EventStream:
+        """
+        Subscribe to the events of a job.
+
+        Args:
+            job_id: Job identifier
+            maxsize: Maximum number of undelivered events (0 for unbounded)
+
+        Returns:
+            EventStream yielding events until the job completes or fails
+        """
+        stream = EventStream(self, job_id, maxsize=maxsize)
+        with self._lock:
+            self._subscribers.setdefault(job_id, []).append(stream)
+        return stream
+
+    def unsubscribe(self, stream: EventStream) -> None:
+        """Remove a subscriber."""
+        with self._lock:
+            streams = self._subscribers.get(stream.job_id, [])
+            if stream in streams:
+                streams.remove(stream)
+            if not streams:
+                self._subscribers.pop(stream.job_id, None)
+
+    def publish(
+        self, job_id: str, event_type: EventType, data: Any = None
+    ) -> Optional[ProgressEvent]:
+        """
+        Publish an event to all subscribers of a job.
+
+        Args:
+            job_id: Job identifier (events without a job are dropped)
+            event_type: Kind of event
+            data: Event payload
+
+        Returns:
+            The published event, or None if it was dropped
+        """
+        if not job_id:
+            return None
+
+        with self._lock:
+            sequence = self._sequences.get(job_id, 0) + 1
+            self._sequences[job_id] = sequence
+            if event_type in TERMINAL_EVENTS:
+                self._sequences.pop(job_id, None)
+            streams = list(self._subscribers.get(job_id, []))
+
+        event = ProgressEvent(
+            job_id=job_id, type=event_type, sequence=sequence, data=data
+        )
+        for stream in streams:
+            stream.put(event)
+
+        logger.debug(f"Published {event_type.value} event #{sequence} for {job_id}")
+        return event
+
+
+# Process-wide event bus used by the flow
+event_bus = EventBus()
@@ -0,0 +1,333 @@
+"""
+Extractive summarization for Meeting Minutes Agent.
+
+Ranks the sentences of a transcript by TextRank centrality over TF-IDF
+sentence vectors and keeps the most central ones, in their original order,
+without an LLM. The sentence similarity graph is never built: with the
+L2-normalized TF-IDF rows X, the cosine similarities are X·Xᵀ, so each power
+iteration is two sparse products, X·(Xᵀ·q), linear in the number of terms
+instead of quadratic in the number of sentences. Sentences can be fed a
+chunk of text at a time, for transcripts too large to hold as one string.
+"""
+
+import re
+from array import array
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from .keyword_matcher import KeywordMatcher, compile_keywords
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Words or phrases, or a matcher already compiled from them
+FocusKeywords = Union[Sequence[str], KeywordMatcher]
+
+# Sentences end at terminal punctuation followed by whitespace, or at a
+# blank line
+_BOUNDARY = re.compile(r"[.!?\u2026]+[\"'\u2019\u201d)\]]*(?=\s)|\n[ \t]*\n")
+# Words of two or more letters or digits, with inner apostrophes
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9']*[a-z0-9]")
+_ABBREVIATIONS = frozenset(
+    "mr mrs ms dr prof sr jr st vs etc eg ie approx dept inc ltd co corp no "
+    "jan feb mar apr jun jul aug sep sept oct nov dec".split()
+)
+# Longest run of text without a sentence boundary held back while streaming
+MAX_SENTENCE_CHARS = 10_000
+
+STOPWORDS = frozenset(
+    """a about above after again against all am an and any are as at be because
+    been before being below between both but by can could did do does doing
+    down during each few for from further had has have having he her here hers
+    herself him himself his how i if in into is it its itself just let me more
+    most my myself no nor not now of off on once only or other our ours
+    ourselves out over own same she should so some such than that the their
+    theirs them themselves then there these they this those through to too
+    under until up very was we were what when where which while who whom why
+    will with would you your yours yourself yourselves i'm it's that's we're
+    you're they're don't i'll we'll gonna okay ok yeah yes um uh hmm like
+    right well oh also really actually sure thing things get got go going
+    know think one""".split()
+)
+
+
+def _ends_with_abbreviation(sentence: str) -> bool:
+    if not sentence.endswith(".") or sentence.endswith(".."):
+        return False
+    words = sentence[:-1].rsplit(None, 1)
+    word = words[-1].lstrip("(\"'") if words else ""
+    if len(word) == 1:
+        # An initial, as in "J. Smith"
+        return word.isupper()
+    return word.replace(".", "").lower() in _ABBREVIATIONS
+
+
+def iter_sentences(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Split text arriving in chunks into sentences.
+
+    Chunks may end anywhere, even mid-word. Whitespace inside a sentence is
+    collapsed; abbreviations, initials and decimals don't end one.
+
+    Args:
+        chunks: Consecutive pieces of the text
+
+    Yields:
+        The sentences in order
+    """
+    carry = ""
+    held = ""
+
+    def complete(sentence: str) -> Iterator[str]:
+        nonlocal held
+        sentence = " ".join(sentence.split())
+        if not sentence:
+            return
+        if held:
+            sentence = f"{held} {sentence}"
+        if _ends_with_abbreviation(sentence) and len(sentence) < MAX_SENTENCE_CHARS:
+            held = sentence
+            return
+        held = ""
+        yield sentence
+
+    for chunk in chunks:
+        carry += chunk
+        start = 0
+        for match in _BOUNDARY.finditer(carry):
+            yield from complete(carry[start : match.end()])
+            start = match.end()
+        # The rest may continue in the next chunk
+        carry = carry[start:]
+        if len(carry) > MAX_SENTENCE_CHARS:
+            cut = carry.rfind(" ", 0, MAX_SENTENCE_CHARS) + 1 or MAX_SENTENCE_CHARS
+            yield from complete(carry[:cut])
+            carry = carry[cut:]
+
+    yield from complete(carry)
+    if held:
+        yield held
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences (see iter_sentences)."""
+    return list(iter_sentences([text]))
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase content words of a text, without stopwords."""
+    return [token for token in _TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class TermMatrix:
+    """Term ids of sentences, added one at a time, as a sparse TF-IDF matrix."""
+
+    def __init__(self):
+        self.vocabulary: Dict[str, int] = {}
+        self._terms = array("i")
+        # Number of term occurrences in each sentence
+        self._lengths = array("i")
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, sentence: str) -> None:
+        """Append a sentence as the next row."""
+        vocabulary = self.vocabulary
+        terms = [
+            vocabulary.setdefault(token, len(vocabulary))
+            for token in _TOKEN.findall(sentence.lower())
+            if token not in STOPWORDS
+        ]
+        self._terms.extend(terms)
+        self._lengths.append(len(terms))
+
+    def tfidf(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Build the L2-normalized TF-IDF matrix in coordinate form.
+
+        Term frequencies are sublinear (1 + log tf) and the IDF smoothed, as
+        in scikit-learn's TfidfVectorizer.
+
+        Returns:
+            Row (sentence) ids, column (term) ids and weights of the
+            non-zero entries, sorted by row
+        """
+        sentences, terms = len(self), max(1, len(self.vocabulary))
+        rows = np.repeat(
+            np.arange(sentences, dtype=np.int64),
+            np.frombuffer(self._lengths, dtype=np.int32),
+        )
+        cols = np.frombuffer(self._terms, dtype=np.int32).astype(np.int64)
+        keys, counts = np.unique(rows * terms + cols, return_counts=True)
+        rows, cols = np.divmod(keys, terms)
+
+        frequency = np.bincount(cols, minlength=terms)
+        idf = np.log((1.0 + sentences) / (1.0 + frequency)) + 1.0
+        weights = (1.0 + np.log(counts)) * idf[cols]
+        norms = np.sqrt(np.bincount(rows, weights=weights**2, minlength=sentences))
+        weights /= norms[rows]
+        return rows, cols, weights
+
+
+def textrank(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    weights: np.ndarray,
+    sentences: int,
+    damping: float = 0.85,
+    tolerance: float = 1e-6,
+    max_iterations: int = 100,
+) -> np.ndarray:
+    """
+    TextRank scores of sentences under cosine similarity of their vectors.
+
+    Args:
+        rows: Sentence ids of the non-zero TF-IDF entries
+        cols: Term ids of the entries
+        weights: Entry weights, each row L2-normalized
+        sentences: Number of sentences
+        damping: Probability of following an edge rather than jumping
+        tolerance: L1 change of the scores at which iteration stops
+        max_iterations: Iterations at most
+
+    Returns:
+        Score of every sentence; the scores sum to 1
+    """
+    if sentences == 0:
+        return np.zeros(0)
+    terms = int(cols.max()) + 1 if len(cols) else 1
+    self_similarity = np.bincount(rows, weights=weights**2, minlength=sentences)
+
+    def similar(q: np.ndarray) -> np.ndarray:
+        # (X·Xᵀ - I)·q without forming X·Xᵀ
+        spread = np.bincount(cols, weights=weights * q[rows], minlength=terms)
+        return (
+            np.bincount(rows, weights=weights * spread[cols], minlength=sentences)
+            - self_similarity * q
+        )
+
+    degree = similar(np.ones(sentences))
+    connected = degree > 1e-12
+    inverse = np.divide(1.0, degree, out=np.zeros(sentences), where=connected)
+    scores = np.full(sentences, 1.0 / sentences)
+    for iteration in range(1, max_iterations + 1):
+        # Sentences sharing no term with any other spread their score evenly
+        dangling = scores[~connected].sum()
+        updated = (1.0 - damping) / sentences + damping * (
+            similar(scores * inverse) + dangling / sentences
+        )
+        change = np.abs(updated - scores).sum()
+        scores = updated
+        if change < tolerance:
+            break
+    logger.debug(f"TextRank of {sentences} sentences took {iteration} iteration(s)")
+    return scores
+
+
+class ExtractiveSummarizer:
+    """Pick the most central sentences of a text by TextRank over TF-IDF."""
+
+    def __init__(
+        self,
+        damping: float = 0.85,
+        tolerance: float = 1e-6,
+        max_iterations: int = 100,
+        keyword_boost: float = 1.0,
+    ):
+        self.damping = damping
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        # Added to a sentence's score per focus keyword occurrence, as a
+        # multiple of the top score, so focused sentences come first
+        self.keyword_boost = keyword_boost
+
+    def rank(
+        self, sentences: Iterable[str], focus_keywords: FocusKeywords = ()
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Score sentences by centrality, boosted by focus keywords.
+
+        Args:
+            sentences: The sentences, consumed once
+            focus_keywords: Words or phrases whose sentences score higher, or
+                a KeywordMatcher compiled from them
+
+        Returns:
+            The sentences and their scores
+        """
+        matcher = (
+            focus_keywords
+            if isinstance(focus_keywords, KeywordMatcher)
+            else compile_keywords(focus_keywords)
+        )
+        matrix = TermMatrix()
+        kept = []
+        hits = array("i")
+        for sentence in sentences:
+            kept.append(sentence)
+            matrix.add(sentence)
+            if len(matcher):
+                hits.append(matcher.count(sentence))
+        rows, cols, weights = matrix.tfidf()
+        scores = textrank(
+            rows,
+            cols,
+            weights,
+            len(kept),
+            self.damping,
+            self.tolerance,
+            self.max_iterations,
+        )
+
+        if len(hits):
+            scores = scores + self.keyword_boost * scores.max() * np.frombuffer(
+                hits, dtype=np.int32
+            )
+        return kept, scores
+
+    def summarize_sentences(
+        self,
+        sentences: Iterable[str],
+        max_sentences: int = 5,
+        focus_keywords: FocusKeywords = (),
+    ) -> List[str]:
+        """
+        Pick the most central sentences.
+
+        Args:
+            sentences: The sentences, consumed once
+            max_sentences: Sentences in the summary at most
+            focus_keywords: Words or phrases whose sentences score higher, or
+                a KeywordMatcher compiled from them
+
+        Returns:
+            The chosen sentences in their original order
+        """
+        kept, scores = self.rank(sentences, focus_keywords)
+        if len(kept) <= max_sentences:
+            return kept
+        # Stable, so equally central sentences are chosen in text order
+        chosen = np.sort(np.argsort(-scores, kind="stable")[: max(0, max_sentences)])
+        logger.info(f"Kept {len(chosen)} of {len(kept)} sentences")
+        return [kept[index] for index in chosen]
+
+    def summarize_stream(
+        self,
+        chunks: Iterable[str],
+        max_sentences: int = 5,
+        focus_keywords: FocusKeywords = (),
+    ) -> List[str]:
+        """Summarize text arriving in chunks, e.g. read from a large file."""
+        return self.summarize_sentences(
+            iter_sentences(chunks), max_sentences, focus_keywords
+        )
+
+    def summarize(
+        self, text: str, max_sentences: int = 5, focus_keywords: FocusKeywords = ()
+    ) -> List[str]:
+        """Summarize a text held in memory."""
+        return self.summarize_sentences(
+            iter_sentences([text]), max_sentences, focus_keywords
+        )
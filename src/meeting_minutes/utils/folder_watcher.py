@@ -0,0 +1,299 @@
+"""
+Watch-folder ingestion for Meeting Minutes Agent.
+
+New recordings dropped into a directory are picked up once they have been
+fully written, collected into debounced batches and handed to a callback.
+File system events come from watchdog (inotify on Linux) when it is
+installed; otherwise the directory is polled.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..config.app_config import PROCESSING_CONFIG, WATCH_CONFIG
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+    WATCHDOG_AVAILABLE = False
+
+# Callback receiving a batch of ready files; returns the files it processed
+# successfully, or None if all of them were processed
+BatchCallback = Callable[[List[Path]], Optional[Iterable[Path]]]
+
+
+def file_fingerprint(path: Path, block_size: int = 1024 * 1024) -> str:
+    """
+    Compute a content fingerprint used to recognize already processed files.
+
+    Args:
+        path: File to fingerprint
+        block_size: Read size in bytes
+
+    Returns:
+        Hex digest of the file size and content
+    """
+    digest = hashlib.sha256()
+    digest.update(str(path.stat().st_size).encode())
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ProcessedLedger:
+    """Append-only JSON lines record of processed recordings."""
+
+    def __init__(self, ledger_path: str):
+        self.path = Path(ledger_path)
+        self._lock = threading.Lock()
+        self._fingerprints: Set[str] = set()
+
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        self._fingerprints.add(json.loads(line)["fingerprint"])
+                    except (ValueError, KeyError):
+                        logger.warning(f"Skipping corrupt ledger line in {self.path}")
+
+    def __contains__(self, fingerprint: str) -> bool:
+        with self._lock:
+            return fingerprint in self._fingerprints
+
+    def add(self, fingerprint: str, path: Path) -> None:
+        """Record a processed recording."""
+        with self._lock:
+            if fingerprint in self._fingerprints:
+                return
+            self._fingerprints.add(fingerprint)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as handle:
+                record = {
+                    "fingerprint": fingerprint,
+                    "path": str(path),
+                    "processed_at": time.time(),
+                }
+                handle.write(json.dumps(record) + "\n")
+
+
+class _EventHandler(FileSystemEventHandler):
+    """Forwards watchdog events for created, modified or moved files."""
+
+    def __init__(self, watcher: "FolderWatcher"):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.watcher.notify(Path(event.src_path))
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.watcher.notify(Path(event.src_path))
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.watcher.notify(Path(event.dest_path))
+
+
+class FolderWatcher:
+    """Turns recordings dropped into a directory into batches of jobs."""
+
+    def __init__(
+        self,
+        directory: str,
+        on_batch: BatchCallback,
+        supported_formats: Optional[List[str]] = None,
+        settle_seconds: Optional[float] = None,
+        debounce_seconds: Optional[float] = None,
+        max_batch_size: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        recursive: Optional[bool] = None,
+        ledger_path: Optional[str] = None,
+        use_watchdog: bool = True,
+    ):
+        self.directory = Path(directory)
+        self.on_batch = on_batch
+        self.supported_formats = {
+            fmt.lower().lstrip(".")
+            for fmt in (
+                supported_formats or PROCESSING_CONFIG["audio"]["supported_formats"]
+            )
+        }
+        self.settle_seconds = _default(settle_seconds, "settle_seconds")
+        self.debounce_seconds = _default(debounce_seconds, "debounce_seconds")
+        self.max_batch_size = _default(max_batch_size, "max_batch_size")
+        self.poll_interval = _default(poll_interval, "poll_interval")
+        self.recursive = _default(recursive, "recursive")
+        self.ledger = ProcessedLedger(_default(ledger_path, "ledger_path"))
+        self.use_watchdog = use_watchdog and WATCHDOG_AVAILABLE
+
+        self._lock = threading.Lock()
+        # path -> (size, mtime_ns, time the file was last seen changing)
+        self._pending: Dict[Path, Tuple[int, int, float]] = {}
+        self._batch: List[Path] = []
+        self._last_added = 0.0
+        # Fingerprints submitted during this run, processed or not
+        self._submitted: Set[str] = set()
+        # path -> (size, mtime_ns) of files already fingerprinted
+        self._handled: Dict[Path, Tuple[int, int]] = {}
+        self._stop = threading.Event()
+        self._observer = None
+
+    def is_candidate(self, path: Path) -> bool:
+        """Return True if the path looks like a supported recording."""
+        return path.suffix.lower().lstrip(
+            "."
+        ) in self.supported_formats and not path.name.startswith(".")
+
+    def notify(self, path: Path) -> None:
+        """Register a created or changed file; it is checked on the next tick."""
+        if not self.is_candidate(path):
+            return
+        with self._lock:
+            if path in self._pending:
+                return
+            handled = self._handled.get(path)
+
+        # Don't re-fingerprint files that have not changed since we saw them
+        if handled is not None:
+            try:
+                stat = path.stat()
+            except OSError:
+                return
+            if (stat.st_size, stat.st_mtime_ns) == handled:
+                return
+
+        with self._lock:
+            self._pending.setdefault(path, (-1, -1, time.monotonic()))
+
+    def scan(self) -> None:
+        """Register every candidate file currently in the directory."""
+        pattern = "**/*" if self.recursive else "*"
+        for path in self.directory.glob(pattern):
+            if path.is_file():
+                self.notify(path)
+
+    def tick(self) -> List[Path]:
+        """
+        Promote settled files to the batch and flush it when due.
+
+        Returns:
+            The batch that was flushed, or an empty list
+        """
+        now = time.monotonic()
+        ready: List[Path] = []
+
+        with self._lock:
+            for path, (size, mtime_ns, changed_at) in list(self._pending.items()):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    del self._pending[path]
+                    continue
+
+                if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+                    # Still being written
+                    self._pending[path] = (stat.st_size, stat.st_mtime_ns, now)
+                elif stat.st_size and now - changed_at >= self.settle_seconds:
+                    del self._pending[path]
+                    self._handled[path] = (size, mtime_ns)
+                    ready.append(path)
+
+        for path in ready:
+            self._add_to_batch(path)
+
+        with self._lock:
+            due = self._batch and (
+                len(self._batch) >= self.max_batch_size
+                or time.monotonic() - self._last_added >= self.debounce_seconds
+            )
+            if not due:
+                return []
+            batch = self._batch[: self.max_batch_size]
+            del self._batch[: self.max_batch_size]
+
+        self._submit(batch)
+        return batch
+
+    def _add_to_batch(self, path: Path) -> None:
+        try:
+            fingerprint = file_fingerprint(path)
+        except OSError as e:
+            logger.warning(f"Could not read {path}: {e}")
+            return
+
+        with self._lock:
+            if fingerprint in self._submitted or fingerprint in self.ledger:
+                logger.debug(f"Skipping already processed recording: {path}")
+                return
+            self._submitted.add(fingerprint)
+            self._batch.append(path)
+            self._last_added = time.monotonic()
+        logger.info(f"Recording ready: {path}")
+
+    def _submit(self, batch: List[Path]) -> None:
+        logger.info(f"Submitting batch of {len(batch)} recording(s)")
+        try:
+            processed = self.on_batch(batch)
+        except Exception as e:
+            logger.error(f"Batch processing failed: {e}")
+            return
+
+        for path in batch if processed is None else processed:
+            try:
+                self.ledger.add(file_fingerprint(path), path)
+            except OSError as e:
+                logger.warning(f"Could not record {path} as processed: {e}")
+
+    def start(self) -> None:
+        """Start receiving file system events (no-op when polling)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self.use_watchdog:
+            self._observer = Observer()
+            self._observer.schedule(
+                _EventHandler(self), str(self.directory), recursive=self.recursive
+            )
+            self._observer.start()
+            logger.info(f"Watching {self.directory} for new recordings (watchdog)")
+        else:
+            logger.info(f"Watching {self.directory} for new recordings (polling)")
+
+        # Pick up recordings that arrived while we were not running
+        self.scan()
+
+    def stop(self) -> None:
+        """Stop watching; a running run() loop returns after its current tick."""
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def run(self) -> None:
+        """Watch the directory until stop() is called."""
+        self.start()
+        try:
+            while not self._stop.wait(self.poll_interval):
+                if not self.use_watchdog:
+                    self.scan()
+                self.tick()
+        finally:
+            self.stop()
+
+
+def _default(value, key):
+    return WATCH_CONFIG[key] if value is None else value
@@ -0,0 +1,160 @@
+"""
+Multi-keyword matching for Meeting Minutes Agent.
+
+Finds every occurrence of a list of keywords and phrases (product names,
+ticker symbols, project codes) in one pass over a text, with an Aho-Corasick
+automaton over words rather than characters: matches always start and end at
+word boundaries, a phrase matches whatever whitespace separates its words,
+and the cost per word of text does not grow with the number of keywords.
+Compiled matchers are cached, so tools called repeatedly with the same
+keywords build their automaton once.
+"""
+
+import functools
+import re
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+# Words, and every other non-space character on its own, so "C++" and
+# "GPT-4" are keywords of several tokens
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over the words of a list of keywords."""
+
+    def __init__(self, keywords: Iterable[str], case_sensitive: bool = False):
+        """
+        Compile the keywords.
+
+        Args:
+            keywords: Words or phrases to find; blank ones are ignored
+            case_sensitive: Match case exactly, e.g. for ticker symbols
+        """
+        self.keywords: List[str] = []
+        self.case_sensitive = case_sensitive
+        # Trie of keyword tokens: state -> token -> next state
+        self._goto: List[Dict[str, int]] = [{}]
+        # Keywords ending in each state, as (keyword index, length in tokens)
+        self._output: List[List[Tuple[int, int]]] = [[]]
+        for keyword in keywords:
+            tokens = self._tokens(keyword)
+            if not tokens:
+                continue
+            state = 0
+            for token in tokens:
+                following = self._goto[state].get(token)
+                if following is None:
+                    following = len(self._goto)
+                    self._goto[state][token] = following
+                    self._goto.append({})
+                    self._output.append([])
+                state = following
+            if self._output[state]:
+                # The same keyword again, perhaps in another case or spacing
+                continue
+            self._output[state].append((len(self.keywords), len(tokens)))
+            self.keywords.append(keyword)
+        self._fail = self._link()
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _tokens(self, text: str) -> List[str]:
+        return _TOKEN.findall(text if self.case_sensitive else text.lower())
+
+    def _link(self) -> List[int]:
+        # Failure links by breadth-first search: the longest proper suffix of
+        # each state's path that is also a path from the root
+        fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, following in self._goto[state].items():
+                queue.append(following)
+                fallback = fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                fail[following] = target if target != following else 0
+                # Keywords that are suffixes of this path end here too
+                self._output[following] = (
+                    self._output[following] + self._output[fail[following]]
+                )
+        return fail
+
+    def _scan(self, tokens: Sequence[str]) -> Iterator[Tuple[int, int, int]]:
+        goto, fail, output = self._goto, self._fail, self._output
+        root = goto[0]
+        state = 0
+        for position, token in enumerate(tokens):
+            if not state and token not in root:
+                continue
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for keyword, length in output[state]:
+                yield keyword, position - length + 1, position + 1
+
+    def find(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Find every keyword occurrence, overlapping ones included.
+
+        Args:
+            text: Text to search
+
+        Yields:
+            (keyword index, start, end) character offsets into the text, in
+            order of their end
+        """
+        if not self.keywords:
+            return
+        # Lowercased token by token, so the offsets stay those of the text
+        matches = list(_TOKEN.finditer(text))
+        tokens = [
+            match.group() if self.case_sensitive else match.group().lower()
+            for match in matches
+        ]
+        for keyword, first, last in self._scan(tokens):
+            yield keyword, matches[first].start(), matches[last - 1].end()
+
+    def count(self, text: str) -> int:
+        """Return the number of keyword occurrences in a text."""
+        if not self.keywords:
+            return 0
+        return sum(1 for _ in self._scan(self._tokens(text)))
+
+    def hits(self, texts: Iterable[str]) -> np.ndarray:
+        """
+        Count keyword occurrences in each of many texts, e.g. sentences.
+
+        Args:
+            texts: The texts, consumed once
+
+        Returns:
+            Occurrence count of every text
+        """
+        return np.fromiter((self.count(text) for text in texts), dtype=np.int64)
+
+
+@functools.lru_cache(maxsize=64)
+def _compiled(keywords: Tuple[str, ...], case_sensitive: bool) -> KeywordMatcher:
+    return KeywordMatcher(keywords, case_sensitive)
+
+
+def compile_keywords(
+    keywords: Iterable[str], case_sensitive: bool = False
+) -> KeywordMatcher:
+    """
+    Return a matcher for keywords, compiled once per distinct keyword list.
+
+    Args:
+        keywords: Words or phrases to find
+        case_sensitive: Match case exactly
+
+    Returns:
+        A shared KeywordMatcher; don't modify it
+    """
+    return _compiled(tuple(keywords), case_sensitive)
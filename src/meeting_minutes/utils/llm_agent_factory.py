@@ -44,15 +44,18 @@ def create_agent_from_config(config, tools=None, **kwargs):
     Create an agent from configuration with local LLM.
 
     Args:
-        config: Agent configuration dictionary
+        config: Agent configuration dictionary, optionally with the agent's
+            model tier under ``llm_tier``
         tools: List of tools agent can use
         **kwargs: Additional arguments for Agent constructor
 
     Returns:
         Agent configured with local LLM and specified config
     """
-    # Get the LLM configured for local use
-    local_llm = get_llm()
+    # Agents choose their model tier in the crew YAML ("llm_tier: fast"),
+    # which is not an Agent field
+    config = dict(config)
+    local_llm = get_llm(config.pop("llm_tier", None))
 
     # Create agent with local LLM
     return Agent(
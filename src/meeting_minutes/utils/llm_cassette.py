@@ -0,0 +1,475 @@
+"""
+Record/replay LLM server for Meeting Minutes Agent.
+
+A local OpenAI-compatible stand-in for the LLM server. In ``record`` mode it
+forwards every request to the real server and stores the completions in a
+cassette (a JSON file); in ``replay`` mode it answers from the cassette
+without any inference, optionally sleeping for the recorded latency. Crews
+and prompts can then be run and benchmarked deterministically, and the time
+they take split into model inference and everything else.
+
+Requests are matched by their messages and sampling parameters, not by the
+model name, which the model resolver may rewrite. Identical requests are
+replayed in the order they were recorded. Streamed requests are recorded
+whole and replayed as server-sent events.
+
+Usage:
+    python -m meeting_minutes.utils.llm_cassette record cassette.json \\
+        --upstream http://localhost:1337/v1 --port 8090
+    python -m meeting_minutes.utils.llm_cassette replay cassette.json \\
+        --port 8090 --latency-scale 1.0
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from .completion_cache import make_key, messages_for_key
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+CASSETTE_VERSION = 1
+MODES = ("record", "replay")
+
+# Metadata endpoints recorded alongside the completions, relative to the
+# base URL; "/props" is llama-server's and lives at the server root
+METADATA_PATHS = ("/models", "/props")
+
+
+def request_key(payload: Dict[str, Any]) -> str:
+    """
+    Identify a chat completion request independently of the model name.
+
+    Args:
+        payload: Request body of /chat/completions
+
+    Returns:
+        Hex digest of the request's messages and sampling parameters
+    """
+    return make_key(messages_for_key(payload.get("messages") or []), "", payload)
+
+
+class Cassette:
+    """Recorded chat completions and server metadata, stored as JSON."""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Cassette file; loaded if it exists
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.interactions: List[Dict[str, Any]] = []
+        self.metadata: Dict[str, Any] = {}
+        # Next interaction to replay for each request key
+        self._positions: Dict[str, int] = {}
+        if self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != CASSETTE_VERSION:
+                raise ValueError(
+                    f"Unsupported cassette version {data.get('version')!r} "
+                    f"in {self.path}"
+                )
+            self.interactions = data.get("interactions", [])
+            self.metadata = data.get("metadata", {})
+
+    def add(
+        self, payload: Dict[str, Any], response: Dict[str, Any], latency: float
+    ) -> None:
+        """Record one completion and the seconds the server took for it."""
+        with self._lock:
+            self.interactions.append(
+                {
+                    "key": request_key(payload),
+                    "model": payload.get("model"),
+                    "messages": len(payload.get("messages") or []),
+                    "latency_seconds": round(latency, 4),
+                    "response": response,
+                }
+            )
+
+    def next(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return the next recorded interaction matching a request.
+
+        Repeated requests get their recordings in order; once those run out
+        the last one is repeated.
+
+        Args:
+            payload: Request body of /chat/completions
+
+        Returns:
+            The interaction, or None if the request was never recorded
+        """
+        key = request_key(payload)
+        with self._lock:
+            matches = [i for i in self.interactions if i["key"] == key]
+            if not matches:
+                return None
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            return matches[min(position, len(matches) - 1)]
+
+    def rewind(self) -> None:
+        """Replay from the first recording again, e.g. before the next run."""
+        with self._lock:
+            self._positions.clear()
+
+    def save(self) -> None:
+        """Write the cassette to its file."""
+        with self._lock:
+            data = {
+                "version": CASSETTE_VERSION,
+                "metadata": self.metadata,
+                "interactions": self.interactions,
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(data, indent=1), encoding="utf-8")
+        tmp.replace(self.path)
+
+
+class _CassetteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections alive
+    server: "_CassetteHTTPServer"
+
+    def _send_json(self, status: int, payload: Any) -> int:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        return len(body)
+
+    def _metadata_path(self) -> Optional[str]:
+        path = self.path.split("?", 1)[0].rstrip("/")
+        for name in METADATA_PATHS:
+            if path.endswith(name):
+                return name
+        return None
+
+    def do_GET(self):
+        name = self._metadata_path()
+        if name is None:
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+        status, payload = self.server.owner.metadata(name)
+        self._send_json(status, payload)
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+        raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        payload = json.loads(raw or b"{}")
+        owner = self.server.owner
+        try:
+            response, latency = owner.complete(payload)
+        except LookupError as e:
+            owner.record_stats(len(raw), 0, None, 0.0, 0.0, miss=True)
+            self._send_json(404, {"error": {"message": str(e)}})
+            return
+        except requests.RequestException as e:
+            self._send_json(502, {"error": {"message": f"Upstream failed: {e}"}})
+            return
+
+        delay = latency * owner.latency_scale
+        if payload.get("stream"):
+            sent = self._send_stream(response, delay)
+        else:
+            time.sleep(delay)
+            sent = self._send_json(200, response)
+        owner.record_stats(len(raw), sent, response.get("usage"), latency, delay)
+
+    def _send_stream(self, response: Dict[str, Any], delay: float) -> int:
+        """Send a recorded completion word by word as server-sent events."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        sent = 0
+
+        def send_event(data: str) -> int:
+            event = f"data: {data}\n\n".encode()
+            self.wfile.write(f"{len(event):x}\r\n".encode() + event + b"\r\n")
+            self.wfile.flush()
+            return len(event)
+
+        choice = (response.get("choices") or [{}])[0]
+        message = choice.get("message") or {}
+        words = (message.get("content") or "").split(" ")
+        for i, word in enumerate(words):
+            # Spread the recorded latency over the tokens
+            time.sleep(delay / len(words))
+            delta = {"content": word if i == 0 else f" {word}"}
+            if i == 0:
+                delta["role"] = "assistant"
+                if message.get("tool_calls"):
+                    delta["tool_calls"] = [
+                        {"index": n, **call}
+                        for n, call in enumerate(message["tool_calls"])
+                    ]
+            last = i == len(words) - 1
+            chunk = {
+                "id": response.get("id", "chatcmpl-cassette"),
+                "object": "chat.completion.chunk",
+                "created": response.get("created", int(time.time())),
+                "model": response.get("model"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": delta,
+                        "finish_reason": choice.get("finish_reason") if last else None,
+                    }
+                ],
+            }
+            if last and response.get("usage"):
+                chunk["usage"] = response["usage"]
+            sent += send_event(json.dumps(chunk))
+        sent += send_event("[DONE]")
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+        return sent
+
+    def log_message(self, *args):
+        pass
+
+
+class _CassetteHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    owner: "CassetteServer"
+
+
+class CassetteServer:
+    """OpenAI-compatible server that records to or replays from a cassette."""
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        mode: str = "replay",
+        upstream: Optional[str] = None,
+        latency_scale: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Args:
+            cassette: Cassette to record to or replay from
+            mode: "record" or "replay"
+            upstream: Base URL of the real LLM server (record mode)
+            latency_scale: Share of the recorded latency to wait before each
+                replayed answer (0 answers at once, 1 as fast as the server)
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+
+        Raises:
+            ValueError: If the mode is unknown or record mode has no upstream
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}; expected {MODES}")
+        if mode == "record" and not upstream:
+            raise ValueError("Recording needs the upstream LLM server's base URL")
+        self.cassette = cassette
+        self.mode = mode
+        self.upstream = (upstream or "").rstrip("/")
+        self.latency_scale = latency_scale
+        self._session = requests.Session()
+        self._lock = threading.Lock()
+        self._stats = self._empty_stats()
+        self._server = _CassetteHTTPServer((host, port), _CassetteHandler)
+        self._server.owner = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "CassetteServer":
+        """Serve requests in a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="llm-cassette", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"LLM cassette server ({self.mode}) at {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving; a recorded cassette is saved."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._session.close()
+        if self.mode == "record":
+            self.cassette.save()
+            logger.info(
+                f"Recorded {len(self.cassette.interactions)} completion(s) "
+                f"to {self.cassette.path}"
+            )
+
+    def __enter__(self) -> "CassetteServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def metadata(self, name: str) -> Tuple[int, Any]:
+        """Answer a metadata request, e.g. /models, from upstream or cassette."""
+        if self.mode == "record":
+            root = self.upstream
+            if name == "/props" and root.endswith("/v1"):
+                root = root[: -len("/v1")]
+            try:
+                response = self._session.get(f"{root}{name}", timeout=10)
+            except requests.RequestException as e:
+                return 502, {"error": {"message": f"Upstream failed: {e}"}}
+            try:
+                payload = response.json()
+            except ValueError:
+                payload = {"error": {"message": response.text[:200]}}
+            if response.ok:
+                self.cassette.metadata[name] = payload
+            return response.status_code, payload
+        if name in self.cassette.metadata:
+            return 200, self.cassette.metadata[name]
+        if name == "/models":
+            models = {i["model"] for i in self.cassette.interactions if i["model"]}
+            return 200, {"data": [{"id": model} for model in sorted(models)]}
+        return 404, {"error": {"message": "not recorded"}}
+
+    def complete(self, payload: Dict[str, Any]) -> Tuple[Dict[str, Any], float]:
+        """
+        Answer a chat completion request.
+
+        Args:
+            payload: Request body of /chat/completions
+
+        Returns:
+            The complete (non-streamed) response and the seconds the real
+            server took to produce it
+
+        Raises:
+            LookupError: If replaying a request that was never recorded
+            requests.RequestException: If the upstream server fails
+        """
+        if self.mode == "replay":
+            interaction = self.cassette.next(payload)
+            if interaction is None:
+                raise LookupError(
+                    f"No recorded completion for this request "
+                    f"(key {request_key(payload)[:12]}) in {self.cassette.path}"
+                )
+            return interaction["response"], interaction["latency_seconds"]
+
+        # Record the whole completion; streams are rebuilt from it on replay
+        upstream_payload = {
+            key: value
+            for key, value in payload.items()
+            if key not in ("stream", "stream_options")
+        }
+        started = time.monotonic()
+        response = self._session.post(
+            f"{self.upstream}/chat/completions", json=upstream_payload, timeout=600
+        )
+        latency = time.monotonic() - started
+        response.raise_for_status()
+        body = response.json()
+        self.cassette.add(payload, body, latency)
+        return body, latency
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {
+            "round_trips": 0,
+            "misses": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "request_bytes": 0,
+            "response_bytes": 0,
+            "inference_seconds": 0.0,
+            "simulated_seconds": 0.0,
+        }
+
+    def record_stats(
+        self,
+        request_bytes: int,
+        response_bytes: int,
+        usage: Optional[Dict[str, Any]],
+        latency: float,
+        delay: float,
+        miss: bool = False,
+    ) -> None:
+        """Count one completion request served."""
+        with self._lock:
+            stats = self._stats
+            stats["round_trips"] += 1
+            stats["misses"] += int(miss)
+            stats["request_bytes"] += request_bytes
+            stats["response_bytes"] += response_bytes
+            stats["inference_seconds"] += latency
+            stats["simulated_seconds"] += delay
+            for name in ("prompt_tokens", "completion_tokens"):
+                stats[name] += (usage or {}).get(name) or 0
+
+    def stats(self, reset: bool = False) -> Dict[str, Any]:
+        """
+        Return the completion requests served since the last reset.
+
+        Args:
+            reset: Start counting afresh after reading
+
+        Returns:
+            Round trips, misses, token and byte volume, the recorded
+            inference seconds and the seconds actually waited
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            if reset:
+                self._stats = self._empty_stats()
+        stats["inference_seconds"] = round(stats["inference_seconds"], 4)
+        stats["simulated_seconds"] = round(stats["simulated_seconds"], 4)
+        return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("mode", choices=MODES)
+    parser.add_argument("cassette", help="cassette file to record to or replay")
+    parser.add_argument("--upstream", help="real LLM server, for recording")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument(
+        "--latency-scale",
+        type=float,
+        default=0.0,
+        help="share of the recorded latency to simulate when replaying",
+    )
+    args = parser.parse_args()
+
+    server = CassetteServer(
+        Cassette(args.cassette),
+        mode=args.mode,
+        upstream=args.upstream,
+        latency_scale=args.latency_scale,
+        host=args.host,
+        port=args.port,
+    )
+    with server:
+        print(f"Serving {args.mode} at {server.base_url}; Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+    print(json.dumps(server.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Shared, pooled HTTP clients for the local LLM server.
+
+Every agent and job talks to the LLM server through the same keep-alive
+connection pool instead of opening new connections per LLM instance. The
+registry keeps one sync and one async client per endpoint and counts how
+many requests reused an existing connection.
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+import openai
+
+from ..config.app_config import LLM_CLIENT_CONFIG, LLM_SERVER, TIMEOUT_CONFIG
+from .llm_trace import note_http_request
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ConnectionMetrics:
+    """Request and connection counters for one endpoint."""
+
+    def __init__(self):
+        self.requests = 0
+        self.connections_opened = 0
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_connection(self) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the counters and the share of requests on reused connections."""
+        with self._lock:
+            reused = max(0, self.requests - self.connections_opened)
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "reused_connections": reused,
+                "reuse_ratio": round(reused / self.requests, 3) if self.requests else 0,
+            }
+
+
+class LLMClients:
+    """Pooled sync and async OpenAI clients for one endpoint."""
+
+    def __init__(
+        self,
+        base_url: str,
+        http_client: httpx.Client,
+        async_http_client: httpx.AsyncClient,
+        client: openai.OpenAI,
+        async_client: openai.AsyncOpenAI,
+        metrics: ConnectionMetrics,
+    ):
+        self.base_url = base_url
+        self.http_client = http_client
+        self.async_http_client = async_http_client
+        self.client = client
+        self.async_client = async_client
+        self.metrics = metrics
+
+
+class LLMClientRegistry:
+    """Process-wide registry of pooled LLM clients, one per endpoint."""
+
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        request_timeout: Optional[float] = None,
+    ):
+        self.pool_size = pool_size or LLM_CLIENT_CONFIG["pool_size"]
+        self.keepalive_expiry = (
+            keepalive_expiry or LLM_CLIENT_CONFIG["keepalive_expiry"]
+        )
+        self.connect_timeout = connect_timeout or LLM_CLIENT_CONFIG["connect_timeout"]
+        self.request_timeout = (
+            request_timeout or TIMEOUT_CONFIG["requests"]["llm"] or None
+        )
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[str, str], LLMClients] = {}
+
+    def get(
+        self, base_url: Optional[str] = None, api_key: Optional[str] = None
+    ) -> LLMClients:
+        """
+        Return the pooled clients for an endpoint, creating them on first use.
+
+        Args:
+            base_url: OpenAI-compatible base URL (defaults to LLM_SERVER)
+            api_key: API key (defaults to LLM_SERVER)
+
+        Returns:
+            LLMClients sharing one connection pool per sync/async flavour
+        """
+        base_url = (base_url or LLM_SERVER["base_url"]).rstrip("/")
+        api_key = api_key or LLM_SERVER["api_key"]
+        key = (base_url, api_key)
+
+        with self._lock:
+            clients = self._clients.get(key)
+            if clients is None:
+                clients = self._create(base_url, api_key)
+                self._clients[key] = clients
+            return clients
+
+    def _create(self, base_url: str, api_key: str) -> LLMClients:
+        metrics = ConnectionMetrics()
+        limits = httpx.Limits(
+            max_connections=self.pool_size,
+            max_keepalive_connections=self.pool_size,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        timeout = httpx.Timeout(self.request_timeout, connect=self.connect_timeout)
+
+        def trace(event_name, info):
+            if event_name == "connection.connect_tcp.complete":
+                metrics.record_connection()
+
+        async def async_trace(event_name, info):
+            trace(event_name, info)
+
+        def on_request(request):
+            metrics.record_request()
+            note_http_request()
+            request.extensions["trace"] = trace
+
+        async def on_async_request(request):
+            metrics.record_request()
+            note_http_request()
+            request.extensions["trace"] = async_trace
+
+        http_client = httpx.Client(
+            limits=limits, timeout=timeout, event_hooks={"request": [on_request]}
+        )
+        async_http_client = httpx.AsyncClient(
+            limits=limits, timeout=timeout, event_hooks={"request": [on_async_request]}
+        )
+        logger.info(
+            f"Created pooled LLM clients for {base_url} (pool size {self.pool_size})"
+        )
+        return LLMClients(
+            base_url=base_url,
+            http_client=http_client,
+            async_http_client=async_http_client,
+            client=openai.OpenAI(
+                base_url=base_url,
+                api_key=api_key,
+                timeout=timeout,
+                http_client=http_client,
+            ),
+            async_client=openai.AsyncOpenAI(
+                base_url=base_url,
+                api_key=api_key,
+                timeout=timeout,
+                http_client=async_http_client,
+            ),
+            metrics=metrics,
+        )
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Return connection reuse counters per endpoint."""
+        with self._lock:
+            clients = list(self._clients.values())
+        return {entry.base_url: entry.metrics.snapshot() for entry in clients}
+
+    def close(self) -> None:
+        """Close all pooled sync connections and forget the clients."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for entry in clients:
+            entry.http_client.close()
+
+
+# Process-wide registry shared by all agents and jobs
+llm_client_registry = LLMClientRegistry()
@@ -2,23 +2,103 @@
 LLM configuration for the application.
 """
 
+from typing import Optional
+
 from langchain_community.chat_models import ChatOpenAI
+from langchain_core.callbacks import BaseCallbackHandler
 
-from ..config.app_config import LLM_SERVER
+from ..config.app_config import (
+    API_CONFIG,
+    LLM_SERVER,
+    PROCESSING_CONFIG,
+    TIMEOUT_CONFIG,
+)
+from .cancellation import check_cancelled
+from .completion_cache import completion_cache, should_cache
+from .endpoint_pool import (
+    AsyncRoutedCompletions,
+    EndpointPool,
+    RoutedCompletions,
+    endpoint_pool,
+)
+from .model_registry import model_resolver
+from .model_tiers import TierLatencyCallbackHandler, model_tiers
 from .skip_validation_wrapper import SkipValidationWrapper
+from .token_stream import TokenStreamCallbackHandler
+
+
+class CancellationCallbackHandler(BaseCallbackHandler):
+    """Aborts LLM calls made on behalf of a cancelled job."""
+
+    # Let JobCancelledError propagate instead of being logged and ignored
+    raise_error: bool = True
+
+    def on_llm_start(self, serialized, prompts, **kwargs):
+        check_cancelled()
+
+    def on_chat_model_start(self, serialized, messages, **kwargs):
+        check_cancelled()
+
+    def on_llm_new_token(self, token, **kwargs):
+        check_cancelled()
+
+
+class CircuitBreakerCallbackHandler(BaseCallbackHandler):
+    """Fails LLM calls fast while the local LLM server is known to be down."""
 
+    # Let CircuitOpenError propagate instead of being logged and ignored
+    raise_error: bool = True
 
-def get_llm():
+    def __init__(self, pool: Optional[EndpointPool] = None):
+        # Endpoints the calls are balanced over; in a pool, a failing endpoint
+        # is ejected by its own breaker rather than opening this circuit
+        self.pool = pool or endpoint_pool
+
+    def on_llm_start(self, serialized, prompts, **kwargs):
+        model_resolver.breaker.before_call()
+
+    def on_chat_model_start(self, serialized, messages, **kwargs):
+        model_resolver.breaker.before_call()
+
+    def on_llm_end(self, response, **kwargs):
+        model_resolver.breaker.record_success()
+
+    def on_llm_error(self, error, **kwargs):
+        self.pool.record_outcome(model_resolver.breaker, error)
+
+
+def get_llm(tier: Optional[str] = None):
     """
     Returns a configured LLM instance using a local API endpoint.
+
+    Args:
+        tier: Model tier, "fast" for extraction and classification or
+            "large" for long-form writing (default: the configured default)
     """
+    temperature = API_CONFIG["openai"]["temperature"]
+    tier = model_tiers.resolve(tier)
+    pool = model_tiers.pool(tier) or endpoint_pool
+
     # Configure LLM to use local endpoint - no need for API key for local server
     llm = ChatOpenAI(
-        model_name="gpt-4o",
+        # Balance requests over the tier's LLM endpoints, each with a shared
+        # keep-alive connection pool
+        client=RoutedCompletions(pool, LLM_SERVER["api_key"]),
+        async_client=AsyncRoutedCompletions(pool, LLM_SERVER["api_key"]),
+        model_name=model_tiers.model_name(tier) or "gpt-4o",
         base_url=LLM_SERVER["base_url"],
         api_key=LLM_SERVER["api_key"],
-        temperature=0.7,
-        streaming=False,
+        temperature=temperature,
+        streaming=PROCESSING_CONFIG["minutes"]["streaming"],
+        # Reuse identical completions across runs unless they are sampled
+        cache=completion_cache.langchain() if should_cache(temperature) else False,
+        request_timeout=TIMEOUT_CONFIG["requests"]["llm"] or None,
+        callbacks=[
+            CancellationCallbackHandler(),
+            CircuitBreakerCallbackHandler(pool),
+            TokenStreamCallbackHandler(),
+            TierLatencyCallbackHandler(tier),
+        ],
     )
 
     # Wrap LLM to skip validation
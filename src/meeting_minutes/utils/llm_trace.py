@@ -0,0 +1,297 @@
+"""
+Structured tracing of LLM calls for Meeting Minutes Agent.
+
+Every LLM call, whether made through LangChain (``get_llm``) or CrewAI's
+LiteLLM, produces one JSON record with its model, endpoint, token counts,
+latency, retries and cache status. Records go to a JSON-lines file instead
+of the console, never contain prompt text, and are gated by level and
+sampled so tracing stays cheap under load:
+
+- ``ERROR``: failed calls only; these are always written
+- ``INFO``: every call, sampled at ``sample_rate``
+- ``DEBUG``: calls with their request parameters and message sizes
+- ``OFF``: nothing
+"""
+
+import contextvars
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..config.app_config import LLM_TRACE_CONFIG
+from .cancellation import current_token
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Request parameters included in DEBUG records
+DEBUG_PARAMS = ("temperature", "top_p", "max_tokens", "seed", "stop")
+
+_current_call: contextvars.ContextVar[Optional["LLMCallTrace"]] = (
+    contextvars.ContextVar("llm_call_trace", default=None)
+)
+# Set by a completion cache miss for the call that follows it
+_cache_missed: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "llm_cache_missed", default=False
+)
+
+
+def _usage_value(usage: Any, name: str) -> Optional[int]:
+    value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+    return value if isinstance(value, int) else None
+
+
+class LLMCallTrace:
+    """Fields of one traced LLM call, filled in while it runs."""
+
+    def __init__(self, source: str, sampled: bool, **fields: Any):
+        token = current_token()
+        self.sampled = sampled
+        self.started = time.monotonic()
+        self.first_token: Optional[float] = None
+        # HTTP requests sent for the call; more than one means retries
+        self.attempts = 0
+        self.fields: Dict[str, Any] = {
+            "trace_id": uuid.uuid4().hex,
+            "timestamp": time.time(),
+            "job_id": token.job_id if token is not None else "",
+            "source": source,
+            "model": None,
+            "endpoint": None,
+            "stream": False,
+            "cache": "bypass",
+            "retries": 0,
+            "prompt_tokens": None,
+            "completion_tokens": None,
+            **fields,
+        }
+
+    def set(self, **fields: Any) -> None:
+        """Add or overwrite fields of the record."""
+        self.fields.update(fields)
+
+    def on_token(self) -> None:
+        """Count a streamed completion token."""
+        if self.first_token is None:
+            self.first_token = time.monotonic()
+        self.fields["completion_tokens"] = (self.fields["completion_tokens"] or 0) + 1
+
+    def record_usage(self, usage: Any) -> None:
+        """Take token counts from a response's ``usage``, if it has one."""
+        if usage is None:
+            return
+        for name in ("prompt_tokens", "completion_tokens"):
+            value = _usage_value(usage, name)
+            if value is not None:
+                self.fields[name] = value
+
+    def record_request(self, kwargs: Dict[str, Any]) -> None:
+        """Keep the request's size and sampling parameters (DEBUG records)."""
+        messages = kwargs.get("messages") or []
+        self.fields["debug"] = {
+            "messages": len(messages),
+            "prompt_chars": sum(
+                len(str(m.get("content") or "")) if isinstance(m, dict) else 0
+                for m in messages
+            ),
+            **{name: kwargs[name] for name in DEBUG_PARAMS if name in kwargs},
+        }
+
+    def finish(self, error: Optional[BaseException]) -> Dict[str, Any]:
+        """Complete the record with the outcome and timings."""
+        ended = time.monotonic()
+        record = dict(self.fields)
+        record["retries"] += max(0, self.attempts - 1)
+        record["status"] = "error" if error is not None else "ok"
+        if error is not None:
+            record["error"] = f"{type(error).__name__}: {error}"[:500]
+        record["latency_ms"] = round((ended - self.started) * 1000, 1)
+        if self.first_token is not None:
+            record["ttft_ms"] = round((self.first_token - self.started) * 1000, 1)
+        return record
+
+
+class LLMTracer:
+    """Writes sampled, level-gated LLM call records to a JSON-lines file."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        level: Optional[str] = None,
+        sample_rate: Optional[float] = None,
+    ):
+        """
+        Args:
+            path: JSON-lines file records are appended to
+            level: DEBUG, INFO, ERROR or OFF (see the module docstring)
+            sample_rate: Share of successful calls that are written
+        """
+        self._path = path
+        self._level = level
+        self._sample_rate = sample_rate
+        self._lock = threading.Lock()
+        self._file = None
+        self._file_path: Optional[Path] = None
+
+    # Read on use so a profile or test applied after import takes effect
+    @property
+    def path(self) -> Path:
+        return Path(self._path or LLM_TRACE_CONFIG["path"])
+
+    @property
+    def level(self) -> Optional[int]:
+        """Numeric logging level, or None when tracing is off."""
+        name = (self._level or LLM_TRACE_CONFIG["level"]).upper()
+        if name == "OFF":
+            return None
+        return getattr(logging, name, logging.INFO)
+
+    @property
+    def sample_rate(self) -> float:
+        if self._sample_rate is not None:
+            return self._sample_rate
+        return LLM_TRACE_CONFIG["sample_rate"]
+
+    @contextmanager
+    def trace(self, source: str, **fields: Any) -> Iterator[LLMCallTrace]:
+        """
+        Trace one LLM call.
+
+        Args:
+            source: What made the call, e.g. "langchain" or "litellm"
+            **fields: Initial record fields, e.g. model and stream
+
+        Yields:
+            The call's trace, to be filled in by the caller
+        """
+        if "cache" not in fields and _cache_missed.get():
+            fields["cache"] = "miss"
+            _cache_missed.set(False)
+        level = self.level
+        sampled = level is not None and random.random() < self.sample_rate
+        call = LLMCallTrace(source, sampled, **fields)
+        context_token = _current_call.set(call)
+        try:
+            yield call
+        except GeneratorExit:
+            # A streamed response the consumer stopped reading early
+            if sampled and level <= logging.INFO:
+                self._emit(call.finish(None), level)
+            raise
+        except BaseException as e:
+            if level is not None and level <= logging.ERROR:
+                self._emit(call.finish(e), level)
+            raise
+        finally:
+            try:
+                _current_call.reset(context_token)
+            except ValueError:
+                # A stream closed from another context than it was opened in
+                pass
+        if sampled and level <= logging.INFO:
+            self._emit(call.finish(None), level)
+
+    def record(self, source: str, **fields: Any) -> None:
+        """Write a record for a call that needed no request, e.g. a cache hit."""
+        with self.trace(source, **fields):
+            pass
+
+    def _emit(self, record: Dict[str, Any], level: int) -> None:
+        if level > logging.DEBUG:
+            record.pop("debug", None)
+        line = json.dumps(record, default=str) + "\n"
+        try:
+            with self._lock:
+                path = self.path
+                if self._file is None or self._file_path != path:
+                    if self._file is not None:
+                        self._file.close()
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(path, "a", encoding="utf-8")
+                    self._file_path = path
+                self._file.write(line)
+                self._file.flush()
+        except OSError as e:
+            # Tracing must never fail the call it describes
+            logger.warning(f"Could not write LLM trace: {e}")
+
+    def close(self) -> None:
+        """Close the trace file; it is reopened by the next record."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+            self._file = None
+            self._file_path = None
+
+
+def note_http_request() -> None:
+    """Count an HTTP request of the traced call in progress, e.g. a retry."""
+    call = _current_call.get()
+    if call is not None:
+        call.attempts += 1
+
+
+def note_cache_lookup(source: str, hit: bool, **fields: Any) -> None:
+    """
+    Trace a completion cache lookup made before an LLM call.
+
+    A hit is recorded as a call of its own; a miss marks the call that
+    follows in this context.
+
+    Args:
+        source: What made the lookup, e.g. "langchain"
+        hit: Whether a stored completion was returned
+        **fields: Further record fields, e.g. model
+    """
+    if hit:
+        llm_tracer.record(source, cache="hit", **fields)
+    else:
+        _cache_missed.set(True)
+
+
+def summarize_traces(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Summarize a trace file per model and endpoint.
+
+    Args:
+        path: JSON-lines file written by LLMTracer
+
+    Returns:
+        For each "model @ endpoint", the number of calls, errors and cache
+        hits, median and 95th percentile latency and the token totals
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                record = json.loads(line)
+                groups[f"{record.get('model')} @ {record.get('endpoint')}"].append(
+                    record
+                )
+
+    summary = {}
+    for name, records in sorted(groups.items()):
+        latencies = sorted(r["latency_ms"] for r in records)
+        summary[name] = {
+            "calls": len(records),
+            "errors": sum(r["status"] == "error" for r in records),
+            "cache_hits": sum(r.get("cache") == "hit" for r in records),
+            "p50_latency_ms": latencies[len(latencies) // 2],
+            "p95_latency_ms": latencies[
+                min(len(latencies) - 1, len(latencies) * 95 // 100)
+            ],
+            "prompt_tokens": sum(r.get("prompt_tokens") or 0 for r in records),
+            "completion_tokens": sum(r.get("completion_tokens") or 0 for r in records),
+        }
+    return summary
+
+
+# Process-wide tracer shared by all jobs in this worker
+llm_tracer = LLMTracer()
@@ -0,0 +1,326 @@
+"""
+Model discovery and circuit breaking for the local LLM server.
+
+The models served by the local LLM server are discovered once through its
+OpenAI-compatible ``/models`` endpoint and cached, so every completion uses
+a model name that is known to work instead of guessing. A circuit breaker
+makes calls fail fast while the server is down rather than waiting for a
+timeout on each of them.
+"""
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import requests
+
+from ..config.app_config import LLM_RESILIENCE_CONFIG, LLM_SERVER
+from .logger import setup_logger
+
+if TYPE_CHECKING:
+    from .endpoint_pool import EndpointPool
+
+logger = setup_logger(__name__)
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of calling a server that is known to be down."""
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing dependency for a while.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are rejected for ``reset_timeout`` seconds. Then a single trial call
+    is let through: success closes the circuit, failure opens it again. A trial
+    that never reports back (e.g. its job was cancelled) expires after another
+    ``reset_timeout``.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+    ):
+        self.name = name
+        self.failure_threshold = (
+            failure_threshold or LLM_RESILIENCE_CONFIG["failure_threshold"]
+        )
+        self.reset_timeout = reset_timeout or LLM_RESILIENCE_CONFIG["reset_timeout"]
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_started: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        with self._lock:
+            if (
+                self._state == self.OPEN
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                return self.HALF_OPEN
+            return self._state
+
+    def before_call(self) -> None:
+        """
+        Check that a call may be made.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or a trial call is running
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            now = time.monotonic()
+            waited = now - self._opened_at
+            trial_running = (
+                self._trial_started is not None
+                and now - self._trial_started < self.reset_timeout
+            )
+            if waited < self.reset_timeout or trial_running:
+                retry_in = max(0.0, self.reset_timeout - waited)
+                raise CircuitOpenError(
+                    f"{self.name} is unavailable after {self._failures} failures; "
+                    f"retrying in {retry_in:.0f}s"
+                )
+            # Let one trial call through
+            self._state = self.HALF_OPEN
+            self._trial_started = now
+
+    def record_success(self) -> None:
+        """Record a successful call and close the circuit."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"{self.name} recovered; circuit closed")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_started = None
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            self._trial_started = None
+            if self._state == self.HALF_OPEN or (
+                self._failures >= self.failure_threshold
+            ):
+                if self._state != self.OPEN:
+                    logger.warning(
+                        f"{self.name} failed {self._failures} time(s); "
+                        f"circuit open for {self.reset_timeout}s"
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def trip(self) -> None:
+        """Open the circuit now, e.g. after a failed health check."""
+        with self._lock:
+            if self._state != self.OPEN:
+                logger.warning(f"{self.name} is unhealthy; circuit open")
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._trial_started = None
+
+
+def is_server_failure(error: BaseException) -> bool:
+    """Return True if an error means the server itself is unhealthy."""
+    if isinstance(error, (ConnectionError, TimeoutError, requests.ConnectionError)):
+        return True
+    if isinstance(error, requests.Timeout):
+        return True
+    status = getattr(error, "status_code", None) or getattr(
+        getattr(error, "response", None), "status_code", None
+    )
+    if isinstance(status, int):
+        return status >= 500
+    name = type(error).__name__
+    return any(
+        marker in name
+        for marker in ("Connection", "Timeout", "ServiceUnavailable", "InternalServer")
+    )
+
+
+def is_model_error(error: BaseException) -> bool:
+    """Return True if an error says the requested model does not exist."""
+    status = getattr(error, "status_code", None)
+    message = str(error).lower()
+    return status == 404 or (
+        "model" in message and ("not found" in message or "does not exist" in message)
+    )
+
+
+class ModelResolver:
+    """
+    Maps requested model names to models the server actually serves.
+
+    Given an endpoint pool, models are discovered from the pool's endpoints,
+    which are assumed to serve the same models, instead of from ``base_url``.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        ttl: Optional[float] = None,
+        probe_timeout: Optional[float] = None,
+        pool: Optional["EndpointPool"] = None,
+    ):
+        self.pool = pool
+        if pool is not None:
+            base_url = ", ".join(endpoint.base_url for endpoint in pool.endpoints)
+        self.base_url = (base_url or LLM_SERVER["base_url"]).rstrip("/")
+        self.breaker = breaker or CircuitBreaker(f"LLM server {self.base_url}")
+        self.ttl = ttl if ttl is not None else LLM_RESILIENCE_CONFIG["model_cache_ttl"]
+        self.probe_timeout = probe_timeout or LLM_RESILIENCE_CONFIG["probe_timeout"]
+        self._lock = threading.Lock()
+        self._models: Optional[List[str]] = None
+        self._discovered_at = 0.0
+        self._resolved: Dict[str, str] = {}
+
+    def discover(self, force: bool = False) -> List[str]:
+        """
+        Return the models served by the server, probing /models when stale.
+
+        Args:
+            force: Probe even if the cached list is still fresh
+
+        Returns:
+            Model ids; empty if the server does not list its models
+
+        Raises:
+            CircuitOpenError: If the server is known to be down
+            requests.RequestException: If the server cannot be reached
+        """
+        with self._lock:
+            fresh = time.monotonic() - self._discovered_at < self.ttl
+            if self._models is not None and fresh and not force:
+                return list(self._models)
+
+        self.breaker.before_call()
+        if self.pool is not None:
+            response = self._get_pooled_models()
+        else:
+            try:
+                response = requests.get(
+                    f"{self.base_url}/models", timeout=self.probe_timeout
+                )
+            except requests.RequestException:
+                self.breaker.record_failure()
+                raise
+            if response.status_code >= 500:
+                self.breaker.record_failure()
+                response.raise_for_status()
+            self.breaker.record_success()
+
+        models: List[str] = []
+        if response.ok:
+            try:
+                models = [
+                    entry["id"]
+                    for entry in response.json().get("data", [])
+                    if entry.get("id")
+                ]
+            except (ValueError, AttributeError, TypeError):
+                logger.warning(f"Unexpected /models response from {self.base_url}")
+        else:
+            logger.warning(
+                f"{self.base_url}/models returned {response.status_code}; "
+                "using requested model names as-is"
+            )
+
+        with self._lock:
+            self._models = models
+            self._discovered_at = time.monotonic()
+            self._resolved.clear()
+        logger.info(f"Discovered models at {self.base_url}: {models or 'none listed'}")
+        return list(models)
+
+    def _get_pooled_models(self) -> requests.Response:
+        # Ask the endpoints in routing order until one answers; each failure
+        # counts against that endpoint, and against this breaker only as the
+        # pool decides (see EndpointPool.record_outcome)
+        error: Optional[BaseException] = None
+        for _ in self.pool.endpoints:
+            try:
+                with self.pool.acquire() as endpoint:
+                    response = requests.get(
+                        f"{endpoint.base_url}/models", timeout=self.probe_timeout
+                    )
+                    if response.status_code >= 500:
+                        response.raise_for_status()
+            except (CircuitOpenError, requests.RequestException) as e:
+                self.pool.record_outcome(self.breaker, e)
+                error = e
+                if isinstance(e, CircuitOpenError) or not is_server_failure(e):
+                    break
+                continue
+            self.pool.record_outcome(self.breaker)
+            return response
+        raise error
+
+    def resolve(self, requested: Optional[str] = None) -> str:
+        """
+        Return the model to call for a requested model name.
+
+        The requested name is used if the server serves it, then the
+        configured ``LLM_SERVER`` model, then the first model listed. If the
+        server does not list its models, the requested name is used as-is.
+
+        Args:
+            requested: Model name asked for by the caller
+
+        Returns:
+            Model name to send to the server
+        """
+        requested = requested or LLM_SERVER["model_name"]
+        with self._lock:
+            fresh = time.monotonic() - self._discovered_at < self.ttl
+            if fresh and requested in self._resolved:
+                return self._resolved[requested]
+
+        models = self.discover()
+        # LiteLLM model names carry a provider prefix, e.g. "openai/gpt-4"
+        prefix, _, bare = requested.rpartition("/")
+        if not models or bare in models:
+            resolved = requested
+        elif LLM_SERVER["model_name"] in models:
+            resolved = LLM_SERVER["model_name"]
+        else:
+            resolved = models[0]
+        if prefix and resolved != requested:
+            resolved = f"{prefix}/{resolved}"
+
+        if resolved != requested:
+            logger.info(f"Model {requested!r} is not served; using {resolved!r}")
+        with self._lock:
+            self._resolved[requested] = resolved
+        return resolved
+
+    def invalidate(self) -> None:
+        """Forget discovered models, e.g. after the server rejected one."""
+        with self._lock:
+            self._models = None
+            self._discovered_at = 0.0
+            self._resolved.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the cached models and resolutions."""
+        with self._lock:
+            return {
+                "models": list(self._models or []),
+                "resolved": dict(self._resolved),
+                "circuit": self.breaker.state,
+            }
+
+
+# Process-wide resolver (and its breaker) for the configured LLM server
+model_resolver = ModelResolver()
@@ -0,0 +1,159 @@
+"""
+Tiered model routing for Meeting Minutes Agent.
+
+Short extraction and classification work (summary notes, action items,
+sentiment, attendees) goes to a small, fast model; the final minutes are
+written by the large one. Agents pick their tier with ``llm_tier`` in the
+crew YAML and direct prompts pass it to ``get_llm()``. Each tier can run on
+its own servers, so fast calls don't queue behind long generations, and the
+latency of every tier is recorded per job.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from ..config.app_config import LLM_TIER_CONFIG
+from .cancellation import current_token
+from .endpoint_pool import EndpointPool
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ModelTiers:
+    """Maps tiers to models and endpoints and records their latency."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pools: Dict[Tuple[str, ...], EndpointPool] = {}
+        self._latencies: Dict[str, Dict[str, List[float]]] = {}
+
+    @staticmethod
+    def resolve(tier: Optional[str] = None) -> str:
+        """
+        Return the tier a call is routed to.
+
+        Args:
+            tier: Requested tier; None for the default
+
+        Returns:
+            The tier, or the default tier when tiers are disabled
+
+        Raises:
+            ValueError: If the tier is not configured
+        """
+        if tier is not None and tier not in LLM_TIER_CONFIG["tiers"]:
+            raise ValueError(
+                f"Unknown model tier {tier!r}; "
+                f"expected one of {', '.join(LLM_TIER_CONFIG['tiers'])}"
+            )
+        if tier is None or not LLM_TIER_CONFIG["enabled"]:
+            return LLM_TIER_CONFIG["default"]
+        return tier
+
+    @staticmethod
+    def model_name(tier: str) -> Optional[str]:
+        """Return the tier's model, or None to use the default model name."""
+        return LLM_TIER_CONFIG["tiers"][tier]["model"] or None
+
+    def pool(self, tier: str) -> Optional[EndpointPool]:
+        """
+        Return the endpoint pool of a tier with its own servers.
+
+        Args:
+            tier: Model tier
+
+        Returns:
+            The tier's pool, or None if it shares the default endpoints
+        """
+        endpoints = tuple(LLM_TIER_CONFIG["tiers"][tier]["endpoints"])
+        if not endpoints:
+            return None
+        with self._lock:
+            pool = self._pools.get(endpoints)
+            if pool is None:
+                pool = self._pools[endpoints] = EndpointPool(list(endpoints))
+                logger.info(f"Model tier {tier!r} served by {', '.join(endpoints)}")
+            return pool
+
+    def tier_for_model(self, model: Optional[str]) -> str:
+        """
+        Return the tier a model name belongs to.
+
+        Args:
+            model: Requested model, optionally with a provider prefix
+
+        Returns:
+            The tier configured with that model, else the default tier
+        """
+        bare = (model or "").rpartition("/")[2]
+        if LLM_TIER_CONFIG["enabled"]:
+            for tier, settings in LLM_TIER_CONFIG["tiers"].items():
+                if settings["model"] and settings["model"].rpartition("/")[2] == bare:
+                    return tier
+        return LLM_TIER_CONFIG["default"]
+
+    def record(self, tier: str, seconds: float) -> None:
+        """Record the latency of one call for the calling job."""
+        token = current_token()
+        job_id = token.job_id if token is not None else ""
+        with self._lock:
+            self._latencies.setdefault(job_id, {}).setdefault(tier, []).append(seconds)
+
+    def pop_job_stats(self, job_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Return and forget the per-tier latency of a finished job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            For each tier used: its model, the number of calls and their
+            total, mean and 95th percentile latency in seconds
+        """
+        with self._lock:
+            latencies = self._latencies.pop(job_id, {})
+        stats = {}
+        for tier, seconds in sorted(latencies.items()):
+            ordered = sorted(seconds)
+            stats[tier] = {
+                "model": self.model_name(tier),
+                "calls": len(ordered),
+                "total_seconds": round(sum(ordered), 3),
+                "mean_seconds": round(sum(ordered) / len(ordered), 3),
+                "p95_seconds": round(
+                    ordered[min(len(ordered) - 1, len(ordered) * 95 // 100)], 3
+                ),
+            }
+        return stats
+
+
+class TierLatencyCallbackHandler(BaseCallbackHandler):
+    """Records the latency of LangChain calls under their model tier."""
+
+    def __init__(self, tier: str, tiers: Optional[ModelTiers] = None):
+        self.tier = tier
+        self.tiers = tiers or model_tiers
+        self._started: Dict[UUID, float] = {}
+
+    def on_llm_start(self, serialized, prompts, *, run_id: UUID, **kwargs):
+        self._started[run_id] = time.monotonic()
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, **kwargs):
+        self._started[run_id] = time.monotonic()
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs):
+        started = self._started.pop(run_id, None)
+        if started is not None:
+            self.tiers.record(self.tier, time.monotonic() - started)
+
+    def on_llm_error(self, error, *, run_id: UUID, **kwargs):
+        self._started.pop(run_id, None)
+
+
+# Process-wide tier routing shared by all jobs in this worker
+model_tiers = ModelTiers()
@@ -2,7 +2,38 @@
 Monkey patches for the CrewAI library to make it work with local LLM endpoints.
 """
 
-from config.app_config import LLM_SERVER
+import json
+import time
+from contextlib import ExitStack
+
+from meeting_minutes.config.app_config import (
+    API_CONFIG,
+    LLM_SERVER,
+    PROCESSING_CONFIG,
+    TIMEOUT_CONFIG,
+)
+from meeting_minutes.utils.cancellation import JobCancelledError, check_cancelled
+from meeting_minutes.utils.completion_cache import (
+    completion_cache,
+    make_key,
+    messages_for_key,
+    should_cache,
+)
+from meeting_minutes.utils.context_budget import context_budget
+from meeting_minutes.utils.endpoint_pool import endpoint_pool
+from meeting_minutes.utils.llm_clients import llm_client_registry
+from meeting_minutes.utils.llm_trace import llm_tracer
+from meeting_minutes.utils.logger import setup_logger
+from meeting_minutes.utils.model_registry import (
+    is_model_error,
+    model_resolver,
+)
+from meeting_minutes.utils.model_tiers import model_tiers
+from meeting_minutes.utils.prompt_layout import prepare_request
+from meeting_minutes.utils.request_coalescer import request_coalescer
+from meeting_minutes.utils.token_stream import CallTimer, stream_metrics
+
+logger = setup_logger(__name__)
 
 
 def apply_monkey_patches():
@@ -41,81 +72,212 @@ def _patch_crewai_llm():
 
 
 def _patch_litellm():
-    """Patch LiteLLM to bypass API key validation and add debugging."""
+    """Patch LiteLLM to bypass API key validation and trace every call."""
     try:
         import litellm
         import litellm.utils
 
-        # Enable debugging
-        litellm.set_verbose = True
+        # Calls are traced to a JSON-lines file (see llm_trace) instead of
+        # LiteLLM's verbose console output, which dumps every prompt
+        litellm.set_verbose = False
 
-        # Patch completion function to use local endpoint
-        original_completion = litellm.completion
-
-        def patched_completion(*args, **kwargs):
-            # Debug: Print what we're trying to call
-            print(f"🔍 LiteLLM Debug - Original kwargs: {kwargs}")
+        # Route LiteLLM through the shared keep-alive connection pool
+        clients = llm_client_registry.get()
+        litellm.client_session = clients.http_client
+        litellm.aclient_session = clients.async_http_client
 
-            # Force local configuration
-            kwargs["api_key"] = LLM_SERVER["api_key"]
-            kwargs["base_url"] = LLM_SERVER["base_url"]
-
-            # Try different model names that might work with local server
-            original_model = kwargs.get("model", "gpt-4o")
-            model_alternatives = [
-                original_model,
-                "gpt-4",
-                "gpt-3.5-turbo",
-                "text-davinci-003",
-                "llama",
-                "local-model",
-            ]
-
-            last_error = None
-            for model_name in model_alternatives:
-                try:
-                    kwargs["model"] = model_name
-                    print(f"🔍 Trying model: {model_name} at {kwargs['base_url']}")
-
-                    # Add custom headers that might be needed
-                    if "extra_headers" not in kwargs:
-                        kwargs["extra_headers"] = {}
-                    kwargs["extra_headers"]["Content-Type"] = "application/json"
+        # Patch completion function to use local endpoint
+        litellm.completion = _patched_completion(litellm, litellm.completion)
+        print("✅ LiteLLM completion function patched successfully")
+    except Exception as e:
+        print(f"❌ Failed to patch LiteLLM: {e}")
 
-                    response = original_completion(*args, **kwargs)
-                    print(f"✅ Success with model: {model_name}")
-                    return response
 
-                except Exception as e:
-                    last_error = e
-                    print(f"❌ Failed with model {model_name}: {str(e)}")
-                    continue
-
-            # If all models failed, provide detailed error info
-            print(f"🚨 All model attempts failed. Last error: {last_error}")
-            print(f"🔍 Server URL: {kwargs['base_url']}")
-            print(
-                f"🔍 Available at server: Check if your local LLM server is running at {kwargs['base_url']}"
+def _patched_completion(litellm, original_completion):
+    """Wrap LiteLLM's completion function for the local LLM endpoints."""
+
+    def patched_completion(*args, **kwargs):
+        messages = kwargs.get("messages") or []
+
+        # Force local configuration
+        kwargs["api_key"] = LLM_SERVER["api_key"]
+        kwargs["base_url"] = LLM_SERVER["base_url"]
+        if TIMEOUT_CONFIG["requests"]["llm"]:
+            kwargs.setdefault("timeout", TIMEOUT_CONFIG["requests"]["llm"])
+
+        # Fail fast while the server is known to be down
+        model_resolver.breaker.before_call()
+        check_cancelled()
+
+        # Use a model the tier's endpoints are known to serve (discovered
+        # once, cached)
+        requested_model = kwargs.get("model") or LLM_SERVER["model_name"]
+        # Agents on a model tier request its model; send them to its servers
+        tier = model_tiers.tier_for_model(requested_model)
+        tier_model = model_tiers.model_name(tier)
+        tier_pool = model_tiers.pool(tier) or endpoint_pool
+
+        # Stream the completion so its tokens reach the job as they arrive;
+        # the caller still gets one complete response
+        streaming = PROCESSING_CONFIG["minutes"]["streaming"]
+        caller_stream = bool(kwargs.get("stream"))
+        stream_internally = streaming and not caller_stream
+
+        with ExitStack() as held:
+            # A stream the caller reads keeps its trace open until consumed
+            call = held.enter_context(
+                llm_tracer.trace(
+                    "litellm",
+                    model=requested_model,
+                    stream=bool(stream_internally or caller_stream),
+                )
             )
-
-            # Try to make a simple request to check if server is alive
-            try:
-                import requests
-
-                health_check = requests.get(
-                    f"{kwargs['base_url'].rstrip('/')}/health", timeout=5
+            call.record_request(kwargs)
+
+            # Reuse a stored completion for an identical deterministic call
+            cache_key = None
+            request_key = make_key(messages_for_key(messages), requested_model, kwargs)
+            temperature = kwargs.get("temperature", API_CONFIG["openai"]["temperature"])
+            if not kwargs.get("stream") and should_cache(temperature):
+                cache_key = request_key
+                cached = completion_cache.get(cache_key)
+                if cached is not None:
+                    call.set(cache="hit")
+                    return litellm.ModelResponse(**json.loads(cached))
+                call.set(cache="miss")
+
+            if stream_internally:
+                kwargs["stream"] = True
+
+            # Static prompt text first, transcript last, for prompt caching
+            kwargs.update(prepare_request(kwargs))
+            # Fail before sending a prompt that overflows the context window
+            kwargs.update(
+                context_budget.fit_request(
+                    kwargs, [e.base_url for e in tier_pool.endpoints]
                 )
-                print(f"🔍 Server health check: {health_check.status_code}")
-            except Exception as health_error:
-                print(f"🚨 Server appears to be down: {health_error}")
+            )
 
-            raise last_error
+            for attempt in range(2):
+                if tier_model:
+                    # A tier's model is configured, not discovered
+                    kwargs["model"] = tier_model.rpartition("/")[2]
+                    kwargs["custom_llm_provider"] = "openai"
+                else:
+                    kwargs["model"] = tier_pool.resolver.resolve(requested_model)
+                call.set(model=kwargs["model"], tier=tier)
+
+                # Add custom headers that might be needed
+                if "extra_headers" not in kwargs:
+                    kwargs["extra_headers"] = {}
+                kwargs["extra_headers"]["Content-Type"] = "application/json"
+
+                def send():
+                    # Spread calls over the least loaded healthy LLM endpoint
+                    with tier_pool.acquire() as endpoint:
+                        kwargs["base_url"] = endpoint.base_url
+                        call.set(endpoint=endpoint.base_url)
+                        timer = CallTimer()
+                        started = time.monotonic()
+                        response = original_completion(*args, **kwargs)
+                        if stream_internally:
+                            response = _collect_stream(
+                                litellm, response, messages, timer, call
+                            )
+                        model_tiers.record(tier, time.monotonic() - started)
+                        return response
+
+                def send_stream():
+                    # The caller reads the stream after this call returns, so
+                    # its endpoint stays reserved until the stream is consumed
+                    with ExitStack() as reserved:
+                        endpoint = reserved.enter_context(tier_pool.acquire())
+                        kwargs["base_url"] = endpoint.base_url
+                        call.set(endpoint=endpoint.base_url)
+                        started = time.monotonic()
+                        response = original_completion(*args, **kwargs)
+                        held.enter_context(reserved.pop_all())
+                        return response, started
 
-        # Apply patch
-        litellm.completion = patched_completion
-        print("✅ LiteLLM completion function patched successfully")
-    except Exception as e:
-        print(f"❌ Failed to patch LiteLLM: {e}")
+                try:
+                    if caller_stream:
+                        # A stream can only be read once, so it is never shared
+                        # with an identical request
+                        response, stream_started = send_stream()
+                    elif stream_internally:
+                        response = send()
+                    else:
+                        # Batch with concurrent requests from other jobs
+                        response = request_coalescer.call(
+                            send, None if temperature else request_key
+                        )
+                except JobCancelledError:
+                    raise
+                except Exception as e:
+                    # Any answer from the server, even an error, shows it is
+                    # up; in a pool only losing every endpoint opens the circuit
+                    tier_pool.record_outcome(model_resolver.breaker, e)
+
+                    if is_model_error(e) and attempt == 0:
+                        # The server's models changed; rediscover and retry
+                        logger.warning(f"Model {kwargs['model']} rejected: {e}")
+                        tier_pool.resolver.invalidate()
+                        check_cancelled()
+                        continue
+                    logger.error(
+                        f"LLM call to {kwargs['base_url']} failed "
+                        f"(circuit {model_resolver.breaker.state}): {e}"
+                    )
+                    raise
+
+                model_resolver.breaker.record_success()
+                call.record_usage(getattr(response, "usage", None))
+                if cache_key is not None:
+                    completion_cache.put(cache_key, response.model_dump_json())
+                if caller_stream:
+                    return _held_stream(
+                        response,
+                        held.pop_all(),
+                        call,
+                        tier_pool,
+                        # Timed once generated in full, like other calls
+                        lambda: model_tiers.record(
+                            tier, time.monotonic() - stream_started
+                        ),
+                    )
+                return response
+
+    return patched_completion
+
+
+def _held_stream(response, held, call, pool, on_consumed):
+    """Yield a stream the caller reads, holding its endpoint until consumed."""
+    with held:
+        try:
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    call.on_token()
+                yield chunk
+        except Exception as e:
+            # The endpoint's own breaker sees the error as the stream closes
+            pool.record_outcome(model_resolver.breaker, e)
+            raise
+        on_consumed()
+
+
+def _collect_stream(litellm, response, messages, timer, call):
+    """Forward a LiteLLM stream's tokens and rebuild the complete response."""
+    chunks = []
+    for chunk in response:
+        check_cancelled()
+        chunks.append(chunk)
+        if chunk.choices:
+            token = chunk.choices[0].delta.content or ""
+            timer.on_token(token)
+            if token:
+                call.on_token()
+    stream_metrics.record(timer)
+    return litellm.stream_chunk_builder(chunks, messages=messages)
 
 
 def _patch_openai():
@@ -146,7 +308,8 @@ def _patch_openai():
 def debug_local_server():
     """Debug function to test local LLM server connectivity."""
     import requests
-    from config.app_config import LLM_SERVER
+
+    from meeting_minutes.config.app_config import LLM_SERVER
 
     base_url = LLM_SERVER["base_url"]
     print(f"🔍 Testing local LLM server at: {base_url}")
@@ -0,0 +1,113 @@
+"""
+Prefix-cache-friendly prompt layout for Meeting Minutes Agent.
+
+llama.cpp-style servers keep the KV cache of the previous prompt in each slot
+and only evaluate the part of a new prompt after the longest common prefix.
+Prompts are therefore arranged so that everything static (system prompt,
+agent backstory, task instructions) comes first and the per-meeting content,
+marked with ``<transcript>`` tags in the prompts, comes last. Requests also
+ask the server to keep and reuse the cached prefix.
+"""
+
+import re
+from typing import Any, Dict, List
+
+from ..config.app_config import LLM_PROMPT_CONFIG
+
+# Per-meeting blocks that must come after all static prompt text
+VARIABLE_TAGS = ("transcript",)
+_VARIABLE_BLOCK = re.compile(
+    r"\s*<(" + "|".join(VARIABLE_TAGS) + r")>.*?</\1>", re.DOTALL
+)
+
+
+def tag_variable(text: str, tag: str = "transcript") -> str:
+    """
+    Mark per-meeting text so arrange_messages() can move it to the end.
+
+    Args:
+        text: Variable prompt content, e.g. the transcript
+        tag: One of VARIABLE_TAGS
+
+    Returns:
+        The text wrapped in the tag
+    """
+    return f"<{tag}>\n{text}\n</{tag}>"
+
+
+def arrange_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Reorder a chat so its static content forms a stable prefix.
+
+    System messages are moved to the front and tagged variable blocks are cut
+    out of them and of the opening user message and appended, in order, to
+    that user message. Two meetings sent through the same prompts then share
+    every token up to their transcripts, and the later turns of an agent loop
+    (assistant replies, tool observations) only extend the prefix of the
+    previous turn, transcript included.
+
+    Args:
+        messages: OpenAI-style messages with string content
+
+    Returns:
+        New list of messages; the input is not modified
+    """
+    system = [m for m in messages if m.get("role") == "system"]
+    rest = [m for m in messages if m.get("role") != "system"]
+    arranged = [dict(m) for m in system + rest]
+    if not arranged:
+        return arranged
+
+    opening = next(
+        (
+            index
+            for index, message in enumerate(arranged)
+            if message.get("role") == "user" and isinstance(message.get("content"), str)
+        ),
+        None,
+    )
+    # Blocks in later turns are history the server has already cached
+    leading = arranged if opening is None else arranged[: opening + 1]
+
+    blocks: List[str] = []
+    for message in leading:
+        content = message.get("content")
+        if not isinstance(content, str):
+            continue
+        found = [match.group(0).strip() for match in _VARIABLE_BLOCK.finditer(content)]
+        if found:
+            blocks.extend(found)
+            message["content"] = _VARIABLE_BLOCK.sub("", content).rstrip()
+
+    if blocks:
+        if opening is not None:
+            target = arranged[opening]
+            parts = [target["content"]] if target["content"] else []
+            target["content"] = "\n\n".join(parts + blocks)
+        else:
+            arranged.append({"role": "user", "content": "\n\n".join(blocks)})
+    return arranged
+
+
+def prepare_request(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Apply the prompt layout and cache hints to chat completion arguments.
+
+    Args:
+        kwargs: Arguments for ``chat.completions.create`` or LiteLLM
+
+    Returns:
+        New arguments with arranged messages and, if enabled, the
+        ``cache_prompt`` hint in ``extra_body``
+    """
+    prepared = dict(kwargs)
+    messages = prepared.get("messages")
+    if messages and all(isinstance(m, dict) for m in messages):
+        prepared["messages"] = arrange_messages(messages)
+    if LLM_PROMPT_CONFIG["cache_prompt"]:
+        # llama.cpp server: reuse the slot's KV cache for the common prefix
+        prepared["extra_body"] = {
+            "cache_prompt": True,
+            **(prepared.get("extra_body") or {}),
+        }
+    return prepared
@@ -0,0 +1,163 @@
+"""
+Cross-job batching of LLM requests for Meeting Minutes Agent.
+
+Local inference servers such as llama-server decode several requests in one
+batch when they arrive together on their parallel slots, which raises the
+aggregate tokens/sec of a CPU box considerably. The coalescer holds
+completion requests for a short window, dispatches everything gathered in
+that window at once (identical deterministic requests only once) and hands
+each result back to its caller.
+"""
+
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional
+
+from ..config.app_config import LLM_COALESCE_CONFIG
+from .cancellation import check_cancelled
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class _Request:
+    """A dispatched call and the future its callers wait on."""
+
+    def __init__(self, func: Callable[[], Any], context: contextvars.Context):
+        self.func = func
+        self.context = context
+        self.future: Future = Future()
+
+
+class RequestCoalescer:
+    """Gathers concurrent LLM requests and submits them together."""
+
+    def __init__(
+        self,
+        window_ms: Optional[float] = None,
+        max_batch: Optional[int] = None,
+        slots: Optional[int] = None,
+    ):
+        """
+        Args:
+            window_ms: How long the first request of a batch waits for others
+                (0 dispatches every request immediately)
+            max_batch: Dispatch as soon as this many requests are waiting
+            slots: Requests sent to the server at the same time
+        """
+        self._window_ms = window_ms
+        self.max_batch = max_batch or LLM_COALESCE_CONFIG["max_batch"]
+        self.slots = slots or LLM_COALESCE_CONFIG["slots"]
+        self._lock = threading.Lock()
+        self._batch: List[_Request] = []
+        self._by_key: Dict[str, _Request] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stats = {"requests": 0, "dispatched": 0, "batches": 0, "shared": 0}
+
+    @property
+    def window_ms(self) -> float:
+        # Read on use so a performance profile applied later takes effect
+        if self._window_ms is not None:
+            return self._window_ms
+        return LLM_COALESCE_CONFIG["window_ms"]
+
+    @property
+    def enabled(self) -> bool:
+        return self.window_ms > 0
+
+    def call(self, func: Callable[[], Any], key: Optional[str] = None) -> Any:
+        """
+        Run a request as part of the current batch and wait for its result.
+
+        Args:
+            func: Performs the request; runs in the caller's context
+            key: Requests with the same key in one batch are sent once and
+                share the result (None never shares, e.g. for sampled calls)
+
+        Returns:
+            What func returned
+
+        Raises:
+            Whatever func raised, or JobCancelledError if the caller's job is
+            cancelled while waiting
+        """
+        if not self.enabled:
+            return func()
+
+        with self._lock:
+            self._stats["requests"] += 1
+            request = self._by_key.get(key) if key is not None else None
+            if request is not None:
+                self._stats["shared"] += 1
+            else:
+                request = _Request(func, contextvars.copy_context())
+                self._batch.append(request)
+                if key is not None:
+                    self._by_key[key] = request
+                if len(self._batch) >= self.max_batch:
+                    self._dispatch_locked()
+                elif self._timer is None:
+                    self._timer = threading.Timer(self.window_ms / 1000, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        while True:
+            try:
+                return request.future.result(timeout=0.5)
+            except FutureTimeoutError:
+                check_cancelled()
+
+    def flush(self) -> None:
+        """Dispatch the requests gathered so far without waiting any longer."""
+        with self._lock:
+            self._dispatch_locked()
+
+    def _dispatch_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._batch = self._batch, []
+        self._by_key = {}
+        if not batch:
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.slots, thread_name_prefix="llm-batch"
+            )
+        self._stats["batches"] += 1
+        self._stats["dispatched"] += len(batch)
+        logger.debug(f"Dispatching {len(batch)} coalesced LLM request(s)")
+        for request in batch:
+            self._executor.submit(self._run, request)
+
+    @staticmethod
+    def _run(request: _Request) -> None:
+        try:
+            request.future.set_result(request.context.run(request.func))
+        except BaseException as e:
+            request.future.set_exception(e)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request, batch and sharing counters."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["mean_batch_size"] = (
+            round(stats["dispatched"] / stats["batches"], 2) if stats["batches"] else 0
+        )
+        return stats
+
+    def close(self) -> None:
+        """Dispatch what is waiting and stop the dispatch threads."""
+        self.flush()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+# Process-wide coalescer shared by all jobs in this worker
+request_coalescer = RequestCoalescer()
@@ -0,0 +1,228 @@
+"""
+Streamed LLM token delivery and generation metrics for Meeting Minutes Agent.
+
+LLM calls stream their completions token by token. Each token is handed to
+the sink bound to the calling job (see ``stream_tokens_to``), and every call
+records its time to first token and generation speed so the job report shows
+how responsive the model was.
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from .cancellation import current_token
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+TokenSink = Callable[[str], None]
+
+_current_sink: contextvars.ContextVar[Optional[TokenSink]] = contextvars.ContextVar(
+    "token_sink", default=None
+)
+
+
+@contextmanager
+def stream_tokens_to(sink: Optional[TokenSink]) -> Iterator[None]:
+    """
+    Send the tokens of LLM calls made in this context to a sink.
+
+    Args:
+        sink: Called with each token as it arrives (None keeps the tokens of
+            intermediate calls out of an enclosing sink)
+    """
+    context_token = _current_sink.set(sink)
+    try:
+        yield
+    finally:
+        _current_sink.reset(context_token)
+
+
+class TokenGate:
+    """
+    Token sink that passes tokens on only while it is open.
+
+    Bound for a whole crew run, it keeps the reasoning, tool calls and outputs
+    of earlier agents out of the sink and lets one task's calls through once
+    that task starts. For a single completion that writes several sections,
+    ``open_after`` lets only the text after one section's header through.
+    """
+
+    def __init__(self, sink: TokenSink):
+        self.sink = sink
+        self._open = threading.Event()
+        self._header: Optional[str] = None
+        self._pending = ""
+
+    @property
+    def is_open(self) -> bool:
+        return self._open.is_set()
+
+    def open(self) -> None:
+        """Start passing tokens on."""
+        self._header = None
+        self._open.set()
+
+    def open_after(self, header: str) -> None:
+        """
+        Start passing tokens on after a line reading ``header`` goes by.
+
+        Args:
+            header: Line that precedes the text to pass on
+        """
+        self._open.clear()
+        self._pending = ""
+        self._header = header
+
+    def close(self) -> None:
+        """Drop tokens again."""
+        self._header = None
+        self._open.clear()
+
+    def __call__(self, text: str) -> None:
+        if self._header is not None:
+            text = self._after_header(text)
+        if text and self._open.is_set():
+            self.sink(text)
+
+    def _after_header(self, text: str) -> str:
+        """Hold back text until the header line is complete, then open."""
+        lines = (self._pending + text).split("\n")
+        for index, line in enumerate(lines[:-1]):
+            if line.strip() == self._header:
+                self._header = None
+                self._pending = ""
+                self._open.set()
+                return "\n".join(lines[index + 1 :])
+        # The last line may still be a header being streamed
+        self._pending = lines[-1]
+        return ""
+
+
+class CallTimer:
+    """Measures one streamed LLM call."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.first_token: Optional[float] = None
+        self.tokens = 0
+        token = current_token()
+        self.job_id = token.job_id if token is not None else ""
+        self.sink = _current_sink.get()
+
+    def on_token(self, text: str) -> None:
+        """Record a token and forward it to the job's sink."""
+        if not text:
+            return
+        if self.first_token is None:
+            self.first_token = time.monotonic()
+        self.tokens += 1
+        if self.sink is not None:
+            try:
+                self.sink(text)
+            except Exception as e:
+                # A broken consumer must not fail the generation
+                logger.warning(f"Token sink failed: {e}")
+                self.sink = None
+
+    def finish(self) -> Dict[str, Any]:
+        """Return the call's time to first token and tokens per second."""
+        ended = time.monotonic()
+        ttft = (self.first_token or ended) - self.started
+        generating = ended - (self.first_token or ended)
+        return {
+            "ttft_seconds": round(ttft, 3),
+            "duration_seconds": round(ended - self.started, 3),
+            "tokens": self.tokens,
+            # The first token is excluded: its latency is the prompt processing
+            "tokens_per_second": (
+                round((self.tokens - 1) / generating, 2)
+                if self.tokens > 1 and generating > 0
+                else 0.0
+            ),
+        }
+
+
+class StreamMetrics:
+    """Per-job record of streamed LLM calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, List[Dict[str, Any]]] = {}
+
+    def record(self, timer: CallTimer) -> Dict[str, Any]:
+        """Store the measurements of a finished call."""
+        call = timer.finish()
+        with self._lock:
+            self._calls.setdefault(timer.job_id, []).append(call)
+        logger.debug(
+            f"LLM call: first token after {call['ttft_seconds']}s, "
+            f"{call['tokens']} tokens at {call['tokens_per_second']} tokens/s"
+        )
+        return call
+
+    def pop_job_metrics(self, job_id: str) -> Dict[str, Any]:
+        """
+        Return and forget the streamed calls of a finished job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The calls with a summary of their time to first token and speed
+        """
+        with self._lock:
+            calls = self._calls.pop(job_id, [])
+        if not calls:
+            return {"calls": []}
+
+        ttfts = sorted(call["ttft_seconds"] for call in calls)
+        tokens = sum(call["tokens"] for call in calls)
+        generating = sum(
+            call["duration_seconds"] - call["ttft_seconds"] for call in calls
+        )
+        return {
+            "calls": calls,
+            "mean_ttft_seconds": round(sum(ttfts) / len(ttfts), 3),
+            "max_ttft_seconds": ttfts[-1],
+            "tokens": tokens,
+            "tokens_per_second": round(tokens / generating, 2) if generating else 0.0,
+        }
+
+
+class TokenStreamCallbackHandler(BaseCallbackHandler):
+    """Times streamed LangChain calls and forwards their tokens."""
+
+    def __init__(self, metrics: Optional[StreamMetrics] = None):
+        self.metrics = metrics or stream_metrics
+        self._timers: Dict[UUID, CallTimer] = {}
+
+    def on_llm_start(self, serialized, prompts, *, run_id: UUID, **kwargs):
+        self._timers[run_id] = CallTimer()
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, **kwargs):
+        self._timers[run_id] = CallTimer()
+
+    def on_llm_new_token(self, token, *, run_id: UUID, **kwargs):
+        timer = self._timers.get(run_id)
+        if timer is not None:
+            timer.on_token(token)
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs):
+        timer = self._timers.pop(run_id, None)
+        # Cache hits and non-streamed calls produce no tokens to time
+        if timer is not None and timer.tokens:
+            self.metrics.record(timer)
+
+    def on_llm_error(self, error, *, run_id: UUID, **kwargs):
+        self._timers.pop(run_id, None)
+
+
+# Process-wide metrics shared by all jobs in this worker
+stream_metrics = StreamMetrics()
@@ -0,0 +1,143 @@
+"""
+Concurrent warm-up of external dependencies for Meeting Minutes Agent.
+
+Gmail OAuth, the local LLM server and the ElevenLabs client are all set up
+in parallel while the audio file is probed and decoded, so that a missing
+dependency fails the job before any paid transcription work starts.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from ..config.app_config import LLM_TIER_CONFIG
+from .endpoint_pool import endpoint_pool
+from .logger import setup_logger
+from .model_registry import CircuitOpenError
+from .model_tiers import model_tiers
+
+logger = setup_logger(__name__)
+
+
+class WarmupError(RuntimeError):
+    """Raised when one or more required dependencies failed to warm up."""
+
+    def __init__(self, failures: Dict[str, BaseException]):
+        self.failures = failures
+        details = ", ".join(f"{name}: {error}" for name, error in failures.items())
+        super().__init__(f"Dependency warm-up failed ({details})")
+
+
+def check_llm_server() -> list:
+    """
+    Check that the LLM endpoints are reachable and serving models.
+
+    Every endpoint of the default pool, and of model tiers with their own
+    servers, is probed, ejecting those that fail. The default pool's models
+    are then discovered, priming the cache used by every LLM call.
+
+    Returns:
+        List of model ids served by the default endpoints
+
+    Raises:
+        CircuitOpenError: If a pool has no healthy endpoint
+    """
+    pools = [endpoint_pool]
+    if LLM_TIER_CONFIG["enabled"]:
+        tier_pools = (model_tiers.pool(tier) for tier in LLM_TIER_CONFIG["tiers"])
+        pools += [pool for pool in tier_pools if pool is not None]
+    for pool in pools:
+        pool.probe()
+        if not pool.admissible():
+            raise CircuitOpenError(
+                f"No healthy LLM endpoint among {pool.resolver.base_url}"
+            )
+
+    models = endpoint_pool.resolver.discover(force=True)
+    logger.debug(f"LLM endpoints serve {len(models)} model(s)")
+    return models
+
+
+class Warmup:
+    """Runs dependency checks concurrently in background threads."""
+
+    def __init__(
+        self,
+        checks: Dict[str, Callable[[], Any]],
+        required: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            checks: Mapping of dependency name to a callable that sets it up
+            required: Names whose failure should abort the job (default: all)
+            timeout: Maximum seconds to wait for all checks to finish
+        """
+        self.checks = checks
+        self.required = set(checks if required is None else required)
+        self.timeout = timeout
+        self.durations: Dict[str, float] = {}
+        self._futures: Dict[str, Any] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def start(self) -> "Warmup":
+        """Start all checks without waiting for them."""
+        if not self.checks:
+            return self
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.checks), thread_name_prefix="warmup"
+        )
+        for name, check in self.checks.items():
+            self._futures[name] = self._executor.submit(self._timed, name, check)
+        logger.info(f"Warming up dependencies: {', '.join(self.checks)}")
+        return self
+
+    def _timed(self, name: str, check: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        try:
+            return check()
+        finally:
+            self.durations[name] = time.perf_counter() - started
+
+    def wait(self) -> Dict[str, Any]:
+        """
+        Wait for the checks and collect their results.
+
+        Returns:
+            Mapping of dependency name to the value its check returned
+
+        Raises:
+            WarmupError: If a required check failed or did not finish in time
+        """
+        if not self._futures:
+            return {}
+
+        done, not_done = wait(self._futures.values(), timeout=self.timeout)
+        results: Dict[str, Any] = {}
+        failures: Dict[str, BaseException] = {}
+
+        for name, future in self._futures.items():
+            if future in not_done:
+                error: Optional[BaseException] = TimeoutError(
+                    f"did not finish within {self.timeout}s"
+                )
+            else:
+                error = future.exception()
+
+            if error is None:
+                results[name] = future.result()
+                logger.info(
+                    f"Warm-up of {name} finished in {self.durations.get(name, 0):.2f}s"
+                )
+            elif name in self.required:
+                failures[name] = error
+            else:
+                logger.warning(f"Optional dependency {name} failed to warm up: {error}")
+
+        # Don't block on checks that are still running
+        self._executor.shutdown(wait=False)
+
+        if failures:
+            raise WarmupError(failures)
+        return results
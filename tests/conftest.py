@@ -1,6 +1,14 @@
 """Test configuration and fixtures."""
 
+import base64
+import email.parser
+import json
 import sys
+import threading
+import time
+import urllib.parse
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -24,6 +32,14 @@ def src_dir():
     return SRC_DIR
 
 
+@pytest.fixture(autouse=True)
+def fixed_context_window(monkeypatch):
+    """Pin the context window so LLM calls don't probe the server for it."""
+    from meeting_minutes.config.app_config import LLM_CONTEXT_CONFIG
+
+    monkeypatch.setitem(LLM_CONTEXT_CONFIG, "window", 32768)
+
+
 @pytest.fixture
 def mock_env_vars(monkeypatch):
     """Mock environment variables."""
@@ -56,6 +72,370 @@ def mock_llm():
     return mock
 
 
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible server: /v1/models and /v1/chat/completions."""
+
+    protocol_version = "HTTP/1.1"  # keep connections alive
+    models = ["local-model"]
+    reply = "Mock response"
+    delay = 0.0
+    # Pause between streamed tokens
+    token_delay = 0.0
+    # Answer every request with 503, like an overloaded or broken server
+    failing = False
+    # Context length reported in /v1/models and llama-server's /props
+    context_window = None
+    props_context_window = None
+    requests_seen = []
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        cls = type(self)
+        cls.requests_seen.append(("GET", self.path, None))
+        if cls.failing:
+            self._send_json(503, {"error": {"message": "unavailable"}})
+        elif self.path.rstrip("/").endswith("/models"):
+            meta = {"meta": {"n_ctx_train": cls.context_window}}
+            self._send_json(
+                200,
+                {
+                    "data": [
+                        {"id": model, **(meta if cls.context_window else {})}
+                        for model in cls.models
+                    ]
+                },
+            )
+        elif self.path == "/props" and cls.props_context_window:
+            settings = {"n_ctx": cls.props_context_window}
+            self._send_json(200, {"default_generation_settings": settings})
+        else:
+            self._send_json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        cls = type(self)
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        cls.requests_seen.append(("POST", self.path, payload))
+        time.sleep(cls.delay)
+        if cls.failing:
+            self._send_json(503, {"error": {"message": "unavailable"}})
+            return
+        if payload.get("stream"):
+            self._send_stream(payload)
+            return
+        self._send_json(
+            200,
+            {
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": payload.get("model", cls.models[0]),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": cls.reply},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 5,
+                    "completion_tokens": 2,
+                    "total_tokens": 7,
+                },
+            },
+        )
+
+    def _send_stream(self, payload):
+        """Send the reply word by word as server-sent events."""
+        cls = type(self)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def send_event(data):
+            event = f"data: {data}\n\n".encode()
+            self.wfile.write(f"{len(event):x}\r\n".encode() + event + b"\r\n")
+            self.wfile.flush()
+
+        words = cls.reply.split(" ")
+        for i, word in enumerate(words):
+            content = word if i == 0 else f" {word}"
+            finish = "stop" if i == len(words) - 1 else None
+            chunk = {
+                "id": "chatcmpl-test",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": payload.get("model", cls.models[0]),
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {"role": "assistant", "content": content},
+                        "finish_reason": finish,
+                    }
+                ],
+            }
+            send_event(json.dumps(chunk))
+            time.sleep(cls.token_delay)
+        send_event("[DONE]")
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+@contextmanager
+def run_fake_llm_server():
+    """Run a local OpenAI-compatible server; yields (base_url, handler class)."""
+    handler = type(
+        "Handler", (FakeLLMHandler,), {"requests_seen": [], "models": ["local-model"]}
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/v1", handler
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def fake_llm_server():
+    """Run a local OpenAI-compatible server; yields (base_url, handler class)."""
+    with run_fake_llm_server() as server:
+        yield server
+
+
+@pytest.fixture
+def fake_llm_servers():
+    """Run two local OpenAI-compatible servers; yields a list of (url, handler)."""
+    with run_fake_llm_server() as first, run_fake_llm_server() as second:
+        yield [first, second]
+
+
+@pytest.fixture
+def local_llm(fake_llm_server, monkeypatch):
+    """Point get_llm() at the fake server; yields (base_url, handler class)."""
+    from meeting_minutes.config.app_config import LLM_SERVER
+    from meeting_minutes.utils import llm_config
+    from meeting_minutes.utils.endpoint_pool import EndpointPool
+
+    base_url, handler = fake_llm_server
+    monkeypatch.setitem(LLM_SERVER, "base_url", base_url)
+    monkeypatch.setattr(llm_config, "endpoint_pool", EndpointPool([base_url]))
+    return base_url, handler
+
+
+class FakeGmailHandler(BaseHTTPRequestHandler):
+    """Minimal Gmail API: draft creation, one at a time, in batch requests or
+    as media uploads (multipart or resumable), and draft search by Message-ID."""
+
+    protocol_version = "HTTP/1.1"
+    # Raw message (or "*" for any) -> HTTP statuses to fail its next create
+    # attempts with
+    failures = {}
+    drafts = []
+    requests_seen = []
+    # Resumable upload session id -> bytes received so far
+    uploads = {}
+    # Drafts to create while answering 503, as if the reply had been lost
+    lost_replies = 0
+    # Batch requests to carry out while answering 503 for the whole batch
+    lost_batches = 0
+
+    def _create_draft(self, body):
+        """Create one draft; returns (status, payload)."""
+        cls = type(self)
+        raw = (body.get("message") or {}).get("raw")
+        pending = cls.failures.get(raw) or cls.failures.get("*")
+        if pending:
+            status = pending.pop(0)
+            return status, {"error": {"code": status, "message": f"failed {status}"}}
+        cls.drafts.append(body["message"])
+        number = len(cls.drafts)
+        if cls.lost_replies:
+            cls.lost_replies -= 1
+            return 503, {"error": {"code": 503, "message": "reply lost"}}
+        return 200, {
+            "id": f"draft-{number}",
+            "message": {"id": f"message-{number}", "threadId": f"thread-{number}"},
+        }
+
+    def _send(self, status, body, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        cls = type(self)
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        path = self.path.split("?", 1)[0]
+        cls.requests_seen.append(("POST", path, body))
+        if path.startswith("/batch"):
+            self._send_batch(body)
+        elif path.startswith("/upload/") and "uploadType=resumable" in self.path:
+            session = f"session-{len(cls.uploads) + 1}"
+            cls.uploads[session] = b""
+            self.send_response(200)
+            self.send_header("Location", f"{self._base_url()}/upload/{session}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif path.startswith("/upload/"):
+            self._send_upload(self._related_media(body))
+        elif path.endswith("/drafts"):
+            status, payload = self._create_draft(json.loads(body))
+            self._send(status, json.dumps(payload).encode())
+        else:
+            self._send(404, b"{}")
+
+    def do_GET(self):
+        cls = type(self)
+        path, _, query = self.path.partition("?")
+        cls.requests_seen.append(("GET", path, b""))
+        if not path.endswith("/drafts"):
+            self._send(404, b"{}")
+            return
+        search = urllib.parse.parse_qs(query).get("q", [""])[0]
+        message_id = search.partition("rfc822msgid:")[2]
+        drafts = [
+            {"id": f"draft-{number}", "message": {"id": f"message-{number}"}}
+            for number, message in enumerate(cls.drafts, 1)
+            if email.message_from_bytes(base64.urlsafe_b64decode(message["raw"]))[
+                "Message-ID"
+            ]
+            == message_id
+        ]
+        payload = {"drafts": drafts, "resultSizeEstimate": len(drafts)}
+        self._send(200, json.dumps(payload).encode())
+
+    def do_PUT(self):
+        cls = type(self)
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        session = self.path.rsplit("/", 1)[-1]
+        cls.requests_seen.append(("PUT", self.path, body))
+        cls.uploads[session] += body
+        received = len(cls.uploads[session])
+        total = self.headers["Content-Range"].rsplit("/", 1)[-1]
+        if total != "*" and received == int(total):
+            self._send_upload(cls.uploads[session])
+            return
+        self.send_response(308)
+        self.send_header("Range", f"bytes=0-{received - 1}")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _related_media(self, body):
+        """The media part of a multipart/related upload body."""
+        boundary = self.headers["Content-Type"].split("boundary=", 1)[1].strip('"')
+        parts = body.split(b"--" + boundary.encode())
+        # Preamble, metadata part, media part, closing "--"
+        # The client library separates the part headers with bare newlines
+        _, _, media = parts[2].partition(b"\n\n")
+        return media[:-1] if media.endswith(b"\n") else media
+
+    def _send_upload(self, media):
+        """Create a draft from an uploaded RFC 822 message."""
+        raw = base64.urlsafe_b64encode(media).decode()
+        status, payload = self._create_draft({"message": {"raw": raw}})
+        self._send(status, json.dumps(payload).encode())
+
+    def _send_batch(self, body):
+        """Answer a multipart/mixed batch with one HTTP response per part."""
+        cls = type(self)
+        content_type = self.headers["Content-Type"]
+        batch = email.parser.BytesParser().parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + body
+        )
+        parts = []
+        for part in batch.get_payload():
+            request = part.get_payload()
+            _, _, payload = request.replace("\r\n", "\n").partition("\n\n")
+            status, response = self._create_draft(json.loads(payload))
+            content_id = part["Content-ID"][1:-1]
+            parts.append(
+                "--batch_boundary\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+                f"{json.dumps(response)}\r\n"
+            )
+        if cls.lost_batches:
+            cls.lost_batches -= 1
+            self._send(503, b'{"error": {"code": 503, "message": "reply lost"}}')
+            return
+        reply = ("".join(parts) + "--batch_boundary--\r\n").encode()
+        self._send(200, reply, "multipart/mixed; boundary=batch_boundary")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_gmail_server():
+    """Run a local stand-in for the Gmail API; yields (base_url, handler class)."""
+    handler = type(
+        "Handler",
+        (FakeGmailHandler,),
+        {
+            "failures": {},
+            "drafts": [],
+            "requests_seen": [],
+            "uploads": {},
+            "lost_replies": 0,
+            "lost_batches": 0,
+        },
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/", handler
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def gmail_service(fake_gmail_server, monkeypatch):
+    """A Gmail API service talking to the stand-in; yields (service, handler)."""
+    import httplib2
+    from googleapiclient.discovery import build_from_document
+
+    from meeting_minutes.config.app_config import GMAIL_CONFIG
+    from meeting_minutes.crews.gmailcrew.tools.gmail_utility import (
+        _discovery_document,
+    )
+
+    base_url, handler = fake_gmail_server
+    monkeypatch.setitem(GMAIL_CONFIG, "api_endpoint", base_url)
+    monkeypatch.setitem(GMAIL_CONFIG, "retry_backoff", 0.0)
+    # Media uploads keep the discovery document's https scheme
+    document = json.loads(_discovery_document())
+    document["rootUrl"] = base_url
+    http = httplib2.Http()
+    http.redirect_codes = http.redirect_codes - {308}
+    service = build_from_document(
+        document,
+        http=http,
+        client_options={"api_endpoint": base_url},
+    )
+    return service, handler
+
+
 @pytest.fixture
 def mock_credentials_data():
     """Mock Google OAuth credentials data."""
@@ -0,0 +1,96 @@
+"""Test job artifact storage."""
+
+import pytest
+
+from meeting_minutes.utils.artifact_store import (
+    ArtifactStore,
+    is_artifact_ref,
+    parse_artifact_ref,
+)
+
+
+class TestArtifactStore:
+    """Test storing and resolving artifacts by handle."""
+
+    def test_put_and_read_by_handle(self, tmp_path):
+        """Test text round-trips through a handle."""
+        store = ArtifactStore("job-1", root=str(tmp_path))
+
+        ref = store.put_text("meeting_minutes.md", "# Minutes")
+
+        assert ref == "artifact://job-1/meeting_minutes.md"
+        assert is_artifact_ref(ref)
+        assert ArtifactStore.for_ref(ref, root=str(tmp_path)).read_text(ref) == (
+            "# Minutes"
+        )
+        assert store.size(ref) == len("# Minutes")
+
+    def test_incremental_writer(self, tmp_path):
+        """Test the writer only publishes the artifact once it is closed."""
+        store = ArtifactStore("job-1", root=str(tmp_path))
+
+        with store.open_writer("transcript.txt") as handle:
+            handle.write("first chunk")
+            assert not store.exists("transcript.txt")
+            handle.write(" second chunk")
+
+        assert store.read_text("transcript.txt") == "first chunk second chunk"
+
+    def test_appender_is_readable_while_written(self, tmp_path):
+        """Test flushed writes are visible before the appender is closed."""
+        store = ArtifactStore("job-1", root=str(tmp_path))
+        store.put_text("meeting_minutes.md", "stale minutes")
+
+        with store.open_appender("meeting_minutes.md") as handle:
+            handle.write("# Min")
+            handle.flush()
+            assert store.read_text("meeting_minutes.md") == "# Min"
+            handle.write("utes")
+
+        assert store.read_text("meeting_minutes.md") == "# Minutes"
+
+    @pytest.mark.parametrize(
+        "ref",
+        [
+            "transcript.txt",
+            "artifact://job-1",
+            "artifact://../x/y",
+            "artifact://a/../b",
+            "artifact://../x",
+            "artifact://../.env",
+            "artifact://./x",
+            "artifact://job-1/..",
+        ],
+    )
+    def test_malformed_handles_rejected(self, ref):
+        """Test handles cannot escape the artifact root."""
+        with pytest.raises(ValueError):
+            parse_artifact_ref(ref)
+
+    def test_handle_from_other_job_rejected(self, tmp_path):
+        """Test a store refuses handles owned by another job."""
+        store = ArtifactStore("job-1", root=str(tmp_path))
+
+        with pytest.raises(ValueError):
+            store.path("artifact://job-2/transcript.txt")
+
+    def test_dot_job_ids_rejected(self, tmp_path):
+        """Test "." and ".." cannot be used as a job id or artifact name."""
+        for job_id in (".", ".."):
+            with pytest.raises(ValueError):
+                ArtifactStore(job_id, root=str(tmp_path))
+        with pytest.raises(ValueError):
+            ArtifactStore("job-1", root=str(tmp_path)).path("..")
+
+    def test_symlink_out_of_root_rejected(self, tmp_path):
+        """Test a job directory linked outside the root is not followed."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "secret.txt").write_text("token")
+        root = tmp_path / "artifacts"
+        root.mkdir()
+        (root / "job-1").symlink_to(outside)
+        store = ArtifactStore("job-1", root=str(root))
+
+        with pytest.raises(ValueError, match="outside"):
+            store.read_text("artifact://job-1/secret.txt")
@@ -0,0 +1,143 @@
+"""Test bounded pipelines and the memory ceiling."""
+
+import threading
+import time
+
+import pytest
+
+from meeting_minutes.utils.backpressure import (
+    JobMemoryMonitor,
+    MemoryGovernor,
+    bounded_map,
+    current_rss_bytes,
+)
+from meeting_minutes.utils.cancellation import CancellationToken, JobCancelledError
+
+
+class TestBoundedMap:
+    """Test the bounded producer/worker pipeline."""
+
+    def test_results_in_source_order(self):
+        """Test results come back in order even when workers finish out of order."""
+
+        def slow_for_even(x):
+            time.sleep(0.05 if x % 2 == 0 else 0)
+            return x * 10
+
+        results = [
+            (item, result)
+            for item, result, _ in bounded_map(slow_for_even, range(6), workers=3)
+        ]
+
+        assert results == [(i, i * 10) for i in range(6)]
+
+    def test_errors_reported_per_item(self):
+        """Test a failing item does not stop the pipeline."""
+
+        def fail_on_two(x):
+            if x == 2:
+                raise ValueError("bad chunk")
+            return x
+
+        outcomes = list(bounded_map(fail_on_two, range(4)))
+
+        assert [error is None for _, _, error in outcomes] == [True, True, False, True]
+        assert isinstance(outcomes[2][2], ValueError)
+
+    def test_producer_is_bounded(self):
+        """Test the producer never runs more than workers + max_pending ahead."""
+        produced = []
+
+        def source():
+            for i in range(20):
+                produced.append(i)
+                yield i
+
+        stats = {}
+        pipeline = bounded_map(
+            lambda x: x, source(), workers=2, max_pending=1, stats=stats
+        )
+        next(pipeline)
+        time.sleep(0.3)
+
+        assert len(produced) <= 2 + 1 + 1
+        pipeline.close()
+        assert stats["max_in_flight"] <= 3
+
+    def test_source_errors_propagate(self):
+        """Test decode errors raised by the source reach the caller."""
+
+        def source():
+            yield 1
+            raise OSError("corrupt audio")
+
+        with pytest.raises(OSError):
+            list(bounded_map(lambda x: x, source()))
+
+    def test_cancellation_stops_pipeline(self):
+        """Test cancelling the token aborts a blocked pipeline."""
+        token = CancellationToken("job")
+        release = threading.Event()
+        threading.Timer(0.1, token.cancel).start()
+
+        with pytest.raises(JobCancelledError):
+            list(bounded_map(lambda x: release.wait(5), range(3), token=token))
+        release.set()
+
+    def test_reservations_returned(self):
+        """Test all governor reservations are released, even on early exit."""
+        governor = MemoryGovernor(ceiling_mb=0)
+        pipeline = bounded_map(lambda x: x, range(10), governor=governor)
+        next(pipeline)
+        pipeline.close()
+        time.sleep(0.3)
+
+        assert governor.in_flight == 0
+
+
+class TestMemoryGovernor:
+    """Test pausing producers at the memory ceiling."""
+
+    def test_disabled_never_pauses(self):
+        """Test a zero ceiling disables the governor."""
+        governor = MemoryGovernor(ceiling_mb=0)
+        governor.acquire()
+
+        assert governor.acquire() == 0.0
+        assert not governor.over_ceiling()
+
+    def test_pauses_until_work_finishes(self):
+        """Test producers wait above the ceiling until in-flight work is released."""
+        governor = MemoryGovernor(ceiling_mb=1, poll_interval=0.05)
+        governor.acquire()  # nothing in flight: granted despite the ceiling
+        threading.Timer(0.2, governor.release).start()
+
+        paused = governor.acquire()
+
+        assert paused >= 0.15
+        assert governor.pauses == 1
+
+    def test_cancellation_while_paused(self):
+        """Test a paused producer stops when its job is cancelled."""
+        governor = MemoryGovernor(ceiling_mb=1, poll_interval=0.05)
+        governor.acquire()
+        token = CancellationToken("job")
+        threading.Timer(0.1, token.cancel).start()
+
+        with pytest.raises(JobCancelledError):
+            governor.acquire(token)
+
+
+class TestJobMemoryMonitor:
+    """Test per-job memory high-water marks."""
+
+    def test_records_peak(self):
+        """Test the peak covers memory allocated while the job ran."""
+        with JobMemoryMonitor(interval=0.01) as monitor:
+            ballast = bytearray(32 * 1024 * 1024)
+            time.sleep(0.1)
+            del ballast
+
+        report = monitor.report()
+        assert current_rss_bytes() > 0
+        assert report["peak_rss_mb"] >= report["start_rss_mb"] + 16
@@ -0,0 +1,98 @@
+"""Test cooperative cancellation and deadlines."""
+
+import threading
+import time
+
+import pytest
+
+from meeting_minutes.utils.cancellation import (
+    CancellationToken,
+    Deadline,
+    JobCancelledError,
+    JobRegistry,
+    StageTimeoutError,
+    check_cancelled,
+    reset_current_token,
+    run_cancellable,
+    set_current_token,
+)
+
+
+class TestRunCancellable:
+    """Test running blocking calls that can be abandoned."""
+
+    def test_returns_result(self):
+        """Test the call's result is returned."""
+        assert run_cancellable(lambda x: x * 2, 21, timeout=1) == 42
+
+    def test_propagates_exceptions(self):
+        """Test exceptions raised by the call reach the caller."""
+
+        def broken():
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            run_cancellable(broken)
+
+    def test_timeout_releases_caller(self):
+        """Test a hung call is abandoned after its timeout."""
+        started = time.monotonic()
+        with pytest.raises(StageTimeoutError):
+            run_cancellable(time.sleep, 5, timeout=0.2)
+        assert time.monotonic() - started < 1
+
+    def test_cancel_releases_caller(self):
+        """Test cancelling the token abandons an in-flight call promptly."""
+        token = CancellationToken("job-1")
+        threading.Timer(0.1, token.cancel).start()
+
+        started = time.monotonic()
+        with pytest.raises(JobCancelledError):
+            run_cancellable(time.sleep, 5, token=token)
+        assert time.monotonic() - started < 1
+
+    def test_call_sees_current_token(self):
+        """Test the worker thread inherits the caller's cancellation token."""
+        token = CancellationToken("job-1")
+        context_token = set_current_token(token)
+        try:
+            token.cancel()
+            with pytest.raises(JobCancelledError):
+                run_cancellable(check_cancelled)
+        finally:
+            reset_current_token(context_token)
+
+
+class TestDeadline:
+    """Test stage deadlines."""
+
+    def test_unlimited(self):
+        """Test a zero deadline never expires."""
+        deadline = Deadline(0)
+        assert deadline.remaining() is None
+        assert deadline.cap(30) == 30
+        deadline.check()
+
+    def test_cap_and_expiry(self):
+        """Test request timeouts are capped by the remaining stage time."""
+        deadline = Deadline(0.05, "transcription")
+        assert deadline.cap(30) <= 0.05
+        time.sleep(0.06)
+        with pytest.raises(StageTimeoutError):
+            deadline.check()
+
+
+class TestJobRegistry:
+    """Test the job registry cancellation API."""
+
+    def test_cancel_running_job(self):
+        """Test operators can cancel registered jobs only."""
+        registry = JobRegistry()
+        token = registry.register("job-1")
+
+        assert registry.active_jobs() == ["job-1"]
+        assert registry.cancel("job-1", "operator request")
+        assert token.cancelled and token.reason == "operator request"
+
+        registry.unregister("job-1")
+        assert not registry.cancel("job-1")
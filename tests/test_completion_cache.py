@@ -0,0 +1,135 @@
+"""Test the persistent LLM completion cache."""
+
+import pytest
+
+from meeting_minutes.config.app_config import API_CONFIG
+from meeting_minutes.utils import llm_config
+from meeting_minutes.utils.cancellation import (
+    CancellationToken,
+    reset_current_token,
+    set_current_token,
+)
+from meeting_minutes.utils.completion_cache import (
+    CompletionCache,
+    make_key,
+    should_cache,
+)
+
+MESSAGES = [
+    {"role": "system", "content": "You write minutes."},
+    {"role": "user", "content": "Transcript: revenue grew."},
+]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Return an empty cache in a temporary directory."""
+    return CompletionCache(str(tmp_path / "cache.sqlite3"), ttl_seconds=60)
+
+
+class TestCacheKey:
+    """Test which calls share a cache entry."""
+
+    def test_whitespace_and_ids_are_normalized(self):
+        """Test formatting differences don't change the key."""
+        reformatted = [
+            {"role": "system", "content": "You  write\nminutes. ", "id": "a1"},
+            {"role": "user", "content": "Transcript:   revenue grew."},
+        ]
+
+        assert make_key(MESSAGES, "gpt-4o", {}) == make_key(reformatted, "gpt-4o", {})
+
+    def test_model_and_sampling_params_matter(self):
+        """Test the model and sampling parameters are part of the key."""
+        key = make_key(MESSAGES, "gpt-4o", {"temperature": 0})
+
+        assert key != make_key(MESSAGES, "llama-3", {"temperature": 0})
+        assert key != make_key(MESSAGES, "gpt-4o", {"temperature": 0, "seed": 1})
+        assert key == make_key(MESSAGES, "gpt-4o", {"temperature": 0, "timeout": 9})
+
+    def test_sampled_calls_bypass_cache(self):
+        """Test temperature > 0 is only cached when explicitly allowed."""
+        assert should_cache(0.0, "deterministic")
+        assert not should_cache(0.7, "deterministic")
+        assert should_cache(0.7, "always")
+        assert not should_cache(0.0, "off")
+
+
+class TestCompletionCache:
+    """Test storing, expiring and evicting completions."""
+
+    def test_round_trip_and_job_stats(self, cache):
+        """Test a hit returns the stored value and is counted for the job."""
+        token = CancellationToken("job-1")
+        reset = set_current_token(token)
+        try:
+            assert cache.get("k") is None
+            cache.put("k", "minutes", elapsed=2.5)
+            assert cache.get("k") == "minutes"
+        finally:
+            reset_current_token(reset)
+
+        stats = cache.pop_job_stats("job-1")
+        assert stats == {
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+            "time_saved_seconds": 2.5,
+        }
+        assert cache.job_stats("job-1")["hits"] == 0
+
+    def test_persists_across_instances(self, cache):
+        """Test completions survive a restart of the worker."""
+        cache.put("k", "minutes")
+
+        assert CompletionCache(str(cache.path)).get("k") == "minutes"
+
+    def test_expired_entries_are_regenerated(self, tmp_path):
+        """Test entries older than the TTL are treated as misses."""
+        cache = CompletionCache(str(tmp_path / "c.sqlite3"), ttl_seconds=0.01)
+        cache.put("k", "minutes")
+        cache._db().execute("UPDATE completions SET created_at = created_at - 1")
+
+        assert cache.get("k") is None
+
+    def test_least_recently_used_is_evicted(self, tmp_path):
+        """Test the oldest unused entries are dropped beyond the size limit."""
+        cache = CompletionCache(
+            str(tmp_path / "c.sqlite3"), ttl_seconds=0, max_size_mb=2500 / 2**20
+        )
+        cache.put("a", "x" * 1000)
+        cache.put("b", "x" * 1000)
+        cache._db().execute("UPDATE completions SET accessed_at = accessed_at - 10")
+        cache.get("a")
+        cache.put("c", "x" * 1000)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+
+class TestLLMIntegration:
+    """Test the cache behind get_llm()."""
+
+    def test_repeated_prompt_is_served_from_cache(self, local_llm, cache, monkeypatch):
+        """Test an identical deterministic call doesn't reach the server."""
+        _, handler = local_llm
+        monkeypatch.setitem(API_CONFIG["openai"], "temperature", 0.0)
+        monkeypatch.setattr(llm_config, "completion_cache", cache)
+
+        first = llm_config.get_llm().invoke("Summarize the meeting")
+        second = llm_config.get_llm().invoke("Summarize  the meeting")
+
+        assert first.content == second.content == handler.reply
+        assert len(handler.requests_seen) == 1
+
+    def test_sampled_prompt_is_not_cached(self, local_llm, cache, monkeypatch):
+        """Test calls at temperature > 0 always reach the server."""
+        _, handler = local_llm
+        monkeypatch.setitem(API_CONFIG["openai"], "temperature", 0.7)
+        monkeypatch.setattr(llm_config, "completion_cache", cache)
+
+        for _ in range(2):
+            llm_config.get_llm().invoke("Summarize the meeting")
+
+        assert len(handler.requests_seen) == 2
@@ -0,0 +1,151 @@
+"""Test context-window budgeting of prompts and transcripts."""
+
+import pytest
+
+from meeting_minutes.config.app_config import LLM_CONTEXT_CONFIG
+from meeting_minutes.crews.meeting_minutes_crew.fused_minutes import (
+    generate_fused_minutes,
+)
+from meeting_minutes.utils.cancellation import (
+    CancellationToken,
+    reset_current_token,
+    set_current_token,
+)
+from meeting_minutes.utils.context_budget import (
+    ContextBudget,
+    ContextOverflowError,
+    context_budget,
+    estimate_tokens,
+    split_text,
+)
+
+SENTENCE = "Alice said the northern region grew by twelve percent this quarter."
+
+
+def transcript(sentences: int) -> str:
+    return " ".join(f"{SENTENCE[:-1]} ({i})." for i in range(sentences))
+
+
+@pytest.fixture
+def discovering(monkeypatch):
+    """Let the budget discover the window instead of using the pinned one."""
+    monkeypatch.setitem(LLM_CONTEXT_CONFIG, "window", 0)
+
+
+class TestSplitText:
+    """Test splitting text into the fewest segments that fit."""
+
+    def test_text_that_fits_is_one_segment(self):
+        """Test a short text is returned whole."""
+        assert split_text(SENTENCE, 100) == [SENTENCE]
+
+    def test_fewest_balanced_segments_at_sentence_ends(self):
+        """Test segments fit, end at sentences and are of similar size."""
+        text = transcript(50)
+        per_sentence = estimate_tokens(f"{SENTENCE[:-1]} (10).") + 1
+
+        segments = split_text(text, per_sentence * 20)
+
+        assert len(segments) == 3
+        assert all(estimate_tokens(s) <= per_sentence * 20 for s in segments)
+        assert all(s.endswith(").") for s in segments)
+        assert " ".join(segments) == text
+        sizes = [len(s) for s in segments]
+        assert max(sizes) - min(sizes) < len(SENTENCE) * 2
+
+    def test_overlong_sentence_is_split_on_words(self):
+        """Test text without sentence ends is still split to fit."""
+        text = " ".join(["word"] * 300)
+
+        segments = split_text(text, 100)
+
+        assert all(estimate_tokens(s) <= 100 for s in segments)
+        assert " ".join(segments) == text
+
+
+class TestContextBudget:
+    """Test discovering the context window and fitting requests to it."""
+
+    def test_window_from_model_metadata(self, discovering, fake_llm_server):
+        """Test the context length listed in /v1/models is used."""
+        base_url, handler = fake_llm_server
+        handler.context_window = 16384
+
+        assert ContextBudget().window([base_url]) == 16384
+
+    def test_slot_context_overrides_training_context(
+        self, discovering, fake_llm_server
+    ):
+        """Test llama-server's runtime context wins over the model's maximum."""
+        base_url, handler = fake_llm_server
+        handler.context_window = 131072
+        handler.props_context_window = 4096
+
+        assert ContextBudget().window([base_url]) == 4096
+
+    def test_smallest_window_of_pool_and_fallback(self, discovering, fake_llm_servers):
+        """Test the pool's smallest window is used and unknown ones fall back."""
+        (first_url, first), (second_url, second) = fake_llm_servers
+        first.context_window = 8192
+        second.context_window = 4096
+
+        assert ContextBudget().window([first_url, second_url]) == 4096
+        second.context_window = None
+        fallback = LLM_CONTEXT_CONFIG["fallback_window"]
+        assert ContextBudget().window([second_url]) == fallback
+
+    def test_max_tokens_fitted_to_free_context(self):
+        """Test max_tokens is capped by what the prompt leaves free."""
+        budget = ContextBudget(window=1000)
+        messages = [{"role": "user", "content": transcript(30)}]
+
+        fitted = budget.fit_request({"messages": messages, "max_tokens": 2000})
+
+        prompt = estimate_tokens(messages[0]["content"])
+        assert 0 < fitted["max_tokens"] < 1000 - prompt
+        small = budget.fit_request({"messages": messages, "max_tokens": 50})
+        assert small["max_tokens"] == 50
+
+    def test_overflowing_prompt_is_not_sent(self):
+        """Test a prompt larger than the window fails before any request."""
+        budget = ContextBudget(window=500)
+
+        with pytest.raises(ContextOverflowError):
+            budget.fit_request({"messages": [{"content": transcript(100)}]})
+
+
+class TestTranscriptBudgeting:
+    """Test minutes generation for transcripts of any length."""
+
+    def test_transcript_that_fits_uses_one_call(self, local_llm):
+        """Test a short transcript is sent as-is in a single call."""
+        _, handler = local_llm
+
+        generate_fused_minutes(transcript(5))
+
+        posts = [r for r in handler.requests_seen if r[0] == "POST"]
+        assert len(posts) == 1
+        assert SENTENCE[:-1] in posts[0][2]["messages"][-1]["content"]
+
+    def test_long_transcript_is_condensed_in_segments(self, local_llm, monkeypatch):
+        """Test an oversized transcript is condensed with one call per segment."""
+        _, handler = local_llm
+        handler.reply = "Alice: revenue up 12%."
+        monkeypatch.setitem(LLM_CONTEXT_CONFIG, "window", 4096)
+        reset = set_current_token(CancellationToken("job-long"))
+        try:
+            sections = generate_fused_minutes(transcript(400))
+        finally:
+            reset_current_token(reset)
+
+        posts = [r[2] for r in handler.requests_seen if r[0] == "POST"]
+        final = posts[-1]["messages"][-1]["content"]
+        segments = len(posts) - 1
+        assert segments >= 2
+        assert f"Notes on part {segments} of {segments}" in final
+        assert SENTENCE[:-1] not in final
+        assert all(p["max_tokens"] <= 4096 for p in posts)
+        assert sections["minutes"] == handler.reply
+        stats = context_budget.pop_job_stats("job-long")
+        assert stats["window"] == 4096
+        assert [p["segments"] for p in stats["prompts"]] == [segments, 1]
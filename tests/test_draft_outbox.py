@@ -0,0 +1,133 @@
+"""Test the durable Gmail draft outbox."""
+
+import time
+
+import pytest
+
+from meeting_minutes.config.app_config import GMAIL_CONFIG
+from meeting_minutes.crews.gmailcrew.tools.draft_outbox import (
+    DraftOutbox,
+    idempotency_key,
+)
+
+
+@pytest.fixture
+def outbox(gmail_service, tmp_path, monkeypatch):
+    """An outbox delivering to the Gmail stand-in; yields (outbox, handler)."""
+    service, handler = gmail_service
+    monkeypatch.setitem(GMAIL_CONFIG, "recipients", ["a@x.org", "b@x.org"])
+    monkeypatch.setitem(GMAIL_CONFIG, "outbox_backoff", 0.0)
+    queue = DraftOutbox(str(tmp_path / "outbox"), service_factory=lambda: service)
+    yield queue, handler
+    queue.stop()
+
+
+def creates(handler):
+    return [r for r in handler.requests_seen if r[0] != "GET"]
+
+
+class TestDraftOutbox:
+    """Test queued drafts are delivered once, however often they are retried."""
+
+    def test_enqueue_is_idempotent(self, outbox):
+        """Test queuing a job again adds no drafts."""
+        queue, _ = outbox
+
+        keys = queue.enqueue("job-1", "Minutes")
+
+        assert queue.enqueue("job-1", "Minutes again") == keys
+        assert keys == [
+            idempotency_key("job-1", "a@x.org"),
+            idempotency_key("job-1", "b@x.org"),
+        ]
+        assert queue.queued("job-1") == 2
+        assert len(set(keys + queue.enqueue("job-2", "Minutes"))) == 4
+
+    def test_delivery(self, outbox):
+        """Test queued drafts are created in one batch and their files removed."""
+        queue, handler = outbox
+        queue.enqueue("job-1", "Minutes")
+
+        assert queue.deliver_due() == 2
+
+        assert len(creates(handler)) == 1
+        assert queue.job_status("job-1") == {
+            "queued": 0,
+            "delivered": 2,
+            "failed": 0,
+            "draft_ids": ["draft-1", "draft-2"],
+        }
+        assert [p.suffix for p in queue.directory.iterdir() if p.suffix == ".eml"] == []
+        assert queue.deliver_due() == 0
+
+    def test_gmail_outage_keeps_drafts_queued(self, outbox):
+        """Test drafts wait while Gmail fails and are delivered afterwards."""
+        queue, handler = outbox
+        handler.failures["*"] = [503, 503]
+        queue.enqueue("job-1", "Minutes")
+
+        assert queue.deliver_due() == 0
+        assert queue.queued() == 2
+
+        assert queue.deliver_due() == 2
+        assert len(handler.drafts) == 2
+
+    def test_lost_reply_is_not_duplicated(self, outbox):
+        """Test a draft created despite an error is found, not created again."""
+        queue, handler = outbox
+        handler.lost_replies = 1
+        queue.enqueue("job-1", "Minutes")
+
+        assert queue.deliver_due() == 1
+        assert queue.deliver_due() == 1
+
+        assert len(handler.drafts) == 2
+        assert queue.job_status("job-1")["draft_ids"] == ["draft-1", "draft-2"]
+
+    def test_rejected_draft_fails_without_retry(self, outbox):
+        """Test a draft Gmail rejects is marked failed after one attempt."""
+        queue, handler = outbox
+        handler.failures["*"] = [400]
+        queue.enqueue("job-1", "Minutes")
+
+        queue.deliver_due()
+        queue.deliver_due()
+
+        assert queue.job_status("job-1")["failed"] == 1
+        assert queue.job_status("job-1")["delivered"] == 1
+        assert len(creates(handler)) == 1
+
+    def test_unavailable_service_counts_no_attempt(self, tmp_path, monkeypatch):
+        """Test drafts stay queued while no Gmail service can be built."""
+        monkeypatch.setitem(GMAIL_CONFIG, "recipients", ["a@x.org"])
+
+        def unavailable():
+            raise FileNotFoundError("credentials.json")
+
+        queue = DraftOutbox(str(tmp_path / "outbox"), service_factory=unavailable)
+        queue.enqueue("job-1", "Minutes")
+
+        assert queue.deliver_due() == 0
+        assert queue.queued() == 1
+
+    def test_background_worker(self, outbox):
+        """Test the worker delivers queued drafts without being called."""
+        queue, handler = outbox
+        queue.enqueue("job-1", "Minutes")
+        queue.start()
+
+        started = time.monotonic()
+        assert queue.flush(timeout=5) == 0
+        assert time.monotonic() - started < 5
+        assert len(handler.drafts) == 2
+
+    def test_queue_survives_restart(self, outbox, gmail_service):
+        """Test drafts queued by one outbox are delivered by the next."""
+        queue, handler = outbox
+        queue.enqueue("job-1", "Minutes")
+
+        service, _ = gmail_service
+        reopened = DraftOutbox(str(queue.directory), service_factory=lambda: service)
+
+        assert reopened.deliver_due() == 2
+        assert len(handler.drafts) == 2
@@ -0,0 +1,88 @@
+"""Test balancing LLM requests over several endpoints."""
+
+import threading
+
+import pytest
+
+from meeting_minutes.utils.endpoint_pool import EndpointPool, RoutedCompletions
+from meeting_minutes.utils.model_registry import CircuitBreaker, CircuitOpenError
+
+MESSAGES = [{"role": "user", "content": "Summarize segment"}]
+
+
+def _pool(servers, **kwargs):
+    return EndpointPool([url for url, _ in servers], probe_interval=0, **kwargs)
+
+
+class TestEndpointPool:
+    """Test routing, ejection and readmission of endpoints."""
+
+    def test_concurrent_requests_spread_over_endpoints(self, fake_llm_servers):
+        """Test parallel calls go to the endpoint with fewest in flight."""
+        for _, handler in fake_llm_servers:
+            handler.delay = 0.2
+        completions = RoutedCompletions(_pool(fake_llm_servers), "key")
+
+        threads = [
+            threading.Thread(
+                target=completions.create, kwargs={"model": "m", "messages": MESSAGES}
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert [len(h.requests_seen) for _, h in fake_llm_servers] == [2, 2]
+
+    def test_failed_probe_ejects_endpoint(self, fake_llm_servers):
+        """Test an endpoint failing its health probe receives no requests."""
+        (_, healthy), (broken_url, broken) = fake_llm_servers
+        broken.failing = True
+        pool = _pool(fake_llm_servers)
+        completions = RoutedCompletions(pool, "key")
+
+        pool.probe()
+        for _ in range(3):
+            completions.create(model="m", messages=MESSAGES)
+
+        assert pool.stats()[broken_url]["state"] == CircuitBreaker.OPEN
+        assert [r[0] for r in healthy.requests_seen] == ["GET"] + ["POST"] * 3
+        assert [r[0] for r in broken.requests_seen] == ["GET"]
+
+    def test_recovered_endpoint_is_readmitted(self, fake_llm_servers):
+        """Test a passing probe brings an ejected endpoint back."""
+        (_, _), (broken_url, broken) = fake_llm_servers
+        broken.failing = True
+        pool = _pool(fake_llm_servers)
+        pool.probe()
+
+        broken.failing = False
+        pool.probe()
+
+        assert pool.stats()[broken_url]["state"] == CircuitBreaker.CLOSED
+
+    def test_all_endpoints_ejected(self, fake_llm_servers):
+        """Test calls fail fast when no endpoint is healthy."""
+        for _, handler in fake_llm_servers:
+            handler.failing = True
+        pool = _pool(fake_llm_servers)
+        pool.probe()
+
+        with pytest.raises(CircuitOpenError):
+            RoutedCompletions(pool, "key").create(model="m", messages=MESSAGES)
+
+    def test_stream_holds_endpoint_until_consumed(self, fake_llm_servers):
+        """Test a streamed call counts as outstanding while it is read."""
+        url, _ = fake_llm_servers[0]
+        pool = EndpointPool([url], probe_interval=0)
+        stream = RoutedCompletions(pool, "key").create(
+            model="m", messages=MESSAGES, stream=True
+        )
+
+        next(stream)
+        assert pool.stats()[url]["outstanding"] == 1
+        list(stream)
+        assert pool.stats()[url]["outstanding"] == 0
+        assert pool.stats()[url]["requests"] == 1
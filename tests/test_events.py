@@ -0,0 +1,51 @@
+"""Test progress event streaming."""
+
+import threading
+
+from meeting_minutes.utils.events import EventBus, EventType
+
+
+class TestEventBus:
+    """Test the progress event bus."""
+
+    def test_publish_to_subscriber(self):
+        """Test events reach subscribers of the same job in order."""
+        bus = EventBus()
+        stream = bus.subscribe("job-1")
+
+        bus.publish("job-1", EventType.TRANSCRIPT_CHUNK, {"index": 0, "text": "hi"})
+        bus.publish("job-2", EventType.TRANSCRIPT_CHUNK, {"index": 0, "text": "no"})
+        bus.publish("job-1", EventType.COMPLETED)
+
+        events = list(stream)
+
+        assert [event.type for event in events] == [
+            EventType.TRANSCRIPT_CHUNK,
+            EventType.COMPLETED,
+        ]
+        assert [event.sequence for event in events] == [1, 2]
+        assert events[0].data["text"] == "hi"
+
+    def test_stream_ends_on_error(self):
+        """Test iteration stops at a terminal event published from another thread."""
+        bus = EventBus()
+        stream = bus.subscribe("job-1")
+
+        def producer():
+            bus.publish("job-1", EventType.SUMMARY, {"text": "summary"})
+            bus.publish("job-1", EventType.ERROR, {"error": "boom"})
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        events = list(stream)
+        thread.join()
+
+        assert events[-1].type == EventType.ERROR
+        # Iteration unsubscribes the stream once it ends
+        assert bus.publish("job-1", EventType.MINUTES) is not None
+        assert stream.get(timeout=0) is None
+
+    def test_publish_without_job_is_dropped(self):
+        """Test events without a job id are ignored."""
+        bus = EventBus()
+        assert bus.publish("", EventType.STARTED) is None
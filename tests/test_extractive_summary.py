@@ -0,0 +1,131 @@
+"""Test the extractive TextRank summarizer."""
+
+import numpy as np
+import pytest
+
+from meeting_minutes.config.app_config import ARTIFACT_CONFIG
+from meeting_minutes.tools.custom_tool import TextSummarizerTool
+from meeting_minutes.utils.artifact_store import ArtifactStore
+from meeting_minutes.utils.extractive_summary import (
+    ExtractiveSummarizer,
+    TermMatrix,
+    iter_sentences,
+    split_sentences,
+    textrank,
+)
+
+TEXT = (
+    "Dr. Lee opened the budget review at 9.30 today. "
+    "The budget for the northern region grew 3.5% this quarter! "
+    "Did the budget review cover hiring? "
+    "J. Park said hiring stays frozen, e.g. for contractors.\n\n"
+    "Lunch was pizza. "
+    "The budget review ends with the northern region budget approved."
+)
+
+
+class TestSentences:
+    """Test sentence segmentation, whole and streamed."""
+
+    def test_split(self):
+        """Test abbreviations, initials and decimals don't end sentences."""
+        assert split_sentences(TEXT) == [
+            "Dr. Lee opened the budget review at 9.30 today.",
+            "The budget for the northern region grew 3.5% this quarter!",
+            "Did the budget review cover hiring?",
+            "J. Park said hiring stays frozen, e.g. for contractors.",
+            "Lunch was pizza.",
+            "The budget review ends with the northern region budget approved.",
+        ]
+
+    def test_blank_line_ends_a_sentence(self):
+        """Test a paragraph break ends a sentence without punctuation."""
+        assert split_sentences("Agenda\n\nFirst item\nstill first.") == [
+            "Agenda",
+            "First item still first.",
+        ]
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 64])
+    def test_chunks_split_anywhere(self, size):
+        """Test streamed chunks give the same sentences as the whole text."""
+        chunks = [TEXT[i : i + size] for i in range(0, len(TEXT), size)]
+
+        assert list(iter_sentences(chunks)) == split_sentences(TEXT)
+
+
+class TestTextRank:
+    """Test ranking sentences by centrality."""
+
+    def test_matches_dense_pagerank(self):
+        """Test the implicit similarity graph gives the dense graph's scores."""
+        sentences = split_sentences(TEXT) * 3 + ["Nothing shared here."]
+        matrix = TermMatrix()
+        for sentence in sentences:
+            matrix.add(sentence)
+        rows, cols, weights = matrix.tfidf()
+        count = len(sentences)
+
+        vectors = np.zeros((count, len(matrix.vocabulary)))
+        vectors[rows, cols] = weights
+        similarity = vectors @ vectors.T
+        np.fill_diagonal(similarity, 0.0)
+        degree = similarity.sum(axis=1, keepdims=True)
+        transition = np.where(
+            degree > 0, similarity / np.where(degree > 0, degree, 1), 1 / count
+        )
+        expected = np.full(count, 1 / count)
+        for _ in range(300):
+            expected = 0.15 / count + 0.85 * transition.T @ expected
+
+        scores = textrank(rows, cols, weights, count, tolerance=1e-12)
+
+        np.testing.assert_allclose(scores, expected, atol=1e-10)
+        assert scores.sum() == pytest.approx(1.0)
+
+    def test_summary_keeps_central_sentences_in_order(self):
+        """Test the off-topic sentence is dropped and the order kept."""
+        summary = ExtractiveSummarizer().summarize(TEXT, max_sentences=3)
+
+        assert len(summary) == 3
+        assert "Lunch was pizza." not in summary
+        sentences = split_sentences(TEXT)
+        assert summary == sorted(summary, key=sentences.index)
+
+    def test_focus_keywords(self):
+        """Test sentences with a focus keyword are preferred."""
+        summary = ExtractiveSummarizer().summarize(
+            TEXT, max_sentences=1, focus_keywords=["pizza"]
+        )
+
+        assert summary == ["Lunch was pizza."]
+
+    def test_short_text_is_kept(self):
+        """Test a text with fewer sentences than asked for is returned whole."""
+        assert ExtractiveSummarizer().summarize("One. Two.", max_sentences=5) == [
+            "One.",
+            "Two.",
+        ]
+        assert ExtractiveSummarizer().summarize("", max_sentences=5) == []
+
+
+class TestTextSummarizerTool:
+    """Test the agent tool over the summarizer."""
+
+    def test_text(self):
+        """Test an inline text is summarized to whole sentences."""
+        summary = TextSummarizerTool()._run(text=TEXT, max_sentences=2)
+
+        assert len(split_sentences(summary)) == 2
+        assert "Lunch" not in summary
+
+    def test_text_ref(self, tmp_path, monkeypatch):
+        """Test a text artifact is summarized while read in chunks."""
+        monkeypatch.setitem(ARTIFACT_CONFIG, "root", str(tmp_path))
+        monkeypatch.setattr("meeting_minutes.tools.custom_tool.SUMMARY_READ_CHARS", 16)
+        ref = ArtifactStore("job-1").put_text("transcript.txt", TEXT)
+
+        summary = TextSummarizerTool()._run(
+            text_ref=ref, max_sentences=1, focus_keywords="pizza"
+        )
+
+        assert summary == "Lunch was pizza."
@@ -0,0 +1,118 @@
+"""Test watch-folder ingestion."""
+
+import threading
+import time
+
+import pytest
+
+from meeting_minutes.utils.folder_watcher import WATCHDOG_AVAILABLE, FolderWatcher
+
+
+@pytest.fixture
+def make_watcher(tmp_path):
+    """Build a polling watcher over a temporary inbox."""
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    batches = []
+
+    def factory(**kwargs):
+        options = {
+            "settle_seconds": 0,
+            "debounce_seconds": 0,
+            "max_batch_size": 10,
+            "ledger_path": str(tmp_path / "ledger.jsonl"),
+            "use_watchdog": False,
+        }
+        options.update(kwargs)
+        return FolderWatcher(str(inbox), on_batch=batches.append, **options)
+
+    return inbox, batches, factory
+
+
+class TestFolderWatcher:
+    """Test recording discovery, batching and deduplication."""
+
+    def test_only_supported_formats(self, make_watcher):
+        """Test non-audio files are ignored."""
+        inbox, batches, factory = make_watcher
+        (inbox / "meeting.wav").write_bytes(b"audio")
+        (inbox / "notes.txt").write_text("not audio")
+        watcher = factory()
+
+        watcher.scan()
+        watcher.tick()  # records the file's size
+        watcher.tick()  # size unchanged: settled and flushed
+
+        assert batches == [[inbox / "meeting.wav"]]
+
+    def test_waits_until_file_is_written(self, make_watcher):
+        """Test a file still growing is not submitted."""
+        inbox, batches, factory = make_watcher
+        recording = inbox / "meeting.mp3"
+        recording.write_bytes(b"part one")
+        watcher = factory()
+
+        watcher.scan()
+        watcher.tick()
+        with open(recording, "ab") as handle:
+            handle.write(b" part two")
+        watcher.tick()
+        assert batches == []
+
+        watcher.tick()
+        assert batches == [[recording]]
+
+    def test_debounced_batches(self, make_watcher):
+        """Test ready files are grouped until the debounce window passes."""
+        inbox, batches, factory = make_watcher
+        watcher = factory(debounce_seconds=0.2, max_batch_size=3)
+        for i in range(4):
+            (inbox / f"meeting-{i}.wav").write_bytes(f"audio {i}".encode())
+
+        watcher.scan()
+        watcher.tick()
+        watcher.tick()
+        # The batch size limit flushes three files immediately
+        assert [len(batch) for batch in batches] == [3]
+
+        time.sleep(0.25)
+        watcher.tick()
+        assert [len(batch) for batch in batches] == [3, 1]
+
+    def test_dedupes_processed_files(self, make_watcher):
+        """Test recordings already in the ledger are skipped, even when renamed."""
+        inbox, batches, factory = make_watcher
+        (inbox / "meeting.wav").write_bytes(b"audio")
+        watcher = factory()
+        watcher.scan()
+        watcher.tick()
+        watcher.tick()
+        assert len(batches) == 1
+
+        # A fresh watcher with the same ledger sees a renamed copy
+        (inbox / "meeting.wav").rename(inbox / "meeting-copy.wav")
+        watcher = factory()
+        watcher.scan()
+        watcher.tick()
+        watcher.tick()
+        assert len(batches) == 1
+
+    @pytest.mark.skipif(not WATCHDOG_AVAILABLE, reason="watchdog not installed")
+    def test_watchdog_events(self, make_watcher):
+        """Test files are discovered from file system events."""
+        inbox, batches, factory = make_watcher
+        watcher = factory(poll_interval=0.05, use_watchdog=True)
+        thread = threading.Thread(target=watcher.run)
+        thread.start()
+        try:
+            time.sleep(0.2)
+            (inbox / "meeting.flac").write_bytes(b"audio")
+            for _ in range(40):
+                if batches:
+                    break
+                time.sleep(0.05)
+        finally:
+            watcher.stop()
+            thread.join()
+
+        assert batches == [[inbox / "meeting.flac"]]
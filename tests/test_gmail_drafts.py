@@ -0,0 +1,236 @@
+"""Test creating Gmail drafts in batch requests."""
+
+import base64
+import email
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from meeting_minutes.config.app_config import GMAIL_CONFIG
+from meeting_minutes.crews.gmailcrew.tools.gmail_utility import (
+    DraftError,
+    create_draft,
+    create_drafts,
+    create_message,
+    draft_minutes,
+    write_message,
+)
+
+
+def messages(count):
+    return [
+        create_message("me@example.com", "team@example.com", f"Minutes {i}", "Hi")
+        for i in range(count)
+    ]
+
+
+def batch_posts(handler):
+    return [r for r in handler.requests_seen if r[1].startswith("/batch")]
+
+
+class TestCreateDrafts:
+    """Test bulk draft creation against a local Gmail stand-in."""
+
+    def test_fifty_drafts_in_one_round_trip(self, gmail_service):
+        """Test a batch of 50 meetings is created with a single request."""
+        service, handler = gmail_service
+        bodies = messages(50)
+
+        results = create_drafts(service, "me", bodies)
+
+        assert len(batch_posts(handler)) == 1
+        assert [r["error"] for r in results] == [None] * 50
+        assert [r["draft"]["id"] for r in results] == [
+            f"draft-{i}" for i in range(1, 51)
+        ]
+        assert [d["raw"] for d in handler.drafts] == [b["raw"] for b in bodies]
+
+    def test_drafts_split_into_batches(self, gmail_service):
+        """Test drafts beyond the batch size go into further requests."""
+        service, handler = gmail_service
+
+        results = create_drafts(service, "me", messages(12), batch_size=5)
+
+        assert len(batch_posts(handler)) == 3
+        assert all(r["draft"] is not None for r in results)
+
+    def test_failed_items_are_retried(self, gmail_service):
+        """Test only retryable failures are sent again, in a later batch."""
+        service, handler = gmail_service
+        bodies = messages(5)
+        handler.failures[bodies[1]["raw"]] = [503]
+        handler.failures[bodies[3]["raw"]] = [400]
+
+        results = create_drafts(service, "me", bodies)
+
+        assert len(batch_posts(handler)) == 2
+        assert results[1]["draft"] is not None
+        assert results[1]["attempts"] == 2
+        assert results[3]["draft"] is None
+        assert "400" in results[3]["error"]
+        assert results[3]["attempts"] == 1
+        assert len(handler.drafts) == 4
+
+    def test_retries_are_bounded(self, gmail_service):
+        """Test a draft that keeps failing is given up after max_attempts."""
+        service, handler = gmail_service
+        bodies = messages(2)
+        handler.failures[bodies[0]["raw"]] = [429] * 5
+
+        results = create_drafts(service, "me", bodies, max_attempts=3)
+
+        assert results[0]["draft"] is None
+        assert results[0]["attempts"] == 3
+        assert results[1]["draft"] is not None
+        assert len(batch_posts(handler)) == 3
+
+    def test_lost_batch_is_not_created_twice(self, gmail_service):
+        """Test drafts of a batch whose reply was lost are found, not resent."""
+        service, handler = gmail_service
+        ids = [f"<minutes-{i}@meeting-minutes.local>" for i in range(3)]
+        bodies = [
+            create_message(
+                "me@example.com", "team@example.com", "Minutes", "Hi", None, i
+            )
+            for i in ids
+        ]
+        handler.failures[bodies[2]["raw"]] = [400]
+        handler.lost_batches = 1
+
+        results = create_drafts(service, "me", bodies, message_ids=ids)
+
+        assert [r["draft"]["id"] for r in results] == ["draft-1", "draft-2", "draft-3"]
+        assert len(handler.drafts) == 3
+        # Only the draft Gmail had not created was sent again
+        assert len(batch_posts(handler)) == 2
+        assert [r[0] for r in handler.requests_seen].count("GET") == 3
+
+    def test_lost_batch_without_message_ids_is_not_retried(self, gmail_service):
+        """Test drafts that cannot be looked up are failed rather than resent."""
+        service, handler = gmail_service
+        handler.lost_batches = 1
+
+        results = create_drafts(service, "me", messages(2))
+
+        assert len(batch_posts(handler)) == 1
+        assert len(handler.drafts) == 2
+        assert all(r["draft"] is None and not r["retryable"] for r in results)
+        assert "may have been created" in results[0]["error"]
+
+    def test_single_draft_errors_are_raised(self, gmail_service):
+        """Test create_draft reports a rejected draft instead of returning None."""
+        service, handler = gmail_service
+        body = messages(1)[0]
+        handler.failures[body["raw"]] = [400]
+
+        with pytest.raises(HttpError):
+            create_draft(service, "me", body)
+        assert create_draft(service, "me", body)["id"] == "draft-1"
+
+
+def headers(draft):
+    return email.message_from_bytes(base64.urlsafe_b64decode(draft["raw"]))
+
+
+class TestDraftMinutes:
+    """Test drafting the minutes directly, without the Gmail agent."""
+
+    def test_one_draft_per_recipient(self, gmail_service, monkeypatch):
+        """Test sender, recipients and subject come from the configuration."""
+        service, handler = gmail_service
+        monkeypatch.setitem(GMAIL_CONFIG, "sender", "bot@example.com")
+        monkeypatch.setitem(GMAIL_CONFIG, "recipients", ["a@example.com", "b@x.org"])
+        monkeypatch.setitem(GMAIL_CONFIG, "subject", "Weekly sync")
+
+        drafts = draft_minutes("# Minutes\n\n- Ship it", service)
+
+        assert [d["id"] for d in drafts] == ["draft-1", "draft-2"]
+        assert len(handler.requests_seen) == 1
+        sent = [headers(d) for d in handler.drafts]
+        assert [m["To"] for m in sent] == ["a@example.com", "b@x.org"]
+        assert {m["Subject"] for m in sent} == {"Weekly sync"}
+        assert {m["From"] for m in sent} == {"bot@example.com"}
+
+    def test_failed_draft_raises(self, gmail_service, monkeypatch):
+        """Test a draft that could not be created fails the call."""
+        service, handler = gmail_service
+        monkeypatch.setitem(GMAIL_CONFIG, "recipients", [])
+        handler.failures["*"] = [400]
+
+        with pytest.raises(DraftError, match="400"):
+            draft_minutes("Minutes", service)
+
+
+def uploads(handler):
+    return [r for r in handler.requests_seen if r[1].startswith("/upload")]
+
+
+class TestMimeMessages:
+    """Test the HTML alternative, attachments and media uploads."""
+
+    def test_html_alternative(self):
+        """Test the minutes are sent as plain text with an HTML alternative."""
+        message = headers(create_message("me@x.org", "a@x.org", "S", "# Title"))
+
+        assert message.get_content_type() == "multipart/alternative"
+        plain, html = message.get_payload()
+        assert plain.get_payload(decode=True).decode().strip() == "# Title"
+        assert "<h1>Title</h1>" in html.get_payload(decode=True).decode()
+
+    def test_attachments_round_trip(self, tmp_path):
+        """Test streamed attachments decode to the original bytes."""
+        audio = tmp_path / "excerpt.mp3"
+        audio.write_bytes(bytes(range(256)) * 1000)
+        notes = tmp_path / "summary.txt"
+        notes.write_text("Revenue grew.")
+
+        with open(tmp_path / "message.eml", "w+b") as handle:
+            written = write_message(
+                handle, "me@x.org", "a@x.org", "S", "Minutes", [audio, notes]
+            )
+            handle.seek(0)
+            data = handle.read()
+
+        assert written == len(data)
+        message = email.message_from_bytes(data)
+        assert message.get_content_type() == "multipart/mixed"
+        body, *attached = message.get_payload()
+        assert body.get_content_type() == "multipart/alternative"
+        assert [a.get_filename() for a in attached] == ["excerpt.mp3", "summary.txt"]
+        assert attached[0].get_content_type() == "audio/mpeg"
+        assert attached[0].get_payload(decode=True) == audio.read_bytes()
+        assert attached[1].get_payload(decode=True) == b"Revenue grew."
+
+    def test_attachments_are_uploaded(self, gmail_service, monkeypatch, tmp_path):
+        """Test drafts with attachments go through the media upload path."""
+        service, handler = gmail_service
+        monkeypatch.setitem(GMAIL_CONFIG, "recipients", ["a@x.org", "b@x.org"])
+        transcript = tmp_path / "transcript.txt"
+        transcript.write_text("Speaker one: hello")
+
+        drafts = draft_minutes("Minutes", service, attachments=[transcript])
+
+        assert len(drafts) == 2
+        assert batch_posts(handler) == []
+        assert len(uploads(handler)) == 2
+        sent = [headers(d) for d in handler.drafts]
+        assert [m["To"] for m in sent] == ["a@x.org", "b@x.org"]
+        attached = sent[0].get_payload()[1]
+        assert attached.get_payload(decode=True) == b"Speaker one: hello"
+
+    def test_large_message_uses_resumable_upload(
+        self, gmail_service, monkeypatch, tmp_path
+    ):
+        """Test a message larger than a chunk is uploaded a chunk at a time."""
+        service, handler = gmail_service
+        monkeypatch.setitem(GMAIL_CONFIG, "recipients", ["a@x.org"])
+        monkeypatch.setitem(GMAIL_CONFIG, "upload_chunk_mb", 0.25)
+        audio = tmp_path / "excerpt.mp3"
+        audio.write_bytes(bytes(range(256)) * 4096)
+
+        draft_minutes("Minutes", service, attachments=[audio])
+
+        puts = [r for r in handler.requests_seen if r[0] == "PUT"]
+        assert len(puts) == 6
+        attached = headers(handler.drafts[0]).get_payload()[1]
+        assert attached.get_payload(decode=True) == audio.read_bytes()
@@ -0,0 +1,134 @@
+"""Test the cached Gmail service and its token refresh."""
+
+import datetime
+import json
+import threading
+import time
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from meeting_minutes.config.app_config import GOOGLE_OAUTH
+from meeting_minutes.crews.gmailcrew.tools.gmail_utility import GmailService
+
+
+def utcnow():
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+@pytest.fixture
+def token_file(tmp_path, monkeypatch):
+    """Write a token.json expiring in the given seconds; returns its path."""
+    path = tmp_path / "token.json"
+    monkeypatch.setitem(GOOGLE_OAUTH, "token_path", str(path))
+    monkeypatch.setitem(GOOGLE_OAUTH, "credentials_path", str(tmp_path / "none.json"))
+    monkeypatch.setitem(GOOGLE_OAUTH, "refresh_margin", 300.0)
+
+    def write(expires_in):
+        creds = Credentials(
+            token="token-0",
+            refresh_token="refresh",
+            token_uri="https://oauth2.googleapis.com/token",
+            client_id="client",
+            client_secret="secret",
+            scopes=GOOGLE_OAUTH["scopes"],
+            expiry=utcnow() + datetime.timedelta(seconds=expires_in),
+        )
+        path.write_text(creds.to_json())
+        return path
+
+    return write
+
+
+@pytest.fixture
+def refreshes(monkeypatch):
+    """Answer token refreshes locally; returns the list of refreshed tokens."""
+    tokens = []
+
+    def refresh(self, request):
+        tokens.append(f"token-{len(tokens) + 1}")
+        self.token = tokens[-1]
+        self.expiry = utcnow() + datetime.timedelta(hours=1)
+
+    monkeypatch.setattr(Credentials, "refresh", refresh)
+    return tokens
+
+
+@pytest.fixture
+def service():
+    """A fresh GmailService, stopped after the test."""
+    gmail = GmailService()
+    yield gmail
+    gmail.reset()
+
+
+class TestGmailService:
+    """Test one Gmail service is built and kept authorized."""
+
+    def test_service_is_built_once(self, token_file, refreshes, service):
+        """Test repeated calls share one service without refreshing."""
+        token_file(3600)
+
+        first = service.get()
+
+        assert all(service.get() is first for _ in range(5))
+        assert service.builds == 1
+        assert refreshes == []
+        assert hasattr(first.users().drafts(), "create")
+
+    def test_expiring_token_is_refreshed_and_saved(
+        self, token_file, refreshes, service
+    ):
+        """Test a token about to expire is refreshed before first use."""
+        path = token_file(60)
+
+        service.get()
+
+        assert refreshes == ["token-1"]
+        assert json.loads(path.read_text())["token"] == "token-1"
+
+    def test_background_refresh(self, token_file, refreshes, service, monkeypatch):
+        """Test the token is refreshed ahead of expiry without any call."""
+        # The token enters the refresh margin about a second after first use
+        monkeypatch.setitem(GOOGLE_OAUTH, "refresh_margin", 3598.0)
+        token_file(3600)
+        service.get()
+        assert refreshes == []
+
+        deadline = time.monotonic() + 5
+        while not refreshes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert refreshes == ["token-1"]
+        assert service.builds == 1
+
+    def test_token_writes_are_atomic(self, token_file, refreshes, service):
+        """Test concurrent token saves never leave a partial file."""
+        path = token_file(3600)
+        service.get()
+        errors = []
+
+        def save():
+            for _ in range(50):
+                service._save(service._creds)
+
+        def read():
+            for _ in range(200):
+                try:
+                    json.loads(path.read_text())
+                except ValueError as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=save) for _ in range(4)]
+        threads += [threading.Thread(target=read) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert [p.name for p in path.parent.iterdir()] == ["token.json"]
+
+    def test_missing_credentials(self, token_file, service):
+        """Test a clear error without token.json or credentials.json."""
+        with pytest.raises(FileNotFoundError, match="credentials.json"):
+            service.get()
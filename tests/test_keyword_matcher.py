@@ -0,0 +1,87 @@
+"""Test multi-keyword matching."""
+
+import pytest
+
+from meeting_minutes.utils.extractive_summary import ExtractiveSummarizer
+from meeting_minutes.utils.keyword_matcher import KeywordMatcher, compile_keywords
+
+
+def found(matcher, text):
+    return [
+        (matcher.keywords[k], text[start:end]) for k, start, end in matcher.find(text)
+    ]
+
+
+class TestKeywordMatcher:
+    """Test keywords and phrases are found at word boundaries in one pass."""
+
+    def test_word_boundaries(self):
+        """Test a keyword inside a longer word is not a match."""
+        matcher = KeywordMatcher(["art", "Q3"])
+
+        assert matcher.count("The party started in q3.") == 1
+        assert found(matcher, "Art and the artist, Q3/Q4") == [
+            ("art", "Art"),
+            ("Q3", "Q3"),
+        ]
+
+    def test_overlapping_phrases(self):
+        """Test phrases sharing words are all found, however they are spaced."""
+        matcher = KeywordMatcher(["new york", "york city hall", "city", "hall"])
+
+        assert found(matcher, "New  York\nCity Hall opens") == [
+            ("new york", "New  York"),
+            ("city", "City"),
+            ("york city hall", "York\nCity Hall"),
+            ("hall", "Hall"),
+        ]
+        assert matcher.count("new jersey and york") == 0
+
+    def test_symbols_and_case(self):
+        """Test keywords with punctuation, and case-sensitive tickers."""
+        matcher = KeywordMatcher(["C++", "GPT-4", "gpt-4"])
+        tickers = KeywordMatcher(["IT", "AAPL"], case_sensitive=True)
+
+        assert len(matcher) == 2
+        assert found(matcher, "We use c++ and GPT-4, not C or GPT-3.") == [
+            ("C++", "c++"),
+            ("GPT-4", "GPT-4"),
+        ]
+        assert tickers.count("it said IT and AAPL beat, aapl fell") == 2
+
+    def test_hits_per_text(self):
+        """Test per-sentence hit counts."""
+        matcher = KeywordMatcher(["budget", "head count"])
+
+        hits = matcher.hits(["Budget up.", "No change.", "Budget and head count."])
+
+        assert hits.tolist() == [1, 0, 2]
+
+    def test_no_keywords(self):
+        """Test an empty matcher finds nothing."""
+        matcher = KeywordMatcher(["", "  ", "\t"])
+
+        assert len(matcher) == 0
+        assert matcher.count("anything") == 0
+        assert list(matcher.find("anything")) == []
+
+    def test_compiled_once(self):
+        """Test the same keyword list reuses its compiled matcher."""
+        assert compile_keywords(["a b", "c"]) is compile_keywords(("a b", "c"))
+        assert compile_keywords(["c"]) is not compile_keywords(["c"], True)
+
+    @pytest.mark.parametrize(
+        "keywords", [["head count"], KeywordMatcher(["head count"])]
+    )
+    def test_summarizer_focus_phrase(self, keywords):
+        """Test the summarizer boosts sentences with the whole phrase only."""
+        text = (
+            "The budget review covered the budget. "
+            "Head office asked about the budget review. "
+            "We count on the budget review. "
+            "Head count stays flat."
+        )
+
+        summary = ExtractiveSummarizer().summarize(text, 1, focus_keywords=keywords)
+
+        assert summary == ["Head count stays flat."]
@@ -0,0 +1,113 @@
+"""Test the record/replay LLM cassette server."""
+
+import time
+
+import pytest
+
+from meeting_minutes.config.app_config import PROCESSING_CONFIG
+from meeting_minutes.utils import llm_config
+from meeting_minutes.utils.endpoint_pool import EndpointPool
+from meeting_minutes.utils.llm_cassette import Cassette, CassetteServer
+
+
+@pytest.fixture
+def use_server(monkeypatch):
+    """Point get_llm() at a cassette server; uncached and unstreamed."""
+    monkeypatch.setitem(PROCESSING_CONFIG["minutes"], "cache_policy", "off")
+    monkeypatch.setitem(PROCESSING_CONFIG["minutes"], "streaming", False)
+
+    def use(server):
+        monkeypatch.setattr(
+            llm_config, "endpoint_pool", EndpointPool([server.base_url])
+        )
+
+    return use
+
+
+def ask(prompt):
+    return llm_config.get_llm().invoke(prompt).content
+
+
+@pytest.fixture
+def recorded(fake_llm_server, use_server, tmp_path):
+    """Record two prompts from the fake server; returns (cassette path, handler)."""
+    base_url, handler = fake_llm_server
+    handler.delay = 0.2
+    path = tmp_path / "cassette.json"
+    with CassetteServer(Cassette(str(path)), "record", upstream=base_url) as server:
+        use_server(server)
+        handler.reply = "First answer"
+        ask("Summarize the meeting")
+        handler.reply = "Second answer"
+        ask("List the action items")
+    handler.requests_seen.clear()
+    return path, handler
+
+
+class TestCassetteServer:
+    """Test recording completions and replaying them without inference."""
+
+    def test_replay_without_upstream(self, recorded, use_server):
+        """Test recorded completions are served without calling the server."""
+        path, handler = recorded
+
+        with CassetteServer(Cassette(str(path))) as server:
+            use_server(server)
+            assert ask("List the action items") == "Second answer"
+            assert ask("Summarize the meeting") == "First answer"
+            stats = server.stats()
+
+        assert not [r for r in handler.requests_seen if r[0] == "POST"]
+        assert stats["round_trips"] == 2
+        assert stats["prompt_tokens"] == 10
+        assert stats["completion_tokens"] == 4
+        assert stats["inference_seconds"] >= 0.4
+        assert stats["simulated_seconds"] == 0
+
+    def test_simulated_latency(self, recorded, use_server):
+        """Test replies can be delayed by the recorded latency."""
+        path, _ = recorded
+
+        with CassetteServer(Cassette(str(path)), latency_scale=1.0) as server:
+            use_server(server)
+            started = time.monotonic()
+            ask("Summarize the meeting")
+            elapsed = time.monotonic() - started
+
+        assert elapsed >= 0.2
+        assert server.stats()["simulated_seconds"] >= 0.2
+
+    def test_streamed_replay(self, recorded, use_server, monkeypatch):
+        """Test a completion recorded whole is replayed as a stream."""
+        path, _ = recorded
+        monkeypatch.setitem(PROCESSING_CONFIG["minutes"], "streaming", True)
+
+        with CassetteServer(Cassette(str(path))) as server:
+            use_server(server)
+            assert ask("Summarize the meeting") == "First answer"
+
+    def test_repeated_requests_replay_in_order(
+        self, fake_llm_server, use_server, tmp_path
+    ):
+        """Test identical requests get their recordings in recorded order."""
+        base_url, handler = fake_llm_server
+        path = tmp_path / "cassette.json"
+        with CassetteServer(Cassette(str(path)), "record", upstream=base_url) as rec:
+            use_server(rec)
+            for reply in ("one", "two"):
+                handler.reply = reply
+                ask("Next step?")
+
+        with CassetteServer(Cassette(str(path))) as server:
+            use_server(server)
+            assert [ask("Next step?") for _ in range(3)] == ["one", "two", "two"]
+
+    def test_unrecorded_request_fails(self, recorded, use_server):
+        """Test a request missing from the cassette is an error, not a guess."""
+        path, _ = recorded
+
+        with CassetteServer(Cassette(str(path))) as server:
+            use_server(server)
+            with pytest.raises(Exception):
+                ask("Something never recorded")
+            assert server.stats()["misses"] >= 1
@@ -0,0 +1,57 @@
+"""Test the shared pooled LLM clients."""
+
+import asyncio
+
+from meeting_minutes.utils.llm_clients import LLMClientRegistry
+
+
+def _ask(client):
+    return client.chat.completions.create(
+        model="local-model", messages=[{"role": "user", "content": "hi"}]
+    )
+
+
+class TestLLMClientRegistry:
+    """Test sharing and reusing LLM connections."""
+
+    def test_same_endpoint_shares_clients(self, fake_llm_server):
+        """Test every caller for an endpoint gets the same pooled clients."""
+        base_url, _ = fake_llm_server
+        registry = LLMClientRegistry()
+
+        assert registry.get(base_url, "key") is registry.get(base_url + "/", "key")
+        assert registry.get(base_url, "key") is not registry.get(base_url, "other")
+        registry.close()
+
+    def test_connections_are_reused(self, fake_llm_server):
+        """Test sequential requests reuse one keep-alive connection."""
+        base_url, handler = fake_llm_server
+        registry = LLMClientRegistry(pool_size=2)
+        clients = registry.get(base_url, "key")
+
+        for _ in range(3):
+            assert _ask(clients.client).choices[0].message.content == handler.reply
+
+        metrics = registry.metrics()[base_url]
+        assert metrics["requests"] == 3
+        assert metrics["connections_opened"] == 1
+        assert metrics["reused_connections"] == 2
+        registry.close()
+
+    def test_async_client(self, fake_llm_server):
+        """Test the async client shares its own pool and is counted too."""
+        base_url, handler = fake_llm_server
+        registry = LLMClientRegistry()
+        clients = registry.get(base_url, "key")
+
+        async def ask_twice():
+            for _ in range(2):
+                await clients.async_client.chat.completions.create(
+                    model="local-model", messages=[{"role": "user", "content": "hi"}]
+                )
+
+        asyncio.run(ask_twice())
+
+        assert registry.metrics()[base_url]["requests"] == 2
+        assert registry.metrics()[base_url]["connections_opened"] == 1
+        registry.close()
@@ -0,0 +1,149 @@
+"""Test structured tracing of LLM calls."""
+
+import json
+
+import pytest
+
+from meeting_minutes.config.app_config import (
+    API_CONFIG,
+    LLM_TRACE_CONFIG,
+    PROCESSING_CONFIG,
+)
+from meeting_minutes.utils import llm_config
+from meeting_minutes.utils.completion_cache import CompletionCache
+from meeting_minutes.utils.llm_trace import LLMTracer, summarize_traces
+
+
+@pytest.fixture
+def trace_file(tmp_path, monkeypatch):
+    """Trace every call to a temporary file; returns a reader for it."""
+    path = tmp_path / "trace.jsonl"
+    monkeypatch.setitem(LLM_TRACE_CONFIG, "path", str(path))
+    monkeypatch.setitem(LLM_TRACE_CONFIG, "level", "INFO")
+    monkeypatch.setitem(LLM_TRACE_CONFIG, "sample_rate", 1.0)
+
+    def read():
+        if not path.exists():
+            return []
+        return [json.loads(line) for line in path.read_text().splitlines()]
+
+    read.path = path
+    return read
+
+
+class TestLLMCallTracing:
+    """Test the records written for get_llm() calls."""
+
+    def test_call_is_traced(self, local_llm, trace_file, monkeypatch):
+        """Test a call records model, endpoint, tokens and latency."""
+        base_url, handler = local_llm
+        monkeypatch.setitem(PROCESSING_CONFIG["minutes"], "streaming", False)
+        monkeypatch.setitem(PROCESSING_CONFIG["minutes"], "cache_policy", "off")
+
+        llm_config.get_llm().invoke("Summarize the meeting")
+
+        (record,) = trace_file()
+        assert record["source"] == "langchain"
+        assert record["endpoint"] == base_url
+        assert record["status"] == "ok"
+        assert record["prompt_tokens"] == 5
+        assert record["completion_tokens"] == 2
+        assert record["retries"] == 0
+        assert record["latency_ms"] > 0
+        assert "debug" not in record
+        assert "Summarize" not in trace_file.path.read_text()
+
+    def test_streamed_call_counts_tokens(self, local_llm, trace_file, monkeypatch):
+        """Test a streamed call records its tokens and time to first token."""
+        _, handler = local_llm
+        handler.reply = "one two three"
+        monkeypatch.setitem(PROCESSING_CONFIG["minutes"], "streaming", True)
+        monkeypatch.setitem(PROCESSING_CONFIG["minutes"], "cache_policy", "off")
+
+        llm_config.get_llm().invoke("Summarize the meeting")
+
+        (record,) = trace_file()
+        assert record["stream"] is True
+        assert record["completion_tokens"] == 3
+        assert 0 < record["ttft_ms"] <= record["latency_ms"]
+
+    def test_cache_hits_and_misses(self, local_llm, trace_file, tmp_path, monkeypatch):
+        """Test the cache status of each call is recorded."""
+        monkeypatch.setitem(API_CONFIG["openai"], "temperature", 0.0)
+        monkeypatch.setattr(
+            llm_config, "completion_cache", CompletionCache(str(tmp_path / "c.db"))
+        )
+
+        for _ in range(2):
+            llm_config.get_llm().invoke("Summarize the meeting")
+
+        assert [r["cache"] for r in trace_file()] == ["miss", "hit"]
+
+    def test_failed_call_with_retries(self, local_llm, trace_file, monkeypatch):
+        """Test failures are traced with their retries even when unsampled."""
+        _, handler = local_llm
+        handler.failing = True
+        monkeypatch.setitem(LLM_TRACE_CONFIG, "sample_rate", 0.0)
+        monkeypatch.setitem(PROCESSING_CONFIG["minutes"], "cache_policy", "off")
+
+        with pytest.raises(Exception):
+            llm_config.get_llm().invoke("Summarize the meeting")
+
+        records = trace_file()
+        assert records and all(r["status"] == "error" for r in records)
+        assert records[-1]["retries"] >= 1
+        assert "InternalServerError" in records[-1]["error"]
+
+
+class TestLLMTracer:
+    """Test level gating, sampling and summaries."""
+
+    def test_levels(self, tmp_path):
+        """Test which records each level writes."""
+        path = tmp_path / "trace.jsonl"
+
+        def trace(level, fail=False):
+            tracer = LLMTracer(str(path), level=level)
+            try:
+                with tracer.trace("test", model="m") as call:
+                    call.record_request({"messages": [], "temperature": 0.2})
+                    if fail:
+                        raise ValueError("boom")
+            except ValueError:
+                pass
+            tracer.close()
+
+        trace("OFF", fail=True)
+        trace("ERROR")
+        assert not path.exists()
+
+        trace("ERROR", fail=True)
+        trace("INFO")
+        trace("DEBUG")
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [r["status"] for r in records] == ["error", "ok", "ok"]
+        assert "debug" not in records[1]
+        assert records[2]["debug"]["temperature"] == 0.2
+
+    def test_sampling(self, tmp_path):
+        """Test successful calls are written at the sample rate."""
+        path = tmp_path / "trace.jsonl"
+        tracer = LLMTracer(str(path), level="INFO", sample_rate=0.25)
+        for _ in range(400):
+            tracer.record("test", model="m")
+        tracer.close()
+
+        assert 50 < len(path.read_text().splitlines()) < 150
+
+    def test_summary(self, tmp_path):
+        """Test traces are summarized per model and endpoint."""
+        path = tmp_path / "trace.jsonl"
+        tracer = LLMTracer(str(path), level="INFO")
+        for cache in ("hit", "miss", "miss"):
+            tracer.record("test", model="m", endpoint="e", cache=cache)
+        tracer.close()
+
+        summary = summarize_traces(str(path))["m @ e"]
+        assert summary["calls"] == 3
+        assert summary["cache_hits"] == 1
+        assert summary["errors"] == 0
@@ -0,0 +1,124 @@
+"""Test model discovery and the LLM circuit breaker."""
+
+import time
+
+import pytest
+import requests
+
+from meeting_minutes.utils.model_registry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ModelResolver,
+    is_model_error,
+    is_server_failure,
+)
+
+
+@pytest.fixture
+def models_server(fake_llm_server):
+    """Serve /v1/models with a model the tests don't ask for by name."""
+    base_url, handler = fake_llm_server
+    handler.models = ["llama-3-8b"]
+    return base_url, handler
+
+
+class TestCircuitBreaker:
+    """Test opening and closing the circuit."""
+
+    def test_opens_after_threshold(self):
+        """Test calls are rejected once the failure threshold is reached."""
+        breaker = CircuitBreaker("server", failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_single_trial_after_reset_timeout(self):
+        """Test one trial call is allowed after the reset timeout."""
+        breaker = CircuitBreaker("server", failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success()
+        breaker.before_call()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens(self):
+        """Test a failed trial call opens the circuit again."""
+        breaker = CircuitBreaker("server", failure_threshold=3, reset_timeout=0.05)
+        for _ in range(3):
+            breaker.record_failure()
+        time.sleep(0.06)
+        breaker.before_call()
+        breaker.record_failure()
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+
+class TestModelResolver:
+    """Test resolving model names against /v1/models."""
+
+    def test_falls_back_to_served_model(self, models_server):
+        """Test an unknown model name resolves to a served model."""
+        base_url, _ = models_server
+        resolver = ModelResolver(base_url, ttl=60)
+
+        assert resolver.resolve("gpt-4o") == "llama-3-8b"
+        assert resolver.resolve("openai/gpt-4o") == "openai/llama-3-8b"
+        assert resolver.resolve("llama-3-8b") == "llama-3-8b"
+
+    def test_discovery_is_cached(self, models_server):
+        """Test /models is probed once per TTL, not once per call."""
+        base_url, handler = models_server
+        resolver = ModelResolver(base_url, ttl=60)
+        for _ in range(5):
+            resolver.resolve("gpt-4o")
+
+        assert len(handler.requests_seen) == 1
+
+    def test_invalidate_rediscovers(self, models_server):
+        """Test invalidation picks up models the server now serves."""
+        base_url, handler = models_server
+        resolver = ModelResolver(base_url, ttl=60)
+        resolver.resolve("gpt-4o")
+        handler.models = ["mistral-7b"]
+
+        resolver.invalidate()
+
+        assert resolver.resolve("gpt-4o") == "mistral-7b"
+
+    def test_down_server_fails_fast(self):
+        """Test an unreachable server opens the circuit instead of retrying."""
+        breaker = CircuitBreaker("server", failure_threshold=1, reset_timeout=60)
+        resolver = ModelResolver("http://127.0.0.1:9/v1", breaker=breaker)
+
+        with pytest.raises(requests.RequestException):
+            resolver.resolve("gpt-4o")
+        with pytest.raises(CircuitOpenError):
+            resolver.resolve("gpt-4o")
+
+
+class TestErrorClassification:
+    """Test telling server outages from bad requests."""
+
+    def test_classification(self):
+        """Test connection errors and 5xx trip the breaker, model errors don't."""
+
+        class APIError(Exception):
+            def __init__(self, message, status_code):
+                super().__init__(message)
+                self.status_code = status_code
+
+        assert is_server_failure(requests.ConnectionError("refused"))
+        assert is_server_failure(APIError("overloaded", 503))
+        assert not is_server_failure(APIError("model gpt-4o not found", 404))
+        assert is_model_error(APIError("model gpt-4o not found", 404))
+        assert not is_model_error(APIError("context length exceeded", 400))
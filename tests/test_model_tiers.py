@@ -0,0 +1,124 @@
+"""Test routing LLM calls to fast and large model tiers."""
+
+import pytest
+
+from meeting_minutes.config.app_config import (
+    LLM_CONTEXT_CONFIG,
+    LLM_TIER_CONFIG,
+    PROCESSING_CONFIG,
+)
+from meeting_minutes.crews.meeting_minutes_crew.fused_minutes import (
+    generate_fused_minutes,
+)
+from meeting_minutes.utils import llm_config
+from meeting_minutes.utils.cancellation import (
+    CancellationToken,
+    reset_current_token,
+    set_current_token,
+)
+from meeting_minutes.utils.endpoint_pool import EndpointPool
+from meeting_minutes.utils.model_tiers import ModelTiers, model_tiers
+
+SENTENCE = "Alice said the northern region grew by twelve percent this quarter."
+
+
+@pytest.fixture
+def tiered_servers(fake_llm_servers, monkeypatch):
+    """Serve the fast tier and the default (large) pool from separate servers."""
+    (large_url, large), (fast_url, fast) = fake_llm_servers
+    monkeypatch.setattr(llm_config, "endpoint_pool", EndpointPool([large_url]))
+    monkeypatch.setitem(LLM_TIER_CONFIG, "enabled", True)
+    monkeypatch.setitem(
+        LLM_TIER_CONFIG["tiers"], "fast", {"model": "small-8b", "endpoints": [fast_url]}
+    )
+    monkeypatch.setitem(
+        LLM_TIER_CONFIG["tiers"], "large", {"model": "", "endpoints": []}
+    )
+    monkeypatch.setitem(PROCESSING_CONFIG["minutes"], "cache_policy", "off")
+    return large, fast
+
+
+def posts(handler):
+    return [r[2] for r in handler.requests_seen if r[0] == "POST"]
+
+
+class TestTierRouting:
+    """Test get_llm() sends each tier to its model and servers."""
+
+    def test_tiers_use_their_servers_and_models(self, tiered_servers):
+        """Test fast calls reach the fast server with the fast model."""
+        large, fast = tiered_servers
+
+        llm_config.get_llm("fast").invoke("Who attended?")
+        llm_config.get_llm("large").invoke("Write the minutes")
+
+        assert [p["model"] for p in posts(fast)] == ["small-8b"]
+        assert [p["model"] for p in posts(large)] == ["gpt-4o"]
+
+    def test_disabled_tiers_use_the_default(self, tiered_servers, monkeypatch):
+        """Test every call goes to the default tier when tiers are off."""
+        large, fast = tiered_servers
+        monkeypatch.setitem(LLM_TIER_CONFIG, "enabled", False)
+
+        llm_config.get_llm("fast").invoke("Who attended?")
+
+        assert not posts(fast)
+        assert len(posts(large)) == 1
+
+    def test_unknown_tier_is_rejected(self):
+        """Test a misspelt tier fails instead of silently using the default."""
+        with pytest.raises(ValueError, match="medium"):
+            llm_config.get_llm("medium")
+
+    def test_long_transcript_condensed_on_fast_tier(self, tiered_servers, monkeypatch):
+        """Test segment notes use the fast tier and the minutes the large one."""
+        large, fast = tiered_servers
+        fast.reply = "Alice: revenue up 12%."
+        monkeypatch.setitem(LLM_CONTEXT_CONFIG, "window", 4096)
+        transcript = " ".join(f"{SENTENCE[:-1]} ({i})." for i in range(400))
+
+        reset = set_current_token(CancellationToken("job-tiers"))
+        try:
+            generate_fused_minutes(transcript)
+        finally:
+            reset_current_token(reset)
+
+        assert len(posts(fast)) >= 2
+        assert len(posts(large)) == 1
+        stats = model_tiers.pop_job_stats("job-tiers")
+        assert stats["fast"]["calls"] == len(posts(fast))
+        assert stats["fast"]["model"] == "small-8b"
+        assert stats["large"]["calls"] == 1
+
+
+class TestModelTiers:
+    """Test tier lookup and latency statistics."""
+
+    def test_tier_for_model(self, monkeypatch):
+        """Test a model name, with or without provider, maps to its tier."""
+        monkeypatch.setitem(LLM_TIER_CONFIG, "enabled", True)
+        monkeypatch.setitem(
+            LLM_TIER_CONFIG["tiers"], "fast", {"model": "small-8b", "endpoints": []}
+        )
+        tiers = ModelTiers()
+
+        assert tiers.tier_for_model("openai/small-8b") == "fast"
+        assert tiers.tier_for_model("gpt-4o") == LLM_TIER_CONFIG["default"]
+
+    def test_latency_stats(self):
+        """Test calls are counted and summarized per tier for each job."""
+        tiers = ModelTiers()
+        reset = set_current_token(CancellationToken("job-stats"))
+        try:
+            for seconds in (0.1, 0.2, 0.3):
+                tiers.record("fast", seconds)
+            tiers.record("large", 2.0)
+        finally:
+            reset_current_token(reset)
+
+        stats = tiers.pop_job_stats("job-stats")
+        assert stats["fast"]["calls"] == 3
+        assert stats["fast"]["mean_seconds"] == 0.2
+        assert stats["fast"]["p95_seconds"] == 0.3
+        assert stats["large"]["total_seconds"] == 2.0
+        assert tiers.pop_job_stats("job-stats") == {}
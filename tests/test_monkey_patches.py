@@ -0,0 +1,227 @@
+"""Test the patched LiteLLM completion function."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from meeting_minutes.config.app_config import (
+    LLM_COALESCE_CONFIG,
+    LLM_CONTEXT_CONFIG,
+    LLM_RESILIENCE_CONFIG,
+    LLM_SERVER,
+    PROCESSING_CONFIG,
+)
+from meeting_minutes.utils import monkey_patches
+from meeting_minutes.utils.cancellation import (
+    CancellationToken,
+    reset_current_token,
+    set_current_token,
+)
+from meeting_minutes.utils.endpoint_pool import EndpointPool
+from meeting_minutes.utils.model_registry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    model_resolver,
+)
+from meeting_minutes.utils.model_tiers import model_tiers
+
+HEALTHY = "http://healthy.invalid/v1"
+BROKEN = "http://broken.invalid/v1"
+MESSAGES = [{"role": "user", "content": "Summarize segment"}]
+# Nothing listens here, so connections are refused at once
+UNREACHABLE = "http://127.0.0.1:9/v1"
+
+
+class FakeCompletion:
+    """Stands in for litellm.completion, answering by endpoint."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+        self.models = []
+        # Streams raise a server error after this many chunks
+        self.break_stream_after = None
+        # Seconds to generate each streamed chunk
+        self.chunk_delay = 0.0
+
+    def __call__(self, *args, base_url, stream=False, **kwargs):
+        self.calls.append(base_url)
+        self.models.append(kwargs.get("model"))
+        if base_url in self.failing:
+            raise ConnectionError(f"{base_url} refused the connection")
+        if stream:
+            return self._stream(f"answer from {base_url}".split(" "))
+        message = SimpleNamespace(content=f"answer from {base_url}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+    def _stream(self, words):
+        for index, word in enumerate(words):
+            if index == self.break_stream_after:
+                raise ConnectionError("connection reset mid-stream")
+            time.sleep(self.chunk_delay)
+            delta = SimpleNamespace(content=word)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+@pytest.fixture
+def patch_completion(monkeypatch):
+    """Build patched completions balanced over fake endpoints, without LiteLLM."""
+    monkeypatch.setitem(LLM_RESILIENCE_CONFIG, "failure_threshold", 1)
+    monkeypatch.setitem(LLM_CONTEXT_CONFIG, "window", 8192)
+    monkeypatch.setitem(PROCESSING_CONFIG["minutes"], "streaming", False)
+    monkeypatch.setitem(PROCESSING_CONFIG["minutes"], "cache_policy", "off")
+    monkeypatch.setattr(model_resolver, "breaker", CircuitBreaker("LLM server"))
+
+    def patch(endpoints, failing=(), discover=False):
+        pool = EndpointPool(endpoints, probe_interval=0)
+        monkeypatch.setattr(monkey_patches, "endpoint_pool", pool)
+        if not discover:
+            monkeypatch.setattr(pool.resolver, "resolve", lambda requested=None: "m")
+        fake = FakeCompletion(failing)
+        litellm = SimpleNamespace(ModelResponse=None, stream_chunk_builder=None)
+        return monkey_patches._patched_completion(litellm, fake), fake, pool
+
+    return patch
+
+
+@pytest.fixture
+def pooled(patch_completion):
+    """Balance patched completions over a healthy and a broken endpoint."""
+    return patch_completion([BROKEN, HEALTHY], failing=[BROKEN])
+
+
+class TestPooledCircuit:
+    """Test one failing endpoint of a pool does not stop every call."""
+
+    def test_calls_route_around_failing_endpoint(self, pooled):
+        """Test calls keep succeeding while one of two endpoints fails."""
+        completion, fake, pool = pooled
+
+        with pytest.raises(ConnectionError):
+            completion(model="m", messages=MESSAGES, temperature=0.5)
+        answers = [
+            completion(model="m", messages=MESSAGES, temperature=0.5) for _ in range(5)
+        ]
+
+        assert [a.choices[0].message.content for a in answers] == [
+            f"answer from {HEALTHY}"
+        ] * 5
+        assert fake.calls == [BROKEN] + [HEALTHY] * 5
+        assert pool.stats()[BROKEN]["state"] == CircuitBreaker.OPEN
+        assert model_resolver.breaker.state == CircuitBreaker.CLOSED
+
+    def test_circuit_opens_when_no_endpoint_is_left(self, pooled):
+        """Test the service's circuit opens once every endpoint is ejected."""
+        completion, fake, _ = pooled
+        fake.failing.add(HEALTHY)
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                completion(model="m", messages=MESSAGES, temperature=0.5)
+
+        assert model_resolver.breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            completion(model="m", messages=MESSAGES, temperature=0.5)
+        assert len(fake.calls) == 2
+
+
+class TestPooledDiscovery:
+    """Test models are discovered from the endpoints calls are sent to."""
+
+    @pytest.fixture(autouse=True)
+    def unreachable_server(self, monkeypatch):
+        monkeypatch.setitem(LLM_SERVER, "base_url", UNREACHABLE)
+
+    def test_pool_without_configured_server(self, patch_completion, fake_llm_server):
+        """Test a pool that excludes LLM_SERVER discovers models from itself."""
+        url, handler = fake_llm_server
+        completion, fake, _ = patch_completion([url], discover=True)
+
+        completion(model="openai/gpt-4o", messages=MESSAGES, temperature=0.5)
+
+        assert fake.calls == [url]
+        assert fake.models == ["openai/local-model"]
+        assert [r[1] for r in handler.requests_seen] == ["/v1/models"]
+
+    def test_discovery_skips_failing_endpoint(self, patch_completion, fake_llm_server):
+        """Test a down endpoint fails discovery over without opening the circuit."""
+        url, _ = fake_llm_server
+        completion, fake, pool = patch_completion([UNREACHABLE, url], discover=True)
+
+        completion(model="openai/gpt-4o", messages=MESSAGES, temperature=0.5)
+
+        assert fake.calls == [url]
+        assert pool.stats()[UNREACHABLE]["failures"] == 1
+        assert model_resolver.breaker.state == CircuitBreaker.CLOSED
+
+
+def stream_text(stream):
+    return " ".join(chunk.choices[0].delta.content for chunk in stream)
+
+
+class TestCallerStreams:
+    """Test streams returned to the caller hold their endpoint while read."""
+
+    def test_stream_holds_endpoint_until_consumed(self, patch_completion):
+        """Test a streamed call counts as outstanding until it is read."""
+        completion, _, pool = patch_completion([HEALTHY])
+
+        stream = completion(model="m", messages=MESSAGES, stream=True)
+
+        assert pool.stats()[HEALTHY]["outstanding"] == 1
+        next(stream)
+        assert pool.stats()[HEALTHY]["outstanding"] == 1
+        assert stream_text(stream) == f"from {HEALTHY}"
+        assert pool.stats()[HEALTHY]["outstanding"] == 0
+
+    def test_stream_failure_counts_against_endpoint(self, patch_completion):
+        """Test an error while the stream is read is recorded for its endpoint."""
+        completion, fake, pool = patch_completion([HEALTHY])
+        fake.break_stream_after = 1
+
+        stream = completion(model="m", messages=MESSAGES, stream=True)
+        with pytest.raises(ConnectionError):
+            list(stream)
+
+        assert pool.stats()[HEALTHY]["outstanding"] == 0
+        assert pool.stats()[HEALTHY]["failures"] == 1
+        assert pool.stats()[HEALTHY]["state"] == CircuitBreaker.OPEN
+
+    def test_identical_streams_are_not_shared(self, patch_completion, monkeypatch):
+        """Test concurrent identical streams each get their own response."""
+        monkeypatch.setitem(LLM_COALESCE_CONFIG, "window_ms", 100)
+        completion, fake, _ = patch_completion([HEALTHY])
+        texts = []
+
+        def read():
+            stream = completion(
+                model="m", messages=MESSAGES, temperature=0, stream=True
+            )
+            texts.append(stream_text(stream))
+
+        threads = [threading.Thread(target=read) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert texts == [f"answer from {HEALTHY}"] * 2
+        assert len(fake.calls) == 2
+
+    def test_latency_covers_whole_stream(self, patch_completion):
+        """Test a stream's tier latency is recorded once it is fully read."""
+        completion, fake, _ = patch_completion([HEALTHY])
+        fake.chunk_delay = 0.05
+        reset = set_current_token(CancellationToken("job-stream-latency"))
+        try:
+            stream = completion(model="m", messages=MESSAGES, stream=True)
+            assert model_tiers.pop_job_stats("job-stream-latency") == {}
+            stream_text(stream)
+        finally:
+            reset_current_token(reset)
+
+        (stats,) = model_tiers.pop_job_stats("job-stream-latency").values()
+        assert stats["calls"] == 1
+        assert stats["total_seconds"] >= 0.14
@@ -0,0 +1,127 @@
+"""Test performance profile selection and config validation."""
+
+import pytest
+
+from meeting_minutes.config.app_config import PROCESSING_CONFIG, WATCH_CONFIG
+from meeting_minutes.config.profiles import (
+    ConfigError,
+    activate_profile,
+    resolve_profile,
+)
+from meeting_minutes.crews.meeting_minutes_crew.fused_minutes import parse_sections
+from meeting_minutes.utils.backpressure import memory_governor
+
+
+@pytest.fixture(autouse=True)
+def restore_profile(monkeypatch):
+    """Run each test without profile env vars and restore the defaults after."""
+    monkeypatch.delenv("PERFORMANCE_PROFILE", raising=False)
+    monkeypatch.delenv("PERFORMANCE_PROFILE_FILE", raising=False)
+    yield
+    activate_profile("balanced")
+
+
+class TestProfiles:
+    """Test choosing and applying profiles."""
+
+    def test_default_is_balanced(self):
+        """Test the configured values are kept when no profile is chosen."""
+        assert resolve_profile() == ("balanced", {})
+
+    def test_env_selects_profile(self, monkeypatch):
+        """Test PERFORMANCE_PROFILE selects the profile."""
+        monkeypatch.setenv("PERFORMANCE_PROFILE", "low-memory")
+        assert resolve_profile()[0] == "low-memory"
+
+    def test_activate_applies_settings(self):
+        """Test a profile updates the config dicts and describes itself."""
+        profile = activate_profile("low-latency")
+
+        assert PROCESSING_CONFIG["transcription"]["concurrency"] == 4
+        assert PROCESSING_CONFIG["minutes"]["llm_path"] == "fused"
+        assert WATCH_CONFIG["max_parallel_jobs"] == 4
+        assert profile["name"] == "low-latency"
+        assert profile["settings"]["chunk_length_ms"] == 30000
+
+    def test_profiles_do_not_stack(self):
+        """Test switching profiles starts again from the configured values."""
+        default_length = PROCESSING_CONFIG["audio"]["chunk_length_ms"]
+        activate_profile("low-memory")
+        activate_profile("balanced")
+
+        assert PROCESSING_CONFIG["audio"]["chunk_length_ms"] == default_length
+
+    def test_unknown_profile(self):
+        """Test an unknown profile name is rejected."""
+        with pytest.raises(ConfigError, match="Unknown performance profile"):
+            resolve_profile("turbo")
+
+    def test_yaml_overlay(self, tmp_path):
+        """Test a YAML overlay can select, extend and tune profiles."""
+        overlay = tmp_path / "profiles.yaml"
+        overlay.write_text(
+            "profile: site\n"
+            "profiles:\n"
+            "  site:\n"
+            "    extends: low-memory\n"
+            "    chunk_length_ms: 45000\n"
+        )
+
+        name, settings = resolve_profile(overlay_path=str(overlay))
+
+        assert name == "site"
+        assert settings["chunk_length_ms"] == 45000
+        assert settings["streaming_decode"] is True
+
+    def test_memory_ceiling_enforced(self, tmp_path):
+        """Test a profile's memory ceiling reaches the shared governor."""
+        overlay = tmp_path / "profiles.yaml"
+        overlay.write_text("profiles:\n  capped:\n    memory_ceiling_mb: 512\n")
+
+        activate_profile("capped", str(overlay))
+
+        assert memory_governor.enabled
+        assert memory_governor.ceiling_bytes == 512 * 1024 * 1024
+
+    def test_invalid_settings_rejected(self, tmp_path):
+        """Test every invalid setting is reported before anything is applied."""
+        overlay = tmp_path / "profiles.yaml"
+        overlay.write_text(
+            "profiles:\n"
+            "  broken:\n"
+            "    stt_concurrency: 0\n"
+            "    llm_path: telepathy\n"
+            "    warp_speed: 9\n"
+        )
+
+        with pytest.raises(ConfigError) as excinfo:
+            activate_profile("broken", str(overlay))
+
+        message = str(excinfo.value)
+        assert "stt_concurrency" in message
+        assert "llm_path" in message
+        assert "warp_speed" in message
+        assert PROCESSING_CONFIG["transcription"]["concurrency"] >= 1
+
+
+class TestFusedMinutes:
+    """Test splitting a fused completion into sections."""
+
+    def test_parse_sections(self):
+        """Test each section header starts a new section."""
+        text = (
+            "=== SUMMARY ===\nRevenue grew.\n"
+            "=== ACTION ITEMS ===\n- Send report\n"
+            "=== SENTIMENT ===\nPositive.\n"
+            "=== MINUTES ===\n# Minutes\nAll good."
+        )
+
+        sections = parse_sections(text)
+
+        assert sections["summary"] == "Revenue grew."
+        assert sections["action_items"] == "- Send report"
+        assert sections["minutes"] == "# Minutes\nAll good."
+
+    def test_unformatted_output_becomes_minutes(self):
+        """Test output without headers is used as the minutes."""
+        assert parse_sections("# Minutes only") == {"minutes": "# Minutes only"}
@@ -0,0 +1,116 @@
+"""Test the prefix-cache-friendly prompt layout."""
+
+from meeting_minutes.crews.meeting_minutes_crew.fused_minutes import build_messages
+from meeting_minutes.utils.prompt_layout import (
+    arrange_messages,
+    prepare_request,
+    tag_variable,
+)
+
+
+def _task_prompt(transcript):
+    """Mimic a CrewAI task prompt with the transcript inside the description."""
+    return [
+        {"role": "system", "content": "You are a meeting minutes summarizer."},
+        {
+            "role": "user",
+            "content": (
+                "Summarize the meeting.\n"
+                f"{tag_variable(transcript)}\n"
+                "Expected output: a summary and a list of action items."
+            ),
+        },
+    ]
+
+
+def _common_prefix(a, b):
+    length = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        length += 1
+    return length
+
+
+class TestArrangeMessages:
+    """Test moving variable content behind the static prompt."""
+
+    def test_transcript_moved_to_end(self):
+        """Test a tagged block is cut out and appended to the user message."""
+        arranged = arrange_messages(_task_prompt("Alice: revenue grew."))
+
+        content = arranged[-1]["content"]
+        assert content.endswith("<transcript>\nAlice: revenue grew.\n</transcript>")
+        assert content.startswith("Summarize the meeting.\nExpected output")
+
+    def test_meetings_share_static_prefix(self):
+        """Test two meetings share every prompt character before the transcript."""
+        first = arrange_messages(_task_prompt("Alice: revenue grew."))
+        second = arrange_messages(_task_prompt("Bob: the launch slipped."))
+        first_text = "".join(m["content"] for m in first)
+        second_text = "".join(m["content"] for m in second)
+
+        shared = _common_prefix(first_text, second_text)
+
+        assert first_text[:shared].endswith("<transcript>\n")
+        assert "Expected output" in first_text[:shared]
+
+    def test_system_messages_first_and_input_untouched(self):
+        """Test system prompts lead and the caller's messages are not modified."""
+        messages = [
+            {"role": "user", "content": "Hi"},
+            {"role": "system", "content": "Be brief."},
+        ]
+
+        arranged = arrange_messages(messages)
+
+        assert [m["role"] for m in arranged] == ["system", "user"]
+        assert messages[0]["role"] == "user"
+
+    def test_agent_turns_extend_the_prefix(self):
+        """Test each turn of an agent loop keeps the previous turn's prompt."""
+        turns = _task_prompt("Alice: revenue grew.")
+        previous = None
+        for step in ("summary.txt", "action_items.txt", "sentiment.txt"):
+            arranged = arrange_messages(turns)
+            text = "".join(m["content"] for m in arranged)
+            if previous is not None:
+                assert text.startswith(previous)
+            previous = text
+            turns = turns + [
+                {"role": "assistant", "content": f"Action: write {step}"},
+                {"role": "user", "content": f"Observation: wrote {step}"},
+            ]
+
+        assert arranged[1]["content"].endswith("</transcript>")
+        assert arranged[-1]["content"] == "Observation: wrote action_items.txt"
+
+    def test_fused_prompt_ends_with_transcript(self):
+        """Test the fused minutes prompt is already in cacheable order."""
+        messages = build_messages("Alice: revenue grew.")
+
+        assert messages[-1][1].endswith("</transcript>")
+
+
+class TestPrepareRequest:
+    """Test the request arguments sent to the server."""
+
+    def test_cache_prompt_hint(self, local_llm, monkeypatch):
+        """Test get_llm() requests carry cache_prompt and the arranged prompt."""
+        from meeting_minutes.config.app_config import PROCESSING_CONFIG
+        from meeting_minutes.utils.llm_config import get_llm
+
+        _, handler = local_llm
+        monkeypatch.setitem(PROCESSING_CONFIG["minutes"], "cache_policy", "off")
+
+        get_llm().invoke(_task_prompt("Alice: revenue grew.")[1]["content"])
+
+        payload = handler.requests_seen[-1][2]
+        assert payload["cache_prompt"] is True
+        assert payload["messages"][-1]["content"].endswith("</transcript>")
+
+    def test_existing_extra_body_kept(self):
+        """Test caller-supplied extra_body fields win over the hint."""
+        prepared = prepare_request({"extra_body": {"cache_prompt": False, "x": 1}})
+
+        assert prepared["extra_body"] == {"cache_prompt": False, "x": 1}
@@ -0,0 +1,145 @@
+"""Test batching concurrent LLM requests."""
+
+import threading
+import time
+
+import pytest
+
+from meeting_minutes.config.app_config import LLM_COALESCE_CONFIG
+from meeting_minutes.config.profiles import activate_profile
+from meeting_minutes.utils.endpoint_pool import EndpointPool, RoutedCompletions
+from meeting_minutes.utils.llm_clients import llm_client_registry
+from meeting_minutes.utils.request_coalescer import RequestCoalescer
+
+
+def _call_concurrently(coalescer, calls):
+    """Run (func, key) pairs from separate threads; return their results."""
+    results = [None] * len(calls)
+
+    def run(index, func, key):
+        try:
+            results[index] = coalescer.call(func, key)
+        except Exception as e:
+            results[index] = e
+
+    threads = [
+        threading.Thread(target=run, args=(i, func, key))
+        for i, (func, key) in enumerate(calls)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestRequestCoalescer:
+    """Test gathering, dispatching and fanning out requests."""
+
+    def test_requests_in_window_dispatched_together(self):
+        """Test concurrent requests form one batch and each gets its result."""
+        coalescer = RequestCoalescer(window_ms=100, max_batch=10, slots=4)
+
+        results = _call_concurrently(
+            coalescer, [(lambda i=i: i * 10, None) for i in range(3)]
+        )
+
+        assert results == [0, 10, 20]
+        assert coalescer.stats()["batches"] == 1
+        assert coalescer.stats()["mean_batch_size"] == 3
+
+    def test_identical_requests_sent_once(self):
+        """Test requests sharing a key in one batch share one call."""
+        coalescer = RequestCoalescer(window_ms=100, max_batch=10, slots=4)
+        calls = []
+
+        def summarize():
+            calls.append(1)
+            return "summary"
+
+        results = _call_concurrently(coalescer, [(summarize, "same")] * 3)
+
+        assert results == ["summary"] * 3
+        assert len(calls) == 1
+        assert coalescer.stats()["shared"] == 2
+
+    def test_full_batch_dispatched_without_waiting(self):
+        """Test a batch is sent as soon as max_batch requests are waiting."""
+        coalescer = RequestCoalescer(window_ms=5000, max_batch=2, slots=2)
+
+        started = time.monotonic()
+        results = _call_concurrently(coalescer, [(lambda: "ok", None)] * 2)
+
+        assert results == ["ok", "ok"]
+        assert time.monotonic() - started < 1
+
+    def test_errors_reach_their_caller(self):
+        """Test a failed request raises in its caller only."""
+        coalescer = RequestCoalescer(window_ms=50, max_batch=10, slots=2)
+
+        def fail():
+            raise ConnectionError("server down")
+
+        results = _call_concurrently(coalescer, [(fail, None), (lambda: "ok", None)])
+
+        assert isinstance(results[0], ConnectionError)
+        assert results[1] == "ok"
+
+    def test_disabled_runs_inline(self):
+        """Test a zero window calls straight through on the caller's thread."""
+        coalescer = RequestCoalescer(window_ms=0)
+
+        assert coalescer.call(threading.get_ident) == threading.get_ident()
+        assert coalescer.stats()["batches"] == 0
+
+
+class TestCoalescedCompletions:
+    """Test batching completions sent through RoutedCompletions."""
+
+    def test_concurrent_completions_reach_server_together(self, fake_llm_server):
+        """Test deterministic duplicates are merged and the rest sent at once."""
+        url, handler = fake_llm_server
+        handler.delay = 0.2
+        coalescer = RequestCoalescer(window_ms=100, max_batch=10, slots=4)
+        completions = RoutedCompletions(
+            EndpointPool([url], probe_interval=0), "key", coalescer
+        )
+
+        def ask(prompt):
+            messages = [{"role": "user", "content": prompt}]
+            return lambda: completions.create(
+                model="m", messages=messages, temperature=0
+            )
+
+        # Create the pooled client up front so only the requests are timed
+        llm_client_registry.get(url, "key").client.chat.completions
+        started = time.monotonic()
+        results = _call_concurrently(
+            RequestCoalescer(window_ms=0),
+            [(ask("a"), None), (ask("a"), None), (ask("b"), None), (ask("c"), None)],
+        )
+
+        assert all(r.choices[0].message.content == handler.reply for r in results)
+        assert len(handler.requests_seen) == 3
+        # Sent together on parallel slots, not one after another
+        assert time.monotonic() - started < 0.2 * 3
+        assert coalescer.stats()["batches"] == 1
+
+
+class TestHighThroughputProfile:
+    """Test the profile that turns batching on."""
+
+    @pytest.fixture(autouse=True)
+    def restore_profile(self, monkeypatch):
+        monkeypatch.delenv("PERFORMANCE_PROFILE", raising=False)
+        yield
+        activate_profile("balanced")
+
+    def test_profile_enables_batching(self):
+        """Test the profile sets a window the shared coalescer picks up."""
+        from meeting_minutes.utils.request_coalescer import request_coalescer
+
+        activate_profile("high-throughput")
+
+        assert LLM_COALESCE_CONFIG["window_ms"] == 50
+        assert request_coalescer.enabled
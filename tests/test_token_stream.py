@@ -0,0 +1,133 @@
+"""Test streamed LLM tokens and their timing."""
+
+import time
+
+import pytest
+
+from meeting_minutes.config.app_config import PROCESSING_CONFIG
+from meeting_minutes.crews.meeting_minutes_crew.fused_minutes import section_header
+from meeting_minutes.utils.artifact_store import ArtifactStore
+from meeting_minutes.utils.cancellation import (
+    CancellationToken,
+    reset_current_token,
+    set_current_token,
+)
+from meeting_minutes.utils.llm_config import get_llm
+from meeting_minutes.utils.token_stream import (
+    CallTimer,
+    StreamMetrics,
+    TokenGate,
+    stream_metrics,
+    stream_tokens_to,
+)
+
+
+@pytest.fixture
+def streaming_server(local_llm, monkeypatch):
+    """Point get_llm() at the fake server with streaming on and no cache."""
+    base_url, handler = local_llm
+    handler.reply = "Minutes of the weekly sync"
+    monkeypatch.setitem(PROCESSING_CONFIG["minutes"], "streaming", True)
+    monkeypatch.setitem(PROCESSING_CONFIG["minutes"], "cache_policy", "off")
+    return base_url, handler
+
+
+class TestTokenStreaming:
+    """Test forwarding tokens from get_llm() calls."""
+
+    def test_tokens_reach_sink_in_order(self, streaming_server):
+        """Test each token is delivered to the bound sink as it arrives."""
+        _, handler = streaming_server
+        tokens = []
+
+        with stream_tokens_to(tokens.append):
+            response = get_llm().invoke("Write the minutes")
+
+        assert "".join(tokens) == handler.reply
+        assert len(tokens) == 5
+        assert response.content == handler.reply
+        assert handler.requests_seen[-1][2]["stream"] is True
+
+    def test_call_metrics_recorded_per_job(self, streaming_server):
+        """Test time to first token and speed are recorded for the job."""
+        _, handler = streaming_server
+        handler.delay = 0.1
+        handler.token_delay = 0.02
+        reset = set_current_token(CancellationToken("job-stream"))
+        try:
+            get_llm().invoke("Write the minutes")
+        finally:
+            reset_current_token(reset)
+
+        metrics = stream_metrics.pop_job_metrics("job-stream")
+        (call,) = metrics["calls"]
+        assert call["tokens"] == 5
+        assert call["ttft_seconds"] >= 0.1
+        assert 0 < call["tokens_per_second"] < 100
+        assert stream_metrics.pop_job_metrics("job-stream") == {"calls": []}
+
+    def test_broken_sink_does_not_fail_call(self, streaming_server):
+        """Test a failing consumer is dropped instead of failing the generation."""
+        _, handler = streaming_server
+
+        def broken(text):
+            raise OSError("disk full")
+
+        with stream_tokens_to(broken):
+            assert get_llm().invoke("Write the minutes").content == handler.reply
+
+    def test_gate_keeps_other_agents_out_of_minutes(self, streaming_server, tmp_path):
+        """Test only calls made after the gate opens reach the minutes artifact."""
+        _, handler = streaming_server
+        store = ArtifactStore("job-gate", root=str(tmp_path))
+
+        with store.open_appender("meeting_minutes.md") as output:
+            gate = TokenGate(output.write)
+            with stream_tokens_to(gate):
+                handler.reply = "Thought: I will write the summary file"
+                get_llm("fast").invoke("Summarize the transcript")
+                gate.open()
+                handler.reply = "# Minutes of the weekly sync"
+                get_llm("large").invoke("Write the minutes")
+
+        assert store.read_text("meeting_minutes.md") == "# Minutes of the weekly sync"
+
+    def test_gate_streams_only_fused_minutes_section(self, streaming_server):
+        """Test a fused completion streams only the text after the minutes header."""
+        _, handler = streaming_server
+        handler.reply = (
+            "=== SUMMARY ===\nWeekly sync.\n\n=== ACTION ITEMS ===\n- Ship it\n\n"
+            "=== SENTIMENT ===\nPositive.\n\n=== MINUTES ===\n# Weekly sync\n"
+        )
+        tokens = []
+        gate = TokenGate(tokens.append)
+        gate.open_after(section_header("minutes"))
+
+        with stream_tokens_to(gate):
+            get_llm("large").invoke("Write the minutes")
+
+        assert gate.is_open
+        assert "".join(tokens) == "# Weekly sync\n"
+
+
+class TestStreamMetrics:
+    """Test summarizing streamed calls."""
+
+    def test_summary(self):
+        """Test the summary averages time to first token over calls."""
+        metrics = StreamMetrics()
+        for ttft in (0.02, 0.04):
+            timer = CallTimer()
+            time.sleep(ttft)
+            for _ in range(3):
+                timer.on_token("x")
+                time.sleep(0.01)
+            metrics.record(timer)
+
+        summary = metrics.pop_job_metrics("")
+
+        assert len(summary["calls"]) == 2
+        assert summary["tokens"] == 6
+        assert summary["max_ttft_seconds"] >= 0.04
+        assert summary["mean_ttft_seconds"] >= 0.03
+        assert summary["tokens_per_second"] > 0
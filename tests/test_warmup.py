@@ -0,0 +1,90 @@
+"""Test concurrent dependency warm-up."""
+
+import time
+
+import pytest
+
+from meeting_minutes.config.app_config import LLM_SERVER
+from meeting_minutes.utils import warmup as warmup_module
+from meeting_minutes.utils.endpoint_pool import EndpointPool
+from meeting_minutes.utils.model_registry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    model_resolver,
+)
+from meeting_minutes.utils.warmup import Warmup, WarmupError
+
+# Nothing listens here, so connections are refused at once
+UNREACHABLE = "http://127.0.0.1:9/v1"
+
+
+class TestWarmup:
+    """Test the dependency warm-up runner."""
+
+    def test_checks_run_concurrently(self):
+        """Test checks overlap instead of running one after another."""
+        checks = {name: (lambda: time.sleep(0.2) or "ok") for name in "abc"}
+
+        started = time.perf_counter()
+        results = Warmup(checks).start().wait()
+        elapsed = time.perf_counter() - started
+
+        assert results == {"a": "ok", "b": "ok", "c": "ok"}
+        assert elapsed < 0.5
+
+    def test_required_failure_raises(self):
+        """Test a failing required dependency aborts the warm-up."""
+
+        def broken():
+            raise ConnectionError("server down")
+
+        warmup = Warmup({"llm_server": broken, "gmail": lambda: "service"}).start()
+
+        with pytest.raises(WarmupError) as exc_info:
+            warmup.wait()
+
+        assert list(exc_info.value.failures) == ["llm_server"]
+
+    def test_optional_failure_is_ignored(self):
+        """Test failures of optional dependencies are only logged."""
+
+        def broken():
+            raise ConnectionError("server down")
+
+        warmup = Warmup({"gmail": broken, "llm_server": lambda: []}, required=[])
+
+        assert warmup.start().wait() == {"llm_server": []}
+
+    def test_timeout(self):
+        """Test checks that do not finish in time count as failures."""
+        warmup = Warmup({"slow": lambda: time.sleep(1)}, timeout=0.05).start()
+
+        with pytest.raises(WarmupError):
+            warmup.wait()
+
+
+class TestCheckLLMServer:
+    """Test the LLM warm-up check against the endpoint pool."""
+
+    @pytest.fixture(autouse=True)
+    def unreachable_server(self, monkeypatch):
+        monkeypatch.setitem(LLM_SERVER, "base_url", UNREACHABLE)
+        monkeypatch.setattr(model_resolver, "breaker", CircuitBreaker("LLM server"))
+
+    def test_probes_pool_endpoints(self, fake_llm_server, monkeypatch):
+        """Test the pool's endpoints are probed, not LLM_SERVER."""
+        url, _ = fake_llm_server
+        pool = EndpointPool([UNREACHABLE, url], probe_interval=0)
+        monkeypatch.setattr(warmup_module, "endpoint_pool", pool)
+
+        assert warmup_module.check_llm_server() == ["local-model"]
+        assert pool.stats()[UNREACHABLE]["state"] == CircuitBreaker.OPEN
+        assert pool.stats()[url]["state"] == CircuitBreaker.CLOSED
+
+    def test_no_healthy_endpoint(self, monkeypatch):
+        """Test the check fails when every endpoint fails its probe."""
+        pool = EndpointPool([UNREACHABLE], probe_interval=0)
+        monkeypatch.setattr(warmup_module, "endpoint_pool", pool)
+
+        with pytest.raises(CircuitOpenError):
+            warmup_module.check_llm_server()